@@ -0,0 +1,113 @@
+"""Form detection on long prior-return PDFs.
+
+Times _detect_form() (one anchor scan per page) against the previous
+approach of trying each of _FORM_SIGNATURES with its own re.search, on
+the pages of a synthetic prior return. With --pdf (needs PyMuPDF) the
+pages are also written to a PDF and parse_prior_return() is timed, cold
+and with page text already extracted, to show how much of a parse
+detection accounts for.
+
+    python scripts/bench_detect_form.py [--pages 400] [--repeat 5] [--pdf]
+"""
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from taxman.parse_documents import (  # noqa: E402
+    _FORM_SIGNATURES,
+    _detect_form,
+    clear_document_cache,
+    parse_prior_return,
+)
+
+_HEADERS = [
+    "Form 1040 U.S. Individual Income Tax Return 2024",
+    "SCHEDULE C (Form 1040) Profit or Loss From Business",
+    "SCHEDULE SE (Form 1040) Self-Employment Tax",
+    "SCHEDULE E (Form 1040) Supplemental Income and Loss",
+    "Form 2555 Foreign Earned Income",
+    "Form 8995 Qualified Business Income Deduction Simplified Computation",
+    "Form 4562 Depreciation and Amortization",
+    "Page continued from previous page",
+    "Statement attached to return",
+]
+_WORDS = ("line amount income tax total enter from attach see instructions "
+          "your business deduction credit payments schedule").split()
+
+
+def _sequential(text: str):
+    for pattern, name in _FORM_SIGNATURES:
+        if re.search(pattern, text, re.IGNORECASE):
+            return name
+    return None
+
+
+def _pages(count: int) -> list[list[str]]:
+    rng = random.Random(2024)
+    pages = []
+    for _ in range(count):
+        lines = [rng.choice(_HEADERS)]
+        for n in range(1, 45):
+            words = " ".join(rng.choice(_WORDS) for _ in range(8))
+            lines.append(f"{n} {words} {rng.randint(0, 250_000):,}")
+        pages.append(lines)
+    return pages
+
+
+def _time(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pdf", action="store_true",
+                        help="also time parse_prior_return on a generated PDF (slow)")
+    args = parser.parse_args()
+
+    pages = _pages(args.pages)
+    texts = ["\n".join(lines) for lines in pages]
+    assert [_detect_form(t) for t in texts] == [_sequential(t) for t in texts]
+
+    sequential = _time(lambda: [_sequential(t) for t in texts], args.repeat)
+    single_pass = _time(lambda: [_detect_form(t) for t in texts], args.repeat)
+    print(f"{args.pages} pages, {sum(map(len, texts)) / len(texts):,.0f} chars each")
+    print(f"  pattern-by-pattern:  {sequential * 1000:>8.1f} ms")
+    print(f"  single anchor scan:  {single_pass * 1000:>8.1f} ms "
+          f"({sequential / single_pass:.1f}x)")
+
+    if not args.pdf:
+        return
+    import fitz
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "prior_return.pdf"
+        doc = fitz.open()
+        for lines in pages:
+            page = doc.new_page()
+            for i, line in enumerate(lines):
+                page.insert_text((36, 40 + 16 * i), line, fontsize=9)
+        doc.save(str(path))
+        doc.close()
+
+        clear_document_cache()
+        cold = _time(lambda: parse_prior_return(str(path)), 1)
+        warm = _time(lambda: parse_prior_return(str(path)), args.repeat)
+        clear_document_cache()
+    print(f"  parse_prior_return:  {cold * 1000:>8.1f} ms cold, "
+          f"{warm * 1000:.1f} ms with page text already extracted")
+
+
+if __name__ == "__main__":
+    main()
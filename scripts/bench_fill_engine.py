@@ -0,0 +1,127 @@
+"""PyPDFForm vs. the direct AcroForm writer for filling one return's forms.
+
+Writes synthetic fillable templates to a temporary FORMS_DIR (one widget
+per field the mappings fill, padded to IRS-like field counts), checks
+that both engines produce the same field values, and times each over
+every form of the return with warm template caches. Needs PyMuPDF; no
+IRS downloads.
+
+    python scripts/bench_fill_engine.py [--businesses 2] [--padding 150] [--rounds 5]
+"""
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fitz  # noqa: E402
+from pypdf import PdfReader  # noqa: E402
+
+from taxman import fill_forms  # noqa: E402
+from taxman.calculator import calculate_return  # noqa: E402
+from taxman.models import BusinessExpenses, ScheduleCData  # noqa: E402
+from tests.fixtures.profiles import make_single_freelancer_profile  # noqa: E402
+
+
+def _profile(businesses: int):
+    profile = make_single_freelancer_profile()
+    profile.businesses = [
+        ScheduleCData(
+            business_name=f"Studio {i + 1}",
+            principal_business_code="541430",
+            gross_receipts=40_000.0 + 1_000 * i,
+            expenses=BusinessExpenses(supplies=1_200.0, travel=800.0),
+        )
+        for i in range(businesses)
+    ]
+    return profile
+
+
+def _write_templates(forms_dir: Path, jobs: list, padding: int):
+    fields: dict[str, dict] = {}
+    for form_key, data in jobs:
+        for key, value in data.items():
+            name = key.removeprefix(fill_forms._WIDGET_PREFIX)
+            fields.setdefault(form_key, {})[name] = isinstance(value, bool)
+    for form_key, names in fields.items():
+        doc = fitz.open()
+        page = None
+        all_fields = list(names.items()) + [(f"pad_{i}[0]", False) for i in range(padding)]
+        for i, (name, checkbox) in enumerate(all_fields):
+            if i % 60 == 0:
+                page = doc.new_page()
+            row, col = divmod(i % 60, 3)
+            widget = fitz.Widget()
+            widget.field_type = (fitz.PDF_WIDGET_TYPE_CHECKBOX if checkbox
+                                 else fitz.PDF_WIDGET_TYPE_TEXT)
+            widget.field_name = name
+            widget.rect = fitz.Rect(36 + 180 * col, 36 + 36 * row,
+                                    36 + 180 * col + (12 if checkbox else 160),
+                                    36 + 36 * row + 14)
+            page.add_widget(widget)
+        doc.save(str(forms_dir / f"{form_key}.pdf"))
+        doc.close()
+        (forms_dir / f"{form_key}{fill_forms._PATCH_SUFFIX}").touch()
+
+
+def _values(pdf_bytes: bytes) -> dict:
+    fields = PdfReader(io.BytesIO(pdf_bytes)).get_fields() or {}
+    return {name: field.get("/V") for name, field in fields.items()}
+
+
+def _time(fill, jobs: list, rounds: int) -> float:
+    for form_key, data in jobs:  # warm the template cache
+        fill(form_key, data)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for form_key, data in jobs:
+            fill(form_key, data)
+    return (time.perf_counter() - started) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--businesses", type=int, default=2)
+    parser.add_argument("--padding", type=int, default=150,
+                        help="extra fields per template")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    profile = _profile(args.businesses)
+    result = calculate_return(profile)
+    fitz.TOOLS.mupdf_display_errors(False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        fill_forms.FORMS_DIR = tmp / "forms"
+        fill_forms.FORMS_DIR.mkdir()
+
+        # Capture the jobs generate_all_forms() would run to know which
+        # fields each template needs
+        jobs = []
+        real_fill_specs = fill_forms._fill_specs
+        fill_forms._fill_specs = lambda js, workers: jobs.extend(js) or []
+        fill_forms.generate_all_forms(result, profile, str(tmp / "probe"),
+                                      assemble_packets=False)
+        fill_forms._fill_specs = real_fill_specs
+        _write_templates(fill_forms.FORMS_DIR, jobs, args.padding)
+
+        for form_key, data in jobs:
+            expected = _values(fill_forms._fill_with_pypdfform(form_key, data))
+            actual = _values(fill_forms.fill_form_bytes(form_key, data))
+            assert actual == expected, f"{form_key}: field values differ"
+
+        pypdfform = _time(fill_forms._fill_with_pypdfform, jobs, args.rounds)
+        direct = _time(fill_forms.fill_form_bytes, jobs, args.rounds)
+
+    print(f"{len(jobs)} forms, field values identical")
+    print(f"  PyPDFForm:        {pypdfform * 1000:>8.1f} ms")
+    print(f"  AcroForm writer:  {direct * 1000:>8.1f} ms ({pypdfform / direct:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
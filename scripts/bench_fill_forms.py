@@ -0,0 +1,113 @@
+"""Serial vs. parallel form filling in generate_all_forms().
+
+Builds a return with many Schedule C copies, writes the synthetic
+templates from bench_fill_engine.py to a temporary FORMS_DIR, and times
+generate_all_forms() with workers=1 and with a process pool. It also
+reports the time spent filling and what a pool could reach with a core
+per worker. Needs PyMuPDF; no IRS downloads.
+
+    python scripts/bench_fill_forms.py [--businesses 12] [--workers 4] [--padding 150]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fitz  # noqa: E402
+
+from bench_fill_engine import _profile, _write_templates  # noqa: E402
+from taxman import fill_forms  # noqa: E402
+from taxman.calculator import calculate_return  # noqa: E402
+
+
+def _pool_startup(workers: int) -> float:
+    """Seconds to start `workers` processes and run a no-op on each."""
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(abs, range(workers)))
+    return time.perf_counter() - started
+
+
+def _time(result, profile, out: Path, workers: int) -> tuple[float, float, list[str]]:
+    """(total seconds, seconds inside _fill_specs, paths) for one run."""
+    fill_forms.clear_template_cache()
+    real_fill_specs = fill_forms._fill_specs
+    in_fills = 0.0
+
+    def timed(jobs, workers):
+        nonlocal in_fills
+        started = time.perf_counter()
+        outcomes = real_fill_specs(jobs, workers)
+        in_fills += time.perf_counter() - started
+        return outcomes
+
+    fill_forms._fill_specs = timed
+    try:
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            paths = fill_forms.generate_all_forms(result, profile, str(out),
+                                                  assemble_packets=False, workers=workers)
+        return time.perf_counter() - started, in_fills, paths
+    finally:
+        fill_forms._fill_specs = real_fill_specs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--businesses", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--padding", type=int, default=150,
+                        help="extra fields per template")
+    args = parser.parse_args()
+
+    profile = _profile(args.businesses)
+    result = calculate_return(profile)
+    fitz.TOOLS.mupdf_display_errors(False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        fill_forms.FORMS_DIR = tmp / "forms"
+        fill_forms.FORMS_DIR.mkdir()
+
+        # Capture the jobs generate_all_forms() would run to know which
+        # fields each template needs
+        jobs = []
+        real_fill_specs = fill_forms._fill_specs
+        fill_forms._fill_specs = lambda js, workers: jobs.extend(js) or []
+        fill_forms.generate_all_forms(result, profile, str(tmp / "probe"),
+                                      assemble_packets=False)
+        fill_forms._fill_specs = real_fill_specs
+        _write_templates(fill_forms.FORMS_DIR, jobs, args.padding)
+        for form_key in {form_key for form_key, _ in jobs}:
+            fill_forms._template_cache.widget_index(form_key)  # write the sidecars
+
+        serial, serial_fills, serial_paths = _time(result, profile, tmp / "serial", 1)
+        pooled, pooled_fills, pooled_paths = _time(result, profile, tmp / "pool",
+                                                   args.workers)
+
+    assert [Path(p).name for p in serial_paths] == [Path(p).name for p in pooled_paths]
+    print(f"{len(serial_paths)} forms ({args.businesses} Schedule C copies), "
+          f"{os.cpu_count()} CPU(s)")
+    print(f"  workers=1:           {serial * 1000:>8.1f} ms "
+          f"({serial_fills * 1000:.1f} ms filling)")
+    print(f"  workers={args.workers}:           {pooled * 1000:>8.1f} ms "
+          f"({pooled_fills * 1000:.1f} ms filling, {serial / pooled:.2f}x)")
+    # What the pool could reach with a core per worker: only the fills
+    # shrink, and each worker still pays its own startup
+    startup = _pool_startup(args.workers)
+    ideal = serial - serial_fills + serial_fills / args.workers + startup
+    print(f"  pool startup:        {startup * 1000:>8.1f} ms")
+    print(f"  ideal, {args.workers} core(s):    {ideal * 1000:>8.1f} ms "
+          f"({serial / ideal:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Memory held per calculated return.
+
+Compares the slotted result containers (LineItem, ScheduleCResult,
+Form1040Result, ...) with the same objects rebuilt as ordinary
+__dict__-backed instances, the layout the containers had before they
+were slotted. Field values (floats, strings) are shared between the
+two, so the difference is container overhead alone.
+
+    python scripts/bench_memory.py [--returns 2000]
+"""
+
+import argparse
+import copy
+import sys
+import tracemalloc
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from taxman.calculator import calculate_return  # noqa: E402
+from tests.fixtures.profiles import (  # noqa: E402
+    make_family_profile,
+    make_investor_profile,
+    make_mfj_high_income_profile,
+    make_mfs_expat_profile,
+    make_single_freelancer_profile,
+)
+
+
+_PLAIN_TYPES: dict[type, type] = {}
+
+
+def _plain_type(cls: type) -> type:
+    """Unslotted twin of a result dataclass (attributes set in __init__)."""
+    if cls not in _PLAIN_TYPES:
+        def __init__(self, values):
+            for name, value in values:
+                setattr(self, name, value)
+        _PLAIN_TYPES[cls] = type(cls.__name__, (), {"__init__": __init__})
+    return _PLAIN_TYPES[cls]
+
+
+def _dict_backed(value):
+    if is_dataclass(value):
+        return _plain_type(type(value))(
+            [(f.name, _dict_backed(getattr(value, f.name))) for f in fields(value)])
+    if isinstance(value, list):
+        return [_dict_backed(v) for v in value]
+    return value
+
+
+def _allocated(build) -> tuple[int, object]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, built
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--returns", type=int, default=2000)
+    args = parser.parse_args()
+
+    makers = (make_mfs_expat_profile, make_single_freelancer_profile,
+              make_mfj_high_income_profile, make_family_profile,
+              make_investor_profile)
+    profiles = [makers[i % len(makers)]() for i in range(args.returns)]
+    results = [calculate_return(p) for p in profiles]
+    line_items = sum(len(r.lines) for r in results) / len(results)
+
+    slotted, _ = _allocated(lambda: copy.deepcopy(results))
+    dict_backed, _ = _allocated(lambda: [_dict_backed(r) for r in results])
+
+    n = len(results)
+    print(f"{n:,} returns, {line_items:.1f} Form 1040 line items each")
+    print(f"  __dict__ containers: {dict_backed / n:>10,.0f} bytes/return")
+    print(f"  slotted containers:  {slotted / n:>10,.0f} bytes/return")
+    print(f"  reduction:           {1 - slotted / dict_backed:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,714 @@
+"""Vectorized batch calculation of many federal returns at once.
+
+calculate_return() builds a full Form1040Result — every schedule, every
+LineItem — one profile at a time. Re-running a whole client book after
+a constants or rules change only needs the totals, so this module
+flattens a list of TaxpayerProfiles into NumPy columns and runs
+Schedule C/E/D/SE, QBI, bracket tax (incl. the QDCG worksheet), Additional
+Medicare, NIIT, AMT, credits and payments as array operations.
+
+Results match calculate_return(profile) to the cent: every intermediate
+rounding step of the scalar path is reproduced, sums are accumulated in
+the same order, and cent rounding uses the same correctly-rounded
+round-half-even as Python's round(). The FEIE scenario is not batched —
+each row is the return calculate_return() produces without a Form 2555.
+
+Requires NumPy (pip install "taxman[batch]").
+"""
+
+from dataclasses import dataclass, fields
+from typing import Sequence
+
+import numpy as np
+
+from taxman.calculator import (
+    ADDITIONAL_MEDICARE_THRESHOLDS,
+    AMT_BREAKPOINTS,
+    AMT_EXEMPTIONS,
+    AMT_PHASEOUTS,
+    BRACKET_TABLES,
+    CAPITAL_LOSS_LIMITS,
+    LTCG_FIFTEEN_THRESHOLDS,
+    LTCG_ZERO_THRESHOLDS,
+    NIIT_THRESHOLDS,
+    QBI_THRESHOLDS,
+    round_cents_array,
+)
+from taxman.constants import (
+    ACTC_EARNED_INCOME_RATE,
+    ACTC_EARNED_INCOME_THRESHOLD,
+    ACTC_REFUNDABLE_PER_CHILD,
+    ADDITIONAL_MEDICARE_RATE,
+    AMT_PHASEOUT_RATE,
+    AMT_RATE_HIGH,
+    AMT_RATE_LOW,
+    CTC_AMOUNT_PER_CHILD,
+    CTC_PHASEOUT_MFJ,
+    CTC_PHASEOUT_OTHER,
+    CTC_PHASEOUT_RATE,
+    MEALS_DEDUCTION_PCT,
+    MEDICARE_TAX_RATE,
+    NIIT_RATE,
+    ODC_AMOUNT,
+    QBI_DEDUCTION_RATE,
+    SE_DEDUCTIBLE_FRACTION,
+    SE_INCOME_FACTOR,
+    SE_MINIMUM_INCOME,
+    SEP_CONTRIBUTION_LIMIT,
+    SEP_CONTRIBUTION_RATE,
+    SS_TAX_RATE,
+    SS_WAGE_BASE,
+    STANDARD_DEDUCTION,
+)
+from taxman.models import FilingStatus, TaxpayerProfile
+
+
+# Row order for every status-keyed lookup table below
+_STATUSES = list(FilingStatus)
+_STATUS_CODES = {fs: i for i, fs in enumerate(_STATUSES)}
+
+# Schedule C Part II expense attributes, in calculate_schedule_c() order
+_EXPENSE_FIELDS = (
+    "advertising", "car_and_truck", "commissions_and_fees", "contract_labor",
+    "depreciation", "employee_benefit_programs", "insurance",
+    "interest_mortgage", "interest_other", "legal_and_professional",
+    "office_expense", "pension_profit_sharing", "rent_vehicles_equipment",
+    "rent_other", "repairs_maintenance", "supplies", "taxes_licenses",
+    "travel", "meals", "utilities", "wages", "other_expenses",
+)
+
+# K-1 boxes read by Schedule E, in calculate_schedule_e() order
+_K1_FIELDS = (
+    "net_rental_income", "other_net_rental_income",
+    "ordinary_business_income", "guaranteed_payments", "interest_income",
+    "dividends", "qualified_dividends", "royalties",
+    "net_short_term_capital_gain", "net_long_term_capital_gain",
+    "net_section_1231_gain", "other_income", "section_179_deduction",
+    "other_deductions", "self_employment_earnings",
+)
+
+
+def _by_status(mapping: dict, codes: np.ndarray) -> np.ndarray:
+    """Broadcast a FilingStatus-keyed constant table onto status codes."""
+    return np.array([mapping[fs] for fs in _STATUSES], dtype=float)[codes]
+
+
+def _sum_by_owner(owners: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """Per-profile running total (``total += value`` in item order)."""
+    if len(owners) == 0:
+        return np.zeros(size)
+    return np.bincount(owners, weights=values, minlength=size)
+
+
+def _builtin_sum_by_owner(owners: np.ndarray, values: np.ndarray,
+                          size: int) -> np.ndarray:
+    """Per-profile builtin sum() — matches scalar code that calls sum().
+
+    Kept separate from _sum_by_owner because sum() of floats is
+    compensated on Python 3.12+, so it is not always bit-identical to
+    a running ``+=`` total.
+    """
+    totals = np.zeros(size)
+    if len(owners) == 0:
+        return totals
+    bounds = np.flatnonzero(np.diff(owners)) + 1
+    starts = np.concatenate(([0], bounds))
+    stops = np.concatenate((bounds, [len(owners)]))
+    for start, stop in zip(starts, stops):
+        totals[owners[start]] = sum(values[start:stop].tolist())
+    return totals
+
+
+def _income_tax(taxable_income: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_income_tax() using each row's bracket table."""
+    tax = np.zeros(len(taxable_income))
+    for code, fs in enumerate(_STATUSES):
+        rows = codes == code
+        if rows.any():
+            tax[rows] = BRACKET_TABLES[fs].tax_array(taxable_income[rows])
+    return tax
+
+
+def _qdcg_tax(taxable_income, qualified_dividends, net_lt, net_st, codes):
+    """Vectorized calculate_tax_with_qdcg_worksheet()."""
+    regular_tax = _income_tax(taxable_income, codes)
+
+    net_st_loss = np.minimum(net_st, 0)
+    net_cap_gain = np.maximum(net_lt + net_st_loss, 0)
+    preferential = np.minimum(qualified_dividends + net_cap_gain, taxable_income)
+
+    ordinary_portion = np.maximum(taxable_income - preferential, 0)
+    ordinary_tax = _income_tax(ordinary_portion, codes)
+
+    zero_room = np.maximum(_by_status(LTCG_ZERO_THRESHOLDS, codes)
+                           - ordinary_portion, 0)
+    at_zero = np.minimum(preferential, zero_room)
+    remaining = preferential - at_zero
+    fifteen_room = np.maximum(_by_status(LTCG_FIFTEEN_THRESHOLDS, codes)
+                              - ordinary_portion - at_zero, 0)
+    at_fifteen = np.minimum(remaining, fifteen_room)
+    at_twenty = remaining - at_fifteen
+
+    preferential_tax = round_cents_array(
+        at_zero * 0.0 + at_fifteen * 0.15 + at_twenty * 0.20
+    )
+    worksheet_tax = round_cents_array(ordinary_tax + preferential_tax)
+
+    tax = np.minimum(worksheet_tax, regular_tax)
+    tax = np.where(preferential <= 0, regular_tax, tax)
+    return np.where(taxable_income <= 0, 0.0, tax)
+
+
+# =============================================================================
+# Column extraction
+# =============================================================================
+
+@dataclass
+class BatchColumns:
+    """Input columns for a batch: one row per profile, plus item tables.
+
+    Per-profile document totals are reduced here with the same builtin
+    sum() calls calculate_return() makes; businesses, rental properties,
+    K-1s and 1099-Bs stay one row per item with an ``*_owner`` column
+    pointing back at the profile row.
+    """
+    size: int
+    status: np.ndarray
+    # Per-profile document totals
+    wages: np.ndarray
+    w2_ss_wages: np.ndarray
+    w2_medicare_wages: np.ndarray
+    tax_exempt_interest: np.ndarray
+    interest: np.ndarray
+    qualified_dividends: np.ndarray
+    ordinary_dividends: np.ndarray
+    ira_taxable: np.ndarray
+    early_penalty_base: np.ndarray
+    w2_withholding: np.ndarray
+    form_1099_withholding: np.ndarray
+    estimated_payments: np.ndarray
+    health_premiums: np.ndarray
+    sep_contribution: np.ndarray
+    nol: np.ndarray
+    salt_for_amt: np.ndarray
+    k1_qbi: np.ndarray
+    k1_w2_wages: np.ndarray
+    k1_ubia: np.ndarray
+    qualifying_children: np.ndarray
+    other_dependents: np.ndarray
+    has_schedule_e: np.ndarray
+    has_cap_activity: np.ndarray
+    # Schedule C — one row per business (incl. auto-created 1099-NEC)
+    biz_owner: np.ndarray
+    biz_gross_receipts: np.ndarray
+    biz_returns: np.ndarray
+    biz_cogs: np.ndarray
+    biz_other_income: np.ndarray
+    biz_expenses: np.ndarray          # (businesses, len(_EXPENSE_FIELDS))
+    biz_home_office: np.ndarray
+    # Schedule E Part I — one row per rental property
+    prop_owner: np.ndarray
+    prop_net_income: np.ndarray
+    # Schedule E Part II — one row per K-1
+    k1_owner: np.ndarray
+    k1_boxes: np.ndarray              # (K-1s, len(_K1_FIELDS))
+    # Schedule D — one row per 1099-B and per 1099-DIV
+    b_owner: np.ndarray
+    b_st_proceeds: np.ndarray
+    b_st_basis: np.ndarray
+    b_lt_proceeds: np.ndarray
+    b_lt_basis: np.ndarray
+    div_owner: np.ndarray
+    div_cap_gain_dist: np.ndarray
+
+
+def extract_columns(profiles: Sequence[TaxpayerProfile]) -> BatchColumns:
+    """Flatten profiles into the columnar layout calculate_columns() reads."""
+    per_profile = {name: [] for name in (
+        "status", "wages", "w2_ss_wages", "w2_medicare_wages",
+        "tax_exempt_interest", "interest", "qualified_dividends",
+        "ordinary_dividends", "ira_taxable", "early_penalty_base",
+        "w2_withholding", "form_1099_withholding", "estimated_payments",
+        "health_premiums", "sep_contribution", "nol", "salt_for_amt", "k1_qbi", "k1_w2_wages",
+        "k1_ubia", "qualifying_children", "other_dependents",
+        "has_schedule_e", "has_cap_activity",
+    )}
+    biz_rows, biz_owner = [], []
+    prop_rows, prop_owner = [], []
+    k1_rows, k1_owner = [], []
+    b_rows, b_owner = [], []
+    div_rows, div_owner = [], []
+
+    for i, p in enumerate(profiles):
+        row = per_profile
+        row["status"].append(_STATUS_CODES[p.filing_status])
+        row["wages"].append(sum(w2.wages for w2 in p.forms_w2))
+        row["w2_ss_wages"].append(sum(w2.ss_wages for w2 in p.forms_w2))
+        row["w2_medicare_wages"].append(sum(w2.medicare_wages for w2 in p.forms_w2))
+        row["tax_exempt_interest"].append(
+            sum(f.tax_exempt_interest for f in p.forms_1099_int))
+        row["interest"].append(sum(f.interest_income for f in p.forms_1099_int))
+        row["qualified_dividends"].append(
+            sum(f.qualified_dividends for f in p.forms_1099_div))
+        row["ordinary_dividends"].append(
+            sum(f.ordinary_dividends for f in p.forms_1099_div))
+        row["ira_taxable"].append(sum(f.taxable_amount for f in p.forms_1099_r))
+        row["early_penalty_base"].append(sum(
+            f.taxable_amount * 0.10 for f in p.forms_1099_r if f.is_early_distribution))
+        row["w2_withholding"].append(
+            sum(w2.federal_tax_withheld for w2 in p.forms_w2))
+        row["form_1099_withholding"].append(
+            sum(f.federal_tax_withheld for f in p.forms_1099_int)
+            + sum(f.federal_tax_withheld for f in p.forms_1099_div)
+            + sum(f.federal_tax_withheld for f in p.forms_1099_b)
+            + sum(f.federal_tax_withheld for f in p.forms_1099_nec)
+            + sum(f.federal_tax_withheld for f in p.forms_1099_r)
+        )
+        row["estimated_payments"].append(p.total_estimated_payments)
+        row["health_premiums"].append(
+            p.health_insurance.total_premiums if p.health_insurance else 0.0)
+        row["sep_contribution"].append(p.sep_ira_contribution)
+        row["nol"].append(p.nol_carryforward)
+        row["salt_for_amt"].append(
+            p.state_local_tax_deduction if p.uses_itemized_deductions else 0.0)
+        non_sstb = [k1 for k1 in p.schedule_k1s if not k1.is_sstb]
+        row["k1_qbi"].append(sum(k1.qbi_amount for k1 in non_sstb))
+        row["k1_w2_wages"].append(sum(k1.qbi_w2_wages for k1 in non_sstb))
+        row["k1_ubia"].append(sum(k1.qbi_ubia for k1 in non_sstb))
+        row["qualifying_children"].append(
+            sum(1 for d in p.dependents if d.is_qualifying_child_ctc))
+        row["other_dependents"].append(
+            sum(1 for d in p.dependents if not d.is_qualifying_child_ctc))
+        row["has_schedule_e"].append(bool(p.schedule_k1s or p.schedule_e_properties))
+        row["has_cap_activity"].append(bool(
+            p.forms_1099_b
+            or any(k1.net_short_term_capital_gain != 0
+                   or k1.net_long_term_capital_gain != 0
+                   or k1.net_section_1231_gain != 0 for k1 in p.schedule_k1s)
+            or any(f.capital_gain_distributions > 0 for f in p.forms_1099_div)
+        ))
+
+        # Same auto-created Schedule C as _apply_schedule_c()
+        if p.businesses:
+            for biz in p.businesses:
+                ho = 0.0
+                if biz.home_office:
+                    ho = (biz.home_office.simplified_deduction
+                          if biz.home_office.use_simplified_method
+                          else biz.home_office.regular_deduction)
+                biz_rows.append((
+                    biz.gross_receipts, biz.returns_and_allowances,
+                    biz.cost_of_goods_sold, biz.other_income, ho,
+                    *(getattr(biz.expenses, name) for name in _EXPENSE_FIELDS),
+                ))
+                biz_owner.append(i)
+        elif p.forms_1099_nec:
+            nec_total = sum(f.nonemployee_compensation for f in p.forms_1099_nec)
+            if nec_total > 0:
+                biz_rows.append((nec_total, 0.0, 0.0, 0.0, 0.0)
+                                + (0.0,) * len(_EXPENSE_FIELDS))
+                biz_owner.append(i)
+
+        for prop in p.schedule_e_properties:
+            prop_rows.append(prop.net_income)
+            prop_owner.append(i)
+        for k1 in p.schedule_k1s:
+            k1_rows.append(tuple(getattr(k1, name) for name in _K1_FIELDS))
+            k1_owner.append(i)
+        for b in p.forms_1099_b:
+            b_rows.append((b.st_proceeds, b.st_cost_basis,
+                           b.lt_proceeds, b.lt_cost_basis))
+            b_owner.append(i)
+        for div in p.forms_1099_div:
+            div_rows.append(div.capital_gain_distributions)
+            div_owner.append(i)
+
+    def _table(rows, width):
+        return np.array(rows, dtype=float).reshape(len(rows), width)
+
+    biz = _table(biz_rows, 5 + len(_EXPENSE_FIELDS))
+    b = _table(b_rows, 4)
+    columns = {
+        name: np.array(values, dtype=int if name in (
+            "status", "qualifying_children", "other_dependents") else
+            bool if name.startswith("has_") else float)
+        for name, values in per_profile.items()
+    }
+    return BatchColumns(
+        size=len(profiles),
+        **columns,
+        biz_owner=np.array(biz_owner, dtype=int),
+        biz_gross_receipts=biz[:, 0],
+        biz_returns=biz[:, 1],
+        biz_cogs=biz[:, 2],
+        biz_other_income=biz[:, 3],
+        biz_home_office=biz[:, 4],
+        biz_expenses=biz[:, 5:],
+        prop_owner=np.array(prop_owner, dtype=int),
+        prop_net_income=np.array(prop_rows, dtype=float),
+        k1_owner=np.array(k1_owner, dtype=int),
+        k1_boxes=_table(k1_rows, len(_K1_FIELDS)),
+        b_owner=np.array(b_owner, dtype=int),
+        b_st_proceeds=b[:, 0],
+        b_st_basis=b[:, 1],
+        b_lt_proceeds=b[:, 2],
+        b_lt_basis=b[:, 3],
+        div_owner=np.array(div_owner, dtype=int),
+        div_cap_gain_dist=np.array(div_rows, dtype=float),
+    )
+
+
+# =============================================================================
+# Batch results
+# =============================================================================
+
+@dataclass
+class BatchResult:
+    """Form 1040 totals for a batch — one array element per profile.
+
+    Field names and line references match the scalar fields of
+    Form1040Result.
+    """
+    wage_income: np.ndarray            # Line 1a
+    tax_exempt_interest: np.ndarray    # Line 2a
+    taxable_interest: np.ndarray       # Line 2b
+    qualified_dividends: np.ndarray    # Line 3a
+    ordinary_dividends: np.ndarray     # Line 3b
+    ira_distributions: np.ndarray      # Line 4b
+    capital_gain_loss: np.ndarray      # Line 7
+    schedule_1_income: np.ndarray      # Line 8
+    total_income: np.ndarray           # Line 9
+    adjustments: np.ndarray            # Line 10
+    agi: np.ndarray                    # Line 11
+    deduction: np.ndarray              # Line 13
+    qbi_deduction: np.ndarray          # Line 13, QBI portion
+    taxable_income: np.ndarray         # Line 15
+    tax: np.ndarray                    # Line 16
+    se_tax: np.ndarray                 # Schedule 2
+    additional_medicare: np.ndarray    # Schedule 2
+    niit: np.ndarray                   # Schedule 2
+    amt: np.ndarray                    # Schedule 2
+    early_withdrawal_penalty: np.ndarray  # Schedule 2, Line 8
+    nonrefundable_credits: np.ndarray  # Line 21
+    total_tax: np.ndarray              # Line 24
+    total_payments: np.ndarray         # Line 33
+    estimated_payments: np.ndarray
+    withholding: np.ndarray            # Line 25a
+    overpayment: np.ndarray            # Line 34
+    amount_owed: np.ndarray            # Line 37
+
+    def __len__(self) -> int:
+        return len(self.total_tax)
+
+    def row(self, index: int) -> dict:
+        """Totals for one profile as a plain {field: float} dict."""
+        return {f.name: float(getattr(self, f.name)[index]) for f in fields(self)}
+
+    def to_records(self) -> list[dict]:
+        """All rows, in input order."""
+        return [self.row(i) for i in range(len(self))]
+
+
+# =============================================================================
+# Array calculation
+# =============================================================================
+
+def calculate_columns(cols: BatchColumns) -> BatchResult:
+    """Compute Form 1040 totals for every row of a BatchColumns."""
+    n = cols.size
+    codes = cols.status
+    mfs = codes == _STATUS_CODES[FilingStatus.MFS]
+
+    # ─── SCHEDULE C ─────────────────────────────────────────────
+    meals_col = _EXPENSE_FIELDS.index("meals")
+    expenses = cols.biz_expenses.copy()
+    expenses[:, meals_col] = round_cents_array(
+        expenses[:, meals_col] * MEALS_DEDUCTION_PCT)
+    gross_income = ((cols.biz_gross_receipts - cols.biz_returns) - cols.biz_cogs
+                    + cols.biz_other_income)
+    total_expenses = np.zeros(len(cols.biz_owner))
+    for j in range(expenses.shape[1]):
+        amount = expenses[:, j]
+        total_expenses = total_expenses + np.where(amount > 0, amount, 0.0)
+    total_expenses = total_expenses + cols.biz_home_office
+    net_profit = round_cents_array(gross_income - total_expenses)
+    total_business_income = _sum_by_owner(cols.biz_owner, net_profit, n)
+    schedule_c_qbi = _builtin_sum_by_owner(cols.biz_owner, net_profit, n)
+
+    # ─── SCHEDULE E ─────────────────────────────────────────────
+    box = {name: cols.k1_boxes[:, j] for j, name in enumerate(_K1_FIELDS)}
+    k1_mfs = mfs[cols.k1_owner]
+    prop_rental = np.where(mfs[cols.prop_owner] & (cols.prop_net_income < 0),
+                           0.0, cols.prop_net_income)
+    box2 = np.where(k1_mfs & (box["net_rental_income"] < 0),
+                    0.0, box["net_rental_income"])
+    box3 = np.where(k1_mfs & (box["other_net_rental_income"] < 0),
+                    0.0, box["other_net_rental_income"])
+    # Properties first, then Box 2/Box 3 for each K-1 in turn
+    net_rental = _sum_by_owner(
+        np.concatenate((cols.prop_owner, np.repeat(cols.k1_owner, 2))),
+        np.concatenate((prop_rental, np.column_stack((box2, box3)).ravel())),
+        n,
+    )
+
+    def k1_total(name, values=None):
+        return _sum_by_owner(cols.k1_owner,
+                             box[name] if values is None else values, n)
+
+    e_ordinary = k1_total("ordinary_business_income")
+    e_guaranteed = k1_total("guaranteed_payments")
+    e_interest = k1_total("interest_income",
+                          np.where(box["interest_income"] > 0,
+                                   box["interest_income"], 0.0))
+    e_dividends = k1_total("dividends")
+    e_qualified = k1_total("qualified_dividends")
+    e_royalties = k1_total("royalties")
+    e_capital_gains = k1_total("net_long_term_capital_gain")
+    e_other = k1_total("other_income")
+    e_179 = k1_total("section_179_deduction")
+    e_other_ded = k1_total("other_deductions")
+    e_se = k1_total("self_employment_earnings")
+    total_schedule_e = round_cents_array(
+        net_rental + e_ordinary + e_guaranteed + e_interest + e_capital_gains
+        + e_royalties + e_other - e_179 - e_other_ded
+    )
+
+    has_e = cols.has_schedule_e
+    k1_se_income = np.where(has_e, e_se + e_guaranteed, 0.0)
+    k1_other_income = np.where(has_e, total_schedule_e - e_interest, 0.0)
+
+    # ─── INVESTMENT INCOME ──────────────────────────────────────
+    taxable_interest = cols.interest + np.where(has_e, e_interest, 0.0)
+    qualified_dividends = cols.qualified_dividends + np.where(has_e, e_qualified, 0.0)
+    ordinary_dividends = cols.ordinary_dividends + np.where(has_e, e_dividends, 0.0)
+    k1_other_income = np.where(has_e, k1_other_income - e_dividends, k1_other_income)
+
+    # ─── SCHEDULE D ─────────────────────────────────────────────
+    has_d = cols.has_cap_activity
+    net_st = _sum_by_owner(
+        np.concatenate((cols.b_owner, cols.k1_owner)),
+        np.concatenate((cols.b_st_proceeds - cols.b_st_basis,
+                        box["net_short_term_capital_gain"])),
+        n,
+    )
+    net_lt = _sum_by_owner(
+        np.concatenate((cols.b_owner, np.repeat(cols.k1_owner, 2), cols.div_owner)),
+        np.concatenate((
+            cols.b_lt_proceeds - cols.b_lt_basis,
+            np.column_stack((box["net_long_term_capital_gain"],
+                             box["net_section_1231_gain"])).ravel(),
+            cols.div_cap_gain_dist,
+        )),
+        n,
+    )
+    d_net_st = round_cents_array(net_st)
+    d_net_lt = round_cents_array(net_lt)
+    d_net = round_cents_array(net_st + net_lt)
+    loss_limit = _by_status(CAPITAL_LOSS_LIMITS, codes)
+    d_for_1040 = np.where(d_net >= 0, d_net,
+                          round_cents_array(np.maximum(d_net, -loss_limit)))
+    capital_gain_loss = np.where(has_d, d_for_1040, 0.0)
+    k1_other_income = np.where(has_d & has_e, k1_other_income - e_capital_gains,
+                               k1_other_income)
+
+    net_investment_income = 0.0 + np.maximum(taxable_interest, 0)
+    net_investment_income = net_investment_income + np.maximum(ordinary_dividends, 0)
+    net_investment_income = net_investment_income + np.where(
+        has_d & (d_net > 0), d_net, 0.0)
+    net_investment_income = net_investment_income + np.where(
+        has_e, np.maximum(net_rental, 0), 0.0)
+    net_investment_income = net_investment_income + np.where(
+        has_e, np.maximum(e_royalties, 0), 0.0)
+
+    # ─── SCHEDULE SE ────────────────────────────────────────────
+    total_se_income = total_business_income + k1_se_income
+    has_se = total_se_income >= SE_MINIMUM_INCOME
+    taxable_se = round_cents_array(total_se_income * SE_INCOME_FACTOR)
+    remaining_ss_base = np.maximum(SS_WAGE_BASE - cols.w2_ss_wages, 0)
+    ss_tax = round_cents_array(np.minimum(taxable_se, remaining_ss_base) * SS_TAX_RATE)
+    medicare_tax = round_cents_array(taxable_se * MEDICARE_TAX_RATE)
+    se_tax_full = round_cents_array(ss_tax + medicare_tax)
+    deductible_se = np.where(
+        has_se, round_cents_array(se_tax_full * SE_DEDUCTIBLE_FRACTION), 0.0)
+    se_tax = np.where(has_se, se_tax_full, 0.0)
+    taxable_se = np.where(has_se, taxable_se, 0.0)
+
+    # ─── FORM 1040: INCOME ──────────────────────────────────────
+    schedule_1_income = total_business_income + k1_other_income
+    schedule_1_income = np.where(cols.nol > 0, schedule_1_income - cols.nol,
+                                 schedule_1_income)
+    total_income = round_cents_array(
+        cols.wages + cols.ira_taxable + taxable_interest + ordinary_dividends
+        + capital_gain_loss + schedule_1_income
+    )
+
+    # ─── ADJUSTMENTS ────────────────────────────────────────────
+    sep_limit = round_cents_array(np.minimum(
+        np.maximum(total_business_income - deductible_se, 0) * SEP_CONTRIBUTION_RATE,
+        SEP_CONTRIBUTION_LIMIT))
+    sep = np.where(cols.sep_contribution > 0,
+                   round_cents_array(np.minimum(cols.sep_contribution, sep_limit)),
+                   0.0)
+    max_health = np.maximum(total_business_income - deductible_se - sep, 0)
+    health = np.where(cols.health_premiums > 0,
+                      round_cents_array(np.minimum(cols.health_premiums, max_health)),
+                      0.0)
+    business_adjustments = 0.0 + np.where(has_se, deductible_se, 0.0)
+    business_adjustments = business_adjustments + sep
+    business_adjustments = business_adjustments + health
+    adjustments = round_cents_array(business_adjustments)
+
+    agi = round_cents_array(total_income - adjustments)
+    deduction = np.array([STANDARD_DEDUCTION[fs.value] for fs in _STATUSES],
+                         dtype=float)[codes]
+
+    # ─── QBI DEDUCTION ──────────────────────────────────────────
+    taxable_before_qbi = np.maximum(agi - deduction, 0)
+    qbi_net_cap_gain = (np.where(has_d, np.maximum(d_net, 0), 0.0)
+                        + qualified_dividends)
+    total_qbi = (schedule_c_qbi - business_adjustments) + cols.k1_qbi
+    threshold = np.array([QBI_THRESHOLDS[fs][0] for fs in _STATUSES],
+                         dtype=float)[codes]
+    phaseout_range = np.array([QBI_THRESHOLDS[fs][1] for fs in _STATUSES],
+                              dtype=float)[codes]
+    full_amount = total_qbi * QBI_DEDUCTION_RATE
+    simple = np.minimum(
+        full_amount,
+        np.maximum(taxable_before_qbi - qbi_net_cap_gain, 0) * QBI_DEDUCTION_RATE,
+    )
+    phase_out_pct = np.minimum((taxable_before_qbi - threshold) / phaseout_range, 1.0)
+    total_w2 = 0.0 + cols.k1_w2_wages
+    total_ubia = 0.0 + cols.k1_ubia
+    wage_limit = np.maximum(total_w2 * 0.50, total_w2 * 0.25 + total_ubia * 0.025)
+    limited_amount = np.minimum(full_amount, wage_limit)
+    limited = np.maximum(full_amount - (full_amount - limited_amount) * phase_out_pct, 0.0)
+    qbi_deduction = np.where(
+        total_qbi <= 0, 0.0,
+        round_cents_array(np.where(taxable_before_qbi <= threshold, simple, limited)),
+    )
+
+    taxable_income = round_cents_array(np.maximum(agi - deduction - qbi_deduction, 0))
+
+    # ─── TAX ────────────────────────────────────────────────────
+    net_lt_for_qdcg = np.where(has_d, d_net_lt, 0.0)
+    net_st_for_qdcg = np.where(has_d, d_net_st, 0.0)
+    use_qdcg = (qualified_dividends > 0) | (net_lt_for_qdcg > 0)
+    tax = np.where(
+        use_qdcg,
+        _qdcg_tax(taxable_income, qualified_dividends, net_lt_for_qdcg,
+                  net_st_for_qdcg, codes),
+        _income_tax(taxable_income, codes),
+    )
+
+    # ─── OTHER TAXES (Schedule 2) ───────────────────────────────
+    combined_medicare = cols.w2_medicare_wages + taxable_se
+    additional_medicare = np.where(
+        combined_medicare > 0,
+        round_cents_array(np.maximum(combined_medicare
+                                - _by_status(ADDITIONAL_MEDICARE_THRESHOLDS, codes), 0)
+                     * ADDITIONAL_MEDICARE_RATE),
+        0.0,
+    )
+    niit = np.where(
+        net_investment_income > 0,
+        round_cents_array(np.minimum(net_investment_income,
+                                np.maximum(agi - _by_status(NIIT_THRESHOLDS, codes), 0))
+                     * NIIT_RATE),
+        0.0,
+    )
+
+    amti = taxable_income + cols.salt_for_amt + 0.0
+    base_exemption = _by_status(AMT_EXEMPTIONS, codes)
+    phaseout_start = _by_status(AMT_PHASEOUTS, codes)
+    exemption = np.where(
+        amti <= phaseout_start, base_exemption,
+        np.maximum(base_exemption - (amti - phaseout_start) * AMT_PHASEOUT_RATE, 0),
+    )
+    amt_taxable = np.maximum(amti - exemption, 0)
+    breakpoint = _by_status(AMT_BREAKPOINTS, codes)
+    tmt = np.where(amt_taxable <= breakpoint, amt_taxable * AMT_RATE_LOW,
+                   breakpoint * AMT_RATE_LOW + (amt_taxable - breakpoint) * AMT_RATE_HIGH)
+    amt = np.where(cols.salt_for_amt > 0,
+                   round_cents_array(np.maximum(tmt - tax, 0)), 0.0)
+
+    # ─── CREDITS ────────────────────────────────────────────────
+    children = cols.qualifying_children
+    has_dependents = (children + cols.other_dependents) > 0
+    gross_ctc = children * CTC_AMOUNT_PER_CHILD
+    gross_total = gross_ctc + cols.other_dependents * ODC_AMOUNT
+    joint = np.isin(codes, [_STATUS_CODES[FilingStatus.MFJ],
+                            _STATUS_CODES[FilingStatus.QSS]])
+    ctc_threshold = np.where(joint, CTC_PHASEOUT_MFJ, CTC_PHASEOUT_OTHER)
+    excess = np.maximum(agi - ctc_threshold, 0)
+    phaseout = -(np.floor_divide(-excess, 1_000)) * CTC_PHASEOUT_RATE
+    after_phaseout = np.maximum(gross_total - phaseout, 0)
+    nonrefundable = np.where(has_dependents,
+                             np.minimum(after_phaseout, tax + amt), 0.0)
+    unused_ctc = np.maximum(np.minimum(gross_ctc, after_phaseout) - nonrefundable, 0)
+    earned_income = cols.wages + np.maximum(total_business_income, 0)
+    earned_amount = (np.maximum(earned_income - ACTC_EARNED_INCOME_THRESHOLD, 0)
+                     * ACTC_EARNED_INCOME_RATE)
+    refundable_actc = np.where(
+        has_dependents & (unused_ctc > 0) & (children > 0),
+        round_cents_array(np.minimum(np.minimum(unused_ctc,
+                                           children * ACTC_REFUNDABLE_PER_CHILD),
+                                earned_amount)),
+        0.0,
+    )
+
+    early_penalty = round_cents_array(cols.early_penalty_base)
+    early_penalty = np.where(early_penalty > 0, early_penalty, 0.0)
+
+    # ─── TOTAL TAX ──────────────────────────────────────────────
+    total_tax = np.maximum(round_cents_array(
+        tax + se_tax + additional_medicare + niit + amt + early_penalty
+        - nonrefundable
+    ), 0)
+
+    # ─── PAYMENTS ───────────────────────────────────────────────
+    withholding = round_cents_array(cols.w2_withholding + cols.form_1099_withholding)
+    total_payments = round_cents_array(withholding + cols.estimated_payments
+                                  + refundable_actc)
+    refund = total_payments > total_tax
+    overpayment = np.where(refund, round_cents_array(total_payments - total_tax), 0.0)
+    amount_owed = np.where(refund, 0.0, round_cents_array(total_tax - total_payments))
+
+    return BatchResult(
+        wage_income=round_cents_array(cols.wages),
+        tax_exempt_interest=round_cents_array(cols.tax_exempt_interest),
+        taxable_interest=round_cents_array(taxable_interest),
+        qualified_dividends=round_cents_array(qualified_dividends),
+        ordinary_dividends=round_cents_array(ordinary_dividends),
+        ira_distributions=round_cents_array(cols.ira_taxable),
+        capital_gain_loss=capital_gain_loss,
+        schedule_1_income=round_cents_array(schedule_1_income),
+        total_income=total_income,
+        adjustments=adjustments,
+        agi=agi,
+        deduction=deduction,
+        qbi_deduction=qbi_deduction,
+        taxable_income=taxable_income,
+        tax=tax,
+        se_tax=se_tax,
+        additional_medicare=additional_medicare,
+        niit=niit,
+        amt=amt,
+        early_withdrawal_penalty=early_penalty,
+        nonrefundable_credits=nonrefundable,
+        total_tax=total_tax,
+        total_payments=total_payments,
+        estimated_payments=cols.estimated_payments,
+        withholding=withholding,
+        overpayment=overpayment,
+        amount_owed=amount_owed,
+    )
+
+
+def calculate_returns_batch(profiles: Sequence[TaxpayerProfile]) -> BatchResult:
+    """Calculate Form 1040 totals for many profiles with array operations.
+
+    Row i of every BatchResult field equals the same field of
+    calculate_return(profiles[i]). Use calculate_return() when the
+    schedules and line-by-line explanations are needed.
+    """
+    return calculate_columns(extract_columns(profiles))
@@ -4,7 +4,10 @@ Computes all form line items from a TaxpayerProfile.
 Each calculation includes the IRS form/line reference and reasoning.
 """
 
+import bisect
+import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from taxman.constants import (
@@ -68,6 +71,8 @@ from taxman.constants import (
     SE_DEDUCTIBLE_FRACTION,
     SE_INCOME_FACTOR,
     SE_MINIMUM_INCOME,
+    SEP_CONTRIBUTION_LIMIT,
+    SEP_CONTRIBUTION_RATE,
     SS_TAX_RATE,
     SS_WAGE_BASE,
     MEDICARE_TAX_RATE,
@@ -171,11 +176,126 @@ LTCG_FIFTEEN_THRESHOLDS = {
     FilingStatus.QSS: LTCG_FIFTEEN_PCT_MFJ,
 }
 
+# =============================================================================
+# Compiled Bracket Tables
+# =============================================================================
+
+@dataclass(frozen=True)
+class BracketTable:
+    """Progressive brackets compiled for O(log n) tax lookup.
+
+    base_tax[k] is the tax on all income up to lower_bounds[k], summed
+    bracket by bracket exactly as calculate_income_tax() always did, so
+    a lookup gives bit-identical results to walking the brackets.
+    """
+    lower_bounds: tuple[float, ...]
+    upper_bounds: tuple[float, ...]
+    rates: tuple[float, ...]
+    base_tax: tuple[float, ...]
+
+    @classmethod
+    def compile(cls, brackets) -> "BracketTable":
+        """Build a table from (upper_bound, rate) tuples."""
+        lower_bounds, upper_bounds, rates, base_tax = [], [], [], []
+        prev_bound = 0
+        cumulative = 0.0
+        for upper_bound, rate in brackets:
+            lower_bounds.append(prev_bound)
+            upper_bounds.append(upper_bound)
+            rates.append(rate)
+            base_tax.append(cumulative)
+            cumulative += (upper_bound - prev_bound) * rate
+            prev_bound = upper_bound
+        return cls(tuple(lower_bounds), tuple(upper_bounds),
+                   tuple(rates), tuple(base_tax))
+
+    def tax(self, taxable_income: float) -> float:
+        """Tax on taxable_income, rounded to the cent."""
+        k = bisect.bisect_left(self.lower_bounds, taxable_income) - 1
+        if k < 0:
+            return 0.0
+        return round(
+            self.base_tax[k] + (taxable_income - self.lower_bounds[k]) * self.rates[k], 2
+        )
+
+    def tax_array(self, taxable_incomes):
+        """Vectorized tax() for a NumPy array of taxable incomes."""
+        import numpy as np
+
+        incomes = np.asarray(taxable_incomes, dtype=float)
+        k = np.searchsorted(np.array(self.lower_bounds, dtype=float),
+                            incomes, side="left") - 1
+        safe_k = np.maximum(k, 0)
+        tax = (np.array(self.base_tax)[safe_k]
+               + (incomes - np.array(self.lower_bounds, dtype=float)[safe_k])
+               * np.array(self.rates)[safe_k])
+        return round_cents_array(np.where(k < 0, 0.0, tax))
+
+    def marginal_rate(self, taxable_income: float) -> float:
+        """Rate of the bracket that contains taxable_income."""
+        k = bisect.bisect_left(self.upper_bounds, taxable_income)
+        return self.rates[min(k, len(self.rates) - 1)]
+
+
+def round_cents_array(values):
+    """Element-wise round(x, 2) for NumPy arrays, with round()'s exact results.
+
+    np.round scales by 100 first, which can land a value that is not
+    really a half-cent exactly on .5 (e.g. 617.285 → 61728.5) and round
+    it the other way. Those near-ties are re-rounded with round().
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=float)
+    scaled = values * 100.0
+    rounded = np.rint(scaled) / 100.0
+    frac = np.abs(scaled - np.trunc(scaled))
+    near_tie = np.abs(frac - 0.5) <= 4 * np.spacing(np.abs(scaled))
+    if near_tie.any():
+        idx = np.flatnonzero(near_tie)
+        rounded[idx] = [round(float(v), 2) for v in values[idx]]
+    return rounded
+
+
+# One table per distinct bracket list (QSS shares the MFJ list)
+_TABLES_BY_LIST_ID = {
+    id(brackets): BracketTable.compile(brackets)
+    for brackets in BRACKETS_BY_STATUS.values()
+}
+
+BRACKET_TABLES = {
+    fs: _TABLES_BY_LIST_ID[id(brackets)]
+    for fs, brackets in BRACKETS_BY_STATUS.items()
+}
+
+
+@lru_cache(maxsize=32)
+def _compile_brackets(brackets: tuple) -> BracketTable:
+    return BracketTable.compile(brackets)
+
+
+def bracket_table(brackets: Optional[list[tuple]] = None) -> BracketTable:
+    """Compiled table for a bracket list (MFS_BRACKETS when None).
+
+    The constants.py lists are compiled at import; any other list is
+    compiled on first use and cached by value.
+    """
+    if brackets is None:
+        brackets = MFS_BRACKETS
+    table = _TABLES_BY_LIST_ID.get(id(brackets))
+    if table is None:
+        table = _compile_brackets(tuple(brackets))
+    return table
+
+
 # =============================================================================
 # Calculation Result Containers
 # =============================================================================
 
-@dataclass
+# Slotted: a return holds dozens of these, and batch/report runs keep
+# thousands of returns alive — no per-instance __dict__.
+
+@dataclass(slots=True)
 class LineItem:
     """A single calculated line on a tax form."""
     form: str
@@ -186,7 +306,7 @@ class LineItem:
     irs_reference: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleCResult:
     """Calculated Schedule C for one business."""
     business_name: str
@@ -201,7 +321,7 @@ class ScheduleCResult:
     lines: list[LineItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleSEResult:
     """Calculated Schedule SE."""
     net_se_earnings: float = 0.0       # Line 3
@@ -212,7 +332,7 @@ class ScheduleSEResult:
     lines: list[LineItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleEResult:
     """Calculated Schedule E (rental/K-1 income)."""
     net_rental_income: float = 0.0      # Box 2 + Box 3 rental income
@@ -234,7 +354,7 @@ class ScheduleEResult:
     lines: list[LineItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Form8995Result:
     """Calculated QBI deduction."""
     total_qbi: float = 0.0
@@ -246,7 +366,7 @@ class Form8995Result:
     lines: list[LineItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleDResult:
     """Calculated Schedule D (Capital Gains and Losses)."""
     net_st_gain_loss: float = 0.0
@@ -256,7 +376,7 @@ class ScheduleDResult:
     lines: list[LineItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Form6251Result:
     """Calculated AMT (Form 6251)."""
     amti: float = 0.0                    # Alternative minimum taxable income
@@ -266,7 +386,7 @@ class Form6251Result:
     lines: list[LineItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaxCreditsResult:
     """Calculated tax credits (CTC, ACTC, ODC)."""
     ctc_per_child: float = 0.0
@@ -281,7 +401,7 @@ class TaxCreditsResult:
     lines: list[LineItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Form2555Result:
     """Calculated FEIE."""
     foreign_earned_income: float = 0.0
@@ -297,7 +417,7 @@ class Form2555Result:
     lines: list[LineItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Form1040Result:
     """Complete calculated Form 1040."""
     # Income
@@ -347,7 +467,7 @@ class Form1040Result:
 # Core Calculation Functions
 # =============================================================================
 
-def calculate_schedule_c(biz: ScheduleCData) -> ScheduleCResult:
+def calculate_schedule_c(biz: ScheduleCData, explain: bool = True) -> ScheduleCResult:
     """Calculate Schedule C (Profit or Loss From Business).
 
     IRS Instructions: https://www.irs.gov/instructions/i1040sc
@@ -360,34 +480,38 @@ def calculate_schedule_c(biz: ScheduleCData) -> ScheduleCResult:
     # = Line 3 (net receipts) - Line 4 (COGS) = Line 5 (gross profit)
     # + Line 6 (other income) = Line 7 (gross income)
     result.gross_receipts = biz.gross_receipts
-    lines.append(LineItem("Schedule C", "1", "Gross receipts or sales",
-                          biz.gross_receipts))
+    if explain:
+        lines.append(LineItem("Schedule C", "1", "Gross receipts or sales",
+                              biz.gross_receipts))
 
     result.returns_allowances = biz.returns_and_allowances
-    lines.append(LineItem("Schedule C", "2", "Returns and allowances",
-                          biz.returns_and_allowances))
+    if explain:
+        lines.append(LineItem("Schedule C", "2", "Returns and allowances",
+                              biz.returns_and_allowances))
 
     result.cost_of_goods_sold = biz.cost_of_goods_sold
-    if biz.cost_of_goods_sold > 0:
+    if explain and biz.cost_of_goods_sold > 0:
         lines.append(LineItem("Schedule C", "4", "Cost of goods sold",
                               biz.cost_of_goods_sold))
 
     gross_profit = biz.gross_profit  # receipts - returns - COGS
     result.gross_profit = gross_profit
-    lines.append(LineItem("Schedule C", "5", "Gross profit",
-                          gross_profit,
-                          "Line 1 minus Line 2 minus Line 4"))
+    if explain:
+        lines.append(LineItem("Schedule C", "5", "Gross profit",
+                              gross_profit,
+                              "Line 1 minus Line 2 minus Line 4"))
 
     result.other_income = biz.other_income
-    if biz.other_income > 0:
+    if explain and biz.other_income > 0:
         lines.append(LineItem("Schedule C", "6", "Other income",
                               biz.other_income))
 
     gross_income = gross_profit + biz.other_income
     result.gross_income = gross_income
-    lines.append(LineItem("Schedule C", "7", "Gross income",
-                          gross_income,
-                          "Line 5 plus Line 6"))
+    if explain:
+        lines.append(LineItem("Schedule C", "7", "Gross income",
+                              gross_income,
+                              "Line 5 plus Line 6"))
 
     # Part II: Expenses
     exp = biz.expenses
@@ -419,7 +543,8 @@ def calculate_schedule_c(biz: ScheduleCData) -> ScheduleCResult:
     total_expenses = 0.0
     for line_num, desc, amount in expense_lines:
         if amount > 0:
-            lines.append(LineItem("Schedule C", line_num, desc, round(amount, 2)))
+            if explain:
+                lines.append(LineItem("Schedule C", line_num, desc, round(amount, 2)))
             total_expenses += amount
 
     # Home office deduction
@@ -427,35 +552,39 @@ def calculate_schedule_c(biz: ScheduleCData) -> ScheduleCResult:
     if biz.home_office:
         if biz.home_office.use_simplified_method:
             home_office_deduction = biz.home_office.simplified_deduction
-            lines.append(LineItem("Schedule C", "30",
-                                  "Business use of home (simplified method)",
-                                  round(home_office_deduction, 2),
-                                  f"{min(biz.home_office.square_footage, 300):.0f} sqft × $5/sqft"))
+            if explain:
+                lines.append(LineItem("Schedule C", "30",
+                                      "Business use of home (simplified method)",
+                                      round(home_office_deduction, 2),
+                                      f"{min(biz.home_office.square_footage, 300):.0f} sqft × $5/sqft"))
         else:
             home_office_deduction = biz.home_office.regular_deduction
-            lines.append(LineItem("Schedule C", "30",
-                                  "Business use of home (regular method, Form 8829)",
-                                  round(home_office_deduction, 2),
-                                  f"{biz.home_office.business_percentage:.1%} business use"))
+            if explain:
+                lines.append(LineItem("Schedule C", "30",
+                                      "Business use of home (regular method, Form 8829)",
+                                      round(home_office_deduction, 2),
+                                      f"{biz.home_office.business_percentage:.1%} business use"))
         total_expenses += home_office_deduction
 
     result.total_expenses = round(total_expenses, 2)
-    lines.append(LineItem("Schedule C", "28", "Total expenses before home office",
-                          round(total_expenses - home_office_deduction, 2)))
+    if explain:
+        lines.append(LineItem("Schedule C", "28", "Total expenses before home office",
+                              round(total_expenses - home_office_deduction, 2)))
 
     # Net profit or loss
     net_profit = round(gross_income - total_expenses, 2)
     result.net_profit_loss = net_profit
-    lines.append(LineItem("Schedule C", "31", "Net profit or (loss)",
-                          net_profit,
-                          "Line 7 minus Line 28 minus Line 30"))
+    if explain:
+        lines.append(LineItem("Schedule C", "31", "Net profit or (loss)",
+                              net_profit,
+                              "Line 7 minus Line 28 minus Line 30"))
 
     result.lines = lines
     return result
 
 
 def calculate_schedule_se(
-    net_se_income: float, w2_ss_wages: float = 0.0
+    net_se_income: float, w2_ss_wages: float = 0.0, explain: bool = True
 ) -> ScheduleSEResult:
     """Calculate Schedule SE (Self-Employment Tax).
 
@@ -471,23 +600,26 @@ def calculate_schedule_se(
 
     result.net_se_earnings = net_se_income
     result.w2_ss_wages = w2_ss_wages
-    lines.append(LineItem("Schedule SE", "3", "Net SE earnings",
-                          round(net_se_income, 2),
-                          "Combined net profit from Schedule C + K-1 SE earnings"))
+    if explain:
+        lines.append(LineItem("Schedule SE", "3", "Net SE earnings",
+                              round(net_se_income, 2),
+                              "Combined net profit from Schedule C + K-1 SE earnings"))
 
     if net_se_income < SE_MINIMUM_INCOME:
-        lines.append(LineItem("Schedule SE", "4", "No SE tax required",
-                              0.0, f"Net SE earnings under ${SE_MINIMUM_INCOME}"))
+        if explain:
+            lines.append(LineItem("Schedule SE", "4", "No SE tax required",
+                                  0.0, f"Net SE earnings under ${SE_MINIMUM_INCOME}"))
         result.lines = lines
         return result
 
     # Line 4a: 92.35% of net SE earnings
     taxable_se = round(net_se_income * SE_INCOME_FACTOR, 2)
     result.taxable_se_earnings = taxable_se
-    lines.append(LineItem("Schedule SE", "4a",
-                          "Multiply Line 3 by 92.35%",
-                          taxable_se,
-                          f"${net_se_income:,.2f} × 0.9235 = ${taxable_se:,.2f}"))
+    if explain:
+        lines.append(LineItem("Schedule SE", "4a",
+                              "Multiply Line 3 by 92.35%",
+                              taxable_se,
+                              f"${net_se_income:,.2f} × 0.9235 = ${taxable_se:,.2f}"))
 
     # Calculate SS and Medicare portions separately
     # SS wage base is reduced by W-2 SS wages (Line 8a-8b on Schedule SE)
@@ -497,33 +629,49 @@ def calculate_schedule_se(
     medicare_tax = round(taxable_se * MEDICARE_TAX_RATE, 2)
     se_tax = round(ss_tax + medicare_tax, 2)
 
-    lines.append(LineItem("Schedule SE", "10",
-                          "Social Security tax",
-                          ss_tax,
-                          f"min(${taxable_se:,.2f}, ${remaining_ss_base:,.2f}) × {SS_TAX_RATE}"))
-    lines.append(LineItem("Schedule SE", "11",
-                          "Medicare tax",
-                          medicare_tax,
-                          f"${taxable_se:,.2f} × {MEDICARE_TAX_RATE}"))
+    if explain:
+        lines.append(LineItem("Schedule SE", "10",
+                              "Social Security tax",
+                              ss_tax,
+                              f"min(${taxable_se:,.2f}, ${remaining_ss_base:,.2f}) × {SS_TAX_RATE}"))
+        lines.append(LineItem("Schedule SE", "11",
+                              "Medicare tax",
+                              medicare_tax,
+                              f"${taxable_se:,.2f} × {MEDICARE_TAX_RATE}"))
 
     result.se_tax = se_tax
-    lines.append(LineItem("Schedule SE", "12",
-                          "Self-employment tax",
-                          se_tax,
-                          f"SS tax ${ss_tax:,.2f} + Medicare ${medicare_tax:,.2f}"))
+    if explain:
+        lines.append(LineItem("Schedule SE", "12",
+                              "Self-employment tax",
+                              se_tax,
+                              f"SS tax ${ss_tax:,.2f} + Medicare ${medicare_tax:,.2f}"))
 
     # Deductible half
     result.deductible_se_tax = round(se_tax * SE_DEDUCTIBLE_FRACTION, 2)
-    lines.append(LineItem("Schedule SE", "13",
-                          "Deductible part of SE tax",
-                          result.deductible_se_tax,
-                          f"50% of ${se_tax:,.2f} — this goes to Schedule 1, Line 15"))
+    if explain:
+        lines.append(LineItem("Schedule SE", "13",
+                              "Deductible part of SE tax",
+                              result.deductible_se_tax,
+                              f"50% of ${se_tax:,.2f} — this goes to Schedule 1, Line 15"))
 
     result.lines = lines
     return result
 
 
-def calculate_schedule_e(profile: TaxpayerProfile) -> ScheduleEResult:
+def calculate_sep_limit(net_business_income: float,
+                        deductible_se_tax: float) -> float:
+    """Maximum deductible SEP-IRA contribution for the self-employed.
+
+    Pub 560 rate worksheet: 20% of net earnings from self-employment
+    (net profit minus the deductible part of SE tax), capped at the
+    §415(c) dollar limit.
+    """
+    net_earnings = max(net_business_income - deductible_se_tax, 0)
+    return round(min(net_earnings * SEP_CONTRIBUTION_RATE, SEP_CONTRIBUTION_LIMIT), 2)
+
+
+def calculate_schedule_e(profile: TaxpayerProfile,
+                         explain: bool = True) -> ScheduleEResult:
     """Calculate Schedule E (Supplemental Income and Loss).
 
     Part I: Direct rental properties (ScheduleEProperty)
@@ -540,36 +688,40 @@ def calculate_schedule_e(profile: TaxpayerProfile) -> ScheduleEResult:
         rental_net = prop.net_income
         if rental_net < 0 and profile.filing_status == FilingStatus.MFS:
             # MFS gets $0 passive loss allowance
-            lines.append(LineItem("Schedule E", "Part I",
-                                  f"Rental loss from {prop.property_address} (SUSPENDED)",
-                                  0.0,
-                                  f"Actual loss: ${rental_net:,.2f}. MFS filers get $0 passive "
-                                  f"loss allowance (IRC §469(i)(5)(B)). Loss is suspended."))
+            if explain:
+                lines.append(LineItem("Schedule E", "Part I",
+                                      f"Rental loss from {prop.property_address} (SUSPENDED)",
+                                      0.0,
+                                      f"Actual loss: ${rental_net:,.2f}. MFS filers get $0 passive "
+                                      f"loss allowance (IRC §469(i)(5)(B)). Loss is suspended."))
         else:
             result.net_rental_income += rental_net
-            lines.append(LineItem("Schedule E", "Part I",
-                                  f"Rental income from {prop.property_address}",
-                                  round(rental_net, 2),
-                                  f"Gross rents ${prop.gross_rents:,.2f} − "
-                                  f"expenses ${prop.total_expenses:,.2f}"))
+            if explain:
+                lines.append(LineItem("Schedule E", "Part I",
+                                      f"Rental income from {prop.property_address}",
+                                      round(rental_net, 2),
+                                      f"Gross rents ${prop.gross_rents:,.2f} − "
+                                      f"expenses ${prop.total_expenses:,.2f}"))
 
     # ─── PART II: K-1 Income ──────────────────────────────────
     for k1 in profile.schedule_k1s:
         # Box 2: Net rental income (passive)
         rental = k1.net_rental_income
         if rental < 0 and profile.filing_status == FilingStatus.MFS:
-            lines.append(LineItem("Schedule E", "Part II",
-                                  f"K-1 rental loss from {k1.partnership_name} (SUSPENDED)",
-                                  0.0,
-                                  f"Actual loss: ${rental:,.2f}. MFS filers get $0 passive "
-                                  f"loss allowance (IRC §469(i)(5)(B)). Loss is suspended "
-                                  f"and carries forward."))
+            if explain:
+                lines.append(LineItem("Schedule E", "Part II",
+                                      f"K-1 rental loss from {k1.partnership_name} (SUSPENDED)",
+                                      0.0,
+                                      f"Actual loss: ${rental:,.2f}. MFS filers get $0 passive "
+                                      f"loss allowance (IRC §469(i)(5)(B)). Loss is suspended "
+                                      f"and carries forward."))
         else:
             result.net_rental_income += rental
-            lines.append(LineItem("Schedule E", "Part II",
-                                  f"K-1 rental income from {k1.partnership_name}",
-                                  round(rental, 2),
-                                  "Net rental income from partnership K-1, Box 2"))
+            if explain:
+                lines.append(LineItem("Schedule E", "Part II",
+                                      f"K-1 rental income from {k1.partnership_name}",
+                                      round(rental, 2),
+                                      "Net rental income from partnership K-1, Box 2"))
 
         # Box 3: Other net rental income
         rental3 = k1.other_net_rental_income
@@ -577,108 +729,122 @@ def calculate_schedule_e(profile: TaxpayerProfile) -> ScheduleEResult:
             pass  # Suspended same as Box 2
         elif rental3 != 0:
             result.net_rental_income += rental3
-            lines.append(LineItem("Schedule E", "K-1 Box 3",
-                                  f"Other net rental income from {k1.partnership_name}",
-                                  round(rental3, 2)))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 3",
+                                      f"Other net rental income from {k1.partnership_name}",
+                                      round(rental3, 2)))
 
         # Box 1: Ordinary business income
         if k1.ordinary_business_income != 0:
             result.ordinary_business_income += k1.ordinary_business_income
-            lines.append(LineItem("Schedule E", "K-1 Box 1",
-                                  f"Ordinary business income from {k1.partnership_name}",
-                                  round(k1.ordinary_business_income, 2)))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 1",
+                                      f"Ordinary business income from {k1.partnership_name}",
+                                      round(k1.ordinary_business_income, 2)))
 
         # Box 4: Guaranteed payments
         if k1.guaranteed_payments != 0:
             result.guaranteed_payments += k1.guaranteed_payments
-            lines.append(LineItem("Schedule E", "K-1 Box 4",
-                                  f"Guaranteed payments from {k1.partnership_name}",
-                                  round(k1.guaranteed_payments, 2),
-                                  "Subject to self-employment tax"))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 4",
+                                      f"Guaranteed payments from {k1.partnership_name}",
+                                      round(k1.guaranteed_payments, 2),
+                                      "Subject to self-employment tax"))
 
         # Box 5: Interest income (flows to Line 2b)
         if k1.interest_income > 0:
             result.interest_income += k1.interest_income
-            lines.append(LineItem("Schedule E", "K-1 Box 5",
-                                  f"Interest income from {k1.partnership_name}",
-                                  round(k1.interest_income, 2),
-                                  "Flows to Form 1040 Line 2b"))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 5",
+                                      f"Interest income from {k1.partnership_name}",
+                                      round(k1.interest_income, 2),
+                                      "Flows to Form 1040 Line 2b"))
 
         # Box 6a: Dividends (flows to Line 3b)
         if k1.dividends != 0:
             result.dividends += k1.dividends
-            lines.append(LineItem("Schedule E", "K-1 Box 6a",
-                                  f"Dividends from {k1.partnership_name}",
-                                  round(k1.dividends, 2),
-                                  "Flows to Form 1040 Line 3b"))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 6a",
+                                      f"Dividends from {k1.partnership_name}",
+                                      round(k1.dividends, 2),
+                                      "Flows to Form 1040 Line 3b"))
 
         # Box 6b: Qualified dividends (flows to Line 3a)
         if hasattr(k1, 'qualified_dividends') and k1.qualified_dividends != 0:
             result.qualified_dividends += k1.qualified_dividends
-            lines.append(LineItem("Schedule E", "K-1 Box 6b",
-                                  f"Qualified dividends from {k1.partnership_name}",
-                                  round(k1.qualified_dividends, 2),
-                                  "Flows to Form 1040 Line 3a"))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 6b",
+                                      f"Qualified dividends from {k1.partnership_name}",
+                                      round(k1.qualified_dividends, 2),
+                                      "Flows to Form 1040 Line 3a"))
 
         # Box 7: Royalties (Schedule E + NII)
         if k1.royalties != 0:
             result.royalties += k1.royalties
-            lines.append(LineItem("Schedule E", "K-1 Box 7",
-                                  f"Royalties from {k1.partnership_name}",
-                                  round(k1.royalties, 2)))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 7",
+                                      f"Royalties from {k1.partnership_name}",
+                                      round(k1.royalties, 2)))
 
         # Box 8: Net short-term capital gain (flows to Schedule D)
         if k1.net_short_term_capital_gain != 0:
             result.net_st_capital_gain += k1.net_short_term_capital_gain
-            lines.append(LineItem("Schedule E", "K-1 Box 8",
-                                  f"Net ST capital gain from {k1.partnership_name}",
-                                  round(k1.net_short_term_capital_gain, 2),
-                                  "Flows to Schedule D"))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 8",
+                                      f"Net ST capital gain from {k1.partnership_name}",
+                                      round(k1.net_short_term_capital_gain, 2),
+                                      "Flows to Schedule D"))
 
         # Box 9a: Net long-term capital gain (flows to Schedule D)
         if k1.net_long_term_capital_gain != 0:
             result.capital_gains += k1.net_long_term_capital_gain
-            lines.append(LineItem("Schedule E", "K-1 Box 9a",
-                                  f"Net long-term capital gain from {k1.partnership_name}",
-                                  round(k1.net_long_term_capital_gain, 2),
-                                  "Flows to Schedule D"))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 9a",
+                                      f"Net long-term capital gain from {k1.partnership_name}",
+                                      round(k1.net_long_term_capital_gain, 2),
+                                      "Flows to Schedule D"))
 
         # Box 10: Net section 1231 gain (treated as LTCG for Schedule D)
         if k1.net_section_1231_gain != 0:
             result.net_section_1231_gain += k1.net_section_1231_gain
-            lines.append(LineItem("Schedule E", "K-1 Box 10",
-                                  f"Net §1231 gain from {k1.partnership_name}",
-                                  round(k1.net_section_1231_gain, 2),
-                                  "Treated as LTCG, flows to Schedule D"))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 10",
+                                      f"Net §1231 gain from {k1.partnership_name}",
+                                      round(k1.net_section_1231_gain, 2),
+                                      "Treated as LTCG, flows to Schedule D"))
 
         # Box 11: Other income
         if k1.other_income != 0:
             result.other_income += k1.other_income
-            lines.append(LineItem("Schedule E", "K-1 Box 11",
-                                  f"Other income from {k1.partnership_name}",
-                                  round(k1.other_income, 2)))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 11",
+                                      f"Other income from {k1.partnership_name}",
+                                      round(k1.other_income, 2)))
 
         # Box 12: Section 179 deduction
         if k1.section_179_deduction != 0:
             result.section_179_deduction += k1.section_179_deduction
-            lines.append(LineItem("Schedule E", "K-1 Box 12",
-                                  f"§179 deduction from {k1.partnership_name}",
-                                  round(k1.section_179_deduction, 2)))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 12",
+                                      f"§179 deduction from {k1.partnership_name}",
+                                      round(k1.section_179_deduction, 2)))
 
         # Box 13: Other deductions
         if k1.other_deductions != 0:
             result.other_deductions += k1.other_deductions
-            lines.append(LineItem("Schedule E", "K-1 Box 13",
-                                  f"Other deductions from {k1.partnership_name}",
-                                  round(k1.other_deductions, 2)))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 13",
+                                      f"Other deductions from {k1.partnership_name}",
+                                      round(k1.other_deductions, 2)))
 
         # Box 14: Self-employment earnings
         if k1.self_employment_earnings != 0:
             result.se_earnings_from_k1 += k1.self_employment_earnings
-            lines.append(LineItem("Schedule E", "K-1 Box 14",
-                                  f"SE earnings from {k1.partnership_name}",
-                                  round(k1.self_employment_earnings, 2),
-                                  "Added to Schedule SE calculation"))
+            if explain:
+                lines.append(LineItem("Schedule E", "K-1 Box 14",
+                                      f"SE earnings from {k1.partnership_name}",
+                                      round(k1.self_employment_earnings, 2),
+                                      "Added to Schedule SE calculation"))
 
     # Total Schedule E income for Schedule 1
     # Excludes dividends/cap gains (they flow to Lines 3b/7 directly)
@@ -688,16 +854,18 @@ def calculate_schedule_e(profile: TaxpayerProfile) -> ScheduleEResult:
         + result.capital_gains + result.royalties + result.other_income
         - result.section_179_deduction - result.other_deductions, 2
     )
-    lines.append(LineItem("Schedule E", "26",
-                          "Total Schedule E income",
-                          result.total_schedule_e_income))
+    if explain:
+        lines.append(LineItem("Schedule E", "26",
+                              "Total Schedule E income",
+                              result.total_schedule_e_income))
 
     result.lines = lines
     return result
 
 
 def calculate_schedule_d(profile: TaxpayerProfile,
-                         filing_status: FilingStatus) -> ScheduleDResult:
+                         filing_status: FilingStatus,
+                         explain: bool = True) -> ScheduleDResult:
     """Calculate Schedule D (Capital Gains and Losses).
 
     Aggregates capital gains/losses from 1099-B, K-1 Boxes 8/9a/10,
@@ -729,10 +897,10 @@ def calculate_schedule_d(profile: TaxpayerProfile,
     result.net_lt_gain_loss = round(net_lt, 2)
     result.net_capital_gain_loss = round(net_st + net_lt, 2)
 
-    if net_st != 0:
+    if explain and net_st != 0:
         lines.append(LineItem("Schedule D", "7", "Net short-term capital gain/loss",
                               result.net_st_gain_loss))
-    if net_lt != 0:
+    if explain and net_lt != 0:
         lines.append(LineItem("Schedule D", "15", "Net long-term capital gain/loss",
                               result.net_lt_gain_loss))
 
@@ -744,8 +912,9 @@ def calculate_schedule_d(profile: TaxpayerProfile,
         loss_limit = CAPITAL_LOSS_LIMITS.get(filing_status, CAPITAL_LOSS_LIMIT_OTHER)
         result.capital_gain_for_1040 = round(max(net, -loss_limit), 2)
 
-    lines.append(LineItem("Schedule D", "21", "Capital gain/loss for 1040 Line 7",
-                          result.capital_gain_for_1040))
+    if explain:
+        lines.append(LineItem("Schedule D", "21", "Capital gain/loss for 1040 Line 7",
+                              result.capital_gain_for_1040))
 
     result.lines = lines
     return result
@@ -762,6 +931,7 @@ def calculate_qbi_deduction(
     k1_ubia: float = 0.0,
     net_capital_gain: float = 0.0,
     business_adjustments: float = 0.0,
+    explain: bool = True,
 ) -> Form8995Result:
     """Calculate QBI deduction (Form 8995/8995-A).
 
@@ -802,23 +972,25 @@ def calculate_qbi_deduction(
     total_ubia = ubia + k1_ubia
     result.total_qbi = total_qbi
 
-    qbi_source = "Schedule C businesses"
-    if k1_qbi > 0:
-        qbi_source += f" + K-1 QBI (${k1_qbi:,.2f})"
-    if business_adjustments > 0:
-        qbi_source += (
-            f", reduced by allocable adjustments "
-            f"(${business_adjustments:,.2f})"
-        )
-    lines.append(LineItem("Form 8995", "1-3",
-                          "Total qualified business income",
-                          round(total_qbi, 2),
-                          f"Sum of net profit from {qbi_source}"))
+    if explain:
+        qbi_source = "Schedule C businesses"
+        if k1_qbi > 0:
+            qbi_source += f" + K-1 QBI (${k1_qbi:,.2f})"
+        if business_adjustments > 0:
+            qbi_source += (
+                f", reduced by allocable adjustments "
+                f"(${business_adjustments:,.2f})"
+            )
+        lines.append(LineItem("Form 8995", "1-3",
+                              "Total qualified business income",
+                              round(total_qbi, 2),
+                              f"Sum of net profit from {qbi_source}"))
 
     if total_qbi <= 0:
-        lines.append(LineItem("Form 8995", "—",
-                              "No QBI deduction (QBI is zero or negative)",
-                              0.0))
+        if explain:
+            lines.append(LineItem("Form 8995", "—",
+                                  "No QBI deduction (QBI is zero or negative)",
+                                  0.0))
         result.lines = lines
         return result
 
@@ -837,12 +1009,13 @@ def calculate_qbi_deduction(
         result.qbi_deduction = round(qbi_deduction, 2)
         result.is_limited = False
 
-        lines.append(LineItem("Form 8995", "10",
-                              "QBI deduction (20% of QBI)",
-                              result.qbi_deduction,
-                              f"Below {filing_status.value.upper()} threshold of "
-                              f"${threshold:,}. 20% × ${total_qbi:,.2f} = "
-                              f"${total_qbi * QBI_DEDUCTION_RATE:,.2f}"))
+        if explain:
+            lines.append(LineItem("Form 8995", "10",
+                                  "QBI deduction (20% of QBI)",
+                                  result.qbi_deduction,
+                                  f"Below {filing_status.value.upper()} threshold of "
+                                  f"${threshold:,}. 20% × ${total_qbi:,.2f} = "
+                                  f"${total_qbi * QBI_DEDUCTION_RATE:,.2f}"))
     else:
         # Above threshold — W-2 wage / UBIA limitations (Bug 2 fix)
         result.is_limited = True
@@ -861,16 +1034,17 @@ def calculate_qbi_deduction(
         qbi_deduction = full_amount - (full_amount - limited_amount) * phase_out_pct
 
         result.qbi_deduction = round(max(qbi_deduction, 0.0), 2)
-        lines.append(LineItem("Form 8995-A", "16",
-                              "QBI deduction (limited)",
-                              result.qbi_deduction,
-                              f"Above threshold. Taxable income "
-                              f"${taxable_income_before_qbi:,.2f} exceeds "
-                              f"${threshold:,} by ${excess:,.2f}. "
-                              f"Phase-out: {phase_out_pct:.1%}. "
-                              f"W-2 wages: ${total_w2_wages:,.2f}, "
-                              f"UBIA: ${total_ubia:,.2f}, "
-                              f"Wage limit: ${wage_limit:,.2f}."))
+        if explain:
+            lines.append(LineItem("Form 8995-A", "16",
+                                  "QBI deduction (limited)",
+                                  result.qbi_deduction,
+                                  f"Above threshold. Taxable income "
+                                  f"${taxable_income_before_qbi:,.2f} exceeds "
+                                  f"${threshold:,} by ${excess:,.2f}. "
+                                  f"Phase-out: {phase_out_pct:.1%}. "
+                                  f"W-2 wages: ${total_w2_wages:,.2f}, "
+                                  f"UBIA: ${total_ubia:,.2f}, "
+                                  f"Wage limit: ${wage_limit:,.2f}."))
 
     result.lines = lines
     return result
@@ -878,21 +1052,12 @@ def calculate_qbi_deduction(
 
 def calculate_income_tax(taxable_income: float,
                          brackets: Optional[list[tuple]] = None) -> float:
-    """Calculate federal income tax using progressive brackets."""
-    if brackets is None:
-        brackets = MFS_BRACKETS
-
-    tax = 0.0
-    prev_bound = 0
+    """Calculate federal income tax using progressive brackets.
 
-    for upper_bound, rate in brackets:
-        if taxable_income <= prev_bound:
-            break
-        taxable_in_bracket = min(taxable_income, upper_bound) - prev_bound
-        tax += taxable_in_bracket * rate
-        prev_bound = upper_bound
-
-    return round(tax, 2)
+    Looks the income up in the compiled BracketTable for the list
+    (bisect over bracket lower bounds) instead of walking every bracket.
+    """
+    return bracket_table(brackets).tax(taxable_income)
 
 
 def calculate_tax_with_qdcg_worksheet(
@@ -911,8 +1076,8 @@ def calculate_tax_with_qdcg_worksheet(
     Based on IRS Form 1040 Instructions, "Qualified Dividends and Capital
     Gain Tax Worksheet" (line 16).
     """
-    brackets = BRACKETS_BY_STATUS.get(filing_status, MFS_BRACKETS)
-    regular_tax = calculate_income_tax(taxable_income, brackets)
+    table = BRACKET_TABLES.get(filing_status, BRACKET_TABLES[FilingStatus.MFS])
+    regular_tax = table.tax(taxable_income)
 
     if taxable_income <= 0:
         return 0.0
@@ -930,7 +1095,7 @@ def calculate_tax_with_qdcg_worksheet(
 
     # Ordinary income portion (taxed at regular brackets)
     ordinary_portion = max(taxable_income - preferential_income, 0)
-    ordinary_tax = calculate_income_tax(ordinary_portion, brackets)
+    ordinary_tax = table.tax(ordinary_portion)
 
     # Stack preferential income on top of ordinary income
     # and apply 0%/15%/20% rates based on total taxable income thresholds
@@ -997,6 +1162,7 @@ def calculate_amt(
     filing_status: FilingStatus,
     salt_deduction: float = 0.0,
     other_amt_adjustments: float = 0.0,
+    explain: bool = True,
 ) -> Form6251Result:
     """Calculate Alternative Minimum Tax (Form 6251).
 
@@ -1011,8 +1177,9 @@ def calculate_amt(
     # AMTI
     amti = taxable_income + salt_deduction + other_amt_adjustments
     result.amti = round(amti, 2)
-    lines.append(LineItem("Form 6251", "7", "AMTI",
-                          result.amti))
+    if explain:
+        lines.append(LineItem("Form 6251", "7", "AMTI",
+                              result.amti))
 
     # Exemption with phaseout
     base_exemption = AMT_EXEMPTIONS.get(filing_status, AMT_EXEMPTION_MFS)
@@ -1025,8 +1192,9 @@ def calculate_amt(
         exemption = max(base_exemption - reduction, 0)
 
     result.exemption = round(exemption, 2)
-    lines.append(LineItem("Form 6251", "13", "AMT exemption",
-                          result.exemption))
+    if explain:
+        lines.append(LineItem("Form 6251", "13", "AMT exemption",
+                              result.exemption))
 
     # AMT taxable excess
     amt_taxable = max(amti - exemption, 0)
@@ -1039,13 +1207,15 @@ def calculate_amt(
         tmt = breakpoint * AMT_RATE_LOW + (amt_taxable - breakpoint) * AMT_RATE_HIGH
 
     result.tentative_minimum_tax = round(tmt, 2)
-    lines.append(LineItem("Form 6251", "14", "Tentative minimum tax",
-                          result.tentative_minimum_tax))
+    if explain:
+        lines.append(LineItem("Form 6251", "14", "Tentative minimum tax",
+                              result.tentative_minimum_tax))
 
     # AMT = max(TMT - regular tax, 0)
     result.amt = round(max(tmt - regular_tax, 0), 2)
-    lines.append(LineItem("Form 6251", "15", "AMT",
-                          result.amt))
+    if explain:
+        lines.append(LineItem("Form 6251", "15", "AMT",
+                              result.amt))
 
     result.lines = lines
     return result
@@ -1056,6 +1226,7 @@ def calculate_tax_credits(
     agi: float,
     tax_liability: float,
     earned_income: float,
+    explain: bool = True,
 ) -> TaxCreditsResult:
     """Calculate CTC, ACTC, and ODC.
 
@@ -1084,10 +1255,11 @@ def calculate_tax_credits(
     result.gross_odc = len(other_dependents) * ODC_AMOUNT
     gross_total = result.gross_ctc + result.gross_odc
 
-    lines.append(LineItem("Schedule 8812", "4",
-                          f"CTC: {len(qualifying_children)} children × ${CTC_AMOUNT_PER_CHILD:,}",
-                          result.gross_ctc))
-    if result.gross_odc > 0:
+    if explain:
+        lines.append(LineItem("Schedule 8812", "4",
+                              f"CTC: {len(qualifying_children)} children × ${CTC_AMOUNT_PER_CHILD:,}",
+                              result.gross_ctc))
+    if explain and result.gross_odc > 0:
         lines.append(LineItem("Schedule 8812", "5",
                               f"ODC: {len(other_dependents)} dependents × ${ODC_AMOUNT}",
                               result.gross_odc))
@@ -1104,9 +1276,10 @@ def calculate_tax_credits(
 
     # Nonrefundable portion: limited to tax liability
     result.nonrefundable_credit = min(result.total_credit_after_phaseout, tax_liability)
-    lines.append(LineItem("Schedule 8812", "14",
-                          "Nonrefundable credit",
-                          result.nonrefundable_credit))
+    if explain:
+        lines.append(LineItem("Schedule 8812", "14",
+                              "Nonrefundable credit",
+                              result.nonrefundable_credit))
 
     # ACTC refundable: only for CTC (not ODC)
     unused_ctc = max(
@@ -1117,7 +1290,7 @@ def calculate_tax_credits(
         actc_per_child_cap = len(qualifying_children) * ACTC_REFUNDABLE_PER_CHILD
         earned_income_amount = max(earned_income - ACTC_EARNED_INCOME_THRESHOLD, 0) * ACTC_EARNED_INCOME_RATE
         result.refundable_actc = round(min(unused_ctc, actc_per_child_cap, earned_income_amount), 2)
-        if result.refundable_actc > 0:
+        if explain and result.refundable_actc > 0:
             lines.append(LineItem("Schedule 8812", "27",
                                   "Additional Child Tax Credit (refundable)",
                                   result.refundable_actc))
@@ -1133,6 +1306,7 @@ def evaluate_feie(
     earned_income: float,
     gross_receipts: float = 0.0,
     se_deduction: float = 0.0,
+    explain: bool = True,
 ) -> Form2555Result:
     """Evaluate whether the Foreign Earned Income Exclusion is beneficial.
 
@@ -1155,6 +1329,7 @@ def evaluate_feie(
         earned_income: Net earned income (Schedule C net profits)
         gross_receipts: Gross Schedule C receipts (for day-based allocation)
         se_deduction: Deductible part of SE tax (1/2 SE tax)
+        explain: Build the Form 2555 line items (False: numbers only)
     """
     result = Form2555Result()
     lines = []
@@ -1167,13 +1342,14 @@ def evaluate_feie(
     days_abroad = profile.days_in_foreign_country_2025
     qualifies = days_abroad >= 330
 
-    lines.append(LineItem("Form 2555", "Physical Presence",
-                          f"Days in foreign country: {days_abroad}",
-                          float(days_abroad),
-                          f"Need 330 full days in 12-month period. "
-                          f"{'QUALIFIES' if qualifies else 'DOES NOT QUALIFY'}. "
-                          f"Note: test is any 12-month period overlapping the "
-                          f"tax year, not just calendar year."))
+    if explain:
+        lines.append(LineItem("Form 2555", "Physical Presence",
+                              f"Days in foreign country: {days_abroad}",
+                              float(days_abroad),
+                              f"Need 330 full days in 12-month period. "
+                              f"{'QUALIFIES' if qualifies else 'DOES NOT QUALIFY'}. "
+                              f"Note: test is any 12-month period overlapping the "
+                              f"tax year, not just calendar year."))
 
     if not qualifies:
         result.is_beneficial = False
@@ -1194,22 +1370,24 @@ def evaluate_feie(
     result.us_earned_income = us_earned
     result.foreign_earned_income = foreign_earned
 
-    lines.append(LineItem("Form 2555", "20a",
-                          "Foreign earned income allocation",
-                          foreign_earned,
-                          f"Gross earned income: ${gross:,.2f}. "
-                          f"US business days: {us_biz_days}/{total_days}. "
-                          f"US-earned: ${us_earned:,.2f}. "
-                          f"Foreign-earned: ${foreign_earned:,.2f}"))
+    if explain:
+        lines.append(LineItem("Form 2555", "20a",
+                              "Foreign earned income allocation",
+                              foreign_earned,
+                              f"Gross earned income: ${gross:,.2f}. "
+                              f"US business days: {us_biz_days}/{total_days}. "
+                              f"US-earned: ${us_earned:,.2f}. "
+                              f"Foreign-earned: ${foreign_earned:,.2f}"))
 
     # Exclusion amount (Line 42) — lesser of foreign earned or limit
     exclusion = min(foreign_earned, FEIE_EXCLUSION_LIMIT)
     result.exclusion_amount = exclusion
-    lines.append(LineItem("Form 2555", "42",
-                          "Foreign earned income exclusion",
-                          round(exclusion, 2),
-                          f"Lesser of foreign earned ${foreign_earned:,.2f} "
-                          f"or limit ${FEIE_EXCLUSION_LIMIT:,}"))
+    if explain:
+        lines.append(LineItem("Form 2555", "42",
+                              "Foreign earned income exclusion",
+                              round(exclusion, 2),
+                              f"Lesser of foreign earned ${foreign_earned:,.2f} "
+                              f"or limit ${FEIE_EXCLUSION_LIMIT:,}"))
 
     # Allocable deductions (Line 44)
     # Per Form 2555: deductions allocable to excluded income =
@@ -1227,22 +1405,23 @@ def evaluate_feie(
     net_exclusion = round(exclusion - allocable_deductions, 2)
     result.net_exclusion = net_exclusion
 
-    lines.append(LineItem("Form 2555", "44-45",
-                          "Allocable deductions and net exclusion",
-                          net_exclusion,
-                          f"Total deductions: ${total_deductions:,.2f} "
-                          f"(1/2 SE ${se_deduction:,.2f} + "
-                          f"Sch C expenses ${max(schedule_c_expenses, 0):,.2f}). "
-                          f"Allocable ratio: {alloc_ratio:.4f}. "
-                          f"Allocable deductions (Line 44): "
-                          f"${allocable_deductions:,.2f}. "
-                          f"Net exclusion (Line 45): ${net_exclusion:,.2f}"))
+    if explain:
+        lines.append(LineItem("Form 2555", "44-45",
+                              "Allocable deductions and net exclusion",
+                              net_exclusion,
+                              f"Total deductions: ${total_deductions:,.2f} "
+                              f"(1/2 SE ${se_deduction:,.2f} + "
+                              f"Sch C expenses ${max(schedule_c_expenses, 0):,.2f}). "
+                              f"Allocable ratio: {alloc_ratio:.4f}. "
+                              f"Allocable deductions (Line 44): "
+                              f"${allocable_deductions:,.2f}. "
+                              f"Net exclusion (Line 45): ${net_exclusion:,.2f}"))
 
     # Stacking method: use actual taxable income, not raw earned income
     # Tax on full taxable income (already computed as tax_without_feie)
     # Tax on excluded portion (at the bottom of the bracket stack)
-    brackets = BRACKETS_BY_STATUS.get(profile.filing_status, MFS_BRACKETS)
-    tax_on_excluded = calculate_income_tax(exclusion, brackets)
+    table = BRACKET_TABLES.get(profile.filing_status, BRACKET_TABLES[FilingStatus.MFS])
+    tax_on_excluded = table.tax(exclusion)
     tax_with_feie = max(tax_without_feie - tax_on_excluded, 0)
 
     result.tax_with_feie = round(tax_with_feie, 2)
@@ -1250,25 +1429,72 @@ def evaluate_feie(
     result.savings = round(tax_without_feie - tax_with_feie, 2)
     result.is_beneficial = result.savings > 0
 
-    lines.append(LineItem("Form 2555", "Analysis",
-                          "Tax comparison",
-                          result.savings,
-                          f"Tax WITHOUT FEIE: ${tax_without_feie:,.2f}\n"
-                          f"Tax WITH FEIE: ${tax_with_feie:,.2f}\n"
-                          f"Income tax savings: ${result.savings:,.2f}\n"
-                          f"Note: SE tax is UNCHANGED by FEIE.\n"
-                          f"{'BENEFICIAL' if result.is_beneficial else 'NOT BENEFICIAL'}"))
+    if explain:
+        lines.append(LineItem("Form 2555", "Analysis",
+                              "Tax comparison",
+                              result.savings,
+                              f"Tax WITHOUT FEIE: ${tax_without_feie:,.2f}\n"
+                              f"Tax WITH FEIE: ${tax_with_feie:,.2f}\n"
+                              f"Income tax savings: ${result.savings:,.2f}\n"
+                              f"Note: SE tax is UNCHANGED by FEIE.\n"
+                              f"{'BENEFICIAL' if result.is_beneficial else 'NOT BENEFICIAL'}"))
 
     result.lines = lines
     return result
 
 
+# =============================================================================
+# Schedule Providers
+# =============================================================================
+
+class ScheduleCalculator:
+    """Computes the schedule results calculate_return() assembles.
+
+    calculate_return() asks this object for every Schedule C, E, D, SE
+    and Form 8995 result. The base class computes each one from scratch;
+    taxman.incremental.IncrementalReturn overrides the methods to hand
+    back results whose inputs have not changed since the last run.
+    """
+
+    def schedule_c(self, biz: ScheduleCData,
+                   explain: bool = True) -> ScheduleCResult:
+        return calculate_schedule_c(biz, explain=explain)
+
+    def schedule_e(self, profile: TaxpayerProfile,
+                   explain: bool = True) -> ScheduleEResult:
+        return calculate_schedule_e(profile, explain=explain)
+
+    def schedule_d(self, profile: TaxpayerProfile,
+                   filing_status: FilingStatus,
+                   explain: bool = True) -> ScheduleDResult:
+        return calculate_schedule_d(profile, filing_status, explain=explain)
+
+    def schedule_se(self, net_se_income: float, w2_ss_wages: float = 0.0,
+                    explain: bool = True) -> ScheduleSEResult:
+        return calculate_schedule_se(net_se_income, w2_ss_wages=w2_ss_wages,
+                                     explain=explain)
+
+    def qbi(self, taxable_income_before_qbi: float,
+            schedule_c_results: list[ScheduleCResult],
+            filing_status: FilingStatus, **kwargs) -> Form8995Result:
+        return calculate_qbi_deduction(
+            taxable_income_before_qbi, schedule_c_results, filing_status, **kwargs
+        )
+
+
+_FROM_SCRATCH = ScheduleCalculator()
+
+
 # =============================================================================
 # Master Calculation — Builds the Full Return
 # =============================================================================
 
 def _apply_schedule_c(
-    profile: TaxpayerProfile, result: Form1040Result, lines: list[LineItem]
+    profile: TaxpayerProfile,
+    result: Form1040Result,
+    lines: list[LineItem],
+    schedules: ScheduleCalculator = _FROM_SCRATCH,
+    explain: bool = True,
 ) -> float:
     """Compute Schedule C for each business and return total business income.
 
@@ -1285,13 +1511,14 @@ def _apply_schedule_c(
 
     total_business_income = 0.0
     for biz in businesses:
-        sc = calculate_schedule_c(biz)
+        sc = schedules.schedule_c(biz, explain=explain)
         result.schedule_c_results.append(sc)
         total_business_income += sc.net_profit_loss
-        lines.append(LineItem("Schedule 1", "3",
-                              f"Business income: {biz.business_name}",
-                              sc.net_profit_loss,
-                              "From Schedule C, Line 31"))
+        if explain:
+            lines.append(LineItem("Schedule 1", "3",
+                                  f"Business income: {biz.business_name}",
+                                  sc.net_profit_loss,
+                                  "From Schedule C, Line 31"))
     return total_business_income
 
 
@@ -1300,11 +1527,13 @@ def _apply_adjustments(
     result: Form1040Result,
     total_business_income: float,
     lines: list[LineItem],
+    explain: bool = True,
 ) -> float:
     """Schedule 1 Part II adjustments to income.
 
     Sets result.adjustments and returns the portion allocable to
-    Schedule C QBI (deductible SE tax + SE health insurance).
+    Schedule C QBI (deductible SE tax + SEP contribution + SE health
+    insurance).
     """
     adjustments = 0.0
     qbi_business_adjustments = 0.0
@@ -1314,33 +1543,53 @@ def _apply_adjustments(
         adj_se = result.schedule_se.deductible_se_tax
         adjustments += adj_se
         qbi_business_adjustments += adj_se
-        lines.append(LineItem("Schedule 1", "15",
-                              "Deductible part of self-employment tax",
-                              adj_se))
+        if explain:
+            lines.append(LineItem("Schedule 1", "15",
+                                  "Deductible part of self-employment tax",
+                                  adj_se))
+
+    # Self-employed SEP-IRA contribution, limited per Pub 560
+    sep_deduction = 0.0
+    if profile.sep_ira_contribution > 0:
+        se_tax_deduction = result.schedule_se.deductible_se_tax if result.schedule_se else 0
+        sep_limit = calculate_sep_limit(total_business_income, se_tax_deduction)
+        sep_deduction = round(min(profile.sep_ira_contribution, sep_limit), 2)
+        adjustments += sep_deduction
+        qbi_business_adjustments += sep_deduction
+        if explain:
+            lines.append(LineItem("Schedule 1", "16",
+                                  "Self-employed SEP, SIMPLE, and qualified plans",
+                                  sep_deduction,
+                                  f"Contribution ${profile.sep_ira_contribution:,.2f}, "
+                                  f"limited to ${sep_limit:,.2f} (20% of net SE "
+                                  f"earnings, max ${SEP_CONTRIBUTION_LIMIT:,})"))
 
     # Self-employed health insurance deduction
     # Per Form 7206 / Pub 535: limited to net profit from the business
     # under which the plan is established, minus the deductible SE tax
+    # and retirement plan contributions
     if profile.health_insurance and profile.health_insurance.total_premiums > 0:
         se_tax_deduction = result.schedule_se.deductible_se_tax if result.schedule_se else 0
-        max_health = max(total_business_income - se_tax_deduction, 0)
+        max_health = max(total_business_income - se_tax_deduction - sep_deduction, 0)
         health_deduction = round(min(
             profile.health_insurance.total_premiums,
             max_health,
         ), 2)
         adjustments += health_deduction
         qbi_business_adjustments += health_deduction
-        lines.append(LineItem("Schedule 1", "17",
-                              "Self-employed health insurance deduction",
-                              health_deduction,
-                              f"100% of premiums (${profile.health_insurance.total_premiums:,.2f}), "
-                              f"limited to net SE income minus deductible SE tax "
-                              f"(${max_health:,.2f})"))
+        if explain:
+            lines.append(LineItem("Schedule 1", "17",
+                                  "Self-employed health insurance deduction",
+                                  health_deduction,
+                                  f"100% of premiums (${profile.health_insurance.total_premiums:,.2f}), "
+                                  f"limited to net SE income minus deductible SE tax "
+                                  f"(${max_health:,.2f})"))
 
     result.adjustments = round(adjustments, 2)
-    lines.append(LineItem("Form 1040", "10",
-                          "Adjustments to income",
-                          result.adjustments))
+    if explain:
+        lines.append(LineItem("Form 1040", "10",
+                              "Adjustments to income",
+                              result.adjustments))
     return qbi_business_adjustments
 
 
@@ -1351,6 +1600,7 @@ def _apply_other_taxes(
     fs: FilingStatus,
     lines: list[LineItem],
     feie_addback: float = 0.0,
+    explain: bool = True,
 ) -> None:
     """Schedule 2 taxes: Additional Medicare Tax, NIIT, and AMT.
 
@@ -1369,7 +1619,7 @@ def _apply_other_taxes(
         result.additional_medicare = calculate_additional_medicare(
             combined_medicare_earnings, fs
         )
-        if result.additional_medicare > 0:
+        if explain and result.additional_medicare > 0:
             lines.append(LineItem("Schedule 2", "23",
                                   "Additional Medicare Tax (0.9%)",
                                   result.additional_medicare,
@@ -1382,7 +1632,7 @@ def _apply_other_taxes(
         result.niit = calculate_niit(
             net_investment_income, result.agi + feie_addback, fs
         )
-        if result.niit > 0:
+        if explain and result.niit > 0:
             lines.append(LineItem("Schedule 2", "18",
                                   "Net Investment Income Tax (3.8%)",
                                   result.niit,
@@ -1393,11 +1643,11 @@ def _apply_other_taxes(
     if salt_for_amt > 0:
         amt_result = calculate_amt(
             result.taxable_income, result.tax, fs,
-            salt_deduction=salt_for_amt,
+            salt_deduction=salt_for_amt, explain=explain,
         )
         result.amt = amt_result.amt
         result.form_6251 = amt_result
-        if result.amt > 0:
+        if explain and result.amt > 0:
             lines.append(LineItem("Schedule 2", "1",
                                   "Alternative Minimum Tax",
                                   result.amt))
@@ -1409,6 +1659,7 @@ def _apply_credits(
     wages: float,
     total_business_income: float,
     lines: list[LineItem],
+    explain: bool = True,
 ) -> float:
     """Child tax credits (CTC/ODC/ACTC). Returns the refundable ACTC."""
     # Earned income for ACTC: wages + SE income
@@ -1420,11 +1671,12 @@ def _apply_credits(
     if profile.dependents:
         credits_result = calculate_tax_credits(
             profile, result.agi, tax_before_credits, earned_income_for_credits,
+            explain=explain,
         )
         result.tax_credits = credits_result
         result.nonrefundable_credits = credits_result.nonrefundable_credit
         refundable_actc = credits_result.refundable_actc
-        if result.nonrefundable_credits > 0:
+        if explain and result.nonrefundable_credits > 0:
             lines.append(LineItem("Form 1040", "19",
                                   "Nonrefundable credits (CTC/ODC)",
                                   result.nonrefundable_credits))
@@ -1436,6 +1688,7 @@ def _apply_payments(
     result: Form1040Result,
     refundable_actc: float,
     lines: list[LineItem],
+    explain: bool = True,
 ) -> None:
     """Withholding, estimated payments, and refund or amount owed."""
     # Federal income tax withheld (Line 25)
@@ -1448,13 +1701,13 @@ def _apply_payments(
         + sum(f.federal_tax_withheld for f in profile.forms_1099_r)
     )
     result.withholding = round(w2_withholding + form_1099_withholding, 2)
-    if result.withholding > 0:
+    if explain and result.withholding > 0:
         lines.append(LineItem("Form 1040", "25a",
                               "Federal income tax withheld",
                               result.withholding))
 
     result.estimated_payments = profile.total_estimated_payments
-    if result.estimated_payments > 0:
+    if explain and result.estimated_payments > 0:
         lines.append(LineItem("Form 1040", "26",
                               "Estimated tax payments",
                               result.estimated_payments))
@@ -1462,27 +1715,32 @@ def _apply_payments(
     result.total_payments = round(
         result.withholding + result.estimated_payments + refundable_actc, 2
     )
-    if refundable_actc > 0:
+    if explain and refundable_actc > 0:
         lines.append(LineItem("Form 1040", "28",
                               "Additional Child Tax Credit (refundable)",
                               refundable_actc))
-    lines.append(LineItem("Form 1040", "33", "Total payments",
-                          result.total_payments))
+    if explain:
+        lines.append(LineItem("Form 1040", "33", "Total payments",
+                              result.total_payments))
 
     # Refund or amount owed
     if result.total_payments > result.total_tax:
         result.overpayment = round(result.total_payments - result.total_tax, 2)
-        lines.append(LineItem("Form 1040", "34", "Overpaid",
-                              result.overpayment))
+        if explain:
+            lines.append(LineItem("Form 1040", "34", "Overpaid",
+                                  result.overpayment))
     else:
         result.amount_owed = round(result.total_tax - result.total_payments, 2)
-        lines.append(LineItem("Form 1040", "37", "Amount you owe",
-                              result.amount_owed))
+        if explain:
+            lines.append(LineItem("Form 1040", "37", "Amount you owe",
+                                  result.amount_owed))
 
 
 def calculate_return(
     profile: TaxpayerProfile,
     feie: Optional[Form2555Result] = None,
+    schedules: Optional[ScheduleCalculator] = None,
+    explain: bool = True,
 ) -> Form1040Result:
     """Calculate the complete federal tax return.
 
@@ -1494,13 +1752,23 @@ def calculate_return(
     Line 8d — reducing total income, AGI, and taxable income — and
     Line 16 tax is computed with the Foreign Earned Income Tax
     Worksheet (stacking method). SE tax is unchanged by FEIE.
+
+    schedules supplies the Schedule C/E/D/SE and Form 8995 results
+    (see ScheduleCalculator); by default each is computed from scratch.
+
+    explain=False is the numbers-only mode for callers that need totals
+    (batch runs, optimizer searches): no LineItem or explanation string
+    is built, so every `lines` list — here and on each schedule result —
+    stays empty. explain_return() rebuilds them for the same inputs.
     """
+    schedules = schedules or _FROM_SCRATCH
     result = Form1040Result()
     lines = []
     fs = profile.filing_status
 
     # ─── SCHEDULE C (for each business) ─────────────────────────
-    total_business_income = _apply_schedule_c(profile, result, lines)
+    total_business_income = _apply_schedule_c(profile, result, lines, schedules,
+                                               explain=explain)
 
     # ─── SCHEDULE E (Rental + K-1 income) ────────────────────────
     sch_e = None
@@ -1509,7 +1777,7 @@ def calculate_return(
     net_investment_income = 0.0
 
     if profile.schedule_k1s or profile.schedule_e_properties:
-        sch_e = calculate_schedule_e(profile)
+        sch_e = schedules.schedule_e(profile, explain=explain)
         result.schedule_e = sch_e
 
         # K-1 SE earnings (Box 14 / guaranteed payments) feed into SE tax
@@ -1559,7 +1827,7 @@ def calculate_return(
     )
     sch_d = None
     if has_cap_activity:
-        sch_d = calculate_schedule_d(profile, fs)
+        sch_d = schedules.schedule_d(profile, fs, explain=explain)
         result.schedule_d = sch_d
         result.capital_gain_loss = sch_d.capital_gain_for_1040
         # Subtract K-1 capital gains from k1_other_income (they flow through Sch D)
@@ -1581,7 +1849,8 @@ def calculate_return(
     # W-2 SS wages reduce the remaining SS wage base for SE tax
     w2_ss_wages = sum(w2.ss_wages for w2 in profile.forms_w2)
     if total_se_income >= SE_MINIMUM_INCOME:
-        se = calculate_schedule_se(total_se_income, w2_ss_wages=w2_ss_wages)
+        se = schedules.schedule_se(total_se_income, w2_ss_wages=w2_ss_wages,
+                                   explain=explain)
         result.schedule_se = se
         result.se_tax = se.se_tax
 
@@ -1589,7 +1858,7 @@ def calculate_return(
     # W-2 wage income (Line 1a)
     wages = sum(w2.wages for w2 in profile.forms_w2)
     result.wage_income = round(wages, 2)
-    if wages > 0:
+    if explain and wages > 0:
         lines.append(LineItem("Form 1040", "1a", "Wages, salaries, tips",
                               result.wage_income))
 
@@ -1597,37 +1866,37 @@ def calculate_return(
     ira_gross = sum(f.gross_distribution for f in profile.forms_1099_r)
     ira_taxable = sum(f.taxable_amount for f in profile.forms_1099_r)
     result.ira_distributions = round(ira_taxable, 2)
-    if ira_gross > 0:
+    if explain and ira_gross > 0:
         lines.append(LineItem("Form 1040", "4a", "IRA distributions (gross)",
                               round(ira_gross, 2)))
-    if ira_taxable > 0:
+    if explain and ira_taxable > 0:
         lines.append(LineItem("Form 1040", "4b", "IRA distributions (taxable)",
                               result.ira_distributions))
 
     # Lines 2a/2b
-    if result.tax_exempt_interest > 0:
+    if explain and result.tax_exempt_interest > 0:
         lines.append(LineItem("Form 1040", "2a", "Tax-exempt interest",
                               result.tax_exempt_interest))
-    if result.taxable_interest > 0:
+    if explain and result.taxable_interest > 0:
         lines.append(LineItem("Form 1040", "2b", "Taxable interest",
                               result.taxable_interest))
 
     # Lines 3a/3b
-    if result.qualified_dividends > 0:
+    if explain and result.qualified_dividends > 0:
         lines.append(LineItem("Form 1040", "3a", "Qualified dividends",
                               result.qualified_dividends))
-    if result.ordinary_dividends > 0:
+    if explain and result.ordinary_dividends > 0:
         lines.append(LineItem("Form 1040", "3b", "Ordinary dividends",
                               result.ordinary_dividends))
 
     # Line 7
-    if result.capital_gain_loss != 0:
+    if explain and result.capital_gain_loss != 0:
         lines.append(LineItem("Form 1040", "7", "Capital gain or (loss)",
                               result.capital_gain_loss))
 
     # Schedule 1 income: business + K-1 (non-investment portions) − NOL
     schedule_1_income = total_business_income + k1_other_income
-    if sch_e and k1_other_income != 0:
+    if explain and sch_e and k1_other_income != 0:
         lines.append(LineItem("Schedule 1", "5",
                               "Rental real estate, partnerships (Schedule E)",
                               round(k1_other_income, 2),
@@ -1638,49 +1907,55 @@ def calculate_return(
     nol = profile.nol_carryforward
     if nol > 0:
         schedule_1_income -= nol
-        lines.append(LineItem("Schedule 1", "8a",
-                              "Net operating loss deduction",
-                              round(-nol, 2),
-                              f"NOL carryforward from prior year: ${nol:,.2f}"))
+        if explain:
+            lines.append(LineItem("Schedule 1", "8a",
+                                  "Net operating loss deduction",
+                                  round(-nol, 2),
+                                  f"NOL carryforward from prior year: ${nol:,.2f}"))
 
     # FEIE (Form 2555) — net exclusion as negative on Schedule 1 Line 8d
     if feie and feie.net_exclusion > 0:
         result.feie = feie
         schedule_1_income -= feie.net_exclusion
-        lines.append(LineItem("Schedule 1", "8d",
-                              "Foreign earned income exclusion (Form 2555)",
-                              round(-feie.net_exclusion, 2),
-                              f"Form 2555 Line 45: ${feie.net_exclusion:,.2f}"))
+        if explain:
+            lines.append(LineItem("Schedule 1", "8d",
+                                  "Foreign earned income exclusion (Form 2555)",
+                                  round(-feie.net_exclusion, 2),
+                                  f"Form 2555 Line 45: ${feie.net_exclusion:,.2f}"))
 
     result.schedule_1_income = round(schedule_1_income, 2)
-    lines.append(LineItem("Form 1040", "8",
-                          "Other income (Schedule 1)",
-                          result.schedule_1_income))
+    if explain:
+        lines.append(LineItem("Form 1040", "8",
+                              "Other income (Schedule 1)",
+                              result.schedule_1_income))
 
     result.total_income = round(
         wages + ira_taxable + taxable_interest + ordinary_dividends
         + result.capital_gain_loss + schedule_1_income, 2
     )
-    lines.append(LineItem("Form 1040", "9", "Total income",
-                          result.total_income))
+    if explain:
+        lines.append(LineItem("Form 1040", "9", "Total income",
+                              result.total_income))
 
     # ─── ADJUSTMENTS TO INCOME (Schedule 1, Part II) ───────────
     qbi_business_adjustments = _apply_adjustments(
-        profile, result, total_business_income, lines
+        profile, result, total_business_income, lines, explain=explain
     )
 
     # ─── AGI ───────────────────────────────────────────────────
     result.agi = round(result.total_income - result.adjustments, 2)
-    lines.append(LineItem("Form 1040", "11",
-                          "Adjusted Gross Income (AGI)",
-                          result.agi,
-                          "Total income minus adjustments"))
+    if explain:
+        lines.append(LineItem("Form 1040", "11",
+                              "Adjusted Gross Income (AGI)",
+                              result.agi,
+                              "Total income minus adjustments"))
 
     # ─── DEDUCTIONS ────────────────────────────────────────────
     result.deduction = STANDARD_DEDUCTION[fs.value]
-    lines.append(LineItem("Form 1040", "13a",
-                          f"Standard deduction ({fs.value.upper()})",
-                          result.deduction))
+    if explain:
+        lines.append(LineItem("Form 1040", "13a",
+                              f"Standard deduction ({fs.value.upper()})",
+                              result.deduction))
 
     # ─── QBI DEDUCTION ─────────────────────────────────────────
     # Aggregate K-1 QBI (non-SSTB partnerships only)
@@ -1693,27 +1968,29 @@ def calculate_return(
     qbi_net_cap_gain = (
         max(result.schedule_d.net_capital_gain_loss, 0) if result.schedule_d else 0.0
     ) + qualified_dividends
-    qbi_result = calculate_qbi_deduction(
+    qbi_result = schedules.qbi(
         taxable_before_qbi, result.schedule_c_results, fs,
         k1_qbi=k1_qbi, k1_w2_wages=k1_w2_wages, k1_ubia=k1_ubia,
         net_capital_gain=qbi_net_cap_gain,
-        business_adjustments=qbi_business_adjustments,
+        business_adjustments=qbi_business_adjustments, explain=explain,
     )
     result.qbi = qbi_result
     result.qbi_deduction = qbi_result.qbi_deduction
-    lines.append(LineItem("Form 1040", "13b",
-                          "Qualified business income deduction",
-                          result.qbi_deduction))
+    if explain:
+        lines.append(LineItem("Form 1040", "13b",
+                              "Qualified business income deduction",
+                              result.qbi_deduction))
 
     # ─── TAXABLE INCOME ────────────────────────────────────────
     result.taxable_income = round(max(
         result.agi - result.deduction - result.qbi_deduction, 0
     ), 2)
-    lines.append(LineItem("Form 1040", "15", "Taxable income",
-                          result.taxable_income))
+    if explain:
+        lines.append(LineItem("Form 1040", "15", "Taxable income",
+                              result.taxable_income))
 
     # ─── TAX ───────────────────────────────────────────────────
-    brackets = BRACKETS_BY_STATUS.get(fs, MFS_BRACKETS)
+    table = BRACKET_TABLES.get(fs, BRACKET_TABLES[FilingStatus.MFS])
     net_lt_for_qdcg = sch_d.net_lt_gain_loss if sch_d else 0.0
     net_st_for_qdcg = sch_d.net_st_gain_loss if sch_d else 0.0
     use_qdcg = qualified_dividends > 0 or net_lt_for_qdcg > 0
@@ -1725,14 +2002,14 @@ def calculate_return(
                 taxable, qualified_dividends,
                 net_lt_for_qdcg, net_st_for_qdcg, fs,
             )
-        return calculate_income_tax(taxable, brackets)
+        return table.tax(taxable)
 
     if feie and feie.net_exclusion > 0:
         # Foreign Earned Income Tax Worksheet (1040 Line 16 instructions):
         # tax on (taxable income + exclusion) minus tax on the exclusion,
         # so excluded income still fills the lower brackets
         tax_plus_exclusion = _tax_on(result.taxable_income + feie.net_exclusion)
-        tax_on_exclusion = calculate_income_tax(feie.net_exclusion, brackets)
+        tax_on_exclusion = table.tax(feie.net_exclusion)
         result.tax = round(max(tax_plus_exclusion - tax_on_exclusion, 0), 2)
         tax_method = "Foreign Earned Income Tax Worksheet"
     elif use_qdcg:
@@ -1741,19 +2018,20 @@ def calculate_return(
     else:
         result.tax = _tax_on(result.taxable_income)
         tax_method = f"{fs.value.upper()} tax brackets"
-    lines.append(LineItem("Form 1040", "16", "Tax",
-                          result.tax,
-                          f"From {tax_method}"))
+    if explain:
+        lines.append(LineItem("Form 1040", "16", "Tax",
+                              result.tax,
+                              f"From {tax_method}"))
 
     # ─── OTHER TAXES (Schedule 2) ──────────────────────────────
     _apply_other_taxes(
         profile, result, net_investment_income, fs, lines,
-        feie_addback=feie.net_exclusion if feie else 0.0,
+        feie_addback=feie.net_exclusion if feie else 0.0, explain=explain,
     )
 
     # ─── TAX CREDITS ─────────────────────────────────────────
     refundable_actc = _apply_credits(
-        profile, result, wages, total_business_income, lines
+        profile, result, wages, total_business_income, lines, explain=explain
     )
 
     # ─── EARLY WITHDRAWAL PENALTY (Schedule 2, Line 8) ────────
@@ -1763,10 +2041,11 @@ def calculate_return(
     ), 2)
     if early_penalty > 0:
         result.early_withdrawal_penalty = early_penalty
-        lines.append(LineItem("Schedule 2", "8",
-                              "Early withdrawal penalty (10%)",
-                              early_penalty,
-                              "10% penalty on early distributions (Code 1/2)"))
+        if explain:
+            lines.append(LineItem("Schedule 2", "8",
+                                  "Early withdrawal penalty (10%)",
+                                  early_penalty,
+                                  "10% penalty on early distributions (Code 1/2)"))
 
     # ─── TOTAL TAX ─────────────────────────────────────────────
     result.total_tax = round(
@@ -1775,39 +2054,65 @@ def calculate_return(
         - result.nonrefundable_credits, 2
     )
     result.total_tax = max(result.total_tax, 0)
-    lines.append(LineItem("Form 1040", "24", "Total tax",
-                          result.total_tax,
-                          f"Income tax ${result.tax:,.2f} + "
-                          f"SE tax ${result.se_tax:,.2f} + "
-                          f"Addl Medicare ${result.additional_medicare:,.2f}"
-                          + (f" + NIIT ${result.niit:,.2f}" if result.niit else "")
-                          + (f" + AMT ${result.amt:,.2f}" if result.amt else "")
-                          + (f" + early penalty ${result.early_withdrawal_penalty:,.2f}"
-                             if result.early_withdrawal_penalty else "")
-                          + (f" - credits ${result.nonrefundable_credits:,.2f}"
-                             if result.nonrefundable_credits else "")))
+    if explain:
+        lines.append(LineItem("Form 1040", "24", "Total tax",
+                              result.total_tax,
+                              f"Income tax ${result.tax:,.2f} + "
+                              f"SE tax ${result.se_tax:,.2f} + "
+                              f"Addl Medicare ${result.additional_medicare:,.2f}"
+                              + (f" + NIIT ${result.niit:,.2f}" if result.niit else "")
+                              + (f" + AMT ${result.amt:,.2f}" if result.amt else "")
+                              + (f" + early penalty ${result.early_withdrawal_penalty:,.2f}"
+                                 if result.early_withdrawal_penalty else "")
+                              + (f" - credits ${result.nonrefundable_credits:,.2f}"
+                                 if result.nonrefundable_credits else "")))
 
     # ─── PAYMENTS, REFUND OR AMOUNT OWED ───────────────────────
-    _apply_payments(profile, result, refundable_actc, lines)
+    _apply_payments(profile, result, refundable_actc, lines, explain=explain)
 
     result.lines = lines
     return result
 
 
+def explain_return(
+    result: Form1040Result,
+    profile: TaxpayerProfile,
+    schedules: Optional[ScheduleCalculator] = None,
+) -> Form1040Result:
+    """Rebuild the line items of a numbers-only (explain=False) result.
+
+    Recalculates the return for the same profile and FEIE input with
+    explanations on; the totals are identical, only `lines` are filled.
+    """
+    if result.feie is not None and not result.feie.lines:
+        # A numbers-only Form 2555 evaluation needs the no-FEIE baseline
+        # to rebuild its own lines, so redo the comparison
+        return compare_feie_scenarios(profile, schedules=schedules)["result_with_feie"]
+    return calculate_return(profile, feie=result.feie, schedules=schedules)
+
+
 # =============================================================================
 # Optimization Analysis
 # =============================================================================
 
-def compare_feie_scenarios(profile: TaxpayerProfile) -> dict:
+def compare_feie_scenarios(
+    profile: TaxpayerProfile,
+    schedules: Optional[ScheduleCalculator] = None,
+    explain: bool = True,
+) -> dict:
     """Compare tax outcomes with and without FEIE.
 
     When the exclusion is beneficial, the returned dict includes
     "result_with_feie": a full Form1040Result recalculated with the
     exclusion on Schedule 1 Line 8d — this is the result the forms
-    should be generated from.
+    should be generated from. schedules is passed through to both
+    calculate_return() calls; explain applies to the FEIE evaluation
+    and "result_with_feie" (the no-FEIE baseline is only read for
+    totals, so it is always computed numbers-only).
     """
     # Calculate without FEIE
-    result_no_feie = calculate_return(profile)
+    result_no_feie = calculate_return(profile, schedules=schedules,
+                                      explain=False)
 
     # Total earned income from Schedule C businesses
     earned_income = sum(sc.net_profit_loss for sc in result_no_feie.schedule_c_results)
@@ -1821,6 +2126,7 @@ def compare_feie_scenarios(profile: TaxpayerProfile) -> dict:
         earned_income=max(earned_income, 0),
         gross_receipts=max(gross_receipts, 0),
         se_deduction=result_no_feie.adjustments,
+        explain=explain,
     )
 
     # Full recalculation with the exclusion folded into the return —
@@ -1828,7 +2134,8 @@ def compare_feie_scenarios(profile: TaxpayerProfile) -> dict:
     # authoritative "with FEIE" outcome
     result_with_feie = None
     if feie_eval.net_exclusion > 0:
-        result_with_feie = calculate_return(profile, feie=feie_eval)
+        result_with_feie = calculate_return(profile, feie=feie_eval,
+                                            schedules=schedules, explain=explain)
         feie_eval.tax_with_feie = result_with_feie.tax
         feie_eval.savings = round(
             result_no_feie.total_tax - result_with_feie.total_tax, 2
@@ -1861,6 +2168,141 @@ def compare_feie_scenarios(profile: TaxpayerProfile) -> dict:
     }
 
 
+class _StatusSweepSchedules(ScheduleCalculator):
+    """Shares status-independent schedules across a filing-status sweep.
+
+    Schedule C and SE never look at filing status. Schedule E only asks
+    "is this MFS?" (passive loss allowance) and Schedule D only needs the
+    capital loss limit, so those are shared between statuses that agree
+    on that one input. Form 8995 is recomputed per status.
+    """
+
+    def __init__(self):
+        self._memo: dict = {}
+
+    def _lookup(self, key, compute):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def schedule_c(self, biz: ScheduleCData,
+                   explain: bool = True) -> ScheduleCResult:
+        return self._lookup(("c", repr(biz), explain),
+                            lambda: super(_StatusSweepSchedules, self).schedule_c(
+                                biz, explain))
+
+    def schedule_e(self, profile: TaxpayerProfile,
+                   explain: bool = True) -> ScheduleEResult:
+        is_mfs = profile.filing_status == FilingStatus.MFS
+        return self._lookup(("e", is_mfs, explain),
+                            lambda: super(_StatusSweepSchedules, self).schedule_e(
+                                profile, explain))
+
+    def schedule_d(self, profile: TaxpayerProfile,
+                   filing_status: FilingStatus,
+                   explain: bool = True) -> ScheduleDResult:
+        loss_limit = CAPITAL_LOSS_LIMITS.get(filing_status, CAPITAL_LOSS_LIMIT_OTHER)
+        return self._lookup(("d", loss_limit, explain),
+                            lambda: super(_StatusSweepSchedules, self).schedule_d(
+                                profile, filing_status, explain))
+
+    def schedule_se(self, net_se_income: float, w2_ss_wages: float = 0.0,
+                    explain: bool = True) -> ScheduleSEResult:
+        return self._lookup(("se", net_se_income, w2_ss_wages, explain),
+                            lambda: super(_StatusSweepSchedules, self).schedule_se(
+                                net_se_income, w2_ss_wages, explain))
+
+
+def eligible_filing_statuses(profile: TaxpayerProfile) -> list[FilingStatus]:
+    """The filing statuses the profile supports, for compare_filing_statuses().
+
+    The profile's own status is always included. A married taxpayer can
+    always file MFS, but MFJ only when the profile already files jointly:
+    otherwise the spouse's income is unknown and a joint return would be
+    priced on one spouse's income alone. HOH needs a qualifying person
+    (any dependent) and, for a married taxpayer, a nonresident alien
+    spouse not treated as resident. QSS depends on a spouse's death,
+    which the profile does not record, so it is never added.
+    """
+    married = (profile.filing_status in (FilingStatus.MFJ, FilingStatus.MFS)
+               or bool(profile.spouse_name or profile.spouse_ssn))
+    statuses = {profile.filing_status}
+    if married:
+        statuses.add(FilingStatus.MFS)
+    else:
+        statuses.add(FilingStatus.SINGLE)
+    if profile.dependents and (
+        not married or (profile.spouse_is_nra and not profile.treat_spouse_as_resident)
+    ):
+        statuses.add(FilingStatus.HOH)
+    return [fs for fs in FilingStatus if fs in statuses]
+
+
+def compare_filing_statuses(
+    profile: TaxpayerProfile,
+    statuses: Optional[list[FilingStatus]] = None,
+    explain: bool = False,
+) -> dict:
+    """Compute the return under each filing status and rank the outcomes.
+
+    Status-independent schedules (C, SE, and E/D where the status does
+    not change them) are computed once and shared; each status then gets
+    its own brackets, standard deduction and QBI / NIIT / AMT / Additional
+    Medicare thresholds through calculate_return(). The profile's income
+    is treated as the household's under every status.
+
+    `statuses` defaults to eligible_filing_statuses(profile). Statuses
+    passed explicitly are not checked for eligibility (marital status,
+    qualifying person); list(FilingStatus) prices all of them.
+
+    Results are numbers-only unless explain=True; explain_return()
+    rebuilds the line items for the chosen status. The shared schedule
+    results appear in several Form1040Results, so treat them as read-only.
+    """
+    statuses = list(statuses) if statuses else eligible_filing_statuses(profile)
+    schedules = _StatusSweepSchedules()
+
+    results = {}
+    for fs in statuses:
+        status_profile = copy.copy(profile)
+        status_profile.filing_status = fs
+        results[fs] = calculate_return(status_profile, schedules=schedules,
+                                       explain=explain)
+
+    current = results.get(profile.filing_status)
+    ranking = []
+    for fs, result in sorted(results.items(), key=lambda item: item[1].total_tax):
+        ranking.append({
+            "filing_status": fs.value,
+            "taxable_income": result.taxable_income,
+            "total_tax": result.total_tax,
+            "overpayment": result.overpayment,
+            "amount_owed": result.amount_owed,
+            "savings_vs_current": (
+                round(current.total_tax - result.total_tax, 2) if current else 0.0
+            ),
+        })
+
+    best = FilingStatus(ranking[0]["filing_status"]) if ranking else None
+    if best is None:
+        recommendation = "No filing statuses to compare"
+    elif current is None or best == profile.filing_status:
+        recommendation = f"File {best.value.upper()} — lowest total tax"
+    else:
+        recommendation = (
+            f"File {best.value.upper()} — saves "
+            f"${ranking[0]['savings_vs_current']:,.2f} vs "
+            f"{profile.filing_status.value.upper()}"
+        )
+
+    return {
+        "results": results,
+        "ranking": ranking,
+        "best": best,
+        "recommendation": recommendation,
+    }
+
+
 def estimate_quarterly_payments(
     total_tax: float,
     prior_year_tax: float,
@@ -1922,6 +2364,7 @@ def generate_optimization_recommendations(
                 result.taxable_income,
                 result.tax,
                 max(earned_income, 0),
+                explain=False,
             )
             if feie_eval.is_beneficial:
                 recommendations.append({
@@ -1936,25 +2379,23 @@ def generate_optimization_recommendations(
     # Check retirement contributions
     se_income = sum(sc.net_profit_loss for sc in result.schedule_c_results)
     if se_income > 50_000:
-        # SEP-IRA: 25% of net SE income (after deductible SE tax), max $69,000
         se_tax_ded = result.schedule_se.deductible_se_tax if result.schedule_se else 0
-        sep_max = min((se_income - se_tax_ded) * 0.25, 69_000)
-        if sep_max > 0:
-            brackets = BRACKETS_BY_STATUS.get(profile.filing_status, MFS_BRACKETS)
-            # Estimate marginal rate
-            marginal_rate = 0.22
-            for upper, rate in brackets:
-                if result.taxable_income <= upper:
-                    marginal_rate = rate
-                    break
-            est_savings = round(sep_max * marginal_rate, 2)
+        sep_room = round(calculate_sep_limit(se_income, se_tax_ded)
+                         - profile.sep_ira_contribution, 2)
+        if sep_room > 0:
+            # Exact savings: re-run the return with the full contribution
+            from taxman.goalseek import TaxEvaluator
+            ev = TaxEvaluator(profile, feie=result.feie)
+            current = ev.evaluate()
+            maxed = ev.evaluate(
+                sep_ira_contribution=profile.sep_ira_contribution + sep_room)
             recommendations.append({
                 "title": "SEP-IRA Contribution",
                 "description": (
-                    f"Contribute up to ${sep_max:,.0f} to a SEP-IRA to reduce "
+                    f"Contribute up to ${sep_room:,.0f} more to a SEP-IRA to reduce "
                     f"taxable income. Deadline is filing deadline (including extensions)."
                 ),
-                "estimated_savings": est_savings,
+                "estimated_savings": round(current.total_tax - maxed.total_tax, 2),
             })
 
     # Check home office optimization
@@ -6,6 +6,7 @@ Commands:
   taxman export   — Generate PDFs and reports
   taxman compare  — FEIE comparison
   taxman scan     — Classify documents in a folder
+  taxman batch    — Process many sessions/profiles in parallel
 """
 
 from pathlib import Path
@@ -25,6 +26,21 @@ app.add_typer(headless_app, name="headless")
 console = Console()
 
 
+@app.callback()
+def main(
+    no_cache: bool = typer.Option(
+        False, "--no-cache",
+        envvar="TAXMAN_NO_CACHE",
+        help="Re-extract every document instead of using ~/.taxman/cache",
+    ),
+):
+    """Tax Man — 2025 Federal Tax Return Preparation."""
+    from taxman.cli.cache import default_extraction_cache
+    from taxman.parse_documents import set_extraction_cache
+
+    set_extraction_cache(None if no_cache else default_extraction_cache())
+
+
 @app.command()
 def prepare(
     documents_dir: Optional[str] = typer.Option(
@@ -107,16 +123,19 @@ def review(
 def export(
     session_id: str = typer.Argument(help="Session ID to export"),
     output_dir: str = typer.Option("output", "--output-dir", "-o"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=0,
+        help="Processes to fill PDF forms with (0 = one per CPU)",
+    ),
+    forms: bool = typer.Option(
+        True, "--forms/--packets-only",
+        help="Also save each filled form as its own PDF",
+    ),
 ):
     """Generate PDFs and reports from a saved session."""
+    from taxman.cli.batch import write_text_reports
     from taxman.cli.serialization import deserialize_profile, deserialize_result
     from taxman.cli.state import SessionState
-    from taxman.reports import (
-        generate_filing_checklist,
-        generate_quarterly_plan,
-        generate_tax_summary,
-        generate_line_detail,
-    )
 
     session = SessionState.load(session_id)
     if not session:
@@ -144,37 +163,14 @@ def export(
     out.mkdir(parents=True, exist_ok=True)
 
     console.print(f"[bold]Exporting session {session_id} to {output_dir}[/bold]")
-    generated_files = []
-
     # Text reports
-    summary = generate_tax_summary(result, profile)
-    summary_path = out / "tax_summary.txt"
-    summary_path.write_text(summary)
-    generated_files.append(summary_path)
-
-    detail = generate_line_detail(result)
-    detail_path = out / "line_detail.txt"
-    detail_path.write_text(detail)
-    generated_files.append(detail_path)
-
-    checklist = generate_filing_checklist(result, profile)
-    checklist_path = out / "filing_checklist.txt"
-    checklist_path.write_text(checklist)
-    generated_files.append(checklist_path)
-
-    prior_year_tax = getattr(profile, "prior_year_tax", 0.0)
-    quarterly = generate_quarterly_plan(
-        result.total_tax, prior_year_tax, result.agi,
-        filing_status=profile.filing_status,
-    )
-    quarterly_path = out / "quarterly_plan.txt"
-    quarterly_path.write_text(quarterly)
-    generated_files.append(quarterly_path)
+    generated_files = write_text_reports(result, profile, out)
 
     # PDF generation (may fail if IRS PDFs can't be downloaded)
     try:
         from taxman.fill_forms import generate_all_forms
-        pdf_files = generate_all_forms(result, profile, output_dir)
+        pdf_files = generate_all_forms(result, profile, output_dir,
+                                       workers=workers or None, write_forms=forms)
         for pf in pdf_files:
             generated_files.append(Path(pf))
     except Exception as e:
@@ -192,12 +188,26 @@ def export(
 @app.command()
 def compare(
     session_id: Optional[str] = typer.Argument(None, help="Session ID"),
+    filing_status: bool = typer.Option(
+        False, "--filing-status", "-f",
+        help="Compare filing statuses instead of FEIE with/without",
+    ),
+    statuses: Optional[str] = typer.Option(
+        None, "--statuses",
+        help="Comma-separated statuses to compare, e.g. mfs,mfj "
+             "(default: those the profile supports)",
+    ),
 ):
-    """Compare tax scenarios (FEIE with/without)."""
-    from taxman.calculator import compare_feie_scenarios
+    """Compare tax scenarios (FEIE with/without, or filing statuses)."""
+    from taxman.calculator import compare_filing_statuses
+    from taxman.cli.cache import default_cache
     from taxman.cli.serialization import deserialize_profile
     from taxman.cli.state import SessionState
-    from taxman.reports import generate_feie_comparison_report
+    from taxman.models import FilingStatus
+    from taxman.reports import (
+        generate_feie_comparison_report,
+        generate_filing_status_comparison_report,
+    )
 
     if not session_id:
         console.print(
@@ -219,6 +229,25 @@ def compare(
 
     profile = deserialize_profile(session.profile_data)
 
+    if filing_status:
+        console.print("[bold]Filing Status Comparison[/bold]")
+        selected = None  # the statuses the profile supports
+        if statuses:
+            try:
+                selected = [FilingStatus(s.strip().lower())
+                            for s in statuses.split(",") if s.strip()]
+                if not selected:
+                    raise ValueError(statuses)
+            except ValueError:
+                console.print(
+                    f"[red]Unknown filing status in '{statuses}'. Choose from: "
+                    f"{', '.join(fs.value for fs in FilingStatus)}[/red]"
+                )
+                raise typer.Exit(1)
+        comparison = compare_filing_statuses(profile, statuses=selected)
+        console.print(generate_filing_status_comparison_report(comparison))
+        return
+
     if profile.days_in_foreign_country_2025 < 330:
         console.print(
             "[yellow]FEIE requires 330+ days in a foreign country. "
@@ -226,7 +255,7 @@ def compare(
         )
 
     console.print("[bold]FEIE Comparison[/bold]")
-    scenarios = compare_feie_scenarios(profile)
+    scenarios = default_cache().compare_feie_scenarios(profile)
     report = generate_feie_comparison_report(scenarios)
     console.print(report)
 
@@ -234,10 +263,14 @@ def compare(
 @app.command()
 def scan(
     directory: str = typer.Argument(help="Folder to scan for tax documents"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=0,
+        help="Processes to extract documents with (0 = one per CPU)",
+    ),
 ):
     """Scan and classify tax documents in a folder."""
-    from taxman.cli.display import display_document_scan
-    from taxman.parse_documents import scan_documents_folder
+    from taxman.cli.display import display_document_scan, display_scan_progress
+    from taxman.parse_documents import iter_scan_documents
 
     path = Path(directory)
     if not path.exists():
@@ -245,12 +278,13 @@ def scan(
         raise typer.Exit(1)
 
     console.print(f"Scanning [bold]{directory}[/bold]...")
-    results = scan_documents_folder(directory)
-
-    if "error" in results:
-        console.print(f"[red]{results['error']}[/red]")
-        raise typer.Exit(1)
+    for event in iter_scan_documents(directory, workers=workers or None):
+        if event["event"] == "error":
+            console.print(f"[red]{event['error']}[/red]")
+            raise typer.Exit(1)
+        display_scan_progress(event)
 
+    results = event["results"]
     display_document_scan(results)
 
     summary = results["summary"]
@@ -258,6 +292,74 @@ def scan(
                   f"({len(summary['classified'])} types classified)[/bold]")
 
 
+@app.command()
+def batch(
+    sources: list[str] = typer.Argument(
+        help="Session IDs, profile/session JSON files, or folders of JSON files",
+    ),
+    output_dir: str = typer.Option("output/batch", "--output-dir", "-o"),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", min=1,
+        help="Worker processes (default: CPU count)",
+    ),
+    forms: bool = typer.Option(
+        True, "--forms/--no-forms",
+        help="Fill IRS PDF forms as well as text reports",
+    ),
+):
+    """Calculate, report and fill forms for many returns in parallel."""
+    import os
+    import time
+
+    from rich.table import Table
+
+    from taxman.cli.batch import resolve_sources, run_batch
+
+    items = resolve_sources(sources)
+    if not items:
+        console.print("[red]No sessions or profile files found.[/red]")
+        raise typer.Exit(1)
+
+    n_workers = workers or os.cpu_count() or 1
+    console.print(f"Processing [bold]{len(items)}[/bold] returns with "
+                  f"{min(n_workers, len(items))} worker(s)...")
+
+    def _progress(outcome):
+        mark = "[green]✓[/green]" if outcome.ok else "[red]✗[/red]"
+        console.print(f"  {mark} {outcome.name}")
+
+    started = time.perf_counter()
+    outcomes = run_batch(items, output_dir, workers=n_workers, forms=forms,
+                         on_done=_progress)
+    elapsed = time.perf_counter() - started
+
+    table = Table(title="Batch Summary", header_style="bold cyan")
+    table.add_column("Return", style="bold")
+    table.add_column("Status")
+    table.add_column("Total Tax", justify="right")
+    table.add_column("Owed / Refund", justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Time", justify="right")
+    for o in outcomes:
+        if o.ok:
+            balance = (f"[red]${o.amount_owed:,.2f}[/red]" if o.amount_owed
+                       else f"[green]-${o.overpayment:,.2f}[/green]")
+            status = "[yellow]ok (no PDFs)[/yellow]" if o.warnings else "[green]ok[/green]"
+            table.add_row(o.name, status, f"${o.total_tax:,.2f}", balance,
+                          str(len(o.files)), f"{o.seconds:.2f}s")
+        else:
+            table.add_row(o.name, f"[red]{o.error}[/red]", "—", "—", "—", "—")
+    console.print()
+    console.print(table)
+
+    failed = sum(1 for o in outcomes if not o.ok)
+    rate = len(outcomes) / elapsed if elapsed > 0 else 0.0
+    console.print(f"\n{len(outcomes) - failed} succeeded, {failed} failed in "
+                  f"{elapsed:.2f}s ({rate:.1f} returns/s). Output: {output_dir}")
+    if failed:
+        raise typer.Exit(1)
+
+
 @app.command()
 def sessions():
     """List all saved sessions."""
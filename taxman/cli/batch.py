@@ -0,0 +1,215 @@
+"""Batch processing — run many returns through calculate → reports → forms.
+
+`taxman batch` takes session IDs, profile JSON files, session JSON files
+or directories of either, and processes every return in a
+ProcessPoolExecutor. Each return is written to its own folder under the
+output directory. A failure in one return is recorded in its
+BatchOutcome and never stops the others.
+
+Sources are resolved to serialized profiles in the parent process, so
+workers only receive plain dicts and never touch ~/.taxman/sessions.
+"""
+
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from taxman.cli.serialization import deserialize_profile
+from taxman.cli.state import SessionState
+
+
+@dataclass
+class BatchItem:
+    """One return to process: a display name plus its serialized profile."""
+    name: str
+    source: str
+    profile_data: dict = field(default_factory=dict)
+    error: str = ""  # set when the source could not be loaded
+
+
+@dataclass
+class BatchOutcome:
+    """Result of processing one BatchItem."""
+    name: str
+    source: str
+    ok: bool = False
+    error: str = ""
+    total_tax: float = 0.0
+    amount_owed: float = 0.0
+    overpayment: float = 0.0
+    files: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("_") or "return"
+
+
+def _load_json_source(path: Path) -> BatchItem:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        return BatchItem(path.stem, str(path), error=f"Cannot read {path}: {e}")
+    if not isinstance(data, dict):
+        return BatchItem(path.stem, str(path), error=f"{path} is not a JSON object")
+    # A saved session wraps the profile; a profile file is the profile itself
+    if "profile_data" in data:
+        name = data.get("session_id") or path.stem
+        if not data["profile_data"]:
+            return BatchItem(name, str(path), error="Session has no profile data")
+        return BatchItem(name, str(path), data["profile_data"])
+    return BatchItem(path.stem, str(path), data)
+
+
+def resolve_sources(sources: list[str]) -> list[BatchItem]:
+    """Expand session IDs, JSON files and directories into BatchItems.
+
+    Directories contribute every *.json file inside them (sorted). Any
+    other argument that is not an existing file is looked up as a
+    session ID. Duplicate names get a numeric suffix so their output
+    folders never collide.
+    """
+    items = []
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            items.extend(_load_json_source(p) for p in sorted(path.glob("*.json")))
+        elif path.is_file():
+            items.append(_load_json_source(path))
+        else:
+            session = SessionState.load(source)
+            if session is None:
+                items.append(BatchItem(source, source,
+                                       error=f"Session {source} not found"))
+            elif not session.profile_data:
+                items.append(BatchItem(source, source,
+                                       error="Session has no profile data"))
+            else:
+                items.append(BatchItem(source, source, session.profile_data))
+
+    seen: dict[str, int] = {}
+    for item in items:
+        base = _safe_name(item.name)
+        seen[base] = seen.get(base, 0) + 1
+        item.name = base if seen[base] == 1 else f"{base}-{seen[base]}"
+    return items
+
+
+def write_text_reports(result, profile, output_dir: Path) -> list[Path]:
+    """Write the standard text reports for one return (as `taxman export`)."""
+    from taxman.reports import (
+        generate_filing_checklist,
+        generate_line_detail,
+        generate_quarterly_plan,
+        generate_tax_summary,
+    )
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    reports = {
+        "tax_summary.txt": generate_tax_summary(result, profile),
+        "line_detail.txt": generate_line_detail(result),
+        "filing_checklist.txt": generate_filing_checklist(result, profile),
+        "quarterly_plan.txt": generate_quarterly_plan(
+            result.total_tax, getattr(profile, "prior_year_tax", 0.0), result.agi,
+            filing_status=profile.filing_status,
+        ),
+    }
+    written = []
+    for filename, text in reports.items():
+        path = output_dir / filename
+        path.write_text(text)
+        written.append(path)
+    return written
+
+
+def process_item(item: BatchItem, output_dir: str, forms: bool = True) -> BatchOutcome:
+    """Calculate, report and (optionally) fill forms for one return.
+
+    Runs in a worker process. Never raises: any error is returned in
+    the outcome. PDF problems are warnings, as in `taxman export`.
+    """
+    from taxman.cli.cache import default_cache
+
+    started = time.perf_counter()
+    outcome = BatchOutcome(item.name, item.source)
+    if item.error:
+        outcome.error = item.error
+        return outcome
+
+    try:
+        profile = deserialize_profile(item.profile_data)
+        cache = default_cache()
+        result = cache.calculate_return(profile)
+        if profile.days_in_foreign_country_2025 >= 330:
+            scenarios = cache.compare_feie_scenarios(profile)
+            if scenarios["feie_result"].is_beneficial and scenarios["result_with_feie"]:
+                result = scenarios["result_with_feie"]
+
+        out = Path(output_dir) / item.name
+        outcome.files = [str(p) for p in write_text_reports(result, profile, out)]
+
+        if forms:
+            try:
+                from taxman.fill_forms import generate_all_forms
+                outcome.files.extend(str(p) for p in
+                                     generate_all_forms(result, profile, str(out)))
+            except Exception as e:
+                outcome.warnings.append(f"PDF generation: {e}")
+
+        outcome.total_tax = result.total_tax
+        outcome.amount_owed = result.amount_owed
+        outcome.overpayment = result.overpayment
+        outcome.ok = True
+    except Exception as e:
+        outcome.error = f"{type(e).__name__}: {e}"
+    outcome.seconds = time.perf_counter() - started
+    return outcome
+
+
+def run_batch(
+    items: list[BatchItem],
+    output_dir: str,
+    workers: Optional[int] = None,
+    forms: bool = True,
+    on_done: Optional[Callable[[BatchOutcome], None]] = None,
+) -> list[BatchOutcome]:
+    """Process items across a process pool; outcomes come back in input order.
+
+    workers defaults to the CPU count; workers=1 runs in this process
+    (no pool), which is easier to debug. on_done is called in the
+    parent as each return finishes.
+    """
+    workers = workers or os.cpu_count() or 1
+    outcomes: list[Optional[BatchOutcome]] = [None] * len(items)
+
+    def _finish(index: int, outcome: BatchOutcome):
+        outcomes[index] = outcome
+        if on_done:
+            on_done(outcome)
+
+    if workers == 1 or len(items) <= 1:
+        for i, item in enumerate(items):
+            _finish(i, process_item(item, output_dir, forms))
+        return outcomes
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        futures = {
+            pool.submit(process_item, item, output_dir, forms): i
+            for i, item in enumerate(items)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. BrokenProcessPool)
+                outcome = BatchOutcome(items[i].name, items[i].source,
+                                       error=f"{type(e).__name__}: {e}")
+            _finish(i, outcome)
+    return outcomes
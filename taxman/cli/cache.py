@@ -0,0 +1,263 @@
+"""Result cache — memoizes calculate_return() and compare_feie_scenarios().
+
+The wizard, headless mode and `taxman compare` recalculate the same
+unchanged profile again and again (compare_feie_scenarios alone runs
+calculate_return twice). ResultCache keys each result by a SHA-256 of
+the serialized profile, the FEIE input and the calculation engine
+itself, and keeps:
+
+  - an in-memory LRU of result objects (bounded by maxsize), and
+  - an optional on-disk tier of serialized results under
+    ~/.taxman/cache/<key>.json (bounded by max_disk_entries, oldest
+    evicted first), so separate headless invocations share work.
+
+The engine digest covers this module and the source of the calculator,
+the result serializer and every taxman module they import, directly or
+through each other (constants, models, validation, ...), so a tax table
+update or a change to any of them starts a fresh set of keys. Code
+reached some other way (plugins, data files) is not covered; bump
+taxman.__version__ when changing it.
+
+Results served from memory are shared between callers — treat them as
+read-only.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import re
+from collections import OrderedDict
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import taxman
+from taxman import calculator
+from taxman.calculator import (
+    Form1040Result,
+    Form2555Result,
+    LineItem,
+    ScheduleCalculator,
+)
+from taxman.cli.config import CACHE_DIR
+from taxman.cli.serialization import (
+    deserialize_result,
+    serialize_profile,
+    serialize_result,
+)
+from taxman.models import TaxpayerProfile
+
+
+_ENGINE_ROOTS = ("taxman.calculator", "taxman.cli.serialization")
+_TAXMAN_IMPORT = re.compile(r"^\s*(?:from|import)\s+(taxman\.[\w.]+)", re.MULTILINE)
+
+
+def _engine_sources() -> dict[str, Path]:
+    """Source files of _ENGINE_ROOTS and the taxman modules they import.
+
+    Imports are followed transitively, including those inside functions;
+    a module must be named in the import (``from taxman.models import
+    ...``, not ``from taxman import models``). This module is listed too
+    (it serializes the cached results), but its own imports are not
+    followed.
+    """
+    sources: dict[str, Path] = {__name__: Path(__file__)}
+    pending = list(_ENGINE_ROOTS)
+    while pending:
+        name = pending.pop()
+        if name in sources:
+            continue
+        spec = importlib.util.find_spec(name)
+        if spec is None or not spec.origin:
+            continue
+        sources[name] = Path(spec.origin)
+        pending.extend(_TAXMAN_IMPORT.findall(sources[name].read_text()))
+    return dict(sorted(sources.items()))
+
+
+@lru_cache(maxsize=1)
+def _engine_digest() -> str:
+    """Digest of everything besides the inputs that shapes a result."""
+    h = hashlib.sha256(taxman.__version__.encode())
+    for name, path in _engine_sources().items():
+        h.update(name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def cache_key(kind: str, profile: TaxpayerProfile,
+              feie: Optional[Form2555Result] = None,
+              explain: bool = True) -> str:
+    """Stable content hash of a calculation's inputs."""
+    payload = {
+        "kind": kind,
+        "explain": explain,
+        "engine": _engine_digest(),
+        "profile": serialize_profile(profile),
+        "feie": asdict(feie) if feie is not None else None,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _deserialize_feie(data: dict) -> Form2555Result:
+    d = dict(data)
+    d["lines"] = [LineItem(**li) for li in d.get("lines", [])]
+    return Form2555Result(**d)
+
+
+def _serialize_scenarios(scenarios: dict) -> dict:
+    d = dict(scenarios)
+    if d.get("result_with_feie") is not None:
+        d["result_with_feie"] = serialize_result(d["result_with_feie"])
+    d["feie_result"] = asdict(d["feie_result"])
+    return d
+
+
+def _deserialize_scenarios(data: dict) -> dict:
+    d = dict(data)
+    d["feie_result"] = _deserialize_feie(d["feie_result"])
+    if d.get("result_with_feie") is not None:
+        result = deserialize_result(d["result_with_feie"])
+        # Fresh comparisons share one Form2555Result between the two keys
+        result.feie = d["feie_result"]
+        d["result_with_feie"] = result
+    return d
+
+
+class ResultCache:
+    """Content-addressed memo for return calculations.
+
+    Usage:
+        cache = ResultCache(disk_dir=CACHE_DIR)
+        result = cache.calculate_return(profile)       # computed
+        result = cache.calculate_return(profile)       # served from memory
+        scenarios = cache.compare_feie_scenarios(profile)
+    """
+
+    def __init__(self, maxsize: int = 64, disk_dir: Optional[Path] = None,
+                 max_disk_entries: int = 256):
+        self.maxsize = maxsize
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, object] = OrderedDict()
+
+    # ── Public API ──────────────────────────────────────────────────
+
+    def calculate_return(self, profile: TaxpayerProfile,
+                         feie: Optional[Form2555Result] = None,
+                         schedules: Optional[ScheduleCalculator] = None,
+                         explain: bool = True) -> Form1040Result:
+        """Memoized calculator.calculate_return()."""
+        return self._get(
+            cache_key("return", profile, feie, explain),
+            lambda: calculator.calculate_return(profile, feie=feie,
+                                                schedules=schedules,
+                                                explain=explain),
+            serialize_result, deserialize_result,
+        )
+
+    def compare_feie_scenarios(self, profile: TaxpayerProfile,
+                               schedules: Optional[ScheduleCalculator] = None,
+                               explain: bool = True) -> dict:
+        """Memoized calculator.compare_feie_scenarios()."""
+        return self._get(
+            cache_key("compare", profile, explain=explain),
+            lambda: calculator.compare_feie_scenarios(profile,
+                                                      schedules=schedules,
+                                                      explain=explain),
+            _serialize_scenarios, _deserialize_scenarios,
+        )
+
+    def clear(self, disk: bool = False):
+        """Drop memory entries, and on-disk entries too if disk=True."""
+        self._memory.clear()
+        if disk and self.disk_dir is not None and self.disk_dir.exists():
+            for path in self.disk_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    # ── Tiers ───────────────────────────────────────────────────────
+
+    def _get(self, key: str, compute, dump, load):
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        value = self._disk_read(key, load)
+        if value is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            value = compute()
+            self._disk_write(key, dump(value))
+
+        self._memory[key] = value
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+        return value
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / f"{key}.json"
+
+    def _disk_read(self, key: str, load):
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                value = load(json.load(f))
+        except (OSError, ValueError, TypeError, KeyError):
+            # Corrupt or incompatible entry — recompute and overwrite
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)  # mark as recently used for eviction
+        return value
+
+    def _disk_write(self, key: str, data: dict):
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp, path)
+            self._disk_evict()
+        except OSError:
+            pass  # the disk tier is best-effort
+
+    def _disk_evict(self):
+        entries = list(self.disk_dir.glob("*.json"))
+        if len(entries) <= self.max_disk_entries:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:len(entries) - self.max_disk_entries]:
+            path.unlink(missing_ok=True)
+
+
+_default_cache: Optional[ResultCache] = None
+
+
+def default_cache() -> ResultCache:
+    """Process-wide cache backed by ~/.taxman/cache/."""
+    global _default_cache
+    if _default_cache is None or _default_cache.disk_dir != CACHE_DIR:
+        _default_cache = ResultCache(disk_dir=CACHE_DIR)
+    return _default_cache
+
+
+def default_extraction_cache():
+    """Document extraction cache under ~/.taxman/cache/extract/."""
+    from taxman.parse_documents import ExtractionCache
+    return ExtractionCache(CACHE_DIR / "extract")
@@ -17,6 +17,7 @@ except ImportError:
 CONFIG_DIR = Path.home() / ".taxman"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 SESSIONS_DIR = CONFIG_DIR / "sessions"
+CACHE_DIR = CONFIG_DIR / "cache"
 
 
 @dataclass
@@ -191,6 +191,29 @@ def display_document_scan(scan_results: dict):
     console.print(tree)
 
 
+def display_scan_progress(event: dict):
+    """Print a streaming scan event (see iter_scan_documents) as it arrives."""
+    kind = event["event"]
+    if kind == "start":
+        console.print(f"[dim]{event['total_files']} files, "
+                      f"{event['to_scan']} PDF(s) to classify[/dim]")
+    elif kind == "document":
+        doc = event["document"]
+        classification = doc.get("classification", "unknown")
+        if classification == "error":
+            style = "red"
+        elif classification == "unknown":
+            style = "yellow"
+        elif classification.startswith("non-pdf"):
+            style = "dim"
+        else:
+            style = "green"
+        note = "unchanged" if event["reused"] else f"{event['seconds']:.2f}s"
+        console.print(f"  [{style}]{classification}[/{style}]  {doc['name']} [dim]({note})[/dim]")
+    elif kind == "finish":
+        console.print(f"[dim]Scanned in {event['elapsed']:.2f}s[/dim]")
+
+
 def display_quarterly_plan(plan: dict):
     """Display quarterly payment plan."""
     table = Table(title="2026 Estimated Tax Payments", header_style="bold cyan")
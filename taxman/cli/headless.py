@@ -5,7 +5,7 @@ allowing Claude Code to drive the tax wizard step-by-step.
 
 Commands:
   taxman headless start [--session-id ID] [--docs-dir PATH]
-  taxman headless step <session-id> <step-name> [--answers JSON]
+  taxman headless step <session-id> <step-name> [--answers JSON] [--stream]
   taxman headless status <session-id>
 """
 
@@ -14,7 +14,7 @@ import sys
 import traceback
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import typer
 
@@ -169,6 +169,14 @@ def _get_step_spec(step_name: str) -> StepSpec:
                     help_text="Point to a folder containing PDF tax documents (W-2s, 1099s, K-1s, etc.). "
                               "The scanner will classify each document by type.",
                 ),
+                FieldSpec(
+                    name="workers",
+                    field_type="number",
+                    prompt="Processes to scan with (0 = one per CPU)",
+                    default=1,
+                    help_text="Large folders scan faster across several processes. "
+                              "Results are the same in any case.",
+                ),
             ],
         ),
         "document_review": StepSpec(
@@ -422,19 +430,20 @@ def _get_step_spec(step_name: str) -> StepSpec:
 # JSON Helpers
 # =============================================================================
 
-def _json_response(data: dict) -> str:
-    """Serialize a dict to pretty JSON."""
-    return json.dumps(data, indent=2, default=str)
+def _json_response(data: dict, compact: bool = False) -> str:
+    """Serialize a dict to pretty JSON (one line if compact, for NDJSON)."""
+    return json.dumps(data, indent=None if compact else 2, default=str)
 
 
-def _error_response(message: str, error_type: str = "error", step: str = "") -> str:
+def _error_response(message: str, error_type: str = "error", step: str = "",
+                    compact: bool = False) -> str:
     """Return a structured JSON error."""
     return _json_response({
         "error": True,
         "error_type": error_type,
         "message": message,
         "step": step,
-    })
+    }, compact)
 
 
 def _spec_to_dict(spec: StepSpec) -> dict:
@@ -492,9 +501,31 @@ def _process_filing_status(session: SessionState, profile: TaxpayerProfile, answ
     }
 
 
-def _process_document_scan(session: SessionState, profile: TaxpayerProfile, answers: dict) -> dict:
-    from taxman.parse_documents import scan_documents_folder
+def _scan_event_line(event: dict) -> dict:
+    """A streaming scan event, trimmed for an NDJSON progress line."""
+    if event["event"] == "document":
+        doc = event["document"]
+        return {
+            "event": "document",
+            "elapsed": event["elapsed"],
+            "index": event["index"],
+            "name": doc.get("name", ""),
+            "classification": doc.get("classification", "unknown"),
+            "path": doc.get("path", ""),
+            "seconds": event["seconds"],
+            "reused": event["reused"],
+        }
+    if event["event"] == "finish":
+        return {
+            "event": "finish",
+            "elapsed": event["elapsed"],
+            "summary": event["results"]["summary"],
+        }
+    return event
+
 
+def _process_document_scan(session: SessionState, profile: TaxpayerProfile, answers: dict,
+                           on_event: Optional[Callable[[dict], None]] = None) -> dict:
     doc_dir = answers.get("documents_dir", "")
     if not doc_dir:
         return {"message": "No documents directory provided. Skipping scan.", "documents": []}
@@ -504,13 +535,15 @@ def _process_document_scan(session: SessionState, profile: TaxpayerProfile, answ
         return {"error": True, "error_type": "validation_error",
                 "message": f"Directory not found: {doc_dir}"}
 
-    session.documents_dir = doc_dir
-    results = scan_documents_folder(doc_dir)
+    for event in session.iter_scan_documents(doc_dir,
+                                             workers=int(answers.get("workers", 1)) or None):
+        if event["event"] == "error":
+            return {"error": True, "error_type": "scan_error", "message": event["error"]}
+        if on_event:
+            on_event(_scan_event_line(event))
+    changes = {key: event[key] for key in ("added", "changed", "removed")}
 
-    if "error" in results:
-        return {"error": True, "error_type": "scan_error", "message": results["error"]}
-
-    session.scan_results = results
+    results = session.scan_results
     session.save()
 
     documents = []
@@ -526,6 +559,7 @@ def _process_document_scan(session: SessionState, profile: TaxpayerProfile, answ
     return {
         "summary": results.get("summary", {}),
         "documents": documents,
+        "changes": {key: len(paths) for key, paths in changes.items()},
     }
 
 
@@ -543,7 +577,11 @@ def _process_document_review(session: SessionState, profile: TaxpayerProfile, an
     from taxman.parse_documents import (
         parse_1095_a,
         parse_1098_mortgage,
+        parse_1099_b,
+        parse_1099_div,
+        parse_1099_int,
         parse_1099_nec,
+        parse_brokerage_statement,
         parse_charity_receipt,
         parse_k1_1065,
         parse_prior_return,
@@ -560,6 +598,10 @@ def _process_document_review(session: SessionState, profile: TaxpayerProfile, an
         "K-1": parse_k1_1065,
         "1098": parse_1098_mortgage,
         "1095-A": parse_1095_a,
+        "1099-INT": parse_1099_int,
+        "1099-DIV": parse_1099_div,
+        "1099-B": parse_1099_b,
+        "Brokerage Statement": parse_brokerage_statement,
         "Charity Receipt": parse_charity_receipt,
     }
     parseable_types = set(PARSERS.keys()) | {"Prior Return"}
@@ -584,10 +626,16 @@ def _process_document_review(session: SessionState, profile: TaxpayerProfile, an
 
     parsed_results = []
     prior_year_tax_updated = False
+    already_parsed = session.parsed_files()
 
     for i, doc in parseable_docs:
         if i not in accepted_indices:
             continue
+        if doc["path"] in already_parsed:
+            # Parsed on an earlier pass and unchanged since the last scan
+            parsed_results.append({"index": i, "type": doc["classification"],
+                                   "unchanged": True})
+            continue
 
         classification = doc.get("classification", "unknown")
 
@@ -619,21 +667,21 @@ def _process_document_review(session: SessionState, profile: TaxpayerProfile, an
             continue
 
         try:
-            pr = parser(doc["path"])
-            entry = {
-                "type": pr.document_type,
-                "file": pr.source_file,
-                "confidence": pr.confidence,
-                "warnings": pr.warnings,
-                "needs_manual_review": pr.needs_manual_review,
-                "data": _asdict(pr.data) if pr.data else None,
-            }
-            parsed_results.append({"index": i, **entry})
-
-            # Also store in session.parsed_documents for later rehydration
-            if not session.parsed_documents:
-                session.parsed_documents = []
-            session.parsed_documents.append(entry)
+            parsed = parser(doc["path"])
+            # A brokerage statement yields one result per form section
+            for pr in parsed if isinstance(parsed, list) else [parsed]:
+                entry = {
+                    "type": pr.document_type,
+                    "file": pr.source_file,
+                    "confidence": pr.confidence,
+                    "warnings": pr.warnings,
+                    "needs_manual_review": pr.needs_manual_review,
+                    "data": _asdict(pr.data) if pr.data else None,
+                }
+                parsed_results.append({"index": i, **entry})
+
+                # Also store in session.parsed_documents for later rehydration
+                session.parsed_documents.append(entry)
 
         except Exception as e:
             parsed_results.append({
@@ -811,6 +859,9 @@ def _apply_parsed_results(session: SessionState, profile: TaxpayerProfile):
         CharityReceipt,
         Form1095A,
         Form1098,
+        Form1099B,
+        Form1099DIV,
+        Form1099INT,
         Form1099NEC,
         FormW2,
         ScheduleK1,
@@ -822,6 +873,9 @@ def _apply_parsed_results(session: SessionState, profile: TaxpayerProfile):
         "K-1": ScheduleK1,
         "1098": Form1098,
         "1095-A": Form1095A,
+        "1099-INT": Form1099INT,
+        "1099-DIV": Form1099DIV,
+        "1099-B": Form1099B,
         "Charity Receipt": CharityReceipt,
     }
 
@@ -845,6 +899,12 @@ def _apply_parsed_results(session: SessionState, profile: TaxpayerProfile):
             profile.schedule_k1s.append(obj)
         elif isinstance(obj, Form1098):
             profile.forms_1098.append(obj)
+        elif isinstance(obj, Form1099INT):
+            profile.forms_1099_int.append(obj)
+        elif isinstance(obj, Form1099DIV):
+            profile.forms_1099_div.append(obj)
+        elif isinstance(obj, Form1099B):
+            profile.forms_1099_b.append(obj)
 
 
 def _process_business_expenses(session: SessionState, profile: TaxpayerProfile, answers: dict) -> dict:
@@ -1016,9 +1076,9 @@ def _process_foreign_income(session: SessionState, profile: TaxpayerProfile, ans
 
 
 def _process_calculate(session: SessionState, profile: TaxpayerProfile, answers: dict) -> dict:
-    from taxman.calculator import calculate_return
+    from taxman.cli.cache import default_cache
 
-    result = calculate_return(profile)
+    result = default_cache().calculate_return(profile)
     session.results = serialize_result(result)
     session.save()
 
@@ -1050,10 +1110,8 @@ def _process_calculate(session: SessionState, profile: TaxpayerProfile, answers:
 
 
 def _process_optimization(session: SessionState, profile: TaxpayerProfile, answers: dict) -> dict:
-    from taxman.calculator import (
-        compare_feie_scenarios,
-        generate_optimization_recommendations,
-    )
+    from taxman.calculator import generate_optimization_recommendations
+    from taxman.cli.cache import default_cache
 
     if not session.results:
         return {"error": True, "error_type": "state_error",
@@ -1064,7 +1122,7 @@ def _process_optimization(session: SessionState, profile: TaxpayerProfile, answe
 
     # FEIE comparison
     if profile.days_in_foreign_country_2025 >= 330:
-        scenarios = compare_feie_scenarios(profile)
+        scenarios = default_cache().compare_feie_scenarios(profile)
         response["feie"] = {
             "without_feie": scenarios["without_feie"],
             "feie_evaluation": scenarios["feie_evaluation"],
@@ -1168,6 +1226,9 @@ PROCESSORS = {
     "filing_checklist": _process_filing_checklist,
 }
 
+# Processors that accept on_event and can stream progress (step --stream)
+STREAMING_STEPS = {"document_scan"}
+
 
 # =============================================================================
 # Typer Commands
@@ -1228,18 +1289,21 @@ def step(
     step_name: str = typer.Argument(help="Step name to process"),
     answers: Optional[str] = typer.Option(None, "--answers", "-a",
                                           help="JSON string with answers"),
+    stream: bool = typer.Option(False, "--stream",
+                                help="Print progress events as NDJSON lines "
+                                     "(document_scan), then the response as one line"),
 ):
     """Process a step or return its spec. Returns JSON."""
     try:
         session = SessionState.load(session_id)
         if not session:
-            print(_error_response(f"Session {session_id} not found.", "not_found"))
+            print(_error_response(f"Session {session_id} not found.", "not_found", compact=stream))
             raise typer.Exit(1)
 
         if step_name not in STEP_ORDER:
             print(_error_response(
                 f"Unknown step '{step_name}'. Valid: {', '.join(STEP_ORDER)}",
-                "validation_error", step_name,
+                "validation_error", step_name, compact=stream,
             ))
             raise typer.Exit(1)
 
@@ -1251,28 +1315,34 @@ def step(
                 "step": step_name,
                 "spec": _spec_to_dict(spec),
             }
-            print(_json_response(response))
+            print(_json_response(response, stream))
             return
 
         # Parse answers JSON
         try:
             answers_dict = json.loads(answers)
         except json.JSONDecodeError as e:
-            print(_error_response(f"Invalid JSON in --answers: {e}", "json_error", step_name))
+            print(_error_response(f"Invalid JSON in --answers: {e}", "json_error", step_name,
+                                  compact=stream))
             raise typer.Exit(1)
 
         # Process the step
         profile = _load_profile(session)
         processor = PROCESSORS.get(step_name)
         if not processor:
-            print(_error_response(f"No processor for step '{step_name}'", "internal_error", step_name))
+            print(_error_response(f"No processor for step '{step_name}'", "internal_error", step_name,
+                                  compact=stream))
             raise typer.Exit(1)
 
-        result = processor(session, profile, answers_dict)
+        if stream and step_name in STREAMING_STEPS:
+            result = processor(session, profile, answers_dict,
+                               on_event=lambda event: print(_json_response(event, True), flush=True))
+        else:
+            result = processor(session, profile, answers_dict)
 
         # Check if processor returned an error
         if isinstance(result, dict) and result.get("error"):
-            print(_json_response(result))
+            print(_json_response(result, stream))
             raise typer.Exit(1)
 
         # Mark step completed
@@ -1291,12 +1361,13 @@ def step(
             "next_spec": _spec_to_dict(next_spec) if next_spec else None,
             "completed": next_step_name is None,
         }
-        print(_json_response(response))
+        print(_json_response(response, stream))
 
     except typer.Exit:
         raise
     except Exception as e:
-        print(_error_response(f"{type(e).__name__}: {e}", "internal_error", step_name))
+        print(_error_response(f"{type(e).__name__}: {e}", "internal_error", step_name,
+                              compact=stream))
         raise typer.Exit(1)
 
 
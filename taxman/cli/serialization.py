@@ -180,6 +180,8 @@ def deserialize_result(data: dict):
     if qbi:
         qbi = dict(qbi)
         qbi["lines"] = [LineItem(**li) for li in qbi.get("lines", [])]
+        # JSON turns the (name, qbi) pairs into lists
+        qbi["business_qbi"] = [tuple(b) for b in qbi.get("business_qbi", [])]
         d["qbi"] = Form8995Result(**qbi)
 
     # FEIE
@@ -9,7 +9,7 @@ import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from taxman.cli.config import SESSIONS_DIR
 
@@ -30,6 +30,7 @@ class SessionState:
     documents_dir: str = ""
     parsed_documents: list[dict] = field(default_factory=list)
     scan_results: dict = field(default_factory=dict)
+    scan_manifest: dict = field(default_factory=dict)  # path -> size/mtime_ns/sha256
 
     # Full profile (replaces fragmented income_data/expense_data/etc.)
     profile_data: dict = field(default_factory=dict)
@@ -85,6 +86,52 @@ class SessionState:
         with open(path, "w") as f:
             json.dump(asdict(self), f, indent=2, default=str)
 
+    def scan_documents(self, documents_dir: str, workers: Optional[int] = 1) -> dict:
+        """Scan documents_dir, classifying only files added or changed since the last scan.
+
+        Updates documents_dir, scan_results and scan_manifest, and drops
+        parsed_documents whose file changed, disappeared or was never
+        fingerprinted, so only those are parsed again. Does not save.
+        Returns the added/changed/removed paths, or {"error": ...}.
+        """
+        *_, last = self.iter_scan_documents(documents_dir, workers)
+        if last["event"] == "error":
+            return {"error": last["error"]}
+        return {key: last[key] for key in ("added", "changed", "removed")}
+
+    def iter_scan_documents(self, documents_dir: str,
+                            workers: Optional[int] = 1) -> Iterator[dict]:
+        """scan_documents(), yielding the scan's progress events as they happen.
+
+        See taxman.parse_documents.iter_scan_documents() for the events.
+        The session is updated when the "finish" event is yielded.
+        """
+        from taxman.parse_documents import iter_scan_documents
+
+        same_folder = self.scan_results.get("folder") == str(Path(documents_dir))
+        for event in iter_scan_documents(
+            documents_dir, workers,
+            previous=self.scan_results if same_folder else {},
+            manifest=self.scan_manifest if same_folder else {},
+        ):
+            if event["event"] == "finish":
+                self._apply_scan(documents_dir, event)
+            yield event
+
+    def _apply_scan(self, documents_dir: str, scan: dict):
+        stale = set(scan["added"]) | set(scan["changed"])
+        self.parsed_documents = [
+            entry for entry in self.parsed_documents
+            if entry.get("file") in scan["manifest"] and entry.get("file") not in stale
+        ]
+        self.documents_dir = documents_dir
+        self.scan_results = scan["results"]
+        self.scan_manifest = scan["manifest"]
+
+    def parsed_files(self) -> set[str]:
+        """Source paths of the documents in parsed_documents."""
+        return {entry.get("file") for entry in self.parsed_documents}
+
     def complete_step(self, step_name: str):
         """Mark a step as completed."""
         if step_name not in self.completed_steps:
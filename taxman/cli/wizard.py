@@ -15,11 +15,10 @@ import questionary
 from rich.console import Console
 
 from taxman.calculator import (
-    calculate_return,
-    compare_feie_scenarios,
     estimate_quarterly_payments,
     generate_optimization_recommendations,
 )
+from taxman.cli.cache import default_cache
 from taxman.cli.display import (
     console,
     display_document_scan,
@@ -28,6 +27,7 @@ from taxman.cli.display import (
     display_optimization_recommendations,
     display_quarterly_plan,
     display_result_panel,
+    display_scan_progress,
     display_schedule_c,
     display_tax_breakdown,
     display_welcome,
@@ -40,6 +40,7 @@ from taxman.cli.serialization import (
     serialize_result,
 )
 from taxman.cli.state import SessionState
+from taxman.incremental import IncrementalReturn
 from taxman.models import (
     BusinessExpenses,
     BusinessType,
@@ -48,6 +49,9 @@ from taxman.models import (
     FilingStatus,
     Form1095A,
     Form1098,
+    Form1099B,
+    Form1099DIV,
+    Form1099INT,
     Form1099NEC,
     FormW2,
     HealthInsurance,
@@ -60,12 +64,15 @@ from taxman.parse_documents import (
     ParseResult,
     parse_1095_a,
     parse_1098_mortgage,
+    parse_1099_b,
+    parse_1099_div,
+    parse_1099_int,
     parse_1099_nec,
+    parse_brokerage_statement,
     parse_charity_receipt,
     parse_k1_1065,
     parse_prior_return,
     parse_w2,
-    scan_documents_folder,
 )
 from taxman.reports import (
     generate_filing_checklist,
@@ -100,8 +107,10 @@ class TaxWizard:
         self.session = session or SessionState.create()
         self.documents_dir = documents_dir or self.session.documents_dir
         self.config = config
-        self.scan_results = None
+        self.scan_results = self.session.scan_results or None
         self.parsed_results = []
+        # Reuses unchanged schedules across recalculations in this run
+        self.incremental = IncrementalReturn()
 
         # Rehydrate profile and result from session if resuming
         if self.session.profile_data:
@@ -221,10 +230,18 @@ class TaxWizard:
             return
 
         self.documents_dir = doc_dir
-        self.session.documents_dir = doc_dir
 
         console.print(f"Scanning [bold]{doc_dir}[/bold]...")
-        self.scan_results = scan_documents_folder(doc_dir)
+        for event in self.session.iter_scan_documents(doc_dir):
+            if event["event"] == "error":
+                console.print(f"[red]{event['error']}[/red]")
+                return
+            display_scan_progress(event)
+        self.scan_results = self.session.scan_results
+        # Keep parses of unchanged documents; the rest are parsed again
+        kept = self.session.parsed_files()
+        self.parsed_results = [pr for pr in self.parsed_results if pr.source_file in kept]
+        self.session.save()
         display_document_scan(self.scan_results)
 
     # ── Step 4: Document Review ──────────────────────────────────────
@@ -236,6 +253,10 @@ class TaxWizard:
         "K-1": parse_k1_1065,
         "1098": parse_1098_mortgage,
         "1095-A": parse_1095_a,
+        "1099-INT": parse_1099_int,
+        "1099-DIV": parse_1099_div,
+        "1099-B": parse_1099_b,
+        "Brokerage Statement": parse_brokerage_statement,
         "Charity Receipt": parse_charity_receipt,
     }
 
@@ -249,11 +270,15 @@ class TaxWizard:
         parseable_types = set(self.PARSERS.keys()) | {"Prior Return"}
 
         prior_year_tax_updated = False
+        already_parsed = {pr.source_file for pr in self.parsed_results}
 
         for doc in self.scan_results["documents"]:
             classification = doc.get("classification", "unknown")
             if classification not in parseable_types:
                 continue
+            if doc["path"] in already_parsed:
+                console.print(f"\n[dim]{doc['name']} — {classification} (unchanged, already parsed)[/dim]")
+                continue
 
             console.print(f"\n[bold]{doc['name']}[/bold] — {classification}")
             if "text_preview" in doc:
@@ -289,9 +314,11 @@ class TaxWizard:
             parser = self.PARSERS.get(classification)
             if parser:
                 try:
-                    parse_result = parser(doc["path"])
-                    self.parsed_results.append(parse_result)
-                    self._display_parse_result(parse_result)
+                    parsed = parser(doc["path"])
+                    # A brokerage statement yields one result per form section
+                    for parse_result in parsed if isinstance(parsed, list) else [parsed]:
+                        self.parsed_results.append(parse_result)
+                        self._display_parse_result(parse_result)
                 except Exception as e:
                     console.print(f"  [yellow]Could not parse {doc['name']}: {e}[/yellow]")
 
@@ -326,6 +353,15 @@ class TaxWizard:
         elif isinstance(data, Form1098):
             console.print(f"    Lender: {data.lender_name}")
             console.print(f"    Mortgage interest: {format_currency(data.mortgage_interest)}")
+        elif isinstance(data, Form1099INT):
+            console.print(f"    Payer: {data.payer_name}")
+            console.print(f"    Interest: {format_currency(data.interest_income)}")
+        elif isinstance(data, Form1099DIV):
+            console.print(f"    Payer: {data.payer_name}")
+            console.print(f"    Ordinary dividends: {format_currency(data.ordinary_dividends)}")
+        elif isinstance(data, Form1099B):
+            console.print(f"    Broker: {data.broker_name}")
+            console.print(f"    Proceeds: {format_currency(data.st_proceeds + data.lt_proceeds)}")
 
         if pr.warnings:
             for w in pr.warnings:
@@ -358,6 +394,9 @@ class TaxWizard:
         "K-1": ScheduleK1,
         "1098": Form1098,
         "1095-A": Form1095A,
+        "1099-INT": Form1099INT,
+        "1099-DIV": Form1099DIV,
+        "1099-B": Form1099B,
         "Charity Receipt": CharityReceipt,
     }
 
@@ -407,6 +446,15 @@ class TaxWizard:
             elif isinstance(data, Form1098):
                 self.profile.forms_1098.append(data)
                 counts["1098"] = counts.get("1098", 0) + 1
+            elif isinstance(data, Form1099INT):
+                self.profile.forms_1099_int.append(data)
+                counts["1099-INT"] = counts.get("1099-INT", 0) + 1
+            elif isinstance(data, Form1099DIV):
+                self.profile.forms_1099_div.append(data)
+                counts["1099-DIV"] = counts.get("1099-DIV", 0) + 1
+            elif isinstance(data, Form1099B):
+                self.profile.forms_1099_b.append(data)
+                counts["1099-B"] = counts.get("1099-B", 0) + 1
             elif isinstance(data, Form1095A):
                 # Store for potential PTC calculation
                 counts["1095-A"] = counts.get("1095-A", 0) + 1
@@ -729,7 +777,7 @@ class TaxWizard:
         console.print("\n[bold]Step 10: Tax Calculation[/bold]")
         console.print("Calculating your return...")
 
-        self.result = calculate_return(self.profile)
+        self.result = self.incremental.calculate(self.profile)
 
         console.print()
         display_income_table(
@@ -757,7 +805,8 @@ class TaxWizard:
         # FEIE comparison
         if self.profile.days_in_foreign_country_2025 >= 330:
             console.print("\n[bold]FEIE Analysis[/bold]")
-            scenarios = compare_feie_scenarios(self.profile)
+            scenarios = default_cache().compare_feie_scenarios(
+                self.profile, schedules=self.incremental)
             display_feie_comparison(scenarios)
 
             # When beneficial, swap in the full recalculation with the
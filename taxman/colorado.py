@@ -21,7 +21,7 @@ from taxman.constants import (
 from taxman.models import FilingStatus, TaxpayerProfile
 
 
-@dataclass
+@dataclass(slots=True)
 class ColoradoForm104Result:
     """Calculated Colorado Form 104."""
     federal_taxable_income: float = 0.0
@@ -227,6 +227,12 @@ SCHEDULE_B_THRESHOLD = 1_500
 # Cannot exceed net SE income. Form 7206 required for calculation.
 # Does NOT reduce SE tax base.
 
+# Self-employed SEP-IRA contribution (Schedule 1, Line 16; Pub 560)
+# 25% of compensation works out to 20% of net SE earnings after the
+# deductible half of SE tax; dollar cap per IRC §415(c) (Notice 2024-80)
+SEP_CONTRIBUTION_RATE = 0.20
+SEP_CONTRIBUTION_LIMIT = 70_000
+
 # Meals deduction: 50% of business meals (100% restaurant exception expired)
 MEALS_DEDUCTION_PCT = 0.50
 
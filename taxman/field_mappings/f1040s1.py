@@ -79,6 +79,11 @@ def build_schedule_1_data(result, profile=None) -> dict:
             result.schedule_se.deductible_se_tax
         )
 
+    # Line 16: Self-employed SEP, SIMPLE, and qualified plans
+    line16 = _line_amount(result, "Schedule 1", "16")
+    if line16 > 0:
+        data["f2_06[0]"] = format_currency_for_pdf(line16)
+
     # Line 17: Self-employed health insurance deduction
     line17 = _line_amount(result, "Schedule 1", "17")
     if line17 > 0:
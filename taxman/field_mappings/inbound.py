@@ -0,0 +1,91 @@
+"""Field maps for reading fillable (AcroForm) source documents.
+
+The build_*_data() modules map our results onto IRS PDFs; these maps go
+the other way, from the populated fields of a 1099-NEC, W-2 or K-1 we
+received to model attributes. IRS fillable PDFs name fields f1_9[0]
+and friends, and issuers' own PDFs use their own names, so fields are
+matched by label: each pattern is searched (case-insensitively) in the
+field's tooltip (/TU), falling back to its partial name (/T). Possessives
+accept a typographic apostrophe (’) as well as a straight one.
+
+Each entry is (attribute, kind, label pattern); the first populated
+field that matches wins, so copies (Copy A, Copy B, ...) of the same box
+are read once. Kinds:
+
+  amount   dollar amount; "(1,234.00)" and "-1,234" are negative
+  name     first line of a name-and-address block
+  tin      first SSN/EIN/9-digit number in the value
+  percent  number with an optional "%"
+
+`required` is the attribute a form must have populated for its fields
+to be trusted over layout text. Field labels should be checked against
+new issuer PDFs with inspect_form_fields_raw().
+"""
+
+F1099_NEC_REQUIRED = "nonemployee_compensation"
+F1099_NEC_FIELDS = (
+    ("payer_name", "name", r"payer['’]?s\s+name"),
+    ("payer_tin", "tin", r"payer['’]?s\s+(?:tin|federal\s+identification)"),
+    ("recipient_name", "name", r"recipient['’]?s\s+name"),
+    ("recipient_tin", "tin", r"recipient['’]?s\s+(?:tin|identification)"),
+    # Box 1 — Nonemployee compensation
+    ("nonemployee_compensation", "amount", r"\bbox\s*1\b|nonemployee\s+compensation"),
+    # Box 4 — Federal income tax withheld
+    ("federal_tax_withheld", "amount", r"\bbox\s*4\b|federal\s+income\s+tax\s+withheld"),
+    # Box 5 — State tax withheld
+    ("state_tax_withheld", "amount", r"\bbox\s*5\b|state\s+tax\s+withheld"),
+)
+
+W2_REQUIRED = "wages"
+W2_FIELDS = (
+    ("employer_name", "name", r"employer['’]?s\s+name"),
+    ("employer_ein", "tin", r"employer['’]?s?\s+(?:ein|identification)|\bbox\s*b\b"),
+    ("employee_name", "name", r"employee['’]?s\s+(?:first\s+)?name"),
+    ("employee_ssn", "tin", r"employee['’]?s\s+social\s+security|\bbox\s*a\b"),
+    # Box 1 — Wages, tips, other compensation ("other" keeps Box 16/18
+    # "State/Local wages, tips, etc." out)
+    ("wages", "amount", r"\bbox\s*1\b|wages,?\s+tips,?\s+other"),
+    # Box 2 — Federal income tax withheld
+    ("federal_tax_withheld", "amount", r"\bbox\s*2\b|federal\s+income\s+tax\s+withheld"),
+    # Box 3 — Social security wages
+    ("ss_wages", "amount", r"\bbox\s*3\b|social\s+security\s+wages"),
+    # Box 4 — Social security tax withheld
+    ("ss_tax_withheld", "amount", r"\bbox\s*4\b|social\s+security\s+tax\s+withheld"),
+    # Box 5 — Medicare wages and tips
+    ("medicare_wages", "amount", r"\bbox\s*5\b|medicare\s+wages"),
+    # Box 6 — Medicare tax withheld
+    ("medicare_tax_withheld", "amount", r"\bbox\s*6\b|medicare\s+tax\s+withheld"),
+    # Box 16 — State wages, tips, etc.
+    ("state_wages", "amount", r"\bbox\s*16\b|state\s+wages"),
+    # Box 17 — State income tax
+    ("state_tax_withheld", "amount", r"\bbox\s*17\b|state\s+income\s+tax"),
+)
+
+K1_1065_REQUIRED = "partnership_name"
+K1_1065_FIELDS = (
+    ("partnership_name", "name", r"partnership['’]?s\s+name"),
+    ("partnership_ein", "tin", r"partnership['’]?s\s+(?:employer\s+identification|ein)"),
+    ("partner_name", "name", r"partner['’]?s\s+name"),
+    ("partner_tin", "tin", r"partner['’]?s\s+(?:ssn|tin|identifying)"),
+    # Item J — Partner's share of profit, loss and capital; only the
+    # Ending column, with the share named right next to "ending"
+    ("partner_share_profit", "percent", r"\bprofit\W+ending\b|\bending\W+profit\b"),
+    ("partner_share_loss", "percent", r"\bloss\W+ending\b|\bending\W+loss\b"),
+    ("partner_share_capital", "percent", r"\bcapital\W+ending\b|\bending\W+capital\b"),
+    # Part III boxes
+    ("ordinary_business_income", "amount", r"\bbox\s*1\b|ordinary\s+business\s+income"),
+    ("net_rental_income", "amount", r"\bbox\s*2\b|net\s+rental\s+real\s+estate"),
+    ("other_net_rental_income", "amount", r"\bbox\s*3\b|other\s+net\s+rental"),
+    ("guaranteed_payments", "amount", r"\bbox\s*4\b|guaranteed\s+payments"),
+    ("interest_income", "amount", r"\bbox\s*5\b|interest\s+income"),
+    ("dividends", "amount", r"\bbox\s*6a\b|ordinary\s+dividends"),
+    ("qualified_dividends", "amount", r"\bbox\s*6b\b|qualified\s+dividends"),
+    ("royalties", "amount", r"\bbox\s*7\b|royalties"),
+    ("net_short_term_capital_gain", "amount", r"\bbox\s*8\b|net\s+short-term\s+capital"),
+    ("net_long_term_capital_gain", "amount", r"\bbox\s*9a\b|net\s+long-term\s+capital"),
+    ("net_section_1231_gain", "amount", r"\bbox\s*10\b|section\s+1231"),
+    ("other_income", "amount", r"\bbox\s*11\b|other\s+income"),
+    ("section_179_deduction", "amount", r"\bbox\s*12\b|section\s+179"),
+    ("other_deductions", "amount", r"\bbox\s*13\b|other\s+deductions"),
+    ("self_employment_earnings", "amount", r"\bbox\s*14\b|self-employment\s+earnings"),
+)
@@ -1,14 +1,20 @@
 """PDF form filler for IRS tax forms.
 
 Downloads official IRS fillable PDFs and fills them with calculated values.
-Uses PyPDFForm for pure-Python PDF manipulation (no pdftk needed).
+Values are written straight into each template's AcroForm with pymupdf
+(AcroFormTemplate); PyPDFForm is the pure-Python fallback (no pdftk needed).
 """
 
+import copy
+import hashlib
+import json
 import os
 import re
 import shutil
 import urllib.request
+from collections import OrderedDict
 from pathlib import Path
+from typing import Optional
 
 from PyPDFForm import PdfWrapper
 
@@ -67,8 +73,9 @@ def _patch_checkbox_appearances(pdf_path: Path) -> None:
     except ImportError:
         return  # pymupdf not installed; skip patching
 
-    # Work on a copy so we can do an incremental save
-    tmp_path = str(pdf_path) + ".patching"
+    # Work on a copy so we can do an incremental save; the name is
+    # per-process so concurrent batch workers never share it
+    tmp_path = f"{pdf_path}.patching.{os.getpid()}"
     shutil.copy(str(pdf_path), tmp_path)
 
     doc = fitz.open(tmp_path)
@@ -133,8 +140,9 @@ def download_irs_form(form_key: str, force: bool = False) -> Path:
 
     print(f"Downloading {form_key} from {url}...")
     # Download to a temp path so a failed transfer never leaves a
-    # partial file that later runs would treat as a valid cached PDF
-    tmp_path = output_path.with_suffix(".pdf.download")
+    # partial file that later runs would treat as a valid cached PDF,
+    # and per-process so concurrent batch workers never write the same one
+    tmp_path = output_path.with_suffix(f".pdf.download.{os.getpid()}")
     try:
         request = urllib.request.Request(url, headers=_DOWNLOAD_HEADERS)
         with urllib.request.urlopen(request) as response, \
@@ -148,10 +156,469 @@ def download_irs_form(form_key: str, force: bool = False) -> Path:
     os.replace(tmp_path, output_path)
     _patch_checkbox_appearances(output_path)
     patch_marker.touch()
+    _template_cache.invalidate(form_key)
     print(f"Saved to {output_path}")
     return output_path
 
 
+# =============================================================================
+# Template Cache
+# =============================================================================
+
+def _clone_wrapper(prototype: PdfWrapper) -> PdfWrapper:
+    """Independent copy of a parsed PdfWrapper, without re-parsing the PDF.
+
+    Filling replaces the wrapper's PDF stream and mutates its widgets,
+    so each widget — and every list, dict or set on it or the wrapper —
+    is copied; the template bytes themselves are immutable and shared.
+    """
+    def copied(obj):
+        clone = copy.copy(obj)
+        for name, value in vars(obj).items():
+            if isinstance(value, (list, dict, set)):
+                setattr(clone, name, copy.copy(value))
+        return clone
+
+    wrapper = copied(prototype)
+    wrapper.widgets = {key: copied(widget) for key, widget in prototype.widgets.items()}
+    return wrapper
+
+
+class TemplateCache:
+    """Form templates read once per process, handed out as copies.
+
+    Each entry holds a template's bytes, plus what is derived from them
+    on first use: a parsed PdfWrapper (wrapper() returns a clone, see
+    _clone_wrapper()), the widget index and an AcroFormTemplate for
+    direct fills. The fifth Schedule C costs a copy rather than a read
+    and a parse. Entries are checked against the file's mtime/size on
+    every use, download_irs_form(force=True) invalidates its form
+    explicitly, and the least recently used template is dropped beyond
+    max_templates.
+    """
+
+    def __init__(self, max_templates: int = 16):
+        self.max_templates = max_templates
+        self.hits = 0
+        self.misses = 0
+        # form_key → [stamp, bytes, PdfWrapper, AcroFormTemplate]; the
+        # last two are filled in on first use
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self._indexes: dict[str, tuple[tuple, dict]] = {}
+
+    @staticmethod
+    def _stamp(form_key: str) -> tuple[Path, tuple]:
+        pdf_path = download_irs_form(form_key)
+        st = pdf_path.stat()
+        return pdf_path, (str(pdf_path), st.st_mtime_ns, st.st_size)
+
+    def _entry(self, form_key: str) -> list:
+        pdf_path, stamp = self._stamp(form_key)
+        entry = self._entries.get(form_key)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            self._entries.move_to_end(form_key)
+            return entry
+        self.misses += 1
+        entry = [stamp, pdf_path.read_bytes(), None, None]
+        self._entries[form_key] = entry
+        self._entries.move_to_end(form_key)
+        while len(self._entries) > self.max_templates:
+            self._indexes.pop(self._entries.popitem(last=False)[0], None)
+        return entry
+
+    def template_bytes(self, form_key: str) -> bytes:
+        """The template PDF's bytes (read from disk only on a miss)."""
+        return self._entry(form_key)[1]
+
+    def wrapper(self, form_key: str) -> PdfWrapper:
+        """A fresh, unfilled PdfWrapper for the template."""
+        entry = self._entry(form_key)
+        if entry[2] is None:
+            entry[2] = PdfWrapper(entry[1])
+        return _clone_wrapper(entry[2])
+
+    def widget_index(self, form_key: str) -> dict:
+        """The template's widget index (see load_widget_index()).
+
+        Kept apart from the parsed templates, so assembling packets
+        never parses a wrapper.
+        """
+        pdf_path, stamp = self._stamp(form_key)
+        cached = self._indexes.get(form_key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        entry = self._entries.get(form_key)
+        data = entry[1] if entry is not None and entry[0] == stamp else pdf_path.read_bytes()
+        index = load_widget_index(form_key, data)
+        self._indexes[form_key] = (stamp, index)
+        return index
+
+    def acroform(self, form_key: str) -> "AcroFormTemplate":
+        """The template prepared for direct fills (see AcroFormTemplate)."""
+        entry = self._entry(form_key)
+        if entry[3] is None:
+            entry[3] = AcroFormTemplate(entry[1], self.widget_index(form_key))
+        return entry[3]
+
+    def invalidate(self, form_key: Optional[str] = None):
+        """Forget one template (or all of them)."""
+        if form_key is None:
+            self._entries.clear()
+            self._indexes.clear()
+        else:
+            self._entries.pop(form_key, None)
+            self._indexes.pop(form_key, None)
+
+
+_template_cache = TemplateCache()
+
+
+def clear_template_cache():
+    """Forget every parsed template (e.g. after replacing files in FORMS_DIR)."""
+    _template_cache.invalidate()
+
+
+# =============================================================================
+# Widget Index
+# =============================================================================
+
+# Sidecar next to each template in FORMS_DIR; bump the version when the
+# entry layout changes so older sidecars are rebuilt
+_INDEX_SUFFIX = ".widgets.json"
+_WIDGET_INDEX_VERSION = 2
+
+
+def build_widget_index(pdf_bytes: bytes) -> dict:
+    """Map each fully-qualified field name to its widgets.
+
+    Every widget is listed as {"page", "slot", "xref", "field", "key",
+    "rect", "type", "on_states"}, in page order. slot is the widget's
+    position in the page's annotation list: filling with PyPDFForm
+    renumbers objects but keeps that order, so slots (not xrefs) locate
+    widgets in filled copies. field is the xref holding the field's /V
+    (the widget itself, or its parent when the widget has no /T), and
+    key its partial name — the short name PyPDFForm fills it by.
+    on_states are a checkbox or radio button's non-Off states.
+    """
+    import fitz
+
+    index: dict[str, list[dict]] = {}
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for page in doc:
+            slots = {xref: slot for slot, (xref, *_) in enumerate(page.annot_xrefs())}
+            for widget in page.widgets():
+                on_states = []
+                if widget.field_type in (fitz.PDF_WIDGET_TYPE_CHECKBOX,
+                                         fitz.PDF_WIDGET_TYPE_RADIOBUTTON):
+                    states = (widget.button_states() or {}).get("normal") or []
+                    on_states = [state for state in states if state != "Off"]
+                field, key = widget.xref, doc.xref_get_key(widget.xref, "T")
+                if key[0] == "null":
+                    parent = doc.xref_get_key(widget.xref, "Parent")
+                    if parent[0] == "xref":
+                        field = int(parent[1].split()[0])
+                        key = doc.xref_get_key(field, "T")
+                index.setdefault(widget.field_name, []).append({
+                    "page": page.number,
+                    "slot": slots[widget.xref],
+                    "xref": widget.xref,
+                    "field": field,
+                    "key": key[1] if key[0] == "string" else "",
+                    "rect": [round(v, 2) for v in widget.rect],
+                    "type": widget.field_type_string,
+                    "on_states": on_states,
+                })
+    return index
+
+
+def load_widget_index(form_key: str, pdf_bytes: bytes) -> dict:
+    """The widget index for a template, from its sidecar when current.
+
+    The sidecar (<form_key>.widgets.json in FORMS_DIR) records the
+    SHA-256 of the template it was built from; a re-downloaded or
+    re-patched template gets a new index. Writing it is best-effort.
+    """
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    sidecar = FORMS_DIR / f"{form_key}{_INDEX_SUFFIX}"
+    try:
+        with open(sidecar) as f:
+            data = json.load(f)
+        if data.get("version") == _WIDGET_INDEX_VERSION and data.get("sha256") == digest:
+            return data["fields"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # missing or corrupt — rebuild
+
+    index = build_widget_index(pdf_bytes)
+    try:
+        tmp = sidecar.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"version": _WIDGET_INDEX_VERSION, "sha256": digest,
+                       "fields": index}, f)
+        os.replace(tmp, sidecar)
+    except OSError:
+        pass
+    return index
+
+
+def _text_widgets(index: dict, data: dict) -> list[tuple[str, int, int]]:
+    """(field name, page, slot) of the text widgets a fill with data could have set.
+
+    Short names match every widget with that partial name, as PyPDFForm
+    fills them; widget:/qualified keys match exactly.
+    """
+    names = {k.removeprefix(_WIDGET_PREFIX) for k in data}
+    return [
+        (name, widget["page"], widget["slot"])
+        for name, widgets in index.items()
+        for widget in widgets
+        if widget["type"] == "Text" and (name in names or widget["key"] in names)
+    ]
+
+
+# =============================================================================
+# AcroForm Writer
+# =============================================================================
+
+def _pdf_string(text: str) -> str:
+    """PDF source for a text string (UTF-16 when it is not plain ASCII)."""
+    if all(" " <= c <= "~" for c in text):
+        escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        return f"({escaped})"
+    return f"<FEFF{text.encode('utf-16-be').hex().upper()}>"
+
+
+def _text_appearance(rect: list, value: str, font_xref: int) -> tuple[str, bytes]:
+    """(dictionary, content) of a text widget's normal appearance stream.
+
+    Laid out like _flatten_filled_pdf() draws values: Helvetica up to
+    10pt, numbers right-aligned, baseline a quarter of the way up.
+    """
+    import fitz
+
+    width, height = rect[2] - rect[0], rect[3] - rect[1]
+    fontsize = min(10, height - 2)
+    if _NUMERIC_VALUE.fullmatch(value):
+        x = width - fitz.get_text_length(value, fontname="helv", fontsize=fontsize) - 2
+    else:
+        x = 1
+    text = "".join(
+        f"\\{c}" if c in "()\\" else c if " " <= c <= "~" else
+        f"\\{ord(c):03o}" if ord(c) < 256 else "?"
+        for c in value
+    )
+    content = (f"/Tx BMC q BT /Helv {fontsize:g} Tf 0 g {x:.2f} {height * 0.25:.2f} Td "
+               f"({text}) Tj ET Q EMC")
+    dictionary = (f"<</Type/XObject/Subtype/Form/BBox[0 0 {width:g} {height:g}]"
+                  f"/Resources<</Font<</Helv {font_xref} 0 R>>>>>>")
+    return dictionary, content.encode("latin-1")
+
+
+def _pdf_name(name: str) -> str:
+    """PDF source for a name object (e.g. a checkbox on-state)."""
+    return "/" + "".join(
+        c if c.isascii() and (c.isalnum() or c in "-_.+") else f"#{ord(c):02X}"
+        for c in name
+    )
+
+
+def _split_keys(data: dict) -> tuple[dict, dict]:
+    """Split field data into (fully-qualified, short-name) dicts.
+
+    Qualified keys are those containing '.' and those prefixed
+    'widget:' (prefix stripped); see _split_field_data().
+    """
+    qualified = {}
+    simple = {}
+    for k, v in data.items():
+        if k.startswith(_WIDGET_PREFIX):
+            qualified[k[len(_WIDGET_PREFIX):]] = v
+        elif "." in k:
+            qualified[k] = v
+        else:
+            simple[k] = v
+    return qualified, simple
+
+
+class AcroFormTemplate:
+    """A form template filled by writing field values straight into it.
+
+    fill() sets /V (and a button's /AS) on just the fields in the data
+    and appends those objects to the template as an incremental update,
+    so the rest of the document is never parsed or rewritten — unlike
+    PyPDFForm, which regenerates the whole PDF on read(). Keys follow
+    the same rules as _split_field_data(): qualified names set the first
+    widget of that field and must exist; short names set every widget
+    with that partial name and are ignored when absent. Filled text
+    widgets get a new appearance stream (_text_appearance()), so viewers
+    show the values without regenerating appearances themselves.
+    """
+
+    def __init__(self, pdf_bytes: bytes, index: dict):
+        import fitz
+
+        self.pdf_bytes = pdf_bytes
+        self.index = index
+        self.by_key: dict[str, list[dict]] = {}
+        for widgets in index.values():
+            for widget in widgets:
+                self.by_key.setdefault(widget["key"], []).append(widget)
+
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            self.size = doc.xref_length()
+            self.trailer = "".join(
+                f"/{key} {doc.xref_get_key(-1, key)[1]}"
+                for key in ("Root", "Info")
+                if doc.xref_get_key(-1, key)[0] == "xref"
+            )
+            # Encrypted strings, or offsets MuPDF had to repair, rule out
+            # appending to the original bytes; fill() then saves in full
+            self.incremental = (doc.xref_get_key(-1, "Encrypt")[0] == "null"
+                                and not doc.is_repaired)
+
+        self.prev = 0
+        self.xref_stream = False
+        self.generations: dict[int, int] = {}
+        if self.incremental:
+            self._read_last_xref()
+
+    def _read_last_xref(self):
+        """Locate the last cross-reference section for _append().
+
+        Without a startxref pointing at an xref table or stream (junk
+        after %%EOF, a truncated file), fill() saves in full instead.
+        """
+        pdf_bytes = self.pdf_bytes
+        startxrefs = re.findall(rb"startxref\s+(\d+)", pdf_bytes[-1024:])
+        prev = int(startxrefs[-1]) if startxrefs else -1
+        if prev < 0 or not (pdf_bytes.startswith(b"xref", prev)
+                or re.match(rb"\d+\s+\d+\s+obj\b", pdf_bytes[prev:prev + 32])):
+            self.incremental = False
+            return
+        self.prev = prev
+        self.xref_stream = not pdf_bytes.startswith(b"xref", prev)
+        # Copied from the last trailer as written: MuPDF decodes the
+        # binary /ID strings as text
+        file_id = re.search(rb"/ID\s*(\[\s*<[0-9A-Fa-f\s]*>\s*<[0-9A-Fa-f\s]*>\s*\])",
+                            pdf_bytes[prev:])
+        if file_id:
+            self.trailer += "/ID" + file_id.group(1).decode("ascii")
+        self.generations = {
+            int(num): int(gen)
+            for num, gen in re.findall(rb"\b(\d+) (\d+) obj\b", pdf_bytes) if gen != b"0"
+        }
+
+    def fill(self, data: dict) -> bytes:
+        """The template with data filled in, as PDF bytes."""
+        import fitz
+
+        qualified, simple = _split_keys(data)
+        missing = sorted(name for name in qualified if name not in self.index)
+        if missing:
+            raise ValueError(f"Fully-qualified fields not found in PDF: {missing}")
+
+        updates: dict[int, dict[str, str]] = {}
+        appearances: dict[int, tuple[dict, str]] = {}  # widget xref → (widget, text)
+        for name, value in qualified.items():
+            self._set(updates, appearances, self.index[name][0], value, clear=False)
+        for key, value in simple.items():
+            for widget in self.by_key.get(key, ()):
+                self._set(updates, appearances, widget, value, clear=True)
+        if not updates:
+            return self.pdf_bytes
+
+        doc = fitz.open(stream=self.pdf_bytes, filetype="pdf")
+        try:
+            if appearances:
+                font = doc.get_new_xref()
+                doc.update_object(
+                    font, "<</Type/Font/Subtype/Type1/BaseFont/Helvetica"
+                          "/Encoding/WinAnsiEncoding>>")
+                for xref, (widget, text) in appearances.items():
+                    dictionary, content = _text_appearance(widget["rect"], text, font)
+                    stream = doc.get_new_xref()
+                    doc.update_object(stream, dictionary)
+                    doc.update_stream(stream, content, compress=0)
+                    updates[xref]["AP"] = f"<</N {stream} 0 R>>"
+            for xref, keys in updates.items():
+                for key, value in keys.items():
+                    doc.xref_set_key(xref, key, value)
+            if not self.incremental:
+                return doc.tobytes()
+            size = doc.xref_length()
+            objects = [(xref, doc.xref_object(xref, compressed=True), None)
+                       for xref in sorted(updates)]
+            objects += [(xref, doc.xref_object(xref, compressed=True),
+                         doc.xref_stream_raw(xref))
+                        for xref in range(self.size, size)]
+        finally:
+            doc.close()
+        return self._append(objects, size)
+
+    @staticmethod
+    def _set(updates: dict, appearances: dict, widget: dict, value, clear: bool):
+        """Stage one widget's value (PyPDFForm's rules for short names).
+
+        A false value unchecks a button when clear is set (short names)
+        and leaves it alone otherwise (qualified names); None is skipped.
+        A text widget is queued in appearances unless its value is empty.
+        """
+        if value is None:
+            return
+        if widget["type"] in ("CheckBox", "RadioButton"):
+            if value:
+                state = next(iter(widget["on_states"]), "Yes")
+            elif clear:
+                state = "Off"
+            else:
+                return
+            updates.setdefault(widget["field"], {})["V"] = _pdf_name(state)
+            updates.setdefault(widget["xref"], {})["AS"] = _pdf_name(state)
+        else:
+            text = str(value)
+            updates.setdefault(widget["field"], {})["V"] = _pdf_string(text)
+            updates.setdefault(widget["xref"], {})
+            if text:
+                appearances[widget["xref"]] = (widget, text)
+            else:
+                appearances.pop(widget["xref"], None)
+
+    def _append(self, objects: list[tuple], size: int) -> bytes:
+        """The template plus an incremental update of (xref, source, stream)
+        objects; size is the new number of objects."""
+        out = bytearray(self.pdf_bytes)
+        if not out.endswith(b"\n"):
+            out += b"\n"
+        entries = []  # (xref, offset, generation)
+        for xref, source, stream in objects:
+            generation = self.generations.get(xref, 0)
+            entries.append((xref, len(out), generation))
+            out += f"{xref} {generation} obj\n{source}\n".encode("latin-1")
+            if stream is not None:
+                out += b"stream\n" + stream + b"\nendstream\n"
+            out += b"endobj\n"
+
+        startxref = len(out)
+        if self.xref_stream:
+            # Cross-reference streams can only be followed by another one
+            entries.append((size, startxref, 0))
+            rows = b"".join(b"\x01" + offset.to_bytes(4, "big") + generation.to_bytes(2, "big")
+                            for _, offset, generation in entries)
+            index = " ".join(f"{xref} 1" for xref, _, _ in entries)
+            out += (f"{size} 0 obj\n<</Type/XRef/Size {size + 1}/Index[{index}]"
+                    f"/W[1 4 2]{self.trailer}/Prev {self.prev}/Length {len(rows)}>>\n"
+                    f"stream\n").encode("latin-1")
+            out += rows + b"\nendstream\nendobj\n"
+        else:
+            out += b"xref\n0 1\n0000000000 65535 f \n"
+            for xref, offset, generation in entries:
+                out += f"{xref} 1\n{offset:010d} {generation:05d} n \n".encode("latin-1")
+            out += (f"trailer\n<</Size {size}{self.trailer}/Prev {self.prev}>>\n"
+                    ).encode("latin-1")
+        out += f"startxref\n{startxref}\n%%EOF\n".encode("latin-1")
+        return bytes(out)
+
+
 def download_all_forms(force: bool = False):
     """Download all required IRS forms."""
     for form_key in IRS_FORM_URLS:
@@ -166,8 +633,7 @@ def inspect_form_fields(form_key: str) -> dict:
 
     Bug 10 fix: Single clean iteration over wrapper.schema.items().
     """
-    pdf_path = download_irs_form(form_key)
-    wrapper = PdfWrapper(str(pdf_path))
+    wrapper = _template_cache.wrapper(form_key)
 
     fields = {}
     for field_name, field_info in wrapper.schema.items():
@@ -195,7 +661,8 @@ def inspect_form_fields_raw(form_key: str) -> list[str]:
     return sorted(field_names)
 
 
-def _apply_qualified_fields(pdf_bytes: bytes, values: dict) -> bytes:
+def _apply_qualified_fields(pdf_bytes: bytes, values: dict,
+                            index: Optional[dict] = None) -> bytes:
     """Set widget values by fully-qualified field name using pymupdf.
 
     PyPDFForm matches fields by short name (e.g. "c1_8[0]"), which is
@@ -204,25 +671,38 @@ def _apply_qualified_fields(pdf_bytes: bytes, values: dict) -> bytes:
     column Single/MFJ/MFS, right column HOH/QSS), and filling the short
     name checks a box in BOTH groups. Field-mapping keys containing a
     '.' are treated as fully-qualified names and applied here instead.
+
+    With the template's widget index, each field's widget is loaded by
+    xref rather than found by walking every widget on every page.
     """
     import fitz
 
+    def apply(widget, value, on_states):
+        if widget.field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
+            if value:
+                widget.field_value = next(iter(on_states), "Yes")
+                widget.update()
+        else:
+            widget.field_value = str(value)
+            widget.update()
+
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     remaining = dict(values)
-    for page in doc:
-        for widget in page.widgets():
-            if widget.field_name not in remaining:
-                continue
-            value = remaining.pop(widget.field_name)
-            if widget.field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
-                if value:
-                    states = (widget.button_states() or {}).get("normal", [])
-                    on_state = next((s for s in states if s != "Off"), "Yes")
-                    widget.field_value = on_state
-                    widget.update()
-            else:
-                widget.field_value = str(value)
-                widget.update()
+    if index is not None:
+        for name in list(remaining):
+            if name in index:
+                entry = index[name][0]
+                page = doc[entry["page"]]  # widgets hold only a weak reference
+                apply(page.load_widget(entry["xref"]), remaining.pop(name),
+                      entry["on_states"])
+    else:
+        for page in doc:
+            for widget in page.widgets():
+                if widget.field_name not in remaining:
+                    continue
+                states = (widget.button_states() or {}).get("normal", [])
+                apply(widget, remaining.pop(widget.field_name),
+                      [state for state in states if state != "Off"])
     out = doc.tobytes()
     doc.close()
     if remaining:
@@ -236,30 +716,44 @@ _WIDGET_PREFIX = "widget:"
 
 
 def _split_field_data(form_key: str, data: dict) -> tuple:
-    """Split field data into (PyPDFForm bytes-or-path source, short-name dict).
+    """Split field data into (PdfWrapper to fill, short-name dict).
 
     Two kinds of keys are pre-applied to the source PDF via pymupdf
     (_apply_qualified_fields); the rest go through PyPDFForm:
     - keys containing '.' — fully-qualified names for ambiguous fields
     - keys prefixed 'widget:' — fields PyPDFForm cannot set, e.g. the
       Colorado DR 0104 "RB*" buttons whose only state is the on-state
+    Without such keys the wrapper is a copy of the cached template.
     """
-    pdf_path = download_irs_form(form_key)
-    qualified = {}
-    simple = {}
-    for k, v in data.items():
-        if k.startswith(_WIDGET_PREFIX):
-            qualified[k[len(_WIDGET_PREFIX):]] = v
-        elif "." in k:
-            qualified[k] = v
-        else:
-            simple[k] = v
-
+    qualified, simple = _split_keys(data)
     if qualified:
-        source = _apply_qualified_fields(pdf_path.read_bytes(), qualified)
+        wrapper = PdfWrapper(_apply_qualified_fields(
+            _template_cache.template_bytes(form_key), qualified,
+            _template_cache.widget_index(form_key)))
     else:
-        source = str(pdf_path)
-    return source, simple
+        wrapper = _template_cache.wrapper(form_key)
+    return wrapper, simple
+
+
+def fill_form_bytes(form_key: str, data: dict) -> bytes:
+    """Fill a PDF form with data and return the filled PDF in memory.
+
+    Same field handling as fill_form(); nothing is written to disk.
+    Values are written directly into the template (AcroFormTemplate);
+    without pymupdf, PyPDFForm fills it instead.
+    """
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        return _fill_with_pypdfform(form_key, data)
+    return _template_cache.acroform(form_key).fill(data)
+
+
+def _fill_with_pypdfform(form_key: str, data: dict) -> bytes:
+    """fill_form_bytes() through PyPDFForm (pymupdf only for qualified names)."""
+    wrapper, simple = _split_field_data(form_key, data)
+    wrapper.fill(simple)
+    return wrapper.read()
 
 
 def fill_form(form_key: str, data: dict, output_path: str) -> str:
@@ -274,19 +768,17 @@ def fill_form(form_key: str, data: dict, output_path: str) -> str:
     Returns:
         Path to the filled PDF
     """
-    source, simple = _split_field_data(form_key, data)
+    output = _write_pdf(fill_form_bytes(form_key, data), output_path)
+    print(f"Filled {form_key} → {output}")
+    return str(output)
 
-    wrapper = PdfWrapper(source)
-    wrapper.fill(simple)
 
+def _write_pdf(pdf_bytes: bytes, output_path: str) -> Path:
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
-
     with open(output, "wb") as f:
-        f.write(wrapper.read())
-
-    print(f"Filled {form_key} → {output}")
-    return str(output)
+        f.write(pdf_bytes)
+    return output
 
 
 def fill_and_flatten(form_key: str, data: dict, output_path: str) -> str:
@@ -295,9 +787,7 @@ def fill_and_flatten(form_key: str, data: dict, output_path: str) -> str:
     Uses PyPDFForm's flatten=True parameter to burn field values
     into the page content, making the form read-only.
     """
-    source, simple = _split_field_data(form_key, data)
-
-    wrapper = PdfWrapper(source)
+    wrapper, simple = _split_field_data(form_key, data)
     wrapper.fill(simple, flatten=True)
 
     output = Path(output_path)
@@ -351,39 +841,70 @@ def _packet_sort_key(path: str, sequence: dict) -> tuple:
 _NUMERIC_VALUE = re.compile(r"-?[\d,]+(\.\d+)?")
 
 
-def _flatten_filled_pdf(path: str):
-    """Open a filled PDF and burn its field values into page content.
+def _indexed_widgets(doc, text_widgets: list) -> Optional[list]:
+    """(page, widget) for each indexed entry, or None if any slot has moved."""
+    import fitz
+
+    pages, found = {}, []
+    for name, pno, slot in text_widgets:
+        if pno not in pages:
+            page = doc[pno]
+            pages[pno] = (page, page.annot_xrefs())
+        page, annots = pages[pno]
+        if slot >= len(annots) or annots[slot][1] != fitz.PDF_ANNOT_WIDGET:
+            return None
+        widget = page.load_widget(annots[slot][0])
+        if widget.field_name != name:
+            return None
+        found.append((page, widget))
+    return found
+
+
+def _flatten_filled_pdf(source, text_widgets: Optional[list] = None):
+    """Open a filled PDF (path or bytes) and burn its field values into page content.
 
     pymupdf's bake() correctly bakes checkbox appearances but drops
     PyPDFForm-written text values (their appearance streams confuse
     MuPDF — "not a dict" errors). So text values are drawn onto the
-    page explicitly first, then bake() removes the widgets and bakes
-    the checkbox glyphs. Numeric values are right-aligned like the
-    original form fields.
+    page explicitly and their widgets deleted — baking them as well
+    would draw any appearance they have (AcroFormTemplate writes real
+    ones) a second time — then bake() bakes the remaining widgets'
+    checkbox glyphs. Numeric values are right-aligned like the original
+    form fields.
+
+    text_widgets, (field name, page, slot) entries from the template's
+    widget index (_text_widgets()), limits the drawing to the fields
+    that were filled; by default, or when an entry no longer names the
+    widget in its slot, every widget on every page is visited.
     """
     import fitz
 
-    doc = fitz.open(path)
-    for page in doc:
-        for widget in page.widgets():
-            if widget.field_type != fitz.PDF_WIDGET_TYPE_TEXT:
-                continue
-            value = str(widget.field_value or "")
-            if not value:
-                continue
-            rect = widget.rect
-            fontsize = min(10, rect.height - 2)
-            if _NUMERIC_VALUE.fullmatch(value):
-                width = fitz.get_text_length(
-                    value, fontname="helv", fontsize=fontsize
-                )
-                x = rect.x1 - width - 2
-            else:
-                x = rect.x0 + 1
-            page.insert_text(
-                (x, rect.y1 - rect.height * 0.25),
-                value, fontsize=fontsize, fontname="helv",
+    if isinstance(source, bytes):
+        doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        doc = fitz.open(source)
+    widgets = _indexed_widgets(doc, text_widgets) if text_widgets is not None else None
+    if widgets is None:
+        widgets = [(page, widget) for page in doc for widget in page.widgets()
+                   if widget.field_type == fitz.PDF_WIDGET_TYPE_TEXT]
+    for page, widget in widgets:
+        value = str(widget.field_value or "")
+        rect = widget.rect
+        page.delete_widget(widget)
+        if not value:
+            continue
+        fontsize = min(10, rect.height - 2)
+        if _NUMERIC_VALUE.fullmatch(value):
+            width = fitz.get_text_length(
+                value, fontname="helv", fontsize=fontsize
             )
+            x = rect.x1 - width - 2
+        else:
+            x = rect.x0 + 1
+        page.insert_text(
+            (x, rect.y1 - rect.height * 0.25),
+            value, fontsize=fontsize, fontname="helv",
+        )
     doc.bake()
     return doc
 
@@ -403,26 +924,37 @@ def assemble_filing_packets(
     Returns:
         List of packet paths created.
     """
+    return _assemble_packets([(Path(p).name, p, None) for p in pdf_paths],
+                             output_dir, filename_suffix)
+
+
+def _assemble_packets(forms: list[tuple], output_dir: str, filename_suffix: str) -> list:
+    """assemble_filing_packets() for (file name, path or PDF bytes, text widgets).
+
+    Filled forms still in memory are flattened and merged without
+    touching disk; the file name only decides packet and page order.
+    Text widgets are passed to _flatten_filled_pdf() (None visits all).
+    """
     import fitz
 
-    federal = [p for p in pdf_paths if not Path(p).name.startswith("co_")]
-    colorado = [p for p in pdf_paths if Path(p).name.startswith("co_")]
+    federal = [f for f in forms if not f[0].startswith("co_")]
+    colorado = [f for f in forms if f[0].startswith("co_")]
 
     # bake() complains (harmlessly) about PyPDFForm appearance streams
     fitz.TOOLS.mupdf_display_errors(False)
     packets = []
     try:
-        for paths, sequence, basename in (
+        for group, sequence, basename in (
             (federal, _FEDERAL_SEQUENCE, "federal_return"),
             (colorado, _COLORADO_SEQUENCE, "colorado_return"),
         ):
-            if not paths:
+            if not group:
                 continue
             merged = fitz.open()
-            for path in sorted(
-                paths, key=lambda p: _packet_sort_key(p, sequence)
+            for _, source, text_widgets in sorted(
+                group, key=lambda f: _packet_sort_key(f[0], sequence)
             ):
-                src = _flatten_filled_pdf(path)
+                src = _flatten_filled_pdf(source, text_widgets)
                 merged.insert_pdf(src)
                 src.close()
             out = Path(output_dir) / f"{basename}_{filename_suffix}.pdf"
@@ -440,9 +972,57 @@ def assemble_filing_packets(
 # Form Generation Pipeline (Phase 6)
 # =============================================================================
 
+def _fill_spec(form_key: str, data: dict) -> tuple:
+    """fill_form_bytes() for one spec, as (PDF bytes, None) or (None, error message)."""
+    try:
+        return fill_form_bytes(form_key, data), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _use_forms_dir(forms_dir: Path):
+    """Pool initializer: read templates from the parent's FORMS_DIR."""
+    global FORMS_DIR
+    FORMS_DIR = forms_dir
+
+
+def _fill_specs(jobs: list[tuple], workers: int) -> list[tuple]:
+    """Run _fill_spec over (form_key, data) jobs, in job order.
+
+    With workers > 1 the jobs are spread over a process pool — fills are
+    CPU-bound pure Python, so threads would not overlap them. Each
+    template is downloaded and indexed here first, so the workers only
+    read templates and sidecars and never race to write them.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [_fill_spec(*job) for job in jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    for form_key in dict.fromkeys(form_key for form_key, _ in jobs):
+        try:
+            _template_cache.widget_index(form_key)
+        except Exception:
+            pass  # each of its specs reports the error from its own fill
+
+    outcomes = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)),
+                             initializer=_use_forms_dir,
+                             initargs=(FORMS_DIR,)) as pool:
+        futures = [pool.submit(_fill_spec, *job) for job in jobs]
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                # The worker itself died (e.g. BrokenProcessPool)
+                outcomes.append((None, f"{type(e).__name__}: {e}"))
+    return outcomes
+
+
 def generate_all_forms(
     result, profile, output_dir: str, filename_suffix: str = "filled",
-    assemble_packets: bool = True,
+    assemble_packets: bool = True, write_forms: bool = True,
+    workers: Optional[int] = 1,
 ) -> list[str]:
     """Orchestrate generation of all required tax forms.
 
@@ -454,9 +1034,16 @@ def generate_all_forms(
             defaults to "filled" → f1040_filled.pdf
         assemble_packets: Also merge the individual forms into
             print-ready federal/Colorado packets in attachment order
+        write_forms: Save each filled form as its own PDF. Packets are
+            assembled from the filled bytes in memory either way, so
+            with write_forms=False only the packets touch disk.
+        workers: Processes to fill forms with (None for one per CPU).
+            Field data is built here either way; only the fills fan out.
+            A pool pays off only with several cores and many forms
+            (scripts/bench_fill_forms.py).
 
     Returns:
-        List of paths to generated PDFs (packets last)
+        List of paths to generated PDFs in spec order (packets last)
     """
     output = Path(output_dir)
     output.mkdir(parents=True, exist_ok=True)
@@ -543,21 +1130,37 @@ def generate_all_forms(
                 lambda: build_dr0104pn_data(co_result, result, profile),
             ))
 
+    # Build every spec's field data first; a failure skips only that form
+    built, jobs = [], []
     for description, form_key, basename, build_data in specs:
         try:
             data = build_data()
-            path = fill_form(
-                form_key, data,
-                str(output / f"{basename}_{filename_suffix}.pdf"),
-            )
-            generated.append(path)
         except Exception as e:
             print(f"Error generating {description}: {e}")
-
-    if assemble_packets and generated:
+            continue
+        built.append((description, form_key, f"{basename}_{filename_suffix}.pdf"))
+        jobs.append((form_key, data))
+
+    filled = []  # (file name, PDF bytes, form_key, data) for packet assembly
+    for (description, form_key, name), (_, data), (pdf_bytes, error) in zip(
+            built, jobs, _fill_specs(jobs, workers or os.cpu_count() or 1)):
+        if error is not None:
+            print(f"Error generating {description}: {error}")
+            continue
+        filled.append((name, pdf_bytes, form_key, data))
+        if write_forms:
+            path = _write_pdf(pdf_bytes, str(output / name))
+            print(f"Filled {form_key} → {path}")
+            generated.append(str(path))
+
+    if assemble_packets and filled:
         try:
             generated.extend(
-                assemble_filing_packets(generated, str(output), filename_suffix)
+                _assemble_packets(
+                    [(name, pdf_bytes,
+                      _text_widgets(_template_cache.widget_index(form_key), data))
+                     for name, pdf_bytes, form_key, data in filled],
+                    str(output), filename_suffix)
             )
         except Exception as e:
             print(f"Error assembling filing packets: {e}")
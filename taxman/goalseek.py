@@ -0,0 +1,214 @@
+"""Goal-seek solvers for tax planning questions.
+
+Each solver answers a "how much X gets me to Y?" question exactly, by
+searching over numbers-only evaluations of the return rather than
+estimating from a single marginal rate:
+
+    max_sep_in_bracket(profile)       # largest SEP contribution that keeps
+                                      # taxable income in the 22% bracket
+    payment_to_owe_zero(profile)      # extra Q4 estimate needed to owe $0
+    qbi_phaseout_expense(profile)     # added expense that brings income down
+                                      # to the QBI phase-out threshold
+
+Money is searched in whole cents by bisection (seek_cents), so a
+$100,000 range takes about 24 evaluations. TaxEvaluator reuses every
+schedule a what-if edit does not touch, so most evaluations rerun only
+the Form 1040 assembly.
+"""
+
+import copy
+from typing import Callable, Optional
+
+from taxman.calculator import (
+    BRACKET_TABLES,
+    QBI_THRESHOLDS,
+    Form1040Result,
+    Form2555Result,
+    calculate_return,
+    calculate_sep_limit,
+)
+from taxman.incremental import IncrementalReturn
+from taxman.models import EstimatedPayment, FilingStatus, TaxpayerProfile
+
+
+class TaxEvaluator:
+    """Fast numbers-only evaluation of one profile under what-if edits.
+
+    Usage:
+        ev = TaxEvaluator(profile)
+        ev.evaluate(sep_ira_contribution=10_000).total_tax
+    """
+
+    def __init__(self, profile: TaxpayerProfile,
+                 feie: Optional[Form2555Result] = None):
+        self.profile = profile
+        self.feie = feie
+        self.evaluations = 0
+        self._schedules = IncrementalReturn()
+
+    def evaluate(self, **changes) -> Form1040Result:
+        """Return (numbers only) for the profile with `changes` applied.
+
+        The profile itself is never modified; changes replace top-level
+        TaxpayerProfile fields on a shallow copy.
+        """
+        what_if = copy.copy(self.profile)
+        for name, value in changes.items():
+            if not hasattr(what_if, name):
+                raise AttributeError(f"TaxpayerProfile has no field {name!r}")
+            setattr(what_if, name, value)
+        self.evaluations += 1
+        return calculate_return(what_if, feie=self.feie,
+                                schedules=self._schedules, explain=False)
+
+
+def seek_cents(predicate: Callable[[float], bool], low: float,
+               high: float) -> Optional[float]:
+    """Largest amount in [low, high], in whole cents, where predicate holds.
+
+    predicate must be monotone — True up to some amount, False beyond
+    it. Returns None if it is already False at low.
+    """
+    lo, hi = round(low * 100), round(high * 100)
+    if not predicate(lo / 100):
+        return None
+    if predicate(hi / 100):
+        return hi / 100
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if predicate(mid / 100):
+            lo = mid
+        else:
+            hi = mid
+    return lo / 100
+
+
+def max_sep_in_bracket(
+    profile: TaxpayerProfile,
+    rate: float = 0.22,
+    feie: Optional[Form2555Result] = None,
+) -> dict:
+    """Largest SEP-IRA contribution that keeps taxable income in `rate`'s bracket.
+
+    Contributions beyond this amount only save tax at the next lower
+    rate. The search covers the full contribution (the profile's
+    current sep_ira_contribution is ignored) up to the deductible limit,
+    and sees the QBI deduction shrink as the contribution grows.
+    """
+    table = BRACKET_TABLES.get(profile.filing_status, BRACKET_TABLES[FilingStatus.MFS])
+    if rate not in table.rates:
+        raise ValueError(f"{rate:.0%} is not a {profile.filing_status.value.upper()} "
+                         f"bracket rate")
+
+    ev = TaxEvaluator(profile, feie=feie)
+    base = ev.evaluate(sep_ira_contribution=0.0)
+    business_income = sum(sc.net_profit_loss for sc in base.schedule_c_results)
+    deductible_se = base.schedule_se.deductible_se_tax if base.schedule_se else 0.0
+    limit = calculate_sep_limit(business_income, deductible_se)
+
+    def in_bracket(contribution: float) -> bool:
+        result = ev.evaluate(sep_ira_contribution=contribution)
+        return table.marginal_rate(result.taxable_income) >= rate
+
+    contribution = seek_cents(in_bracket, 0.0, limit) or 0.0
+    result = ev.evaluate(sep_ira_contribution=contribution)
+    return {
+        "contribution": contribution,
+        "deduction_limit": limit,
+        "taxable_income": result.taxable_income,
+        "marginal_rate": table.marginal_rate(result.taxable_income),
+        "total_tax": result.total_tax,
+        "tax_savings": round(base.total_tax - result.total_tax, 2),
+        "evaluations": ev.evaluations,
+    }
+
+
+def payment_to_owe_zero(
+    profile: TaxpayerProfile,
+    quarter: int = 4,
+    feie: Optional[Form2555Result] = None,
+) -> dict:
+    """Extra estimated payment (in `quarter`) needed to owe $0 at filing.
+
+    Payments never feed back into the tax itself, so the amount owed is
+    the answer; it is confirmed with a second evaluation that includes
+    the payment.
+    """
+    ev = TaxEvaluator(profile, feie=feie)
+    result = ev.evaluate()
+    extra = result.amount_owed
+    if extra > 0:
+        payments = [*profile.estimated_payments,
+                    EstimatedPayment(quarter=quarter, amount=extra)]
+        # Float summation can leave a cent owing — cover it
+        if ev.evaluate(estimated_payments=payments).amount_owed > 0:
+            extra = round(extra + 0.01, 2)
+    return {
+        "extra_payment": extra,
+        "quarter": quarter,
+        "total_tax": result.total_tax,
+        "total_payments": result.total_payments,
+        "evaluations": ev.evaluations,
+    }
+
+
+def qbi_phaseout_expense(
+    profile: TaxpayerProfile,
+    business_index: int = 0,
+    feie: Optional[Form2555Result] = None,
+) -> dict:
+    """Additional Schedule C expense that ends the QBI phase-out.
+
+    Above the QBI threshold the W-2 wage / UBIA limitation phases in
+    (Form 8995-A). This finds the smallest extra expense on one business
+    (booked as other expenses, line 27b) that brings taxable income
+    before QBI down to the threshold. The expense also lowers SE tax and
+    the deductible half of it, which the search accounts for. Returns an
+    "additional_expense" of 0.0 when the return is not in the phase-out,
+    and None when the business's profit cannot cover it — as for a
+    wage-heavy return, where the profit runs out while taxable income is
+    still above the threshold.
+
+    The search is on taxable income itself, not on Form 8995's
+    is_limited flag: that flag is also False once total QBI reaches
+    zero, however high the income.
+    """
+    if not profile.businesses:
+        raise ValueError("profile has no Schedule C businesses")
+    ev = TaxEvaluator(profile, feie=feie)
+    base = ev.evaluate()
+    biz = profile.businesses[business_index]
+
+    def with_expense(amount: float) -> Form1040Result:
+        changed = copy.copy(biz)
+        changed.expenses = copy.copy(biz.expenses)
+        changed.expenses.other_expenses += amount
+        businesses = list(profile.businesses)
+        businesses[business_index] = changed
+        return ev.evaluate(businesses=businesses)
+
+    threshold = QBI_THRESHOLDS[profile.filing_status][0]
+
+    def above_threshold(result: Form1040Result) -> bool:
+        return result.agi - result.deduction > threshold
+
+    if not base.qbi or not above_threshold(base):
+        expense = 0.0
+    else:
+        max_expense = max(base.schedule_c_results[business_index].net_profit_loss, 0)
+        still_limited = seek_cents(lambda x: above_threshold(with_expense(x)),
+                                   0.0, max_expense)
+        if still_limited is None or still_limited >= max_expense:
+            expense = None
+        else:
+            expense = round(still_limited + 0.01, 2)
+
+    result = with_expense(expense) if expense else base
+    return {
+        "business": biz.business_name,
+        "additional_expense": expense,
+        "qbi_deduction_before": base.qbi_deduction,
+        "qbi_deduction_after": result.qbi_deduction,
+        "total_tax_after": result.total_tax,
+        "evaluations": ev.evaluations,
+    }
@@ -0,0 +1,215 @@
+"""Incremental recalculation of a return after profile edits.
+
+calculate_return() rebuilds every schedule — and every LineItem
+explanation — on each call. In interactive what-if loops (the wizard,
+"what if I add this expense?") a single edit usually touches one
+schedule. IncrementalReturn keeps the schedule results of the previous
+run and, guided by the dependency graph below, recomputes only the
+nodes whose inputs changed:
+
+    profile fields ──► Schedule C (per business) ─┐
+                   ──► Schedule E ────────────────┼─► Schedule SE ─┐
+                   ──► Schedule D ────────────────┘                ├─► Form 1040
+                                        Form 8995 (QBI) ◄──────────┘
+
+Schedule C/E/D read profile fields directly (NODE_INPUTS). Schedule SE
+and Form 8995 are fed numbers computed by the 1040 assembly, so they are
+keyed on the values they receive and recompute only when those values
+change. The Form 1040 assembly itself reruns whenever any field changed;
+with nothing changed the previous result is returned as-is.
+
+Every node is also keyed on the explain flag. A numbers-only
+(explain=False) request reuses an explained result when one exists,
+never the other way round.
+
+Reused schedule results are shared between successive Form1040Results,
+so treat them as read-only.
+"""
+
+from typing import Optional
+
+from taxman.calculator import (
+    Form1040Result,
+    Form2555Result,
+    Form8995Result,
+    ScheduleCalculator,
+    ScheduleCResult,
+    ScheduleDResult,
+    ScheduleEResult,
+    ScheduleSEResult,
+    calculate_return,
+)
+from taxman.models import FilingStatus, ScheduleCData, TaxpayerProfile
+
+
+# Profile fields each profile-fed node reads
+NODE_INPUTS = {
+    "schedule_c": ("businesses", "forms_1099_nec"),
+    "schedule_e": ("schedule_k1s", "schedule_e_properties", "filing_status"),
+    "schedule_d": ("forms_1099_b", "schedule_k1s", "forms_1099_div",
+                   "filing_status"),
+}
+
+# Nodes fed by other nodes rather than directly by profile fields
+NODE_UPSTREAM = {
+    "schedule_se": ("schedule_c", "schedule_e"),
+    "form_8995": ("schedule_c", "schedule_se", "schedule_d"),
+    "form_1040": ("schedule_c", "schedule_e", "schedule_d",
+                  "schedule_se", "form_8995"),
+}
+
+
+def _fingerprint(value) -> str:
+    """Stable value fingerprint — dataclass reprs include every field."""
+    return repr(value)
+
+
+class IncrementalReturn(ScheduleCalculator):
+    """Recalculates a return, reusing schedules whose inputs are unchanged.
+
+    Usage:
+        inc = IncrementalReturn()
+        result = inc.calculate(profile)
+        profile.businesses[0].expenses.supplies += 500
+        result = inc.calculate(profile)   # only that Schedule C reruns
+        inc.recomputed                     # {"schedule_c", "schedule_se", ...}
+    """
+
+    def __init__(self):
+        self.result: Optional[Form1040Result] = None
+        # Nodes actually recomputed by the most recent calculate()
+        self.recomputed: set[str] = set()
+        self._field_prints: dict[str, str] = {}
+        # (FEIE fingerprint, explain) of the last calculate()
+        self._inputs_print: Optional[tuple] = None
+        # node -> {input fingerprint: result}
+        self._memo: dict[str, dict] = {
+            node: {} for node in (*NODE_INPUTS, "schedule_se", "form_8995")
+        }
+        self._used: dict[str, set] = {node: set() for node in self._memo}
+
+    # ── Dependency tracking ─────────────────────────────────────────
+
+    def changed_fields(self, profile: TaxpayerProfile) -> set[str]:
+        """Profile fields that differ from the last calculate() call."""
+        if self.result is None:
+            return set(vars(profile))
+        return {
+            name for name, value in vars(profile).items()
+            if self._field_prints.get(name) != _fingerprint(value)
+        }
+
+    def dirty_nodes(self, profile: TaxpayerProfile) -> set[str]:
+        """Nodes a calculate() on this profile would have to revisit.
+
+        Schedule SE and Form 8995 are listed when an upstream node is
+        dirty; they may still be reused if the values they receive turn
+        out unchanged.
+        """
+        changed = self.changed_fields(profile)
+        dirty = {node for node, inputs in NODE_INPUTS.items()
+                 if changed.intersection(inputs)}
+        if changed:
+            dirty.add("form_1040")
+        for node, upstream in NODE_UPSTREAM.items():
+            if dirty.intersection(upstream):
+                dirty.add(node)
+        return dirty
+
+    # ── Calculation ─────────────────────────────────────────────────
+
+    def calculate(self, profile: TaxpayerProfile,
+                  feie: Optional[Form2555Result] = None,
+                  explain: bool = True) -> Form1040Result:
+        """Calculate the return, recomputing only what changed."""
+        inputs_print = (_fingerprint(feie), explain)
+        if (self.result is not None and not self.changed_fields(profile)
+                and inputs_print == self._inputs_print):
+            self.recomputed = set()
+            return self.result
+
+        self.recomputed = {"form_1040"}
+        for used in self._used.values():
+            used.clear()
+
+        result = calculate_return(profile, feie=feie, schedules=self,
+                                  explain=explain)
+
+        # Drop results no longer reachable from the current profile
+        for node, memo in self._memo.items():
+            for key in set(memo) - self._used[node]:
+                del memo[key]
+
+        self._field_prints = {
+            name: _fingerprint(value) for name, value in vars(profile).items()
+        }
+        self._inputs_print = inputs_print
+        self.result = result
+        return result
+
+    def _lookup(self, node: str, key, explain: bool, compute):
+        """Memoized compute(); a numbers-only request reuses an explained result."""
+        memo = self._memo[node]
+        if not explain and (key, True) in memo:
+            key = (key, True)
+        else:
+            key = (key, explain)
+        self._used[node].add(key)
+        if key not in memo:
+            memo[key] = compute()
+            self.recomputed.add(node)
+        return memo[key]
+
+    # ── ScheduleCalculator overrides ────────────────────────────────
+
+    def schedule_c(self, biz: ScheduleCData,
+                   explain: bool = True) -> ScheduleCResult:
+        return self._lookup(
+            "schedule_c", _fingerprint(biz), explain,
+            lambda: super(IncrementalReturn, self).schedule_c(biz, explain),
+        )
+
+    def schedule_e(self, profile: TaxpayerProfile,
+                   explain: bool = True) -> ScheduleEResult:
+        key = tuple(_fingerprint(getattr(profile, name))
+                    for name in NODE_INPUTS["schedule_e"])
+        return self._lookup(
+            "schedule_e", key, explain,
+            lambda: super(IncrementalReturn, self).schedule_e(profile, explain),
+        )
+
+    def schedule_d(self, profile: TaxpayerProfile,
+                   filing_status: FilingStatus,
+                   explain: bool = True) -> ScheduleDResult:
+        key = tuple(_fingerprint(getattr(profile, name))
+                    for name in NODE_INPUTS["schedule_d"]) + (filing_status,)
+        return self._lookup(
+            "schedule_d", key, explain,
+            lambda: super(IncrementalReturn, self).schedule_d(
+                profile, filing_status, explain),
+        )
+
+    def schedule_se(self, net_se_income: float, w2_ss_wages: float = 0.0,
+                    explain: bool = True) -> ScheduleSEResult:
+        return self._lookup(
+            "schedule_se", (net_se_income, w2_ss_wages), explain,
+            lambda: super(IncrementalReturn, self).schedule_se(
+                net_se_income, w2_ss_wages, explain),
+        )
+
+    def qbi(self, taxable_income_before_qbi: float,
+            schedule_c_results: list[ScheduleCResult],
+            filing_status: FilingStatus, **kwargs) -> Form8995Result:
+        explain = kwargs.get("explain", True)
+        key = (
+            taxable_income_before_qbi,
+            tuple((r.business_name, r.net_profit_loss) for r in schedule_c_results),
+            filing_status,
+            tuple(sorted((k, v) for k, v in kwargs.items() if k != "explain")),
+        )
+        return self._lookup(
+            "form_8995", key, explain,
+            lambda: super(IncrementalReturn, self).qbi(
+                taxable_income_before_qbi, schedule_c_results, filing_status,
+                **kwargs),
+        )
@@ -0,0 +1,298 @@
+"""Lot-level 1099-B transactions in columnar form.
+
+Form1099B holds a broker's short- and long-term totals, which is all
+Schedule D needs — but an active trader's broker export lists every
+lot, often tens of thousands of them. This module keeps those lots as
+NumPy columns (8 bytes per amount, 4 per date, 1 per flag; no Python
+object per lot) and nets them with array operations:
+
+    totals = summarize_lots_csv("brokerage_lots.csv")
+    profile.forms_1099_b.append(totals.to_form_1099b("Example Brokerage"))
+
+summarize_lots_csv() streams the file in fixed-size chunks and keeps
+only running totals, so its memory use does not grow with the number
+of lots. load_lots_csv() keeps every lot (a LotTable) for reporting.
+
+Wash-sale disallowed losses (Form 8949 code W) add to the gain. In the
+Form1099B totals they are netted into cost basis, so Schedule D's gain
+matches the sum of Form 8949 column (h).
+
+Requires NumPy (pip install "taxman[batch]").
+"""
+
+import csv
+import functools
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Iterator, Optional
+
+import numpy as np
+
+from taxman.models import Form1099B
+
+# Lots read per chunk by the streaming importer
+LOT_CHUNK_SIZE = 65_536
+
+# CSV header (lowercased, spaces/hyphens as underscores) → column
+_HEADER_ALIASES = {
+    "date_acquired": "acquired", "acquired": "acquired", "acquisition_date": "acquired",
+    "date_sold": "sold", "sold": "sold", "sale_date": "sold",
+    "proceeds": "proceeds", "gross_proceeds": "proceeds",
+    "cost_basis": "basis", "basis": "basis", "cost_or_other_basis": "basis",
+    "wash_sale_disallowed": "wash_sale", "wash_sale": "wash_sale",
+    "wash_sale_loss_disallowed": "wash_sale",
+    "term": "term", "holding_period": "term",
+    "covered": "covered", "basis_reported": "covered",
+}
+_REQUIRED_COLUMNS = ("sold", "proceeds", "basis")
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y")
+_EPOCH = date(1970, 1, 1).toordinal()
+_NO_DATE = np.iinfo(np.int32).min  # "VARIOUS" and blank acquisition dates
+
+
+@dataclass
+class LotTable:
+    """1099-B lots as parallel columns, one element per lot.
+
+    Dates are days since 1970-01-01 (int32; acquired is _NO_DATE when
+    the broker reports "VARIOUS"). long_term and covered are booleans.
+    """
+    acquired: np.ndarray
+    sold: np.ndarray
+    proceeds: np.ndarray
+    basis: np.ndarray
+    wash_sale: np.ndarray
+    long_term: np.ndarray
+    covered: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.proceeds)
+
+    @classmethod
+    def concatenate(cls, tables: list["LotTable"]) -> "LotTable":
+        names = cls.__dataclass_fields__
+        if not tables:
+            return cls(**{name: np.empty(0, dtype=_COLUMN_DTYPES[name]) for name in names})
+        return cls(**{name: np.concatenate([getattr(t, name) for t in tables])
+                      for name in names})
+
+    @property
+    def gain_loss(self) -> np.ndarray:
+        """Form 8949 column (h) for each lot."""
+        return self.proceeds - self.basis + self.wash_sale
+
+    def totals(self) -> "LotTotals":
+        """Short- and long-term sums (vectorized; rounded to the cent)."""
+        lt = self.long_term
+        st = ~lt
+        return LotTotals(
+            lots=len(self),
+            st_proceeds=round(float(self.proceeds[st].sum()), 2),
+            st_cost_basis=round(float(self.basis[st].sum()), 2),
+            st_wash_sale=round(float(self.wash_sale[st].sum()), 2),
+            lt_proceeds=round(float(self.proceeds[lt].sum()), 2),
+            lt_cost_basis=round(float(self.basis[lt].sum()), 2),
+            lt_wash_sale=round(float(self.wash_sale[lt].sum()), 2),
+            noncovered_lots=int(np.count_nonzero(~self.covered)),
+        )
+
+
+_COLUMN_DTYPES = {
+    "acquired": np.int32, "sold": np.int32,
+    "proceeds": np.float64, "basis": np.float64, "wash_sale": np.float64,
+    "long_term": np.bool_, "covered": np.bool_,
+}
+
+
+@dataclass
+class LotTotals:
+    """Netted lots for Schedule D, by holding period."""
+    lots: int = 0
+    st_proceeds: float = 0.0
+    st_cost_basis: float = 0.0
+    st_wash_sale: float = 0.0
+    lt_proceeds: float = 0.0
+    lt_cost_basis: float = 0.0
+    lt_wash_sale: float = 0.0
+    noncovered_lots: int = 0
+
+    def __add__(self, other: "LotTotals") -> "LotTotals":
+        return LotTotals(**{
+            name: round(getattr(self, name) + getattr(other, name), 2)
+            for name in self.__dataclass_fields__
+        })
+
+    @property
+    def net_st_gain_loss(self) -> float:
+        return round(self.st_proceeds - self.st_cost_basis + self.st_wash_sale, 2)
+
+    @property
+    def net_lt_gain_loss(self) -> float:
+        return round(self.lt_proceeds - self.lt_cost_basis + self.lt_wash_sale, 2)
+
+    def to_form_1099b(self, broker_name: str = "", broker_tin: str = "",
+                      federal_tax_withheld: float = 0.0) -> Form1099B:
+        """Form1099B totals for calculate_schedule_d() (wash sales netted into basis)."""
+        return Form1099B(
+            broker_name=broker_name,
+            broker_tin=broker_tin,
+            st_proceeds=self.st_proceeds,
+            st_cost_basis=round(self.st_cost_basis - self.st_wash_sale, 2),
+            lt_proceeds=self.lt_proceeds,
+            lt_cost_basis=round(self.lt_cost_basis - self.lt_wash_sale, 2),
+            federal_tax_withheld=federal_tax_withheld,
+        )
+
+
+def long_term_mask(acquired: np.ndarray, sold: np.ndarray) -> np.ndarray:
+    """True where a lot was held more than one year (day counts since 1970).
+
+    The holding period starts the day after acquisition, so a lot is
+    long-term when sold after the anniversary of its purchase date; a
+    lot bought on February 29 has its anniversary on February 28.
+    """
+    acquired_days = acquired.astype("datetime64[D]")
+    month = acquired_days.astype("datetime64[M]")
+    day_of_month = (acquired_days - month.astype("datetime64[D]")).astype(np.int64)
+    anniversary_month = month + 12
+    month_length = ((anniversary_month + 1).astype("datetime64[D]")
+                    - anniversary_month.astype("datetime64[D]")).astype(np.int64)
+    anniversary = (anniversary_month.astype("datetime64[D]")
+                   + np.minimum(day_of_month, month_length - 1))
+    return sold.astype("datetime64[D]") > anniversary
+
+
+# Lot files repeat the same few hundred trade dates, and strptime() is
+# most of the per-lot parsing cost
+@functools.lru_cache(maxsize=4096)
+def _parse_day(value: str) -> Optional[int]:
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date().toordinal() - _EPOCH
+        except ValueError:
+            continue
+    return None
+
+
+def _day(value: str, line: int, column: str) -> int:
+    value = value.strip()
+    if column == "acquired" and (not value or value.lower() == "various"):
+        return _NO_DATE
+    day = _parse_day(value)
+    if day is None:
+        raise ValueError(f"line {line}: unrecognized {column} date {value!r}")
+    return day
+
+
+def _money(value: str, line: int, column: str) -> float:
+    cleaned = value.strip().replace("$", "").replace(",", "")
+    if not cleaned or cleaned == "--":
+        return 0.0
+    negative = cleaned.startswith("(") and cleaned.endswith(")")
+    try:
+        amount = float(cleaned.strip("()"))
+    except ValueError:
+        raise ValueError(f"line {line}: {column} is not an amount: {value!r}") from None
+    return -amount if negative else amount
+
+
+def _term(value: str, line: int) -> int:
+    """1 for long-term, 0 for short-term, -1 when not given."""
+    value = value.strip().lower()
+    if not value:
+        return -1
+    if value in ("lt", "long", "long-term", "long term", "d", "e", "f"):
+        return 1
+    if value in ("st", "short", "short-term", "short term", "a", "b", "c"):
+        return 0
+    raise ValueError(f"line {line}: unrecognized term {value!r}")
+
+
+def _flag(value: str) -> bool:
+    return value.strip().lower() not in ("n", "no", "false", "0", "noncovered")
+
+
+def _columns(header: list[str]) -> dict[str, int]:
+    columns = {}
+    for i, name in enumerate(header):
+        key = re.sub(r"[\s\-]+", "_", name.strip().lower())
+        alias = _HEADER_ALIASES.get(key)
+        if alias and alias not in columns:
+            columns[alias] = i
+    missing = [c for c in _REQUIRED_COLUMNS if c not in columns]
+    if missing:
+        raise ValueError(f"lot file has no {', '.join(missing)} column")
+    return columns
+
+
+def _cell(record: list[str], columns: dict[str, int], name: str) -> str:
+    index = columns.get(name)
+    return record[index] if index is not None and index < len(record) else ""
+
+
+def _chunk(rows: dict[str, list]) -> LotTable:
+    acquired = np.array(rows["acquired"], dtype=np.int32)
+    sold = np.array(rows["sold"], dtype=np.int32)
+    term = np.array(rows["term"], dtype=np.int8)
+    known = acquired != _NO_DATE
+    by_dates = np.zeros(len(sold), dtype=np.bool_)
+    by_dates[known] = long_term_mask(acquired[known], sold[known])
+    return LotTable(
+        acquired=acquired,
+        sold=sold,
+        proceeds=np.array(rows["proceeds"], dtype=np.float64),
+        basis=np.array(rows["basis"], dtype=np.float64),
+        wash_sale=np.array(rows["wash_sale"], dtype=np.float64),
+        # A term column, when given, overrides the dates (brokers apply
+        # tacked holding periods for gifts, inheritances and wash sales)
+        long_term=np.where(term >= 0, term == 1, by_dates),
+        covered=np.array(rows["covered"], dtype=np.bool_),
+    )
+
+
+def iter_lot_chunks(path, chunk_size: int = LOT_CHUNK_SIZE) -> Iterator[LotTable]:
+    """Read a broker's lot CSV as LotTables of up to chunk_size lots.
+
+    Columns are matched by header (date acquired, date sold, proceeds,
+    cost basis, wash sale disallowed, term, covered; see _HEADER_ALIASES).
+    Lots without a term are classified from their dates; an acquisition
+    date of "VARIOUS" then requires the term column.
+    """
+    names = ("acquired", "sold", "proceeds", "basis", "wash_sale", "term", "covered")
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        columns = _columns(next(reader, []))
+        rows: dict[str, list] = {name: [] for name in names}
+        for line, record in enumerate(reader, start=2):
+            if not any(cell.strip() for cell in record):
+                continue
+            term = _term(_cell(record, columns, "term"), line)
+            acquired = _day(_cell(record, columns, "acquired"), line, "acquired")
+            if term < 0 and acquired == _NO_DATE:
+                raise ValueError(f"line {line}: no acquisition date or term")
+            rows["acquired"].append(acquired)
+            rows["sold"].append(_day(_cell(record, columns, "sold"), line, "sold"))
+            for name in ("proceeds", "basis", "wash_sale"):
+                rows[name].append(_money(_cell(record, columns, name), line, name))
+            rows["term"].append(term)
+            rows["covered"].append(
+                _flag(_cell(record, columns, "covered")) if "covered" in columns else True)
+            if len(rows["term"]) == chunk_size:
+                yield _chunk(rows)
+                rows = {name: [] for name in names}
+        if rows["term"]:
+            yield _chunk(rows)
+
+
+def load_lots_csv(path) -> LotTable:
+    """Every lot in a broker's lot CSV."""
+    return LotTable.concatenate(list(iter_lot_chunks(path)))
+
+
+def summarize_lots_csv(path, chunk_size: int = LOT_CHUNK_SIZE) -> LotTotals:
+    """Short- and long-term totals of a lot CSV, one chunk in memory at a time."""
+    totals = LotTotals()
+    for chunk in iter_lot_chunks(path, chunk_size):
+        totals = totals + chunk.totals()
+    return totals
@@ -568,6 +568,8 @@ class TaxpayerProfile:
     # Payments & insurance
     estimated_payments: list[EstimatedPayment] = field(default_factory=list)
     health_insurance: Optional[HealthInsurance] = None
+    # SEP-IRA contribution for the self-employed taxpayer (Schedule 1, Line 16)
+    sep_ira_contribution: float = 0.0
 
     # Foreign
     days_in_us_2025: int = 0
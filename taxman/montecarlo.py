@@ -0,0 +1,234 @@
+"""Monte Carlo quarterly-estimate planner.
+
+estimate_quarterly_payments() plans next year's estimates from a single
+point estimate of the tax. Freelance income swings, so this module draws
+thousands of income scenarios for one profile — each business's gross
+receipts and each K-1's income scaled by a random multiplier — and runs
+all of them through the batch engine at once:
+
+    plan = simulate_quarterly_plan(
+        profile, prior_year_tax=30_000,
+        variations={"Law Consulting LLC": IncomeDistribution("lognormal", 0.25)},
+    )
+    plan["tax_percentiles"][90]       # 90th-percentile total tax
+    plan["safe_harbor_probability"]   # chance the planned estimates suffice
+
+A scenario is covered when withholding plus the planned estimated
+payments reach the safe-harbor amount for that scenario: the smaller of
+90% of its tax and 100% (110% above the AGI threshold) of prior-year tax.
+
+Requires NumPy (pip install "taxman[batch]").
+"""
+
+from dataclasses import dataclass, replace
+from typing import Optional
+
+import numpy as np
+
+from taxman.batch import BatchColumns, BatchResult, calculate_columns, extract_columns
+from taxman.calculator import (
+    ESTIMATED_TAX_HIGH_INCOME_THRESHOLDS,
+    calculate_return,
+    estimate_quarterly_payments,
+    round_cents_array,
+)
+from taxman.constants import (
+    ESTIMATED_TAX_HIGH_INCOME_THRESHOLD_MFS,
+    ESTIMATED_TAX_PRIOR_YEAR_HIGH_INCOME_PCT,
+    ESTIMATED_TAX_PRIOR_YEAR_PCT,
+    ESTIMATED_TAX_SAFE_HARBOR_PCT,
+)
+from taxman.models import TaxpayerProfile
+
+DISTRIBUTION_KINDS = ("normal", "lognormal", "uniform", "triangular")
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 90, 95)
+DEFAULT_COVERAGE_LEVELS = (0.50, 0.80, 0.90, 0.95)
+
+
+@dataclass
+class IncomeDistribution:
+    """Random multiplier applied to one income source's expected amount.
+
+    kind:
+      normal      1 + spread * N(0, 1)
+      lognormal   mean-1 lognormal with log-scale sigma = spread (never negative)
+      uniform     evenly between 1 - spread and 1 + spread
+      triangular  between 1 - spread and 1 + spread, most likely 1
+    """
+    kind: str = "normal"
+    spread: float = 0.20
+
+    def __post_init__(self):
+        if self.kind not in DISTRIBUTION_KINDS:
+            raise ValueError(f"kind must be one of {', '.join(DISTRIBUTION_KINDS)}, "
+                             f"got {self.kind!r}")
+        if self.spread < 0:
+            raise ValueError(f"spread must be non-negative, got {self.spread}")
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        s = self.spread
+        if self.kind == "normal":
+            return 1.0 + s * rng.standard_normal(size)
+        if self.kind == "lognormal":
+            return np.exp(s * rng.standard_normal(size) - s * s / 2)
+        if s == 0:
+            return np.ones(size)
+        if self.kind == "uniform":
+            return rng.uniform(1.0 - s, 1.0 + s, size)
+        return rng.triangular(1.0 - s, 1.0, 1.0 + s, size)
+
+
+def _repeat_rows(array: np.ndarray, count: int) -> np.ndarray:
+    """Stack `count` copies of a one-profile item table, scenario-major."""
+    return np.tile(array, (count,) + (1,) * (array.ndim - 1))
+
+
+# BatchColumns item tables (one row per business, property, K-1, ...)
+_ITEM_COLUMNS = (
+    "biz_gross_receipts", "biz_returns", "biz_cogs", "biz_other_income",
+    "biz_expenses", "biz_home_office", "prop_net_income", "k1_boxes",
+    "b_st_proceeds", "b_st_basis", "b_lt_proceeds", "b_lt_basis",
+    "div_cap_gain_dist",
+)
+
+
+def _scenario_columns(base: BatchColumns, count: int) -> BatchColumns:
+    """`count` identical copies of a one-profile BatchColumns."""
+    repeated = {}
+    for name, value in vars(base).items():
+        if name == "size":
+            repeated[name] = count
+        elif name.endswith("_owner"):
+            repeated[name] = np.repeat(np.arange(count), len(value))
+        elif name in _ITEM_COLUMNS:
+            repeated[name] = _repeat_rows(value, count)
+        else:
+            repeated[name] = np.repeat(value, count)
+    return BatchColumns(**repeated)
+
+
+def _schedule_c_names(profile: TaxpayerProfile) -> list[str]:
+    """Business names in the order the batch engine lays out Schedule Cs."""
+    if profile.businesses:
+        return [biz.business_name for biz in profile.businesses]
+    if sum(f.nonemployee_compensation for f in profile.forms_1099_nec) > 0:
+        return ["1099-NEC Income"]  # auto-created by _apply_schedule_c()
+    return []
+
+
+def simulate_income_scenarios(
+    profile: TaxpayerProfile,
+    variations: dict[str, IncomeDistribution],
+    scenarios: int = 10_000,
+    seed: Optional[int] = None,
+) -> BatchResult:
+    """Form 1040 totals for `scenarios` random draws of the profile's income.
+
+    variations maps a business name (Schedule C gross receipts; "1099-NEC
+    Income" for the Schedule C built from 1099-NECs) or a K-1
+    partnership name (every K-1 box and its QBI amount) to the
+    distribution of its multiplier. Sources not named stay fixed; each
+    source is drawn independently. Receipts never go below zero, and a
+    K-1's multiplier is clamped at zero: a "normal" draw (or a "uniform"
+    or "triangular" one with spread above 1) can fall below zero, which
+    would otherwise flip the sign of every box, turning a loss into
+    income. Such draws count as a year with nothing from that K-1.
+    """
+    biz_names = _schedule_c_names(profile)
+    k1_names = [k1.partnership_name for k1 in profile.schedule_k1s]
+    unknown = set(variations) - set(biz_names) - set(k1_names)
+    if unknown:
+        raise ValueError(f"No business or K-1 named {', '.join(sorted(unknown))}")
+
+    rng = np.random.default_rng(seed)
+    cols = _scenario_columns(extract_columns([profile]), scenarios)
+
+    receipts = cols.biz_gross_receipts.reshape(scenarios, len(biz_names))
+    for j, name in enumerate(biz_names):
+        if name in variations:
+            receipts[:, j] = np.maximum(
+                receipts[:, j] * variations[name].sample(rng, scenarios), 0)
+
+    k1_qbi = np.zeros(scenarios)
+    k1_boxes = cols.k1_boxes.reshape(scenarios, len(k1_names), cols.k1_boxes.shape[1])
+    for j, k1 in enumerate(profile.schedule_k1s):
+        multiplier = (np.maximum(variations[k1.partnership_name].sample(rng, scenarios), 0)
+                      if k1.partnership_name in variations else np.ones(scenarios))
+        k1_boxes[:, j, :] *= multiplier[:, None]
+        if not k1.is_sstb:
+            k1_qbi = k1_qbi + k1.qbi_amount * multiplier
+
+    if profile.schedule_k1s:
+        cols = replace(cols, k1_qbi=k1_qbi)
+    return calculate_columns(cols)
+
+
+def _ceil_cents(value) -> float:
+    return float(np.ceil(np.round(value * 100, 6)) / 100)
+
+
+def simulate_quarterly_plan(
+    profile: TaxpayerProfile,
+    prior_year_tax: float,
+    variations: dict[str, IncomeDistribution],
+    scenarios: int = 10_000,
+    planned_annual: Optional[float] = None,
+    seed: Optional[int] = None,
+    percentiles: tuple = DEFAULT_PERCENTILES,
+    coverage_levels: tuple = DEFAULT_COVERAGE_LEVELS,
+) -> dict:
+    """Quarterly estimate plan under income uncertainty.
+
+    planned_annual defaults to the point-estimate plan from
+    estimate_quarterly_payments() on the profile as entered.
+
+    Returns a dict with:
+      point_estimate           {"total_tax", "recommended_annual"} of that plan
+      tax_percentiles          {percentile: total tax}
+      mean_tax
+      planned_annual / planned_quarterly
+      safe_harbor_probability  share of scenarios the plan covers
+      annual_for_coverage      {probability: smallest annual estimate total
+                                covering that share of scenarios}
+      results                  the BatchResult of every scenario
+    """
+    base = calculate_return(profile, explain=False)
+    point = estimate_quarterly_payments(base.total_tax, prior_year_tax, base.agi,
+                                        filing_status=profile.filing_status)
+    if planned_annual is None:
+        planned_annual = point["recommended_annual"]
+
+    results = simulate_income_scenarios(profile, variations, scenarios, seed)
+
+    threshold = ESTIMATED_TAX_HIGH_INCOME_THRESHOLDS.get(
+        profile.filing_status, ESTIMATED_TAX_HIGH_INCOME_THRESHOLD_MFS
+    )
+    prior_pct = np.where(results.agi > threshold,
+                         ESTIMATED_TAX_PRIOR_YEAR_HIGH_INCOME_PCT,
+                         ESTIMATED_TAX_PRIOR_YEAR_PCT)
+    safe_harbor = np.minimum(
+        round_cents_array(prior_year_tax * prior_pct),
+        round_cents_array(results.total_tax * ESTIMATED_TAX_SAFE_HARBOR_PCT),
+    )
+    needed = np.maximum(safe_harbor - results.withholding, 0)
+
+    return {
+        "scenarios": scenarios,
+        "point_estimate": {
+            "total_tax": base.total_tax,
+            "recommended_annual": point["recommended_annual"],
+        },
+        "tax_percentiles": {
+            p: round(float(v), 2)
+            for p, v in zip(percentiles, np.percentile(results.total_tax, percentiles))
+        },
+        "mean_tax": round(float(results.total_tax.mean()), 2),
+        "planned_annual": planned_annual,
+        "planned_quarterly": round(planned_annual / 4, 2),
+        "safe_harbor_probability": float(np.mean(needed <= planned_annual)),
+        "annual_for_coverage": {
+            level: _ceil_cents(np.quantile(needed, level, method="higher"))
+            for level in coverage_levels
+        },
+        "results": results,
+    }
@@ -5,25 +5,47 @@ Extracts structured data from:
 - Schedule K-1 (Form 1065)
 - W-2 forms
 - 1098 Mortgage Interest
+- 1099-INT, 1099-DIV and 1099-B, alone or in a composite brokerage statement
 - 1095-A Health Insurance Marketplace
 - Charity receipts
 - Prior year tax returns (1040 + all schedules)
 - Estimated payment confirmations
+
+Every file is read through a PDFDocument, which opens it once and
+caches page text, words and tables. Scanning, classification and the
+parse_* functions share that document (get_document()), so a file's
+layout analysis runs once per pipeline.
 """
 
+import functools
+import hashlib
 import json
 import os
 import re
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import pdfplumber
 
+from taxman.field_mappings.inbound import (
+    F1099_NEC_FIELDS,
+    F1099_NEC_REQUIRED,
+    K1_1065_FIELDS,
+    K1_1065_REQUIRED,
+    W2_FIELDS,
+    W2_REQUIRED,
+)
 from taxman.models import (
     CharityReceipt,
     Form1095A,
     Form1098,
+    Form1099B,
+    Form1099DIV,
+    Form1099INT,
     Form1099NEC,
     FormW2,
     ScheduleK1,
@@ -54,36 +76,375 @@ class ParseResult:
 # Core PDF Extraction
 # =============================================================================
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+# Bump when extraction or classification output changes (e.g. new
+# pdfplumber settings) so on-disk cache entries from older extractors
+# are never reused
+_EXTRACTOR_REVISION = 3
+EXTRACTOR_VERSION = f"{_EXTRACTOR_REVISION}/pdfplumber-{pdfplumber.__version__}"
+
+
+def _file_sha256(path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ExtractionCache:
+    """On-disk cache of PDF extractions, keyed by file content.
+
+    Entries live in <directory>/<key>.json, where key is a SHA-256 of
+    the file's SHA-256 and EXTRACTOR_VERSION — a renamed or moved file
+    still hits, an edited file or a new extractor misses. Each entry
+    holds page text, any words and tables extracted so far, and
+    classifications by file name. The directory is bounded by max_bytes;
+    least recently used entries are evicted first.
+    """
+
+    def __init__(self, directory, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(pdf_path) -> str:
+        return hashlib.sha256(
+            f"{_file_sha256(pdf_path)}:{EXTRACTOR_VERSION}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError):
+            path.unlink(missing_ok=True)  # corrupt — extract again
+            self.misses += 1
+            return None
+        os.utime(path)  # mark as recently used for eviction
+        self.hits += 1
+        return data
+
+    def store(self, key: str, data: dict):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+            self._evict()
+        except OSError:
+            pass  # the cache is best-effort
+
+    def _evict(self):
+        entries = [(p.stat(), p) for p in self.directory.glob("*.json")]
+        total = sum(st.st_size for st, _ in entries)
+        if total <= self.max_bytes:
+            return
+        entries.sort(key=lambda e: e[0].st_mtime)
+        for st, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+
+    def clear(self):
+        if self.directory.exists():
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
+class PDFDocument:
+    """One PDF opened once, with page text, words and tables cached lazily.
+
+    Scanning, classification and parsing all read through the same
+    PDFDocument, so pdfplumber's layout analysis of a page runs once no
+    matter how many steps look at it:
+
+        with PDFDocument(path) as doc:
+            doc_type = _classify_document(doc)
+            result = parse_1099_nec(doc)   # reuses the text scan extracted
+
+    close() releases the file handle but keeps everything extracted so
+    far; a later request for something not yet cached reopens the file.
+    With an ExtractionCache, earlier extractions of the same content are
+    loaded up front and new ones are written back on close().
+    """
+
+    def __init__(self, path, cache: Optional[ExtractionCache] = None):
+        self.path = str(path)
+        self.name = Path(path).name
+        self.opens = 0  # times the file was actually opened
+        self.classifications: dict[str, str] = {}  # file name -> type
+        self._pdf = None
+        self._page_count: Optional[int] = None
+        self._page_text: dict[int, str] = {}
+        self._page_words: dict[int, list[dict]] = {}
+        self._page_tables: dict[int, list[list]] = {}
+        self._form_fields: Optional[list[dict]] = None
+        self._cache = cache
+        self._cache_key: Optional[str] = None
+        self._dirty = False
+        if cache is not None:
+            self._cache_key = cache.key_for(self.path)
+            entry = cache.load(self._cache_key)
+            if entry is not None:
+                self._restore(entry)
+
+    def __enter__(self) -> "PDFDocument":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _open(self):
+        if self._pdf is None:
+            self._pdf = pdfplumber.open(self.path)
+            self.opens += 1
+        return self._pdf
+
+    def _page(self, index: int):
+        self._dirty = True  # the caller is about to extract something new
+        return self._open().pages[index]
+
+    def close(self):
+        """Release the file handle; cached extractions stay available."""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        if self._dirty and self._cache is not None:
+            if self._cache_key is None:
+                self._cache_key = self._cache.key_for(self.path)
+            self._cache.store(self._cache_key, self._snapshot())
+        self._dirty = False
+
+    def _snapshot(self) -> dict:
+        return {
+            "page_count": self._page_count,
+            "page_text": self._page_text,
+            "page_words": self._page_words,
+            "page_tables": self._page_tables,
+            "form_fields": self._form_fields,
+            "classifications": self.classifications,
+        }
+
+    def _restore(self, entry: dict):
+        self._page_count = entry.get("page_count")
+        # JSON object keys are strings; pages are looked up by int
+        self._page_text = {int(i): t for i, t in entry.get("page_text", {}).items()}
+        self._page_words = {int(i): w for i, w in entry.get("page_words", {}).items()}
+        self._page_tables = {int(i): t for i, t in entry.get("page_tables", {}).items()}
+        self._form_fields = entry.get("form_fields")
+        self.classifications = dict(entry.get("classifications", {}))
+
+    def remember_classification(self, filename: str, doc_type: str):
+        if self.classifications.get(filename) != doc_type:
+            self.classifications[filename] = doc_type
+            self._dirty = True
+
+    @property
+    def page_count(self) -> int:
+        if self._page_count is None:
+            self._dirty = True
+            self._page_count = len(self._open().pages)
+        return self._page_count
+
+    def page_text(self, index: int) -> str:
+        if index not in self._page_text:
+            self._page_text[index] = self._page(index).extract_text() or ""
+        return self._page_text[index]
+
+    def page_words(self, index: int) -> list[dict]:
+        if index not in self._page_words:
+            self._page_words[index] = self._page(index).extract_words()
+        return self._page_words[index]
+
+    def page_tables(self, index: int) -> list[list]:
+        if index not in self._page_tables:
+            self._page_tables[index] = self._page(index).extract_tables() or []
+        return self._page_tables[index]
+
+    @property
+    def pages(self) -> list[str]:
+        """Text of each page ("" for pages without a text layer)."""
+        return [self.page_text(i) for i in range(self.page_count)]
+
+    @property
+    def text(self) -> str:
+        """All text, pages separated by a blank line."""
+        return "".join(t + "\n\n" for t in self.pages if t)
+
+    def head_text(self, pages: int) -> str:
+        """Text of the first `pages` pages, formatted like text."""
+        count = min(pages, self.page_count)
+        return "".join(t + "\n\n" for t in map(self.page_text, range(count)) if t)
+
+    def preview(self, chars: int = 500) -> str:
+        """text[:chars], extracting only as many pages as that needs."""
+        preview = ""
+        for i in range(self.page_count):
+            if len(preview) >= chars:
+                break
+            if t := self.page_text(i):
+                preview += t + "\n\n"
+        return preview[:chars]
+
+    def stream_pages(self) -> Iterator[str]:
+        """Text of each page in turn, without caching it.
+
+        For long documents read once, front to back: only the current
+        page is held, and pdfplumber's layout objects for it are freed
+        once its text is out. Pages already cached are reused.
+        """
+        for i in range(self.page_count):
+            if i in self._page_text:
+                yield self._page_text[i]
+                continue
+            page = self._open().pages[i]
+            text = page.extract_text() or ""
+            page.close()
+            yield text
+
+    @property
+    def form_fields(self) -> list[dict]:
+        """Populated AcroForm fields: {"name", "label", "value"} each.
+
+        name is the fully qualified field name and label its tooltip (or
+        partial name). Read with pypdf, which parses the form dictionary
+        only — no page layout analysis.
+        """
+        if self._form_fields is None:
+            from pypdf import PdfReader
+
+            self._dirty = True
+            self._form_fields = []
+            try:
+                fields = PdfReader(self.path).get_fields() or {}
+            except Exception:
+                fields = {}  # unreadable form dictionary — use layout text
+            for name, fld in fields.items():
+                value = fld.get("/V")
+                if value is None or str(value).strip() in ("", "/Off"):
+                    continue
+                label = fld.get("/TU") or fld.get("/T") or name
+                self._form_fields.append(
+                    {"name": name, "label": str(label), "value": str(value)})
+        return self._form_fields
+
+    @property
+    def words(self) -> list[dict]:
+        return [w for i in range(self.page_count) for w in self.page_words(i)]
+
+    @property
+    def tables(self) -> list[list]:
+        return [t for i in range(self.page_count) for t in self.page_tables(i)]
+
+
+# Documents seen recently (scan → classify → parse), keyed by path and
+# validated against the file's mtime/size so edits are never served stale
+_DOCUMENT_CACHE_SIZE = 64
+_document_cache: "OrderedDict[str, tuple[tuple, PDFDocument]]" = OrderedDict()
+
+# Persistent extraction cache used by get_document(); off unless configured
+_extraction_cache: Optional[ExtractionCache] = None
+
+
+def set_extraction_cache(cache: Optional[ExtractionCache]):
+    """Use `cache` for documents opened from now on (None disables it)."""
+    global _extraction_cache
+    clear_document_cache()
+    _extraction_cache = cache
+
+
+def get_document(pdf_path) -> PDFDocument:
+    """Shared PDFDocument for a path (cached across pipeline steps)."""
+    key = str(Path(pdf_path).resolve())
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _document_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        _document_cache.move_to_end(key)
+        return cached[1]
+    doc = PDFDocument(pdf_path, cache=_extraction_cache)
+    _remember_document(key, stamp, doc)
+    return doc
+
+
+def _remember_document(key: str, stamp: tuple, doc: PDFDocument):
+    _document_cache[key] = (stamp, doc)
+    _document_cache.move_to_end(key)
+    while len(_document_cache) > _DOCUMENT_CACHE_SIZE:
+        _, (_, evicted) = _document_cache.popitem(last=False)
+        evicted.close()
+
+
+def _share_document(pdf_path, snapshot: dict):
+    """Make extractions done in another process available to get_document()."""
+    key = str(Path(pdf_path).resolve())
+    st = os.stat(key)
+    doc = PDFDocument(pdf_path)
+    doc._restore(snapshot)
+    doc._cache = _extraction_cache  # later extractions still get written back
+    _remember_document(key, (st.st_mtime_ns, st.st_size), doc)
+
+
+def clear_document_cache():
+    """Forget all shared PDFDocuments (closing any open handles)."""
+    for _, doc in _document_cache.values():
+        doc.close()
+    _document_cache.clear()
+
+
+@contextmanager
+def _opened(source):
+    """PDFDocument for a path or an existing document.
+
+    A document passed in stays open (its owner closes it); one looked up
+    by path has its handle released on exit, keeping its cached text.
+    """
+    if isinstance(source, PDFDocument):
+        yield source
+        return
+    doc = get_document(source)
+    try:
+        yield doc
+    finally:
+        doc.close()
+
+
+def _reads_document(parse):
+    """Let a parser accept a path or a PDFDocument; it always receives the document."""
+    @functools.wraps(parse)
+    def wrapper(source, *args, **kwargs):
+        with _opened(source) as doc:
+            return parse(doc, *args, **kwargs)
+    return wrapper
+
+
+def extract_text_from_pdf(pdf_path) -> str:
     """Extract all text from a PDF file."""
-    text = ""
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n\n"
-    return text
+    with _opened(pdf_path) as doc:
+        return doc.text
 
 
-def extract_pages_from_pdf(pdf_path: str) -> list[str]:
+def extract_pages_from_pdf(pdf_path) -> list[str]:
     """Extract text from each page separately."""
-    pages = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            pages.append(page_text or "")
-    return pages
+    with _opened(pdf_path) as doc:
+        return doc.pages
 
 
-def extract_tables_from_pdf(pdf_path: str) -> list[list]:
+def extract_tables_from_pdf(pdf_path) -> list[list]:
     """Extract tables from a PDF file."""
-    tables = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_tables = page.extract_tables()
-            if page_tables:
-                tables.extend(page_tables)
-    return tables
+    with _opened(pdf_path) as doc:
+        return doc.tables
 
 
 def find_amount(text: str, pattern: str) -> float:
@@ -110,19 +471,82 @@ def find_amount(text: str, pattern: str) -> float:
     return 0.0
 
 
+def _field_value(kind: str, value: str):
+    """Convert an AcroForm value for an inbound field map kind (None if unusable)."""
+    value = value.strip()
+    if kind == "amount":
+        cleaned = value.replace("$", "").replace(",", "").strip()
+        negative = cleaned.startswith("(") and cleaned.endswith(")")
+        try:
+            amount = float(cleaned.strip("()"))
+        except ValueError:
+            return None
+        return -amount if negative else amount
+    if kind == "percent":
+        try:
+            return float(value.rstrip("%").strip())
+        except ValueError:
+            return None
+    if kind == "tin":
+        match = re.search(r"\d{2}-\d{7}|\d{3}-\d{2}-\d{4}|\d{9}", value)
+        return match.group(0) if match else None
+    return value.splitlines()[0].strip() if value else None  # name
+
+
+def _read_form_fields(doc: PDFDocument, field_map, required: str) -> Optional[dict]:
+    """Attribute values from a fillable PDF's fields, per an inbound field map.
+
+    Returns None — parse the layout text instead — unless the required
+    attribute is populated.
+    """
+    fields = doc.form_fields
+    if not fields:
+        return None
+    values = {}
+    for attribute, kind, pattern in field_map:
+        label = re.compile(pattern, re.IGNORECASE)
+        for fld in fields:
+            if label.search(fld["label"]):
+                value = _field_value(kind, fld["value"])
+                if value is not None:
+                    values[attribute] = value
+                    break
+    return values if values.get(required) else None
+
+
+def _form_field_result(doc: PDFDocument, document_type: str, data, values: dict) -> ParseResult:
+    """ParseResult for a document read from its form fields."""
+    for attribute, value in values.items():
+        setattr(data, attribute, value)
+    return ParseResult(data=data, confidence=1.0, source_file=doc.path,
+                       document_type=document_type)
+
+
 # =============================================================================
 # Document Parsers
 # =============================================================================
 
-def parse_1099_nec(pdf_path: str) -> ParseResult:
+@_reads_document
+def parse_1099_nec(doc: PDFDocument) -> ParseResult:
     """Parse a 1099-NEC PDF into structured data.
 
+    Fillable PDFs are read from their form fields when Box 1 is filled in.
     Bug 5 fix: Uses labeled regex patterns for TINs instead of positional.
     Multi-strategy extraction: regex + table + positional fallback.
     """
-    text = extract_text_from_pdf(pdf_path)
+    values = _read_form_fields(doc, F1099_NEC_FIELDS, F1099_NEC_REQUIRED)
+    if values is not None:
+        result = _form_field_result(doc, "1099-NEC", Form1099NEC(), values)
+        if "payer_name" not in values:
+            result.add_warning("Could not extract payer name")
+            result.confidence = 0.5
+        _validate_amount(result, values["nonemployee_compensation"], "compensation",
+                         max_reasonable=10_000_000)
+        return result
+
+    text = doc.text
     result = ParseResult(
-        source_file=str(pdf_path),
+        source_file=doc.path,
         document_type="1099-NEC",
     )
 
@@ -147,7 +571,7 @@ def parse_1099_nec(pdf_path: str) -> ParseResult:
     box1 = find_amount(text, r'(?:box\s*1|nonemployee\s+compensation)')
     if box1 == 0:
         # Try table extraction as fallback
-        tables = extract_tables_from_pdf(str(pdf_path))
+        tables = doc.tables
         for table in tables:
             for row in table:
                 if row and any('nonemployee' in str(c).lower() for c in row if c):
@@ -207,15 +631,28 @@ def parse_1099_nec(pdf_path: str) -> ParseResult:
     return result
 
 
-def parse_k1_1065(pdf_path: str) -> ParseResult:
+@_reads_document
+def parse_k1_1065(doc: PDFDocument) -> ParseResult:
     """Parse a Schedule K-1 (Form 1065) PDF into structured data.
 
+    Fillable PDFs are read from their form fields when the partnership
+    name is filled in.
     Bug 6 fix: Extracts Box 14 (SE earnings), Box 11 (other income),
     Box 13 (other deductions). Handles negative numbers in parentheses.
     """
-    text = extract_text_from_pdf(pdf_path)
+    values = _read_form_fields(doc, K1_1065_FIELDS, K1_1065_REQUIRED)
+    if values is not None:
+        result = _form_field_result(doc, "K-1", ScheduleK1(), values)
+        k1 = result.data
+        if not any([k1.ordinary_business_income, k1.net_rental_income,
+                    k1.guaranteed_payments, k1.interest_income]):
+            result.add_warning("No income boxes found — verify K-1 data manually")
+            result.confidence = 0.65
+        return result
+
+    text = doc.text
     result = ParseResult(
-        source_file=str(pdf_path),
+        source_file=doc.path,
         document_type="K-1",
     )
 
@@ -282,11 +719,28 @@ def parse_k1_1065(pdf_path: str) -> ParseResult:
     return result
 
 
-def parse_w2(pdf_path: str) -> ParseResult:
-    """Parse a W-2 PDF into structured data."""
-    text = extract_text_from_pdf(pdf_path)
+@_reads_document
+def parse_w2(doc: PDFDocument) -> ParseResult:
+    """Parse a W-2 PDF into structured data.
+
+    Fillable PDFs are read from their form fields when Box 1 is filled in
+    (a $0 Box 1 falls through to the layout text and its warning).
+    """
+    values = _read_form_fields(doc, W2_FIELDS, W2_REQUIRED)
+    if values is not None:
+        result = _form_field_result(doc, "W-2", FormW2(), values)
+        if "employer_name" not in values:
+            result.add_warning("Could not extract employer name")
+            result.confidence = 0.5
+        if values["wages"] < 0:
+            result.add_warning("Box 1 (wages) is negative — verify manually")
+            result.confidence = 0.3
+        _validate_amount(result, values["wages"], "wages")
+        return result
+
+    text = doc.text
     result = ParseResult(
-        source_file=str(pdf_path),
+        source_file=doc.path,
         document_type="W-2",
     )
 
@@ -320,11 +774,12 @@ def parse_w2(pdf_path: str) -> ParseResult:
     return result
 
 
-def parse_1098_mortgage(pdf_path: str) -> ParseResult:
+@_reads_document
+def parse_1098_mortgage(doc: PDFDocument) -> ParseResult:
     """Parse a 1098 Mortgage Interest Statement."""
-    text = extract_text_from_pdf(pdf_path)
+    text = doc.text
     result = ParseResult(
-        source_file=str(pdf_path),
+        source_file=doc.path,
         document_type="1098",
     )
 
@@ -357,18 +812,19 @@ def parse_1098_mortgage(pdf_path: str) -> ParseResult:
     return result
 
 
-def parse_1095_a(pdf_path: str) -> ParseResult:
+@_reads_document
+def parse_1095_a(doc: PDFDocument) -> ParseResult:
     """Parse a 1095-A Health Insurance Marketplace Statement."""
-    text = extract_text_from_pdf(pdf_path)
+    text = doc.text
     result = ParseResult(
-        source_file=str(pdf_path),
+        source_file=doc.path,
         document_type="1095-A",
     )
 
     form = Form1095A()
 
     # Try to extract monthly data from tables
-    tables = extract_tables_from_pdf(str(pdf_path))
+    tables = doc.tables
     for table in tables:
         for row in table:
             if not row or len(row) < 4:
@@ -420,11 +876,12 @@ def parse_1095_a(pdf_path: str) -> ParseResult:
     return result
 
 
-def parse_charity_receipt(pdf_path: str) -> ParseResult:
+@_reads_document
+def parse_charity_receipt(doc: PDFDocument) -> ParseResult:
     """Parse a charitable contribution receipt."""
-    text = extract_text_from_pdf(pdf_path)
+    text = doc.text
     result = ParseResult(
-        source_file=str(pdf_path),
+        source_file=doc.path,
         document_type="Charity Receipt",
     )
 
@@ -464,6 +921,215 @@ def parse_charity_receipt(pdf_path: str) -> ParseResult:
     return result
 
 
+# =============================================================================
+# Brokerage Statements (1099-INT, 1099-DIV, 1099-B)
+# =============================================================================
+
+def _payer_info(text: str, payer: tuple[str, str] = ("", "")) -> tuple[str, str]:
+    """(name, EIN) of the payer or broker in text, defaulting to `payer`."""
+    name_match = re.search(r"(?:payer|broker)'?s?\s+name[:\s]+(.+)", text, re.IGNORECASE)
+    ein_match = re.search(r'\b(\d{2}-\d{7})\b', text)
+    return (name_match.group(1).strip() if name_match else payer[0],
+            ein_match.group(1) if ein_match else payer[1])
+
+
+def _parse_1099_int_text(text: str, source_file: str,
+                         payer: tuple[str, str] = ("", "")) -> ParseResult:
+    result = ParseResult(source_file=source_file, document_type="1099-INT")
+    form = Form1099INT()
+    form.payer_name, form.payer_tin = _payer_info(text, payer)
+
+    # Box 1 needs its number: the form title is also "Interest Income"
+    form.interest_income = find_amount(text, r'(?:box\s*1|\b1)[\s.:-]+interest\s+income')
+    form.early_withdrawal_penalty = find_amount(text, r'early\s+withdrawal\s+penalty')
+    form.federal_tax_withheld = find_amount(text, r'federal\s+income\s+tax\s+withheld')
+    form.tax_exempt_interest = find_amount(text, r'tax[\s-]+exempt\s+interest')
+
+    if form.interest_income == 0:
+        result.add_warning("Box 1 (interest income) is $0 — verify manually")
+
+    result.data = form
+    result.confidence = 0.7 if form.interest_income > 0 else 0.3
+    return result
+
+
+def _parse_1099_div_text(text: str, source_file: str,
+                         payer: tuple[str, str] = ("", "")) -> ParseResult:
+    result = ParseResult(source_file=source_file, document_type="1099-DIV")
+    form = Form1099DIV()
+    form.payer_name, form.payer_tin = _payer_info(text, payer)
+
+    form.ordinary_dividends = find_amount(text, r'total\s+ordinary\s+dividends')
+    form.qualified_dividends = find_amount(text, r'qualified\s+dividends')
+    form.capital_gain_distributions = find_amount(
+        text, r'total\s+capital\s+gain\s+distributions?'
+    )
+    form.federal_tax_withheld = find_amount(text, r'federal\s+income\s+tax\s+withheld')
+    form.section_199a_dividends = find_amount(text, r'section\s+199A\s+dividends')
+
+    if form.ordinary_dividends == 0:
+        result.add_warning("Box 1a (ordinary dividends) is $0 — verify manually")
+
+    result.data = form
+    result.confidence = 0.7 if form.ordinary_dividends > 0 else 0.3
+    return result
+
+
+_STATEMENT_AMOUNT = re.compile(r'\(?-?\$?[\d,]+\.\d{2}\)?')
+
+
+def _statement_amount(value: str) -> float:
+    amount = float(value.strip("()").replace("$", "").replace(",", ""))
+    return -amount if value.startswith("(") else amount
+
+
+def _parse_1099_b_text(text: str, source_file: str,
+                       payer: tuple[str, str] = ("", "")) -> ParseResult:
+    """1099-B totals: proceeds and cost basis from each short/long-term "Total" line."""
+    result = ParseResult(source_file=source_file, document_type="1099-B")
+    form = Form1099B()
+    form.broker_name, form.broker_tin = _payer_info(text, payer)
+
+    totals = {"st": [0.0, 0.0], "lt": [0.0, 0.0]}
+    term = None
+    for line in text.splitlines():
+        lowered = line.lower()
+        if re.search(r'short[\s-]+term', lowered):
+            term = "st"
+        elif re.search(r'long[\s-]+term', lowered):
+            term = "lt"
+        if term is None or not re.match(r'\s*totals?\b', lowered) or "withheld" in lowered:
+            continue
+        amounts = _STATEMENT_AMOUNT.findall(line)
+        if len(amounts) >= 2:  # proceeds, then cost basis
+            totals[term][0] += _statement_amount(amounts[0])
+            totals[term][1] += _statement_amount(amounts[1])
+
+    form.st_proceeds, form.st_cost_basis = totals["st"]
+    form.lt_proceeds, form.lt_cost_basis = totals["lt"]
+    form.federal_tax_withheld = find_amount(text, r'federal\s+income\s+tax\s+withheld')
+
+    if form.st_proceeds == 0 and form.lt_proceeds == 0:
+        result.add_warning("No short- or long-term proceeds totals found — verify manually")
+
+    result.data = form
+    result.confidence = 0.7 if form.st_proceeds or form.lt_proceeds else 0.3
+    return result
+
+
+@_reads_document
+def parse_1099_int(doc: PDFDocument) -> ParseResult:
+    """Parse a 1099-INT PDF into structured data."""
+    return _parse_1099_int_text(doc.text, doc.path)
+
+
+@_reads_document
+def parse_1099_div(doc: PDFDocument) -> ParseResult:
+    """Parse a 1099-DIV PDF into structured data."""
+    return _parse_1099_div_text(doc.text, doc.path)
+
+
+@_reads_document
+def parse_1099_b(doc: PDFDocument) -> ParseResult:
+    """Parse a 1099-B PDF (short- and long-term totals) into structured data."""
+    return _parse_1099_b_text(doc.text, doc.path)
+
+
+# Section headers in composite ("consolidated") brokerage statements: the
+# form number and its title on one line, in either order. Brokers repeat
+# the header on every page of a section.
+_STATEMENT_SECTIONS = [
+    (r'1099-DIV\b.*Dividends\s+and\s+Distributions'
+     r'|Dividends\s+and\s+Distributions.*1099-DIV\b', "1099-DIV"),
+    (r'1099-INT\b.*Interest\s+Income|Interest\s+Income.*1099-INT\b', "1099-INT"),
+    (r'1099-B\b.*Proceeds\s+From\s+Broker|Proceeds\s+From\s+Broker.*1099-B\b', "1099-B"),
+    (r'Supplemental\s+(?:Information|Statement)', "Supplemental"),
+]
+_STATEMENT_SECTION_RE = re.compile(
+    "|".join(f"(?P<s{i}>{pattern})" for i, (pattern, _) in enumerate(_STATEMENT_SECTIONS)),
+    re.IGNORECASE,
+)
+
+_SECTION_PARSERS = {
+    "1099-DIV": _parse_1099_div_text,
+    "1099-INT": _parse_1099_int_text,
+    "1099-B": _parse_1099_b_text,
+}
+
+
+@dataclass
+class StatementSection:
+    """The pages of a composite statement belonging to one form."""
+    form: str  # "1099-DIV", "1099-INT", "1099-B", "Supplemental", or "" before the first header
+    first_page: int
+    last_page: int
+    text: str
+
+
+def iter_statement_sections(source) -> Iterator[StatementSection]:
+    """Split a composite brokerage statement into per-form sections.
+
+    Pages are read one at a time (PDFDocument.stream_pages()) and a
+    section is yielded as soon as the next form's header appears, so
+    only the current section's text is held however long the statement
+    is. A header partway down a page splits that page between sections;
+    a repeated header (same form, next page) continues the section.
+    """
+    with _opened(source) as doc:
+        form, first, last, parts = "", 0, 0, []
+        for index, page_text in enumerate(doc.stream_pages()):
+            start, header_end = 0, -1
+            for match in _STATEMENT_SECTION_RE.finditer(page_text):
+                name = _STATEMENT_SECTIONS[int(match.lastgroup[1:])][1]
+                if name == form:
+                    continue
+                # The new section starts at the beginning of the header's
+                # line, or at the header itself when it shares a line with
+                # the previous one
+                cut = page_text.rfind("\n", 0, match.start()) + 1
+                if cut < header_end:
+                    cut = match.start()
+                before = page_text[start:cut]
+                if before.strip():
+                    parts.append(before)
+                    last = index
+                if parts:
+                    yield StatementSection(form, first, last, "".join(parts))
+                form, first, last, parts = name, index, index, []
+                start, header_end = cut, match.end()
+            rest = page_text[start:]
+            if rest.strip():
+                parts.append(rest + "\n\n")
+                last = index
+        if parts:
+            yield StatementSection(form, first, last, "".join(parts))
+
+
+@_reads_document
+def parse_brokerage_statement(doc: PDFDocument) -> list[ParseResult]:
+    """Parse a composite brokerage statement: one result per form section.
+
+    Each 1099-DIV, 1099-INT and 1099-B section goes to that form's parser
+    as it is read (see iter_statement_sections()). The payer's name and
+    EIN are usually printed once, on the cover page, and carry over to
+    sections that don't repeat them. Supplemental pages, and sections
+    without a single amount (a contents line naming each form), are
+    skipped.
+    """
+    results = []
+    payer = ("", "")
+    for section in iter_statement_sections(doc):
+        payer = _payer_info(section.text, payer)
+        parse = _SECTION_PARSERS.get(section.form)
+        if parse is None:
+            continue
+        result = parse(section.text, doc.path, payer)
+        amounts = [v for v in vars(result.data).values() if isinstance(v, float)]
+        if any(amounts):
+            results.append(result)
+    return results
+
+
 # =============================================================================
 # Document Validation
 # =============================================================================
@@ -514,15 +1180,16 @@ def _validate_amount(result: ParseResult, amount: float, label: str,
 # Prior Return Parsing
 # =============================================================================
 
-def parse_prior_return(pdf_path: str) -> dict:
+@_reads_document
+def parse_prior_return(doc: PDFDocument) -> dict:
     """Parse a prior year tax return PDF into structured line-item data.
 
     Returns a dict organized by form/schedule with line numbers and values.
     This handles the full return package (1040 + all schedules in one PDF).
     """
-    pages = extract_pages_from_pdf(pdf_path)
+    pages = doc.pages
     result = {
-        "source_file": os.path.basename(pdf_path),
+        "source_file": doc.name,
         "pages": len(pages),
         "forms_detected": [],
         "data": {},
@@ -551,34 +1218,64 @@ def parse_prior_return(pdf_path: str) -> dict:
     return result
 
 
+# Form signatures for prior-return pages, highest priority first. Every
+# pattern starts with one of the _FORM_ANCHORS words, so _detect_form()
+# only tries them where an anchor occurs.
+_FORM_SIGNATURES = [
+    (r'Form\s+1040\b(?!\s*-)', "Form 1040"),
+    (r'Schedule\s+C\b.*(?:Profit|Loss|Business)', "Schedule C"),
+    (r'Schedule\s+SE\b.*Self-Employment', "Schedule SE"),
+    (r'Schedule\s+E\b.*Supplemental', "Schedule E"),
+    (r'Schedule\s+1\b.*Additional\s+Income', "Schedule 1"),
+    (r'Schedule\s+2\b.*Additional\s+Tax', "Schedule 2"),
+    (r'Schedule\s+3\b.*Additional\s+Credits', "Schedule 3"),
+    (r'Schedule\s+A\b.*Itemized', "Schedule A"),
+    (r'Schedule\s+B\b.*Interest', "Schedule B"),
+    (r'Schedule\s+D\b.*Capital\s+Gains', "Schedule D"),
+    (r'Form\s+2555\b.*Foreign\s+Earned', "Form 2555"),
+    (r'Form\s+8995\b.*Qualified\s+Business', "Form 8995"),
+    (r'Form\s+8829\b.*Business\s+Use.*Home', "Form 8829"),
+    (r'Form\s+4562\b.*Depreciation', "Form 4562"),
+    (r'Schedule\s+SE\b', "Schedule SE"),
+    (r'Self-Employment\s+Tax', "Schedule SE"),
+    (r'Qualified\s+Dividends.*Capital\s+Gain\s+Tax\s+Worksheet', "QDCG Worksheet"),
+    (r'Form\s+W-?2\b', "W-2"),
+    (r'Form\s+1098\b', "Form 1098"),
+    (r'Form\s+1095-?A\b', "Form 1095-A"),
+]
+_FORM_ANCHORS = re.compile(r"form|schedule|self-employment|qualified")
+_FORM_ANCHORS_ANY_CASE = re.compile(_FORM_ANCHORS.pattern, re.IGNORECASE)
+# One alternation in priority order: at a given position, match()
+# reports the highest-priority signature starting there
+_FORM_SIGNATURE_RE = re.compile(
+    "|".join(f"(?P<f{i}>{pattern})" for i, (pattern, _) in enumerate(_FORM_SIGNATURES)),
+    re.IGNORECASE,
+)
+
+
 def _detect_form(text: str) -> str | None:
-    """Detect which IRS form a page of text belongs to."""
-    form_patterns = [
-        (r'Form\s+1040\b(?!\s*-)', "Form 1040"),
-        (r'Schedule\s+C\b.*(?:Profit|Loss|Business)', "Schedule C"),
-        (r'Schedule\s+SE\b.*Self-Employment', "Schedule SE"),
-        (r'Schedule\s+E\b.*Supplemental', "Schedule E"),
-        (r'Schedule\s+1\b.*Additional\s+Income', "Schedule 1"),
-        (r'Schedule\s+2\b.*Additional\s+Tax', "Schedule 2"),
-        (r'Schedule\s+3\b.*Additional\s+Credits', "Schedule 3"),
-        (r'Schedule\s+A\b.*Itemized', "Schedule A"),
-        (r'Schedule\s+B\b.*Interest', "Schedule B"),
-        (r'Schedule\s+D\b.*Capital\s+Gains', "Schedule D"),
-        (r'Form\s+2555\b.*Foreign\s+Earned', "Form 2555"),
-        (r'Form\s+8995\b.*Qualified\s+Business', "Form 8995"),
-        (r'Form\s+8829\b.*Business\s+Use.*Home', "Form 8829"),
-        (r'Form\s+4562\b.*Depreciation', "Form 4562"),
-        (r'Schedule\s+SE\b', "Schedule SE"),
-        (r'Self-Employment\s+Tax', "Schedule SE"),
-        (r'Qualified\s+Dividends.*Capital\s+Gain\s+Tax\s+Worksheet', "QDCG Worksheet"),
-        (r'Form\s+W-?2\b', "W-2"),
-        (r'Form\s+1098\b', "Form 1098"),
-        (r'Form\s+1095-?A\b', "Form 1095-A"),
-    ]
-    for pattern, name in form_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return name
-    return None
+    """Detect which IRS form a page of text belongs to.
+
+    Same answer as trying each of _FORM_SIGNATURES in order, but the
+    page is scanned once for anchor words and signatures are matched
+    only at those positions.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        anchors = _FORM_ANCHORS.finditer(lowered)
+    else:  # lower() changed some offsets (rare non-ASCII case mappings)
+        anchors = _FORM_ANCHORS_ANY_CASE.finditer(text)
+
+    best = None
+    for anchor in anchors:
+        match = _FORM_SIGNATURE_RE.match(text, anchor.start())
+        if match:
+            index = int(match.lastgroup[1:])
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+    return None if best is None else _FORM_SIGNATURES[best][1]
 
 
 def _extract_line_items(text: str) -> dict[str, str | float]:
@@ -604,63 +1301,272 @@ def _extract_line_items(text: str) -> dict[str, str | float]:
 # Document Scanning & Classification
 # =============================================================================
 
-def scan_documents_folder(folder_path: str) -> dict:
+def _scan_pdf(pdf_path) -> dict:
+    """Classification and text preview for one PDF in a folder scan."""
+    try:
+        # Parsers reading this file later reuse its cached text
+        with _opened(pdf_path) as doc:
+            doc_type = _classify_document(doc)
+            return {"text_preview": doc.preview(500), "classification": doc_type}
+    except Exception as e:
+        return {"classification": "error", "error": str(e)}
+
+
+def _scan_pdf_worker(pdf_path: str) -> tuple[dict, Optional[dict], float]:
+    """_scan_pdf in a pool process; also returns what was extracted."""
+    started = time.perf_counter()
+    info = _scan_pdf(pdf_path)
+    cached = _document_cache.get(str(Path(pdf_path).resolve()))
+    try:
+        snapshot = cached[1]._snapshot() if cached and "error" not in info else None
+    except Exception:
+        snapshot = None  # the parent re-extracts it if a parser needs it
+    return info, snapshot, time.perf_counter() - started
+
+
+def _iter_scan_pdfs(pdfs: list[Path], workers: int) -> Iterator[tuple[int, dict, float]]:
+    """Run _scan_pdf over pdfs across up to `workers` processes.
+
+    Yields (position in pdfs, info, seconds) as each file finishes —
+    in order when serial, in completion order with a pool. A worker that
+    dies or raises marks only its own file as an error.
+    """
+    if workers <= 1 or len(pdfs) <= 1:
+        for pos, f in enumerate(pdfs):
+            started = time.perf_counter()
+            info = _scan_pdf(f)
+            yield pos, info, time.perf_counter() - started
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(pdfs)),
+                             initializer=set_extraction_cache,
+                             initargs=(_extraction_cache,)) as pool:
+        futures = {pool.submit(_scan_pdf_worker, str(f)): pos
+                   for pos, f in enumerate(pdfs)}
+        for future in as_completed(futures):
+            pos = futures[future]
+            try:
+                info, snapshot, seconds = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. BrokenProcessPool)
+                info, snapshot, seconds = (
+                    {"classification": "error", "error": f"{type(e).__name__}: {e}"},
+                    None, 0.0)
+            if snapshot is not None:
+                _share_document(pdfs[pos], snapshot)
+            yield pos, info, seconds
+
+
+def iter_scan_documents(folder_path: str, workers: Optional[int] = 1,
+                        previous: Optional[dict] = None,
+                        manifest: Optional[dict] = None) -> Iterator[dict]:
+    """Scan a folder for tax documents, yielding progress events as it goes.
+
+    Every event is a dict with "event" and "elapsed" (seconds since the
+    scan started):
+
+      start     folder, total_files, pdf_files, to_scan (PDFs to classify)
+      document  index, document, seconds, reused — once per file, as soon
+                as it is done. index is the file's position in the final
+                listing; with workers > 1 PDFs finish out of order.
+      finish    results (as scan_documents_folder returns them), plus
+                manifest, added, changed, removed when a manifest was given
+      error     error — the folder does not exist (the only event)
+
+    With workers > 1 (None for one per CPU), PDFs are extracted and
+    classified across a process pool. Passing the manifest and results
+    of an earlier scan makes it incremental; see rescan_documents_folder().
+    """
+    started = time.perf_counter()
+
+    def event(kind: str, **data) -> dict:
+        return {"event": kind, "elapsed": time.perf_counter() - started, **data}
+
+    folder = Path(folder_path)
+    if not folder.exists():
+        yield event("error", error=f"Folder not found: {folder_path}")
+        return
+
+    files = _folder_files(folder)
+    reuse: dict[str, dict] = {}
+    if manifest is not None:
+        new_manifest, reuse, changes = _diff_manifest(files, previous or {}, manifest)
+    pdfs = [f for f in files if f.suffix.lower() == ".pdf" and str(f) not in reuse]
+    yield event("start", folder=str(folder), total_files=len(files),
+                pdf_files=sum(f.suffix.lower() == ".pdf" for f in files),
+                to_scan=len(pdfs))
+
+    # Reused entries and non-PDFs are ready at once; PDFs follow as classified
+    documents: list[Optional[dict]] = [None] * len(files)
+    for i, f in enumerate(files):
+        if str(f) in reuse:
+            documents[i] = reuse[str(f)]
+        elif f.suffix.lower() != ".pdf":
+            documents[i] = _file_info(f, classification=f"non-pdf ({f.suffix})")
+        else:
+            continue
+        yield event("document", index=i, document=documents[i], seconds=0.0,
+                    reused=str(f) in reuse)
+
+    position = {str(f): i for i, f in enumerate(files)}
+    for pos, info, seconds in _iter_scan_pdfs(pdfs, workers or os.cpu_count() or 1):
+        i = position[str(pdfs[pos])]
+        documents[i] = _file_info(pdfs[pos], **info)
+        yield event("document", index=i, document=documents[i], seconds=seconds,
+                    reused=False)
+
+    finish = {"results": _scan_results(folder, documents)}
+    if manifest is not None:
+        finish.update(manifest=new_manifest, **changes)
+    yield event("finish", **finish)
+
+
+def scan_documents_folder(folder_path: str, workers: Optional[int] = 1) -> dict:
     """Scan a folder for tax documents and classify them.
 
+    With workers > 1 (None for one per CPU), PDFs are extracted and
+    classified across a process pool; documents are still listed in
+    path order and the summary is identical to a serial scan. Use
+    iter_scan_documents() to see documents as they are classified.
+
     Returns a summary of what was found and what's parseable.
     """
-    folder = Path(folder_path)
-    if not folder.exists():
-        return {"error": f"Folder not found: {folder_path}"}
+    *_, last = iter_scan_documents(folder_path, workers)
+    if last["event"] == "error":
+        return {"error": last["error"]}
+    return last["results"]
+
+
+def rescan_documents_folder(folder_path: str, previous: dict, manifest: dict,
+                            workers: Optional[int] = 1) -> dict:
+    """Rescan a folder, classifying only files added or changed since `previous`.
+
+    manifest maps each previously scanned path to its size, mtime_ns and
+    sha256. A file whose size and mtime match is unchanged without being
+    read; otherwise its hash decides (a touched but identical file is
+    still unchanged). Entries for unchanged files are carried over from
+    previous["documents"]; deleted files drop out.
+
+    Returns {"results", "manifest", "added", "changed", "removed"} — the
+    scan results as scan_documents_folder() would return them, the
+    manifest for the next rescan and the affected paths — or {"error"}.
+    An empty previous/manifest makes every file "added".
+    """
+    *_, last = iter_scan_documents(folder_path, workers, previous, manifest)
+    if last["event"] == "error":
+        return {"error": last["error"]}
+    return {key: last[key] for key in ("results", "manifest", "added", "changed", "removed")}
+
+
+def _folder_files(folder: Path) -> list[Path]:
+    return [f for f in sorted(folder.rglob("*")) if f.is_file()]
+
 
+def _file_info(f: Path, **fields) -> dict:
+    return {
+        "path": str(f),
+        "name": f.name,
+        "size_kb": round(f.stat().st_size / 1024, 1),
+        "type": f.suffix.lower(),
+        **fields,
+    }
+
+
+def _diff_manifest(files: list[Path], previous: dict,
+                   manifest: dict) -> tuple[dict, dict, dict]:
+    """Fingerprint files against manifest.
+
+    Returns (new manifest, previous documents to reuse by path,
+    {"added", "changed", "removed"} paths).
+    """
+    known_docs = {d["path"]: d for d in previous.get("documents", [])}
+    new_manifest, reuse, added, changed = {}, {}, [], []
+    for f in files:
+        path = str(f)
+        known = manifest.get(path)
+        st = f.stat()
+        if known and (known.get("size"), known.get("mtime_ns")) == (st.st_size, st.st_mtime_ns):
+            entry = known
+        else:
+            entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                     "sha256": _file_sha256(f)}
+        new_manifest[path] = entry
+
+        if known is None or path not in known_docs:
+            added.append(path)
+        elif entry["sha256"] != known.get("sha256"):
+            changed.append(path)
+        else:
+            reuse[path] = known_docs[path]
+
+    removed = sorted((set(manifest) | set(known_docs)) - set(new_manifest))
+    return new_manifest, reuse, {"added": added, "changed": changed, "removed": removed}
+
+
+def _scan_results(folder: Path, documents: list[dict]) -> dict:
+    """Scan results (listing plus summary) for documents in path order."""
     results = {
         "folder": str(folder),
-        "documents": [],
+        "documents": documents,
         "summary": {
-            "total_files": 0,
+            "total_files": len(documents),
             "pdf_files": 0,
             "classified": {},
             "unclassified": [],
         }
     }
+    for doc_info in documents:
+        if doc_info["type"] != ".pdf":
+            continue
+        results["summary"]["pdf_files"] += 1
+        doc_type = doc_info["classification"]
+        if doc_type == "unknown":
+            results["summary"]["unclassified"].append(doc_info["name"])
+        elif doc_type != "error":
+            results["summary"]["classified"][doc_type] = (
+                results["summary"]["classified"].get(doc_type, 0) + 1
+            )
+    return results
 
-    for f in sorted(folder.rglob("*")):
-        if f.is_file():
-            results["summary"]["total_files"] += 1
-            doc_info = {
-                "path": str(f),
-                "name": f.name,
-                "size_kb": round(f.stat().st_size / 1024, 1),
-                "type": f.suffix.lower(),
-            }
-
-            if f.suffix.lower() == ".pdf":
-                results["summary"]["pdf_files"] += 1
-                try:
-                    text = extract_text_from_pdf(str(f))
-                    doc_type = _classify_document(text, f.name)
-                    doc_info["classification"] = doc_type
-                    doc_info["text_preview"] = text[:500]
-
-                    if doc_type != "unknown":
-                        results["summary"]["classified"][doc_type] = (
-                            results["summary"]["classified"].get(doc_type, 0) + 1
-                        )
-                    else:
-                        results["summary"]["unclassified"].append(f.name)
-                except Exception as e:
-                    doc_info["classification"] = "error"
-                    doc_info["error"] = str(e)
-            else:
-                doc_info["classification"] = f"non-pdf ({f.suffix})"
-
-            results["documents"].append(doc_info)
 
-    return results
+# Pages read per classification attempt (None = all). A form's identity
+# is nearly always on page 1, so more pages are read only while the
+# document is still "unknown".
+_CLASSIFY_PAGE_LIMITS = (1, 3, None)
+
 
+def _classify_document(source, filename: str = "") -> str:
+    """Classify a tax document based on its content and filename.
 
-def _classify_document(text: str, filename: str) -> str:
-    """Classify a tax document based on its content and filename."""
+    source is a PDFDocument (its file name and first page(s) are used)
+    or text already extracted from the document.
+    """
+    if isinstance(source, PDFDocument):
+        filename = filename or source.name
+        if filename in source.classifications:
+            return source.classifications[filename]
+        doc_type = _classify_pages(source, filename)
+        source.remember_classification(filename, doc_type)
+        return doc_type
+    return _classify_text(source, filename)
+
+
+def _classify_pages(doc: PDFDocument, filename: str) -> str:
+    pages_read = 0
+    for limit in _CLASSIFY_PAGE_LIMITS:
+        pages = doc.page_count if limit is None else min(limit, doc.page_count)
+        if pages_read and pages <= pages_read:
+            continue  # no new text since the last attempt
+        doc_type = _classify_text(doc.head_text(pages), filename)
+        if doc_type != "unknown":
+            return doc_type
+        pages_read = pages
+    return "unknown"
+
+
+def _classify_text(text: str, filename: str) -> str:
     text_lower = text.lower()
     fname_lower = filename.lower()
 
@@ -684,6 +1590,16 @@ def _classify_document(text: str, filename: str) -> str:
         return "1095-A"
     if "health insurance marketplace" in text_lower:
         return "1095-A"
+    statement_forms = [
+        form for form in ("1099-DIV", "1099-INT", "1099-B")
+        if form.lower() in text_lower or form.lower() in fname_lower
+        or form.lower().replace("-", "") in fname_lower
+    ]
+    if len(statement_forms) > 1 or re.search(r"(?:composite|consolidated)\s+(?:form\s+)?1099",
+                                             text_lower):
+        return "Brokerage Statement"
+    if statement_forms:
+        return statement_forms[0]
     if "form 1040" in text_lower or "individual income tax" in text_lower:
         if "estimated" in text_lower or "1040-es" in text_lower:
             return "1040-ES"
@@ -353,6 +353,35 @@ Or EFTPS: https://www.eftps.gov
 """
 
 
+def generate_monte_carlo_plan_report(plan: dict) -> str:
+    """Generate quarterly plan report under income uncertainty (simulate_quarterly_plan)."""
+    point = plan["point_estimate"]
+    lines = []
+    lines.append("ESTIMATED TAX PLAN — INCOME SCENARIOS")
+    lines.append("=" * 50)
+    lines.append("")
+    lines.append(f"  Scenarios simulated:     {plan['scenarios']:>13,}")
+    lines.append(f"  Point-estimate tax:      ${point['total_tax']:>12,.2f}")
+    lines.append(f"  Mean simulated tax:      ${plan['mean_tax']:>12,.2f}")
+    lines.append("")
+    lines.append("Total tax by percentile:")
+    for pct, tax in plan["tax_percentiles"].items():
+        lines.append(f"  {pct:>3}th percentile:       ${tax:>12,.2f}")
+    lines.append("")
+    lines.append("Planned estimated payments:")
+    lines.append(f"  Annual total:            ${plan['planned_annual']:>12,.2f}")
+    lines.append(f"  Each quarter:            ${plan['planned_quarterly']:>12,.2f}")
+    lines.append(f"  Meets safe harbor in:    {plan['safe_harbor_probability']:>12.1%}"
+                 " of scenarios")
+    lines.append("")
+    lines.append("Annual estimates needed to meet safe harbor:")
+    for level, annual in plan["annual_for_coverage"].items():
+        lines.append(f"  {level:>4.0%} of scenarios:       ${annual:>12,.2f}"
+                     f"  (${annual / 4:,.2f}/quarter)")
+
+    return "\n".join(lines)
+
+
 def generate_feie_comparison_report(scenarios: dict) -> str:
     """Generate detailed FEIE comparison report."""
     wo = scenarios["without_feie"]
@@ -382,6 +411,30 @@ def generate_feie_comparison_report(scenarios: dict) -> str:
     return "\n".join(lines)
 
 
+def generate_filing_status_comparison_report(comparison: dict) -> str:
+    """Generate filing status comparison report (compare_filing_statuses)."""
+    lines = []
+    lines.append("FILING STATUS COMPARISON")
+    lines.append("=" * 60)
+    lines.append("")
+    lines.append(f"  {'Status':<8}{'Taxable income':>16}{'Total tax':>14}"
+                 f"{'vs current':>14}")
+    for row in comparison["ranking"]:
+        lines.append(f"  {row['filing_status'].upper():<8}"
+                     f"${row['taxable_income']:>15,.2f}"
+                     f"${row['total_tax']:>13,.2f}"
+                     f"${row['savings_vs_current']:>13,.2f}")
+    lines.append("")
+    skipped = [fs.value.upper() for fs in FilingStatus if fs not in comparison["results"]]
+    if skipped:
+        lines.append(f"  Not compared: {', '.join(skipped)}")
+    lines.append("  Confirm eligibility for the recommended status before filing.")
+    lines.append("")
+    lines.append(f"  RECOMMENDATION: {comparison['recommendation']}")
+
+    return "\n".join(lines)
+
+
 def generate_prior_year_comparison(current: Form1040Result,
                                    prior: dict) -> str:
     """Generate year-over-year comparison report.
@@ -13,6 +13,16 @@ from tests.fixtures.profiles import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolate_result_cache(tmp_path, monkeypatch):
+    """Keep the on-disk result and extraction caches out of ~/.taxman during tests."""
+    import taxman.cli.cache as cache_mod
+    import taxman.parse_documents as parse_mod
+    monkeypatch.setattr(cache_mod, "CACHE_DIR", tmp_path / "result_cache")
+    monkeypatch.setattr(cache_mod, "_default_cache", None)
+    monkeypatch.setattr(parse_mod, "_extraction_cache", None)
+
+
 @pytest.fixture
 def mfs_expat():
     """MFS expat profile with law firm + DocSherpa + K-1."""
@@ -0,0 +1,201 @@
+"""Tests for the vectorized batch calculator."""
+
+import random
+from dataclasses import fields
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from taxman.batch import BatchResult, calculate_returns_batch, extract_columns
+from taxman.calculator import calculate_return
+from taxman.models import (
+    BusinessExpenses,
+    Dependent,
+    EstimatedPayment,
+    FilingStatus,
+    Form1099B,
+    Form1099DIV,
+    Form1099INT,
+    Form1099NEC,
+    Form1099R,
+    FormW2,
+    HealthInsurance,
+    HomeOffice,
+    ScheduleCData,
+    ScheduleEProperty,
+    ScheduleK1,
+    TaxpayerProfile,
+)
+from tests.fixtures.profiles import (
+    make_family_profile,
+    make_investor_profile,
+    make_mfj_high_income_profile,
+    make_mfs_expat_profile,
+    make_minimal_profile,
+    make_single_freelancer_profile,
+    make_zero_income_profile,
+)
+
+BATCH_FIELDS = [f.name for f in fields(BatchResult)]
+
+
+def _money(rng, low, high):
+    return round(rng.uniform(low, high), 2)
+
+
+def _random_profile(rng: random.Random) -> TaxpayerProfile:
+    """A profile exercising every input the batch engine reads."""
+    profile = TaxpayerProfile(filing_status=rng.choice(list(FilingStatus)))
+    for n in range(rng.randint(0, 3)):
+        home_office = None
+        if rng.random() < 0.3:
+            home_office = HomeOffice(
+                use_simplified_method=rng.random() < 0.5,
+                square_footage=rng.randint(50, 400),
+                total_home_sqft=1500, office_sqft=rng.randint(50, 300),
+                rent=_money(rng, 0, 30_000), utilities=_money(rng, 0, 4_000),
+            )
+        profile.businesses.append(ScheduleCData(
+            business_name=f"Biz {n}",
+            gross_receipts=_money(rng, 0, 400_000),
+            returns_and_allowances=_money(rng, 0, 2_000),
+            cost_of_goods_sold=_money(rng, 0, 20_000),
+            other_income=_money(rng, 0, 3_000),
+            expenses=BusinessExpenses(
+                advertising=_money(rng, 0, 5_000),
+                meals=_money(rng, 0, 6_000),
+                travel=_money(rng, 0, 15_000),
+                supplies=_money(rng, 0, 4_000),
+                other_expenses=_money(rng, 0, 90_000),
+            ),
+            home_office=home_office,
+        ))
+    if rng.random() < 0.3:
+        profile.forms_1099_nec.append(Form1099NEC(
+            nonemployee_compensation=_money(rng, 0, 90_000),
+            federal_tax_withheld=_money(rng, 0, 1_000),
+        ))
+    for _ in range(rng.randint(0, 2)):
+        wages = _money(rng, 0, 250_000)
+        profile.forms_w2.append(FormW2(
+            wages=wages, ss_wages=min(wages, 176_100), medicare_wages=wages,
+            federal_tax_withheld=_money(rng, 0, 40_000),
+        ))
+    for _ in range(rng.randint(0, 2)):
+        profile.schedule_k1s.append(ScheduleK1(
+            ordinary_business_income=_money(rng, -20_000, 80_000),
+            net_rental_income=_money(rng, -15_000, 15_000),
+            other_net_rental_income=_money(rng, -3_000, 3_000),
+            guaranteed_payments=_money(rng, 0, 40_000),
+            interest_income=_money(rng, -100, 2_000),
+            dividends=_money(rng, 0, 3_000),
+            qualified_dividends=_money(rng, 0, 2_000),
+            royalties=_money(rng, -500, 2_000),
+            net_short_term_capital_gain=_money(rng, -5_000, 5_000),
+            net_long_term_capital_gain=_money(rng, -5_000, 30_000),
+            net_section_1231_gain=_money(rng, 0, 5_000),
+            other_income=_money(rng, 0, 1_000),
+            section_179_deduction=_money(rng, 0, 2_000),
+            self_employment_earnings=_money(rng, 0, 50_000),
+            qbi_amount=_money(rng, 0, 60_000),
+            qbi_w2_wages=_money(rng, 0, 100_000),
+            qbi_ubia=_money(rng, 0, 300_000),
+            is_sstb=rng.random() < 0.3,
+        ))
+    if rng.random() < 0.3:
+        profile.schedule_e_properties.append(ScheduleEProperty(
+            gross_rents=_money(rng, 0, 40_000),
+            mortgage_interest=_money(rng, 0, 20_000),
+            depreciation=_money(rng, 0, 15_000),
+        ))
+    if rng.random() < 0.4:
+        profile.forms_1099_int.append(Form1099INT(
+            interest_income=_money(rng, 0, 10_000),
+            tax_exempt_interest=_money(rng, 0, 2_000),
+        ))
+    if rng.random() < 0.4:
+        ordinary = _money(rng, 0, 30_000)
+        profile.forms_1099_div.append(Form1099DIV(
+            ordinary_dividends=ordinary,
+            qualified_dividends=round(ordinary * rng.random(), 2),
+            capital_gain_distributions=_money(rng, 0, 4_000),
+        ))
+    if rng.random() < 0.4:
+        profile.forms_1099_b.append(Form1099B(
+            st_proceeds=_money(rng, 0, 50_000), st_cost_basis=_money(rng, 0, 60_000),
+            lt_proceeds=_money(rng, 0, 200_000), lt_cost_basis=_money(rng, 0, 150_000),
+            federal_tax_withheld=_money(rng, 0, 500),
+        ))
+    if rng.random() < 0.2:
+        taxable = _money(rng, 0, 40_000)
+        profile.forms_1099_r.append(Form1099R(
+            gross_distribution=taxable, taxable_amount=taxable,
+            is_early_distribution=rng.random() < 0.5,
+        ))
+    for _ in range(rng.randint(0, 3)):
+        profile.dependents.append(Dependent(
+            first_name="Kid", is_qualifying_child_ctc=rng.random() < 0.7))
+    for q in range(rng.randint(0, 4)):
+        profile.estimated_payments.append(
+            EstimatedPayment(quarter=q + 1, amount=_money(rng, 0, 15_000)))
+    if rng.random() < 0.4:
+        profile.health_insurance = HealthInsurance(total_premiums=_money(rng, 0, 12_000))
+    if rng.random() < 0.3:
+        profile.sep_ira_contribution = _money(rng, 0, 40_000)
+    if rng.random() < 0.2:
+        profile.nol_carryforward = _money(rng, 0, 20_000)
+    if rng.random() < 0.3:
+        profile.uses_itemized_deductions = True
+        profile.state_local_tax_deduction = _money(rng, 0, 40_000)
+    return profile
+
+
+def _assert_matches_scalar(profiles):
+    batch = calculate_returns_batch(profiles)
+    assert len(batch) == len(profiles)
+    for i, profile in enumerate(profiles):
+        scalar = calculate_return(profile)
+        row = batch.row(i)
+        for name in BATCH_FIELDS:
+            assert row[name] == getattr(scalar, name), (
+                f"profile {i} field {name}: batch {row[name]!r} "
+                f"!= scalar {getattr(scalar, name)!r}"
+            )
+
+
+class TestCalculateReturnsBatch:
+    def test_fixture_profiles_match_scalar(self):
+        _assert_matches_scalar([
+            make_mfs_expat_profile(),
+            make_single_freelancer_profile(),
+            make_mfj_high_income_profile(),
+            make_minimal_profile(),
+            make_zero_income_profile(),
+            make_investor_profile(),
+            make_family_profile(),
+        ])
+
+    def test_random_profiles_match_scalar(self):
+        rng = random.Random(2025)
+        _assert_matches_scalar([_random_profile(rng) for _ in range(400)])
+
+    def test_empty_batch(self):
+        batch = calculate_returns_batch([])
+        assert len(batch) == 0
+        assert batch.to_records() == []
+
+    def test_rows_follow_input_order(self):
+        profiles = [make_zero_income_profile(), make_mfj_high_income_profile()]
+        records = calculate_returns_batch(profiles).to_records()
+        assert records[0]["total_tax"] == 0.0
+        assert records[1]["total_tax"] == calculate_return(profiles[1]).total_tax
+
+    def test_nec_only_profile_gets_auto_schedule_c(self):
+        profile = TaxpayerProfile(
+            filing_status=FilingStatus.SINGLE,
+            forms_1099_nec=[Form1099NEC(nonemployee_compensation=50_000)],
+        )
+        cols = extract_columns([profile])
+        assert list(cols.biz_gross_receipts) == [50_000]
+        _assert_matches_scalar([profile])
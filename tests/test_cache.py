@@ -0,0 +1,122 @@
+"""Tests for the content-hash result cache (taxman.cli.cache)."""
+
+import json
+from dataclasses import asdict
+
+from taxman.calculator import calculate_return, compare_feie_scenarios
+from taxman.cli import cache as cache_mod
+from taxman.cli.cache import ResultCache, cache_key, default_cache
+from taxman.cli.serialization import deserialize_profile, serialize_profile
+
+
+def _scenarios_equal(a, b):
+    def plain(s):
+        d = dict(s)
+        d["feie_result"] = asdict(d["feie_result"])
+        if d["result_with_feie"] is not None:
+            d["result_with_feie"] = asdict(d["result_with_feie"])
+        return d
+    return plain(a) == plain(b)
+
+
+class TestCacheKey:
+    def test_equal_profiles_share_a_key(self, mfs_expat):
+        copy = deserialize_profile(serialize_profile(mfs_expat))
+        assert cache_key("return", copy) == cache_key("return", mfs_expat)
+
+    def test_any_edit_changes_the_key(self, mfs_expat):
+        before = cache_key("return", mfs_expat)
+        mfs_expat.businesses[0].expenses.supplies += 1
+        assert cache_key("return", mfs_expat) != before
+
+    def test_kind_and_feie_are_part_of_the_key(self, mfs_expat):
+        feie = compare_feie_scenarios(mfs_expat)["feie_result"]
+        keys = {
+            cache_key("return", mfs_expat),
+            cache_key("compare", mfs_expat),
+            cache_key("return", mfs_expat, feie),
+        }
+        assert len(keys) == 3
+
+    def test_engine_digest_covers_calculator_dependencies(self):
+        modules = cache_mod._engine_sources()
+        for name in ("taxman.calculator", "taxman.constants", "taxman.models",
+                     "taxman.validation", "taxman.cli.serialization", "taxman.cli.cache"):
+            assert name in modules
+
+
+class TestResultCache:
+    def test_memory_hit_returns_same_object(self, mfs_expat):
+        cache = ResultCache()
+        first = cache.calculate_return(mfs_expat)
+        assert cache.calculate_return(mfs_expat) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert asdict(first) == asdict(calculate_return(mfs_expat))
+
+    def test_edit_misses(self, single_freelancer):
+        cache = ResultCache()
+        first = cache.calculate_return(single_freelancer)
+        single_freelancer.businesses[0].gross_receipts += 1_000
+        second = cache.calculate_return(single_freelancer)
+        assert second is not first
+        assert cache.misses == 2
+
+    def test_lru_eviction(self, mfs_expat, single_freelancer, mfj_high_income):
+        cache = ResultCache(maxsize=2)
+        cache.calculate_return(mfs_expat)
+        cache.calculate_return(single_freelancer)
+        cache.calculate_return(mfs_expat)          # refresh
+        cache.calculate_return(mfj_high_income)    # evicts single_freelancer
+        assert len(cache) == 2
+        cache.calculate_return(mfs_expat)
+        assert cache.misses == 3
+        cache.calculate_return(single_freelancer)
+        assert cache.misses == 4
+
+    def test_disk_tier_survives_new_process(self, mfs_expat, tmp_path):
+        first = ResultCache(disk_dir=tmp_path).calculate_return(mfs_expat)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        fresh = ResultCache(disk_dir=tmp_path)
+        again = fresh.calculate_return(mfs_expat)
+        assert (fresh.hits, fresh.misses) == (1, 0)
+        assert asdict(again) == asdict(first)
+
+    def test_compare_round_trips_through_disk(self, mfs_expat, tmp_path):
+        expected = compare_feie_scenarios(mfs_expat)
+        ResultCache(disk_dir=tmp_path).compare_feie_scenarios(mfs_expat)
+
+        fresh = ResultCache(disk_dir=tmp_path)
+        scenarios = fresh.compare_feie_scenarios(mfs_expat)
+        assert fresh.hits == 1
+        assert _scenarios_equal(scenarios, expected)
+        if scenarios["result_with_feie"] is not None:
+            assert scenarios["result_with_feie"].feie is scenarios["feie_result"]
+
+    def test_disk_eviction_keeps_newest(self, mfs_expat, single_freelancer,
+                                        mfj_high_income, tmp_path):
+        cache = ResultCache(disk_dir=tmp_path, max_disk_entries=2)
+        for profile in (mfs_expat, single_freelancer, mfj_high_income):
+            cache.calculate_return(profile)
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_corrupt_disk_entry_is_recomputed(self, mfs_expat, tmp_path):
+        key = cache_key("return", mfs_expat)
+        (tmp_path / f"{key}.json").write_text("{not json")
+        cache = ResultCache(disk_dir=tmp_path)
+        result = cache.calculate_return(mfs_expat)
+        assert cache.misses == 1
+        assert asdict(result) == asdict(calculate_return(mfs_expat))
+        assert json.loads((tmp_path / f"{key}.json").read_text())
+
+    def test_clear(self, mfs_expat, tmp_path):
+        cache = ResultCache(disk_dir=tmp_path)
+        cache.calculate_return(mfs_expat)
+        cache.clear(disk=True)
+        assert len(cache) == 0
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_default_cache_uses_cache_dir(self):
+        cache = default_cache()
+        assert cache.disk_dir == cache_mod.CACHE_DIR
+        assert default_cache() is cache
@@ -1,8 +1,13 @@
 """Tests for the tax calculation engine."""
 
+from dataclasses import asdict
+
 import pytest
 from taxman.calculator import (
+    BRACKET_TABLES,
     BRACKETS_BY_STATUS,
+    BracketTable,
+    bracket_table,
     calculate_additional_medicare,
     calculate_amt,
     calculate_income_tax,
@@ -16,8 +21,11 @@ from taxman.calculator import (
     calculate_tax_credits,
     calculate_tax_with_qdcg_worksheet,
     compare_feie_scenarios,
+    compare_filing_statuses,
+    eligible_filing_statuses,
     estimate_quarterly_payments,
     evaluate_feie,
+    explain_return,
     Form2555Result,
     generate_optimization_recommendations,
 )
@@ -33,6 +41,7 @@ from taxman.constants import (
     NIIT_THRESHOLD_SINGLE,
     NIIT_THRESHOLD_MFJ,
     QBI_THRESHOLD_MFS,
+    SEP_CONTRIBUTION_LIMIT,
     SS_WAGE_BASE,
     STANDARD_DEDUCTION,
 )
@@ -611,6 +620,78 @@ class TestCalculateIncomeTax:
         assert brackets is HOH_BRACKETS
 
 
+# =============================================================================
+# TestBracketTable
+# =============================================================================
+
+def _walk_brackets(taxable_income, brackets):
+    """Reference implementation: walk every bracket."""
+    tax = 0.0
+    prev_bound = 0
+    for upper_bound, rate in brackets:
+        if taxable_income <= prev_bound:
+            break
+        tax += (min(taxable_income, upper_bound) - prev_bound) * rate
+        prev_bound = upper_bound
+    return round(tax, 2)
+
+
+class TestBracketTable:
+    INCOMES = [
+        -50.0, 0.0, 0.01, 1.0, 11_924.99, 11_925, 11_925.01, 17_000,
+        48_475, 55_123.45, 103_350, 197_300, 250_525, 394_600, 500_000,
+        626_350, 751_600, 1_000_000, 12_345_678.91,
+    ]
+
+    def test_matches_bracket_walk(self):
+        import random
+        rng = random.Random(42)
+        incomes = self.INCOMES + [round(rng.uniform(0, 900_000), 2)
+                                  for _ in range(2_000)]
+        for status, brackets in BRACKETS_BY_STATUS.items():
+            table = BRACKET_TABLES[status]
+            for income in incomes:
+                assert table.tax(income) == _walk_brackets(income, brackets)
+                assert calculate_income_tax(income, brackets) == \
+                    _walk_brackets(income, brackets)
+
+    def test_cumulative_tax_at_boundaries(self):
+        table = BRACKET_TABLES[FilingStatus.MFS]
+        assert table.lower_bounds[:2] == (0, 11_925)
+        assert table.base_tax[0] == 0.0
+        assert table.base_tax[1] == 1_192.50
+        assert table.base_tax[2] == 1_192.50 + (48_475 - 11_925) * 0.12
+
+    def test_constant_lists_precompiled(self):
+        assert bracket_table(MFJ_BRACKETS) is BRACKET_TABLES[FilingStatus.MFJ]
+        assert bracket_table() is BRACKET_TABLES[FilingStatus.MFS]
+        assert BRACKET_TABLES[FilingStatus.QSS] is BRACKET_TABLES[FilingStatus.MFJ]
+
+    def test_custom_brackets_compiled_on_demand(self):
+        custom = [(10_000, 0.05), (float('inf'), 0.5)]
+        assert calculate_income_tax(20_000, custom) == 5_500.0
+        assert bracket_table(custom) is bracket_table(list(custom))
+
+    def test_marginal_rate(self):
+        table = BRACKET_TABLES[FilingStatus.SINGLE]
+        assert table.marginal_rate(0) == 0.10
+        assert table.marginal_rate(11_925) == 0.10
+        assert table.marginal_rate(11_925.01) == 0.12
+        assert table.marginal_rate(10_000_000) == 0.37
+
+    def test_tax_array_matches_scalar(self):
+        np = pytest.importorskip("numpy")
+        for status, table in BRACKET_TABLES.items():
+            incomes = np.array(self.INCOMES)
+            expected = [table.tax(x) for x in self.INCOMES]
+            assert table.tax_array(incomes).tolist() == expected
+
+    def test_compile_from_tuples(self):
+        table = BracketTable.compile([(100, 0.1), (float('inf'), 0.2)])
+        assert table.tax(150) == 20.0
+        assert table.tax(0) == 0.0
+
+
 # =============================================================================
 # TestCalculateAdditionalMedicare
 # =============================================================================
@@ -1570,6 +1651,21 @@ class TestOptimizationRecommendations:
         feie_rec = [r for r in recs if "FEIE" in r["title"] or "Foreign" in r["title"]]
         assert len(feie_rec) == 0
 
+    def test_sep_savings_are_exact(self, mfj_high_income):
+        result = calculate_return(mfj_high_income)
+        recs = generate_optimization_recommendations(result, mfj_high_income)
+        sep = next(r for r in recs if r["title"] == "SEP-IRA Contribution")
+
+        mfj_high_income.sep_ira_contribution = SEP_CONTRIBUTION_LIMIT
+        maxed = calculate_return(mfj_high_income)
+        assert sep["estimated_savings"] == round(result.total_tax - maxed.total_tax, 2)
+
+    def test_no_sep_once_maxed(self, mfj_high_income):
+        mfj_high_income.sep_ira_contribution = SEP_CONTRIBUTION_LIMIT
+        result = calculate_return(mfj_high_income)
+        recs = generate_optimization_recommendations(result, mfj_high_income)
+        assert not [r for r in recs if r["title"] == "SEP-IRA Contribution"]
+
 
 # =============================================================================
 # TestQDCGWorksheet — Fix #2
@@ -2205,3 +2301,124 @@ class TestFEIEDayAllocation:
         # Net exclusion = exclusion - allocable deductions
         assert feie.net_exclusion == round(
             feie.exclusion_amount - feie.allocable_deductions, 2)
+
+
+def _without_lines(value):
+    """asdict() with every `lines` list dropped, recursively."""
+    if isinstance(value, dict):
+        return {k: _without_lines(v) for k, v in value.items() if k != "lines"}
+    if isinstance(value, list):
+        return [_without_lines(v) for v in value]
+    return value
+
+
+def _all_lines(result):
+    """Every lines list on a Form1040Result and its schedule results."""
+    subs = [result, *result.schedule_c_results, result.schedule_se,
+            result.schedule_e, result.schedule_d, result.form_6251,
+            result.tax_credits, result.qbi, result.feie]
+    return [item for sub in subs if sub is not None for item in sub.lines]
+
+
+class TestExplainMode:
+    @pytest.mark.parametrize("fixture", [
+        "mfs_expat", "single_freelancer", "mfj_high_income",
+        "investor", "family", "zero_income",
+    ])
+    def test_numbers_only_matches_explained_totals(self, fixture, request):
+        profile = request.getfixturevalue(fixture)
+        explained = calculate_return(profile)
+        numbers = calculate_return(profile, explain=False)
+        assert _all_lines(explained)
+        assert _all_lines(numbers) == []
+        assert _without_lines(asdict(numbers)) == _without_lines(asdict(explained))
+
+    def test_explain_return_rebuilds_lines(self, mfj_high_income):
+        numbers = calculate_return(mfj_high_income, explain=False)
+        rebuilt = explain_return(numbers, mfj_high_income)
+        assert asdict(rebuilt) == asdict(calculate_return(mfj_high_income))
+
+    def test_explain_return_rebuilds_feie_lines(self, mfs_expat):
+        scenarios = compare_feie_scenarios(mfs_expat, explain=False)
+        numbers = scenarios["result_with_feie"]
+        assert numbers is not None and numbers.feie.lines == []
+        rebuilt = explain_return(numbers, mfs_expat)
+        expected = compare_feie_scenarios(mfs_expat)["result_with_feie"]
+        assert asdict(rebuilt) == asdict(expected)
+        assert rebuilt.feie.lines
+
+    def test_helpers_skip_line_items(self, mfs_expat):
+        biz = mfs_expat.businesses[0]
+        assert calculate_schedule_c(biz, explain=False).lines == []
+        assert (calculate_schedule_c(biz, explain=False).net_profit_loss
+                == calculate_schedule_c(biz).net_profit_loss)
+        assert calculate_schedule_se(80_000, explain=False).lines == []
+        assert calculate_schedule_e(mfs_expat, explain=False).lines == []
+        assert calculate_amt(300_000, 50_000, FilingStatus.MFS,
+                             salt_deduction=10_000, explain=False).lines == []
+
+
+class TestCompareFilingStatuses:
+    def _fresh(self, profile, fs):
+        profile.filing_status = fs
+        return calculate_return(profile)
+
+    @pytest.mark.parametrize("fixture", [
+        "mfs_expat", "mfj_high_income", "investor", "family",
+    ])
+    def test_matches_separate_calculations(self, fixture, request):
+        profile = request.getfixturevalue(fixture)
+        comparison = compare_filing_statuses(profile, list(FilingStatus), explain=True)
+        assert set(comparison["results"]) == set(FilingStatus)
+        for fs, result in comparison["results"].items():
+            other = request.getfixturevalue(fixture)
+            assert asdict(result) == asdict(self._fresh(other, fs))
+
+    def test_ranking_sorted_by_total_tax(self, mfj_high_income):
+        comparison = compare_filing_statuses(mfj_high_income)
+        taxes = [row["total_tax"] for row in comparison["ranking"]]
+        assert taxes == sorted(taxes)
+        assert comparison["best"].value == comparison["ranking"][0]["filing_status"]
+
+    def test_savings_relative_to_current_status(self, mfs_expat):
+        comparison = compare_filing_statuses(
+            mfs_expat, statuses=[FilingStatus.MFS, FilingStatus.MFJ])
+        rows = {row["filing_status"]: row for row in comparison["ranking"]}
+        assert rows["mfs"]["savings_vs_current"] == 0.0
+        mfs = comparison["results"][FilingStatus.MFS].total_tax
+        mfj = comparison["results"][FilingStatus.MFJ].total_tax
+        assert rows["mfj"]["savings_vs_current"] == round(mfs - mfj, 2)
+        assert comparison["best"] == FilingStatus.MFJ
+        assert "MFJ" in comparison["recommendation"]
+
+    def test_status_independent_schedules_are_shared(self, mfs_expat):
+        results = compare_filing_statuses(mfs_expat, list(FilingStatus))["results"]
+        sc = {id(r.schedule_c_results[0]) for r in results.values()}
+        se = {id(r.schedule_se) for r in results.values()}
+        sch_e = {id(r.schedule_e) for r in results.values()}
+        assert len(sc) == 1 and len(se) == 1
+        assert len(sch_e) == 2   # MFS suspends passive losses; others don't
+
+    def test_defaults_to_eligible_statuses(self, mfs_expat, mfj_high_income):
+        comparison = compare_filing_statuses(mfs_expat)
+        assert list(comparison["results"]) == [FilingStatus.MFS]
+        assert comparison["recommendation"] == "File MFS — lowest total tax"
+        assert set(compare_filing_statuses(mfj_high_income)["results"]) == {
+            FilingStatus.MFJ, FilingStatus.MFS}
+
+    def test_profile_unchanged(self, mfs_expat):
+        compare_filing_statuses(mfs_expat)
+        assert mfs_expat.filing_status == FilingStatus.MFS
+
+    def test_eligible_statuses(self, mfs_expat, mfj_high_income):
+        assert eligible_filing_statuses(mfs_expat) == [FilingStatus.MFS]
+        assert eligible_filing_statuses(mfj_high_income) == [
+            FilingStatus.MFJ, FilingStatus.MFS]
+        mfs_expat.dependents = [Dependent(first_name="Ana")]
+        assert eligible_filing_statuses(mfs_expat) == [FilingStatus.MFS, FilingStatus.HOH]
+        mfs_expat.treat_spouse_as_resident = True
+        assert eligible_filing_statuses(mfs_expat) == [FilingStatus.MFS]
+        single = TaxpayerProfile(filing_status=FilingStatus.SINGLE,
+                                 dependents=[Dependent(first_name="Ana")])
+        assert eligible_filing_statuses(single) == [FilingStatus.SINGLE, FilingStatus.HOH]
+
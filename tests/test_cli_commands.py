@@ -251,6 +251,37 @@ class TestCompareCommand:
         restored = deserialize_profile(session.profile_data)
         assert restored.days_in_foreign_country_2025 == 0
 
+    def test_compare_filing_statuses_report(self, tmp_path, monkeypatch):
+        """--filing-status ranks only the statuses the profile supports."""
+        _create_session_with_results(tmp_path, monkeypatch)
+
+        cli_result = CliRunner().invoke(app, ["compare", "test123", "--filing-status"])
+
+        assert cli_result.exit_code == 0, cli_result.output
+        assert "FILING STATUS COMPARISON" in cli_result.stdout
+        assert "Not compared: SINGLE, MFJ, HOH, QSS" in cli_result.stdout
+        assert "RECOMMENDATION: File MFS" in cli_result.stdout
+
+    def test_compare_explicit_statuses(self, tmp_path, monkeypatch):
+        """--statuses compares exactly the statuses asked for."""
+        _create_session_with_results(tmp_path, monkeypatch)
+
+        cli_result = CliRunner().invoke(
+            app, ["compare", "test123", "--filing-status", "--statuses", "mfs,mfj"])
+
+        assert cli_result.exit_code == 0, cli_result.output
+        assert "Not compared: SINGLE, HOH, QSS" in cli_result.stdout
+        assert "vs MFS" in cli_result.stdout
+
+    def test_compare_unknown_status(self, tmp_path, monkeypatch):
+        _create_session_with_results(tmp_path, monkeypatch)
+
+        cli_result = CliRunner().invoke(
+            app, ["compare", "test123", "--filing-status", "--statuses", "mfs,joint"])
+
+        assert cli_result.exit_code == 1
+        assert "Unknown filing status" in cli_result.stdout
+
 
 # =============================================================================
 # Fix 3: Quarterly Plan Prior Year Tax
@@ -303,3 +334,83 @@ class TestQuarterlyPlanPriorYearTax:
 
         # With a real prior_year_tax, safe harbor amount should differ
         assert "25,000" in quarterly_with_prior or quarterly_with_prior != quarterly_without
+
+
+# =============================================================================
+# Batch Command Tests
+# =============================================================================
+
+class TestBatchCommand:
+    def _write_profiles(self, tmp_path):
+        profiles_dir = tmp_path / "profiles"
+        profiles_dir.mkdir()
+        for name, receipts in (("alice", 60_000.0), ("bob", 120_000.0)):
+            profile = TaxpayerProfile(
+                first_name=name.title(),
+                filing_status=FilingStatus.SINGLE,
+                businesses=[ScheduleCData(business_name=f"{name} LLC",
+                                          gross_receipts=receipts)],
+            )
+            (profiles_dir / f"{name}.json").write_text(
+                json.dumps(serialize_profile(profile), default=str))
+        return profiles_dir
+
+    def test_batch_mixes_sessions_and_profile_files(self, tmp_path, monkeypatch):
+        _create_session_with_results(tmp_path, monkeypatch)
+        profiles_dir = self._write_profiles(tmp_path)
+        output_dir = tmp_path / "batch_out"
+
+        cli_result = CliRunner().invoke(app, [
+            "batch", "test123", str(profiles_dir),
+            "--output-dir", str(output_dir), "--workers", "2", "--no-forms",
+        ])
+
+        assert cli_result.exit_code == 0, cli_result.output
+        assert "3 succeeded, 0 failed" in cli_result.output
+        assert "returns/s" in cli_result.output
+        for name in ("test123", "alice", "bob"):
+            assert (output_dir / name / "tax_summary.txt").exists()
+            assert (output_dir / name / "quarterly_plan.txt").exists()
+
+    def test_batch_isolates_failures(self, tmp_path, monkeypatch):
+        import taxman.cli.state as state_mod
+        monkeypatch.setattr(state_mod, "SESSIONS_DIR", tmp_path)
+        profiles_dir = self._write_profiles(tmp_path)
+        (profiles_dir / "broken.json").write_text(
+            json.dumps({"filing_status": "not-a-status"}))
+
+        from taxman.cli.batch import resolve_sources, run_batch
+        items = resolve_sources([str(profiles_dir), "missing-session"])
+        outcomes = run_batch(items, str(tmp_path / "out"), workers=2, forms=False)
+
+        by_name = {o.name: o for o in outcomes}
+        assert [o.name for o in outcomes] == ["alice", "bob", "broken",
+                                              "missing-session"]
+        assert by_name["alice"].ok and by_name["bob"].ok
+        assert "ValueError" in by_name["broken"].error
+        assert "not found" in by_name["missing-session"].error
+
+        cli_result = CliRunner().invoke(app, [
+            "batch", str(profiles_dir), "--output-dir", str(tmp_path / "out2"),
+            "--workers", "1", "--no-forms",
+        ])
+        assert cli_result.exit_code == 1
+        assert "2 succeeded, 1 failed" in cli_result.output
+
+
+# =============================================================================
+# Scan Command Tests
+# =============================================================================
+
+class TestScanCommand:
+    def test_scan_prints_documents_as_they_arrive(self, tmp_path):
+        (tmp_path / "notes.txt").write_text("notes")
+        cli_result = CliRunner().invoke(app, ["scan", str(tmp_path)])
+        assert cli_result.exit_code == 0
+        assert "non-pdf (.txt)  notes.txt" in cli_result.stdout
+        assert "Scanned in" in cli_result.stdout
+        assert "Total: 1 files, 0 PDFs" in cli_result.stdout
+
+    def test_scan_missing_folder(self, tmp_path):
+        cli_result = CliRunner().invoke(app, ["scan", str(tmp_path / "nope")])
+        assert cli_result.exit_code == 1
@@ -439,6 +439,18 @@ class TestSchedule1LineMath:
         assert line15 == round(result.schedule_se.deductible_se_tax)
         assert line26 == round(result.adjustments)
 
+    def test_sep_contribution_on_line_16(self):
+        profile = _build_test_profile()
+        profile.sep_ira_contribution = 5_000
+        result = _build_test_result(profile)
+        data = build_schedule_1_data(result, profile)
+
+        line15 = _parse_currency(data.get("f2_05[0]", "0"))
+        line16 = _parse_currency(data.get("f2_06[0]", "0"))
+        line26 = _parse_currency(data.get("f2_30[0]", "0"))
+        assert line16 == 5_000
+        assert abs(line26 - (line15 + line16)) <= 1
+
     def test_feie_on_line_8d(self):
         """With FEIE, line 8d holds the net exclusion and line 10 nets it."""
         from taxman.calculator import compare_feie_scenarios
@@ -1002,6 +1014,378 @@ class TestFilingPacketAssembly:
         doc.close()
 
 
+def _write_template(path, names, checkboxes=(), **save_options):
+    """A fillable PDF with a text field per name (checkboxes for those
+    in checkboxes), 30 fields to a page."""
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    for i, name in enumerate(names):
+        if i % 30 == 0:
+            page = doc.new_page()
+        y = 36 + 24 * (i % 30)
+        widget = fitz.Widget()
+        widget.field_name = name
+        if name in checkboxes:
+            widget.field_type = fitz.PDF_WIDGET_TYPE_CHECKBOX
+            widget.rect = fitz.Rect(72, y, 84, y + 12)
+        else:
+            widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+            widget.rect = fitz.Rect(72, y, 300, y + 18)
+        page.add_widget(widget)
+    doc.save(str(path), **save_options)
+    doc.close()
+
+
+def _job_templates(tmp_path, monkeypatch, result, profile, **save_options):
+    """Point FORMS_DIR at templates with exactly the fields each of
+    generate_all_forms()'s specs fills; returns its (form_key, data) jobs."""
+    from taxman import fill_forms
+
+    forms_dir = tmp_path / "forms"
+    forms_dir.mkdir()
+    monkeypatch.setattr(fill_forms, "FORMS_DIR", forms_dir)
+    monkeypatch.setattr(fill_forms, "_template_cache", fill_forms.TemplateCache())
+
+    jobs = []
+    with monkeypatch.context() as m:
+        m.setattr(fill_forms, "_fill_specs", lambda js, workers: jobs.extend(js) or [])
+        fill_forms.generate_all_forms(result, profile, str(tmp_path / "probe"),
+                                      assemble_packets=False)
+    fields, checkboxes = {}, set()
+    for form_key, data in jobs:
+        for key, value in data.items():
+            name = key.removeprefix(fill_forms._WIDGET_PREFIX)
+            fields.setdefault(form_key, set()).add(name)
+            if isinstance(value, bool):
+                checkboxes.add(name)
+    for form_key, names in fields.items():
+        _write_template(forms_dir / f"{form_key}.pdf", sorted(names), checkboxes,
+                        **save_options)
+        (forms_dir / f"{form_key}{fill_forms._PATCH_SUFFIX}").touch()
+    return jobs
+
+
+class TestTemplateCache:
+    """Templates are parsed once and handed out as independent copies."""
+
+    @pytest.fixture
+    def forms_dir(self, tmp_path, monkeypatch):
+        from taxman import fill_forms
+        monkeypatch.setattr(fill_forms, "FORMS_DIR", tmp_path)
+        monkeypatch.setattr(fill_forms, "_template_cache", fill_forms.TemplateCache())
+        _write_template(tmp_path / "f1040sc.pdf", ["f1_1[0]", "f1_2[0]"])
+        (tmp_path / "f1040sc.checkbox_patched").touch()
+        return tmp_path
+
+    def test_copies_are_filled_independently(self, forms_dir, tmp_path):
+        from pypdf import PdfReader
+        from taxman import fill_forms
+
+        for i in (1, 2, 3):
+            fill_forms.fill_form("f1040sc", {"f1_1[0]": f"Business {i}"},
+                                 str(tmp_path / "out" / f"schedule_c_{i}.pdf"))
+        cache = fill_forms._template_cache
+        assert (cache.misses, cache.hits) == (1, 2)
+        values = [PdfReader(str(tmp_path / "out" / f"schedule_c_{i}.pdf"))
+                  .get_fields()["f1_1[0]"].get("/V") for i in (1, 2, 3)]
+        assert values == ["Business 1", "Business 2", "Business 3"]
+        # The cached prototype is never filled
+        assert not any(w.value for w in cache.wrapper("f1040sc").widgets.values())
+
+    def test_refreshed_template_is_reparsed(self, forms_dir, monkeypatch):
+        import io
+        from taxman import fill_forms
+
+        cache = fill_forms._template_cache
+        assert set(cache.wrapper("f1040sc").widgets) == {"f1_1[0]", "f1_2[0]"}
+
+        _write_template(forms_dir / "new.pdf", ["f1_9[0]"])
+        new_bytes = (forms_dir / "new.pdf").read_bytes()
+        monkeypatch.setattr(fill_forms.urllib.request, "urlopen",
+                            lambda request: io.BytesIO(new_bytes))
+        fill_forms.download_irs_form("f1040sc", force=True)
+        assert set(cache.wrapper("f1040sc").widgets) == {"f1_9[0]"}
+        assert cache.misses == 2
+
+    def test_bounded(self, forms_dir):
+        from taxman import fill_forms
+
+        for key in ("f1040s1", "f1040s2", "f1040s3"):
+            _write_template(forms_dir / f"{key}.pdf", ["f1_1[0]"])
+            (forms_dir / f"{key}{fill_forms._PATCH_SUFFIX}").touch()
+        cache = fill_forms.TemplateCache(max_templates=2)
+        for key in ("f1040sc", "f1040s1", "f1040s2", "f1040s3"):
+            cache.template_bytes(key)
+        assert list(cache._entries) == ["f1040s2", "f1040s3"]
+
+
+class TestWidgetIndex:
+    """Per-template widget index, cached in a sidecar keyed by checksum."""
+
+    @pytest.fixture
+    def forms_dir(self, tmp_path, monkeypatch):
+        fitz = pytest.importorskip("fitz")
+        from taxman import fill_forms
+        monkeypatch.setattr(fill_forms, "FORMS_DIR", tmp_path)
+        monkeypatch.setattr(fill_forms, "_template_cache", fill_forms.TemplateCache())
+        _write_template(tmp_path / "f1040.pdf", [f"f1_{i:02d}[0]" for i in range(1, 21)])
+        with fitz.open(tmp_path / "f1040.pdf") as doc:
+            widget = fitz.Widget()
+            widget.field_type = fitz.PDF_WIDGET_TYPE_CHECKBOX
+            widget.field_name = "Page1[0].Checkbox_ReadOrder[0].c1_8[0]"
+            widget.rect = fitz.Rect(400, 72, 412, 84)
+            doc[0].add_widget(widget)
+            doc.saveIncr()
+        (tmp_path / "f1040.checkbox_patched").touch()
+        return tmp_path
+
+    def test_sidecar_reused_until_template_changes(self, forms_dir, monkeypatch):
+        import json
+        from taxman import fill_forms
+
+        builds = []
+        real_build = fill_forms.build_widget_index
+        monkeypatch.setattr(fill_forms, "build_widget_index",
+                            lambda data: builds.append(1) or real_build(data))
+
+        index = fill_forms._template_cache.widget_index("f1040")
+        checkbox = index["Page1[0].Checkbox_ReadOrder[0].c1_8[0]"][0]
+        assert checkbox["type"] == "CheckBox" and checkbox["on_states"]
+        assert index["f1_01[0]"][0]["type"] == "Text"
+        sidecar = json.loads((forms_dir / "f1040.widgets.json").read_text())
+        assert sidecar["fields"] == index
+
+        # A new process (fresh cache) reads the sidecar instead of the widgets
+        assert fill_forms.TemplateCache().widget_index("f1040") == index
+        assert len(builds) == 1
+
+        _write_template(forms_dir / "f1040.pdf", ["f1_99[0]"])
+        assert set(fill_forms.TemplateCache().widget_index("f1040")) == {"f1_99[0]"}
+        assert len(builds) == 2
+
+    def test_indexed_fill_and_flatten_match_full_walk(self, forms_dir):
+        import fitz
+        from taxman import fill_forms
+
+        template = fill_forms._template_cache.template_bytes("f1040")
+        index = fill_forms._template_cache.widget_index("f1040")
+        qualified = {"Page1[0].Checkbox_ReadOrder[0].c1_8[0]": True, "f1_20[0]": "Jane"}
+
+        def values(pdf_bytes):
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                return {w.field_name: w.field_value for w in doc[0].widgets()}
+
+        indexed = values(fill_forms._apply_qualified_fields(template, qualified, index))
+        assert indexed == values(fill_forms._apply_qualified_fields(template, qualified))
+        assert indexed["f1_20[0]"] == "Jane"
+        assert indexed["Page1[0].Checkbox_ReadOrder[0].c1_8[0]"] not in ("Off", False)
+
+        data = {"f1_03[0]": "1,234", "widget:f1_20[0]": "Jane",
+                "Page1[0].Checkbox_ReadOrder[0].c1_8[0]": True}
+        filled = fill_forms.fill_form_bytes("f1040", data)
+        text_widgets = fill_forms._text_widgets(index, data)
+        assert [name for name, _, _ in text_widgets] == ["f1_03[0]", "f1_20[0]"]
+
+        def flattened(widgets):
+            with fill_forms._flatten_filled_pdf(filled, widgets) as doc:
+                return doc[0].get_text()
+
+        assert flattened(text_widgets) == flattened(None)
+        assert "1,234" in flattened(text_widgets)
+        # A stale entry falls back to visiting every widget
+        stale = [("f1_04[0]", page, slot) for _, page, slot in text_widgets]
+        assert flattened(stale) == flattened(None)
+
+
+class TestAcroFormWriter:
+    """Direct fills match PyPDFForm field for field, as incremental updates."""
+
+    @staticmethod
+    def _fields(pdf_bytes):
+        """Each field's /V (read by pypdf) and each widget's /AS."""
+        import io
+        import fitz
+        from pypdf import PdfReader
+
+        reader = PdfReader(io.BytesIO(pdf_bytes), strict=True)
+        values = {name: field.get("/V") for name, field in reader.get_fields().items()}
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            states = {w.field_name: doc.xref_get_key(w.xref, "AS")[1]
+                      for page in doc for w in page.widgets()}
+        return values, states
+
+    @pytest.mark.parametrize("save_options", [{}, {"garbage": 3, "use_objstms": 1}],
+                             ids=["xref-table", "xref-stream"])
+    def test_matches_pypdfform(self, tmp_path, monkeypatch, save_options):
+        from taxman import fill_forms
+
+        profile = _build_test_profile()
+        result = _build_test_result(profile)
+        jobs = _job_templates(tmp_path, monkeypatch, result, profile, **save_options)
+        assert any(isinstance(v, bool) for _, data in jobs for v in data.values())
+
+        for form_key, data in jobs:
+            template = fill_forms._template_cache.template_bytes(form_key)
+            filled = fill_forms.fill_form_bytes(form_key, data)
+            assert filled.startswith(template)  # appended, not rewritten
+            assert (self._fields(filled)
+                    == self._fields(fill_forms._fill_with_pypdfform(form_key, data)))
+
+    def test_flattened_text_matches_pypdfform(self, tmp_path, monkeypatch):
+        """Appearance streams are not drawn twice when packets are flattened."""
+        from taxman import fill_forms
+
+        profile = _build_test_profile()
+        result = _build_test_result(profile)
+        jobs = _job_templates(tmp_path, monkeypatch, result, profile)
+
+        def flattened(pdf_bytes, text_widgets):
+            with fill_forms._flatten_filled_pdf(pdf_bytes, text_widgets) as doc:
+                return [page.get_text() for page in doc]
+
+        for form_key, data in jobs:
+            text_widgets = fill_forms._text_widgets(
+                fill_forms._template_cache.widget_index(form_key), data)
+            expected = flattened(fill_forms._fill_with_pypdfform(form_key, data), None)
+            assert any(expected)
+            filled = fill_forms.fill_form_bytes(form_key, data)
+            assert flattened(filled, text_widgets) == expected
+            assert flattened(filled, None) == expected
+
+    def test_text_widgets_get_appearance_streams(self, tmp_path, monkeypatch):
+        import fitz
+        from taxman import fill_forms
+
+        monkeypatch.setattr(fill_forms, "FORMS_DIR", tmp_path)
+        monkeypatch.setattr(fill_forms, "_template_cache", fill_forms.TemplateCache())
+        _write_template(tmp_path / "f1040.pdf", ["f1_01[0]", "f1_02[0]", "f1_03[0]"])
+        (tmp_path / "f1040.checkbox_patched").touch()
+
+        filled = fill_forms.fill_form_bytes(
+            "f1040", {"f1_01[0]": "1,234", "f1_02[0]": "Jane (Doe)", "f1_03[0]": ""})
+        with fitz.open(stream=filled, filetype="pdf") as doc:
+            streams = {}
+            for widget in doc[0].widgets():
+                ap = doc.xref_get_key(widget.xref, "AP/N")
+                streams[widget.field_name] = (
+                    doc.xref_stream(int(ap[1].split()[0])) if ap[0] == "xref" else None)
+            assert b"(1,234) Tj" in streams["f1_01[0]"]
+            assert b"(Jane \\(Doe\\)) Tj" in streams["f1_02[0]"]
+            assert b"Tj" not in (streams["f1_03[0]"] or b"")
+            assert doc.xref_get_key(doc.pdf_catalog(), "AcroForm/NeedAppearances")[0] == "null"
+
+    @pytest.mark.parametrize("junk, incremental", [
+        (b"% trailing comment\n", True),
+        (b"\0" * 2048, False),  # startxref pushed out of the tail
+    ], ids=["short", "long"])
+    def test_bytes_after_eof(self, tmp_path, junk, incremental):
+        import fitz
+        from taxman import fill_forms
+
+        _write_template(tmp_path / "f.pdf", ["f1_01[0]", "f1_02[0]"])
+        template = (tmp_path / "f.pdf").read_bytes() + junk
+        writer = fill_forms.AcroFormTemplate(
+            template, fill_forms.build_widget_index(template))
+        assert writer.incremental is incremental
+
+        filled = writer.fill({"f1_01[0]": "1,234"})
+        assert filled.startswith(template) is incremental
+        with fitz.open(stream=filled, filetype="pdf") as doc:
+            assert {w.field_name: w.field_value for w in doc[0].widgets()} == {
+                "f1_01[0]": "1,234", "f1_02[0]": ""}
+
+    @_skip_no_forms
+    @pytest.mark.slow
+    def test_matches_pypdfform_on_irs_forms(self):
+        from taxman import fill_forms
+
+        profile = _build_test_profile()
+        result = _build_test_result(profile)
+        for form_key, data in (
+            ("f1040", build_1040_data(result, profile)),
+            ("f1040sc", build_schedule_c_data(result.schedule_c_results[0],
+                                              profile.businesses[0], profile)),
+        ):
+            assert (self._fields(fill_forms.fill_form_bytes(form_key, data))
+                    == self._fields(fill_forms._fill_with_pypdfform(form_key, data)))
+
+    def test_key_rules(self, tmp_path, monkeypatch):
+        import fitz
+        from taxman import fill_forms
+
+        monkeypatch.setattr(fill_forms, "FORMS_DIR", tmp_path)
+        monkeypatch.setattr(fill_forms, "_template_cache", fill_forms.TemplateCache())
+        _write_template(tmp_path / "f1040.pdf",
+                        ["f1_01[0]", "f1_02[0]", "c1_1[0]", "c1_2[0]"], {"c1_1[0]", "c1_2[0]"})
+        (tmp_path / "f1040.checkbox_patched").touch()
+
+        filled = fill_forms.fill_form_bytes("f1040", {
+            "f1_01[0]": "Café (2)", "f1_02[0]": 1234, "c1_1[0]": True,
+            "widget:c1_2[0]": False, "not_on_form[0]": "ignored",
+        })
+        with fitz.open(stream=filled, filetype="pdf") as doc:
+            values = {w.field_name: w.field_value for w in doc[0].widgets()}
+        assert values == {"f1_01[0]": "Café (2)", "f1_02[0]": "1234",
+                          "c1_1[0]": "Yes", "c1_2[0]": "Off"}
+
+        with pytest.raises(ValueError, match="not found"):
+            fill_forms.fill_form_bytes("f1040", {"Page1[0].f1_01[0]": "x"})
+
+
+class TestParallelFill:
+    """generate_all_forms(workers=N) fills in a process pool, in spec order."""
+
+    def test_matches_serial_order_and_isolates_errors(self, tmp_path, monkeypatch, capsys):
+        from taxman import fill_forms
+
+        profile = _build_test_profile()
+        profile.businesses = profile.businesses * 3
+        result = _build_test_result(profile)
+        jobs = _job_templates(tmp_path, monkeypatch, result, profile)
+        (tmp_path / "forms" / "f1040sse.pdf").write_bytes(b"not a pdf")
+
+        serial = fill_forms.generate_all_forms(
+            result, profile, str(tmp_path / "serial"), assemble_packets=False)
+        fill_forms.clear_template_cache()
+        for sidecar in (tmp_path / "forms").glob("*.widgets.json"):
+            sidecar.unlink()
+        parallel = fill_forms.generate_all_forms(
+            result, profile, str(tmp_path / "parallel"), assemble_packets=False, workers=2)
+
+        expected = [Path(p).name for p in serial]
+        assert len(expected) == len([key for key, _ in jobs if key != "f1040sse"])
+        assert [Path(p).name for p in parallel] == expected
+        # Every template was indexed, with no temp files left behind
+        assert not list((tmp_path / "forms").glob("*.tmp"))
+        assert {p.name for p in (tmp_path / "forms").glob("*.widgets.json")} == {
+            f"{key}.widgets.json" for key, _ in jobs if key != "f1040sse"}
+        assert [n for n in expected if n.startswith("schedule_c")] == [
+            f"schedule_c_{i}_filled.pdf" for i in (1, 2, 3)]
+        assert capsys.readouterr().out.count("Error generating Schedule SE") == 2
+
+    def test_packets_assembled_in_memory(self, tmp_path, monkeypatch):
+        """write_forms=False writes only the packets, with every filled page."""
+        import fitz
+        from taxman import fill_forms
+
+        profile = _build_test_profile()
+        result = _build_test_result(profile)
+        _job_templates(tmp_path, monkeypatch, result, profile)
+
+        on_disk = fill_forms.generate_all_forms(result, profile, str(tmp_path / "disk"))
+        in_memory = fill_forms.generate_all_forms(
+            result, profile, str(tmp_path / "memory"), write_forms=False)
+
+        packets = [Path(p).name for p in on_disk if "_return_" in Path(p).name]
+        assert packets
+        assert [Path(p).name for p in in_memory] == packets
+        assert sorted(p.name for p in (tmp_path / "memory").iterdir()) == sorted(packets)
+        for name in packets:
+            with fitz.open(tmp_path / "disk" / name) as a, \
+                    fitz.open(tmp_path / "memory" / name) as b:
+                assert [p.get_text() for p in a] == [p.get_text() for p in b]
+
+
 class TestFormVintage:
     """Cached PDFs must match the engine's TAX_YEAR.
 
@@ -0,0 +1,127 @@
+"""Tests for the goal-seek solvers (taxman.goalseek)."""
+
+import copy
+
+import pytest
+
+from taxman.calculator import BRACKET_TABLES, calculate_return
+from taxman.goalseek import (
+    TaxEvaluator,
+    max_sep_in_bracket,
+    payment_to_owe_zero,
+    qbi_phaseout_expense,
+    seek_cents,
+)
+from taxman.models import EstimatedPayment, FormW2
+
+
+def _with(profile, **changes):
+    what_if = copy.deepcopy(profile)
+    for name, value in changes.items():
+        setattr(what_if, name, value)
+    return what_if
+
+
+class TestSeekCents:
+    def test_finds_boundary_to_the_cent(self):
+        assert seek_cents(lambda x: x <= 1234.56, 0, 10_000) == 1234.56
+
+    def test_whole_range_holds(self):
+        assert seek_cents(lambda x: True, 0, 500) == 500
+
+    def test_never_holds(self):
+        assert seek_cents(lambda x: False, 0, 500) is None
+
+
+class TestTaxEvaluator:
+    def test_matches_calculate_return_without_touching_profile(self, mfs_expat):
+        ev = TaxEvaluator(mfs_expat)
+        result = ev.evaluate(sep_ira_contribution=5_000)
+        expected = calculate_return(_with(mfs_expat, sep_ira_contribution=5_000))
+        assert result.total_tax == expected.total_tax
+        assert mfs_expat.sep_ira_contribution == 0
+        assert ev.evaluations == 1
+
+    def test_unknown_field_rejected(self, mfs_expat):
+        with pytest.raises(AttributeError):
+            TaxEvaluator(mfs_expat).evaluate(not_a_field=1)
+
+
+class TestMaxSepInBracket:
+    def test_stops_at_bracket_floor(self, mfs_expat):
+        answer = max_sep_in_bracket(mfs_expat, rate=0.22)
+        table = BRACKET_TABLES[mfs_expat.filing_status]
+        assert 0 < answer["contribution"] < answer["deduction_limit"]
+        assert answer["marginal_rate"] == 0.22
+
+        # One more cent drops taxable income into the 12% bracket
+        over = calculate_return(_with(
+            mfs_expat, sep_ira_contribution=answer["contribution"] + 0.01))
+        assert table.marginal_rate(over.taxable_income) == 0.12
+
+    def test_savings_match_full_recalculation(self, mfs_expat):
+        answer = max_sep_in_bracket(mfs_expat)
+        with_sep = calculate_return(_with(
+            mfs_expat, sep_ira_contribution=answer["contribution"]))
+        assert with_sep.total_tax == answer["total_tax"]
+        assert answer["tax_savings"] == round(
+            calculate_return(mfs_expat).total_tax - with_sep.total_tax, 2)
+
+    def test_already_below_bracket(self, single_freelancer):
+        answer = max_sep_in_bracket(single_freelancer, rate=0.22)
+        assert answer["contribution"] == 0.0
+        assert answer["tax_savings"] == 0.0
+
+    def test_unknown_rate(self, mfs_expat):
+        with pytest.raises(ValueError):
+            max_sep_in_bracket(mfs_expat, rate=0.25)
+
+
+class TestPaymentToOweZero:
+    def test_extra_payment_clears_balance(self, single_freelancer):
+        answer = payment_to_owe_zero(single_freelancer)
+        assert answer["extra_payment"] > 0
+        paid = _with(single_freelancer, estimated_payments=[
+            *single_freelancer.estimated_payments,
+            EstimatedPayment(quarter=4, amount=answer["extra_payment"]),
+        ])
+        assert calculate_return(paid).amount_owed == 0
+
+    def test_overpaid_needs_nothing(self, mfs_expat):
+        assert payment_to_owe_zero(mfs_expat)["extra_payment"] == 0.0
+
+
+class TestQbiPhaseoutExpense:
+    def test_smallest_expense_ending_limitation(self, single_freelancer):
+        single_freelancer.businesses[0].gross_receipts += 180_000
+        assert calculate_return(single_freelancer).qbi.is_limited
+
+        answer = qbi_phaseout_expense(single_freelancer)
+        expense = answer["additional_expense"]
+        assert expense > 0
+        assert answer["qbi_deduction_after"] > answer["qbi_deduction_before"]
+
+        def limited_with(amount):
+            p = copy.deepcopy(single_freelancer)
+            p.businesses[0].expenses.other_expenses += amount
+            return calculate_return(p).qbi.is_limited
+
+        assert not limited_with(expense)
+        assert limited_with(expense - 0.01)
+        # The original business is left untouched
+        assert single_freelancer.businesses[0].expenses.other_expenses == 0
+
+    def test_wage_heavy_profit_runs_out_first(self, single_freelancer):
+        """Wages keep income above the threshold after the profit is gone."""
+        single_freelancer.forms_w2 = [FormW2(employer_name="Big Co", wages=400_000)]
+        base = calculate_return(single_freelancer)
+        assert base.qbi.is_limited
+
+        assert qbi_phaseout_expense(single_freelancer)["additional_expense"] is None
+
+    def test_not_limited(self, mfs_expat):
+        assert qbi_phaseout_expense(mfs_expat)["additional_expense"] == 0.0
+
+    def test_requires_business(self, investor):
+        with pytest.raises(ValueError):
+            qbi_phaseout_expense(investor)
@@ -456,6 +456,109 @@ class TestProcessors:
         assert len(result["generated_files"]) > 0
         assert result["output_dir"] == output_dir
 
+    def test_process_document_scan_with_workers(self, patch_sessions, tmp_path):
+        session = SessionState.create()
+        session.save()
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "notes.txt").write_text("not a tax form")
+
+        result = PROCESSORS["document_scan"](session, TaxpayerProfile(), {
+            "documents_dir": str(docs), "workers": "2",
+        })
+
+        assert result["summary"]["total_files"] == 1
+        assert result["documents"][0]["classification"] == "non-pdf (.txt)"
+        assert "workers" in [f.name for f in _get_step_spec("document_scan").fields]
+
+    def test_rescan_only_parses_new_documents(self, patch_sessions, tmp_path):
+        fitz = pytest.importorskip("fitz")
+
+        def make_pdf(path, lines):
+            doc = fitz.open()
+            page = doc.new_page()
+            for i, line in enumerate(lines):
+                page.insert_text((72, 72 + 20 * i), line)
+            doc.save(str(path))
+            doc.close()
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        make_pdf(docs / "a_1099nec.pdf", ["Form 1099-NEC", "PAYER'S name: Acme",
+                                          "Box 1 Nonemployee compensation $1,000.00"])
+        session = SessionState.create()
+        session.save()
+        profile = TaxpayerProfile()
+
+        PROCESSORS["document_scan"](session, profile, {"documents_dir": str(docs)})
+        first = PROCESSORS["document_review"](session, profile, {})
+        assert "unchanged" not in first["parsed"][0]
+
+        make_pdf(docs / "b_1099nec.pdf", ["Form 1099-NEC", "PAYER'S name: Beta",
+                                          "Box 1 Nonemployee compensation $2,000.00"])
+        scan = PROCESSORS["document_scan"](session, profile, {"documents_dir": str(docs)})
+        assert scan["changes"] == {"added": 1, "changed": 0, "removed": 0}
+        second = PROCESSORS["document_review"](session, profile, {})
+        assert [p.get("unchanged", False) for p in second["parsed"]] == [True, False]
+
+        reloaded = SessionState.load(session.session_id)
+        assert [d["data"]["payer_name"] for d in reloaded.parsed_documents] == ["Acme", "Beta"]
+        assert set(reloaded.scan_manifest) == {str(docs / "a_1099nec.pdf"),
+                                               str(docs / "b_1099nec.pdf")}
+
+        (docs / "a_1099nec.pdf").unlink()
+        PROCESSORS["document_scan"](session, profile, {"documents_dir": str(docs)})
+        assert [d["data"]["payer_name"] for d in session.parsed_documents] == ["Beta"]
+
+    def test_brokerage_statement_parses_per_section(self, patch_sessions, tmp_path):
+        fitz = pytest.importorskip("fitz")
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        doc = fitz.open()
+        for lines in (["Consolidated Form 1099", "PAYER'S name: Example Brokerage"],
+                      ["Form 1099-DIV Dividends and Distributions",
+                       "1a Total ordinary dividends 600.00",
+                       "Form 1099-INT Interest Income",
+                       "1 Interest income 75.00"]):
+            page = doc.new_page()
+            for i, line in enumerate(lines):
+                page.insert_text((72, 72 + 20 * i), line)
+        doc.save(str(docs / "composite.pdf"))
+        doc.close()
+        session = SessionState.create()
+        session.save()
+        profile = TaxpayerProfile()
+
+        scan = PROCESSORS["document_scan"](session, profile, {"documents_dir": str(docs)})
+        assert scan["documents"][0]["classification"] == "Brokerage Statement"
+        review = PROCESSORS["document_review"](session, profile, {})
+        assert [(p["index"], p["type"]) for p in review["parsed"]] == [
+            (0, "1099-DIV"), (0, "1099-INT")]
+
+        PROCESSORS["income_review"](session, profile, {})
+        assert profile.forms_1099_div[0].ordinary_dividends == 600.0
+        assert profile.forms_1099_int[0].payer_name == "Example Brokerage"
+
+    def test_document_scan_stream(self, patch_sessions, tmp_path):
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.txt").write_text("a")
+        (docs / "b.csv").write_text("b")
+        session = SessionState.create()
+        session.save()
+
+        r = runner.invoke(app, ["headless", "step", session.session_id, "document_scan",
+                                "--stream", "--answers",
+                                json.dumps({"documents_dir": str(docs)})])
+        assert r.exit_code == 0
+        lines = [json.loads(line) for line in r.stdout.splitlines()]
+        assert [line.get("event") for line in lines] == [
+            "start", "document", "document", "finish", None]
+        assert lines[1]["name"] == "a.txt"
+        assert lines[3]["summary"]["total_files"] == 2
+        assert lines[-1]["result"]["changes"]["added"] == 2
+
 
 # =============================================================================
 # Full Flow Integration Test
@@ -0,0 +1,124 @@
+"""Tests for incremental recalculation (taxman.incremental)."""
+
+from dataclasses import asdict
+
+from taxman.calculator import calculate_return, compare_feie_scenarios
+from taxman.incremental import IncrementalReturn
+from taxman.models import FilingStatus, Form1099B, ScheduleCData
+
+
+def _same_as_fresh(result, profile):
+    return asdict(result) == asdict(calculate_return(profile))
+
+
+class TestIncrementalReturn:
+    def test_first_run_matches_calculate_return(self, mfs_expat):
+        inc = IncrementalReturn()
+        result = inc.calculate(mfs_expat)
+        assert _same_as_fresh(result, mfs_expat)
+        assert {"schedule_c", "schedule_e", "schedule_se",
+                "form_8995", "form_1040"} <= inc.recomputed
+
+    def test_unchanged_profile_returns_previous_result(self, mfs_expat):
+        inc = IncrementalReturn()
+        first = inc.calculate(mfs_expat)
+        assert inc.calculate(mfs_expat) is first
+        assert inc.recomputed == set()
+        assert inc.dirty_nodes(mfs_expat) == set()
+
+    def test_expense_edit_recomputes_only_that_business(self, mfs_expat):
+        inc = IncrementalReturn()
+        first = inc.calculate(mfs_expat)
+        untouched = first.schedule_c_results[1]
+
+        mfs_expat.businesses[0].expenses.supplies += 500
+        assert inc.dirty_nodes(mfs_expat) >= {"schedule_c", "form_1040"}
+        assert "schedule_e" not in inc.dirty_nodes(mfs_expat)
+
+        second = inc.calculate(mfs_expat)
+        assert "schedule_c" in inc.recomputed
+        assert "schedule_e" not in inc.recomputed
+        assert second.schedule_c_results[1] is untouched
+        assert second.schedule_c_results[0] is not first.schedule_c_results[0]
+        assert second.schedule_e is first.schedule_e
+        assert _same_as_fresh(second, mfs_expat)
+
+    def test_k1_edit_recomputes_schedule_e_not_schedule_c(self, mfs_expat):
+        inc = IncrementalReturn()
+        first = inc.calculate(mfs_expat)
+        mfs_expat.schedule_k1s[0].net_rental_income += 1_000
+
+        second = inc.calculate(mfs_expat)
+        assert "schedule_e" in inc.recomputed
+        assert "schedule_c" not in inc.recomputed
+        assert second.schedule_c_results[0] is first.schedule_c_results[0]
+        assert _same_as_fresh(second, mfs_expat)
+
+    def test_payment_edit_reuses_every_schedule(self, single_freelancer):
+        inc = IncrementalReturn()
+        inc.calculate(single_freelancer)
+        single_freelancer.prior_year_tax += 1
+        single_freelancer.nol_carryforward = 0.0
+        single_freelancer.foreign_tax_paid = 0.0
+        single_freelancer.days_in_us_2025 += 1
+
+        result = inc.calculate(single_freelancer)
+        assert inc.recomputed == {"form_1040"}
+        assert _same_as_fresh(result, single_freelancer)
+
+    def test_filing_status_change_dirties_status_dependent_nodes(self, mfj_high_income):
+        inc = IncrementalReturn()
+        inc.calculate(mfj_high_income)
+        mfj_high_income.filing_status = FilingStatus.MFS
+        dirty = inc.dirty_nodes(mfj_high_income)
+        assert {"schedule_e", "schedule_d", "form_1040"} <= dirty
+        assert "schedule_c" not in dirty
+        assert _same_as_fresh(inc.calculate(mfj_high_income), mfj_high_income)
+
+    def test_edit_sequence_matches_fresh_calculation(self, mfs_expat):
+        inc = IncrementalReturn()
+        edits = [
+            lambda p: setattr(p.businesses[0], "gross_receipts", 150_000),
+            lambda p: p.forms_1099_b.append(Form1099B(lt_proceeds=20_000,
+                                                      lt_cost_basis=5_000)),
+            lambda p: p.businesses.append(ScheduleCData(business_name="New",
+                                                        gross_receipts=9_000)),
+            lambda p: setattr(p, "filing_status", FilingStatus.SINGLE),
+            lambda p: p.businesses.pop(0),
+            lambda p: setattr(p.schedule_k1s[0], "guaranteed_payments", 4_000),
+        ]
+        for edit in edits:
+            edit(mfs_expat)
+            assert _same_as_fresh(inc.calculate(mfs_expat), mfs_expat)
+
+    def test_drops_results_for_removed_inputs(self, mfs_expat):
+        inc = IncrementalReturn()
+        inc.calculate(mfs_expat)
+        mfs_expat.businesses.pop()
+        inc.calculate(mfs_expat)
+        assert len(inc._memo["schedule_c"]) == len(mfs_expat.businesses)
+
+    def test_feie_comparison_reuses_schedules(self, mfs_expat):
+        inc = IncrementalReturn()
+        result = inc.calculate(mfs_expat)
+        scenarios = compare_feie_scenarios(mfs_expat, schedules=inc)
+        with_feie = scenarios["result_with_feie"]
+        assert with_feie.schedule_c_results[0] is result.schedule_c_results[0]
+        fresh = compare_feie_scenarios(mfs_expat)
+        assert asdict(with_feie) == asdict(fresh["result_with_feie"])
+
+    def test_numbers_only_reuses_explained_schedules(self, mfs_expat):
+        inc = IncrementalReturn()
+        explained = inc.calculate(mfs_expat)
+        numbers = inc.calculate(mfs_expat, explain=False)
+        assert numbers is not explained
+        assert inc.recomputed == {"form_1040"}
+        assert numbers.lines == []
+        assert numbers.schedule_c_results[0] is explained.schedule_c_results[0]
+
+    def test_explained_request_never_reuses_numbers_only(self, mfs_expat):
+        inc = IncrementalReturn()
+        inc.calculate(mfs_expat, explain=False)
+        result = inc.calculate(mfs_expat)
+        assert "schedule_c" in inc.recomputed
+        assert _same_as_fresh(result, mfs_expat)
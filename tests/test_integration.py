@@ -304,6 +304,37 @@ class TestDetectForm:
     def test_w2(self):
         assert _detect_form("Form W-2 Wage and Tax Statement") == "W-2"
 
+    def test_priority_beats_position(self):
+        text = "Attach Form W-2 here\nSchedule SE Self-Employment Tax"
+        assert _detect_form(text) == "Schedule SE"
+        assert _detect_form("see SCHEDULE se\nform 1040 individual") == "Form 1040"
+        assert _detect_form("Form 1040-ES voucher") is None
+
+    def test_matches_pattern_by_pattern_search(self):
+        import random
+        import re
+
+        from taxman.parse_documents import _FORM_SIGNATURES
+
+        def sequential(text):
+            for pattern, name in _FORM_SIGNATURES:
+                if re.search(pattern, text, re.IGNORECASE):
+                    return name
+            return None
+
+        fragments = [
+            "Form 1040", "Form 1040-SR", "Schedule C", "Profit or Loss", "Schedule SE",
+            "Self-Employment Tax", "Schedule E", "Supplemental", "Schedule 1",
+            "Additional Income", "SCHEDULE A", "Itemized", "Form 2555", "Foreign Earned",
+            "Qualified Dividends and Capital Gain Tax Worksheet", "Form W2", "Form 1098",
+            "Form 1095-A", "platform", "business use of your home", "Form 8829",
+            "line 7 wages 75,000", "\n", "İstanbul",
+        ]
+        rng = random.Random(17)
+        for _ in range(500):
+            text = " ".join(rng.choice(fragments) for _ in range(rng.randint(1, 12)))
+            assert _detect_form(text) == sequential(text), text
+
 
 class TestExtractLineItems:
     def test_basic_line(self):
@@ -0,0 +1,97 @@
+"""Tests for lot-level 1099-B transactions (taxman.lots)."""
+
+import tracemalloc
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from taxman.calculator import calculate_schedule_d
+from taxman.lots import (
+    iter_lot_chunks,
+    load_lots_csv,
+    long_term_mask,
+    summarize_lots_csv,
+)
+from taxman.models import FilingStatus, TaxpayerProfile
+
+LOTS_CSV = """Description,Date Acquired,Date Sold,Proceeds,Cost Basis,Wash Sale Loss Disallowed,Term,Covered
+10 AAPL,01/05/2025,03/01/2025,"$1,800.00","1,500.00",,,Y
+5 TSLA,2025-02-01,2025-02-20,900.00,1200.00,150.00,,Y
+20 MSFT,02/01/2021,06/10/2025,"5,000.00","3,000.00",,,Y
+VTI,VARIOUS,06/10/2025,2000.00,2500.00,,LT,N
+
+1 BND,2024-06-10,2025-06-10,(10.00),0.00,,,Y
+"""
+
+
+def _days(*dates):
+    epoch = date(1970, 1, 1).toordinal()
+    return np.array([date.fromisoformat(d).toordinal() - epoch for d in dates],
+                    dtype=np.int32)
+
+
+class TestHoldingPeriod:
+    def test_more_than_one_year(self):
+        acquired = _days("2024-03-15", "2024-03-15", "2024-02-29", "2024-02-29")
+        sold = _days("2025-03-15", "2025-03-16", "2025-02-28", "2025-03-01")
+        assert long_term_mask(acquired, sold).tolist() == [False, True, False, True]
+
+
+class TestLotImport:
+    def test_load_and_net(self, tmp_path):
+        path = tmp_path / "lots.csv"
+        path.write_text(LOTS_CSV)
+        lots = load_lots_csv(path)
+        assert len(lots) == 5
+        assert lots.long_term.tolist() == [False, False, True, True, False]
+        assert lots.covered.tolist() == [True, True, True, False, True]
+        assert lots.gain_loss.tolist() == [300.0, -150.0, 2_000.0, -500.0, -10.0]
+
+        totals = lots.totals()
+        assert (totals.st_proceeds, totals.st_cost_basis, totals.st_wash_sale) == (
+            2_690.0, 2_700.0, 150.0)
+        assert (totals.lt_proceeds, totals.lt_cost_basis) == (7_000.0, 5_500.0)
+        assert (totals.net_st_gain_loss, totals.net_lt_gain_loss) == (140.0, 1_500.0)
+        assert totals.noncovered_lots == 1
+
+    def test_streamed_totals_match(self, tmp_path):
+        path = tmp_path / "lots.csv"
+        path.write_text(LOTS_CSV)
+        assert [len(c) for c in iter_lot_chunks(path, chunk_size=2)] == [2, 2, 1]
+        assert summarize_lots_csv(path, chunk_size=2) == load_lots_csv(path).totals()
+
+    def test_feeds_schedule_d(self, tmp_path):
+        path = tmp_path / "lots.csv"
+        path.write_text(LOTS_CSV)
+        form = summarize_lots_csv(path).to_form_1099b("Example Brokerage")
+        sd = calculate_schedule_d(TaxpayerProfile(forms_1099_b=[form]),
+                                  FilingStatus.SINGLE, explain=False)
+        assert (sd.net_st_gain_loss, sd.net_lt_gain_loss) == (140.0, 1_500.0)
+
+    def test_errors_name_the_line(self, tmp_path):
+        path = tmp_path / "lots.csv"
+        path.write_text("Date Acquired,Date Sold,Proceeds,Cost Basis\n"
+                        "VARIOUS,2025-06-10,100.00,50.00\n")
+        with pytest.raises(ValueError, match="line 2"):
+            load_lots_csv(path)
+        path.write_text("Date Sold,Proceeds\n2025-06-10,100.00\n")
+        with pytest.raises(ValueError, match="basis"):
+            load_lots_csv(path)
+
+    def test_streaming_memory_is_flat(self, tmp_path):
+        def peak(count):
+            path = tmp_path / f"lots_{count}.csv"
+            with open(path, "w") as f:
+                f.write("Date Acquired,Date Sold,Proceeds,Cost Basis\n")
+                for i in range(count):
+                    f.write(f"2024-01-{i % 28 + 1:02d},2025-03-01,{i}.25,{i}.00\n")
+            tracemalloc.start()
+            totals = summarize_lots_csv(path, chunk_size=500)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert totals.lots == count
+            return peak_bytes
+
+        assert peak(12_000) < 1.5 * peak(2_000)
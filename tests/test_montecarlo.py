@@ -0,0 +1,113 @@
+"""Tests for the Monte Carlo quarterly-estimate planner."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from taxman.calculator import calculate_return, estimate_quarterly_payments
+from taxman.models import FilingStatus, Form1099NEC, TaxpayerProfile
+from taxman.montecarlo import (
+    IncomeDistribution,
+    simulate_income_scenarios,
+    simulate_quarterly_plan,
+)
+from taxman.reports import generate_monte_carlo_plan_report
+
+
+class TestIncomeDistribution:
+    @pytest.mark.parametrize("kind", ["normal", "lognormal", "uniform", "triangular"])
+    def test_multipliers_center_on_one(self, kind):
+        rng = np.random.default_rng(0)
+        draws = IncomeDistribution(kind, 0.2).sample(rng, 50_000)
+        assert draws.mean() == pytest.approx(1.0, abs=0.01)
+
+    def test_rejects_unknown_kind(self):
+        with pytest.raises(ValueError):
+            IncomeDistribution("poisson")
+
+    def test_rejects_negative_spread(self):
+        with pytest.raises(ValueError):
+            IncomeDistribution("normal", -0.1)
+
+
+class TestSimulateIncomeScenarios:
+    def test_zero_spread_reproduces_return(self, mfs_expat):
+        variations = {biz.business_name: IncomeDistribution("uniform", 0.0)
+                      for biz in mfs_expat.businesses}
+        variations["Denver Rental Partners"] = IncomeDistribution("normal", 0.0)
+        results = simulate_income_scenarios(mfs_expat, variations, scenarios=3)
+        expected = calculate_return(mfs_expat)
+        assert list(results.total_tax) == [expected.total_tax] * 3
+        assert list(results.agi) == [expected.agi] * 3
+
+    def test_scenario_matches_scalar_return(self, single_freelancer):
+        name = single_freelancer.businesses[0].business_name
+        results = simulate_income_scenarios(
+            single_freelancer, {name: IncomeDistribution("lognormal", 0.4)},
+            scenarios=20, seed=3)
+        multiplier = IncomeDistribution("lognormal", 0.4).sample(
+            np.random.default_rng(3), 20)[7]
+        single_freelancer.businesses[0].gross_receipts *= multiplier
+        assert results.total_tax[7] == calculate_return(single_freelancer).total_tax
+
+    def test_negative_k1_multiplier_clamped_at_zero(self, mfs_expat):
+        variations = {"Denver Rental Partners": IncomeDistribution("uniform", 2.0)}
+        results = simulate_income_scenarios(mfs_expat, variations, scenarios=50, seed=5)
+        multipliers = IncomeDistribution("uniform", 2.0).sample(np.random.default_rng(5), 50)
+        i = int(np.argmin(multipliers))
+        assert multipliers[i] < 0
+        mfs_expat.schedule_k1s = []
+        assert results.total_tax[i] == calculate_return(mfs_expat).total_tax
+
+    def test_nec_only_profile(self):
+        profile = TaxpayerProfile(
+            filing_status=FilingStatus.SINGLE,
+            forms_1099_nec=[Form1099NEC(nonemployee_compensation=60_000)],
+        )
+        results = simulate_income_scenarios(
+            profile, {"1099-NEC Income": IncomeDistribution("normal", 0.3)},
+            scenarios=100, seed=1)
+        assert results.se_tax.std() > 0
+
+    def test_unknown_source(self, single_freelancer):
+        with pytest.raises(ValueError, match="No business or K-1"):
+            simulate_income_scenarios(
+                single_freelancer, {"Nope LLC": IncomeDistribution()})
+
+
+class TestSimulateQuarterlyPlan:
+    @pytest.fixture
+    def plan(self, mfs_expat):
+        return simulate_quarterly_plan(
+            mfs_expat, prior_year_tax=25_000,
+            variations={"Law Consulting LLC": IncomeDistribution("lognormal", 0.3)},
+            scenarios=5_000, seed=11)
+
+    def test_percentiles_ordered(self, plan):
+        values = list(plan["tax_percentiles"].values())
+        assert values == sorted(values)
+        assert values[0] < plan["point_estimate"]["total_tax"] < values[-1]
+
+    def test_defaults_to_point_plan(self, plan, mfs_expat):
+        base = calculate_return(mfs_expat)
+        point = estimate_quarterly_payments(base.total_tax, 25_000, base.agi,
+                                            filing_status=mfs_expat.filing_status)
+        assert plan["planned_annual"] == point["recommended_annual"]
+        assert 0 < plan["safe_harbor_probability"] < 1
+
+    def test_coverage_amounts(self, plan, mfs_expat):
+        coverage = plan["annual_for_coverage"]
+        assert list(coverage.values()) == sorted(coverage.values())
+        # The prior-year safe harbor caps what is ever needed
+        assert max(coverage.values()) <= 25_000 * 1.10
+
+        again = simulate_quarterly_plan(
+            mfs_expat, prior_year_tax=25_000,
+            variations={"Law Consulting LLC": IncomeDistribution("lognormal", 0.3)},
+            scenarios=5_000, seed=11, planned_annual=coverage[0.9])
+        assert again["safe_harbor_probability"] >= 0.9
+
+    def test_report(self, plan):
+        report = generate_monte_carlo_plan_report(plan)
+        assert "90th percentile" in report
+        assert "Meets safe harbor" in report
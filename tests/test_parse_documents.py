@@ -0,0 +1,524 @@
+"""Tests for the shared PDF extraction context (taxman.parse_documents)."""
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from taxman import parse_documents
+from taxman.parse_documents import (
+    ExtractionCache,
+    PDFDocument,
+    _classify_document,
+    clear_document_cache,
+    get_document,
+    iter_scan_documents,
+    iter_statement_sections,
+    parse_1099_int,
+    parse_1099_nec,
+    parse_brokerage_statement,
+    parse_k1_1065,
+    parse_prior_return,
+    parse_w2,
+    rescan_documents_folder,
+    scan_documents_folder,
+    set_extraction_cache,
+)
+
+NEC_LINES = [
+    "Form 1099-NEC Nonemployee Compensation",
+    "PAYER'S name: Acme Corp",
+    "PAYER'S TIN: 12-3456789",
+    "RECIPIENT'S TIN: 123-45-6789",
+    "Box 1 Nonemployee compensation $45,000.00",
+]
+
+
+def _make_pdf(path, *pages):
+    """Write a text-only PDF, one list of lines per page."""
+    doc = fitz.open()
+    for lines in pages:
+        page = doc.new_page()
+        for i, line in enumerate(lines):
+            page.insert_text((72, 72 + 20 * i), line)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_document_cache():
+    clear_document_cache()
+    yield
+    clear_document_cache()
+
+
+class TestPDFDocument:
+    def test_text_pages_words_and_tables_share_one_open(self, tmp_path):
+        path = _make_pdf(tmp_path / "two.pdf", ["Page one text"], ["Page two text"])
+        with PDFDocument(path) as doc:
+            assert doc.page_count == 2
+            assert doc.pages == ["Page one text", "Page two text"]
+            assert doc.text == "Page one text\n\nPage two text\n\n"
+            assert [w["text"] for w in doc.page_words(1)] == ["Page", "two", "text"]
+            assert doc.tables == []
+            assert doc.opens == 1
+
+    def test_close_keeps_cached_extractions(self, tmp_path):
+        path = _make_pdf(tmp_path / "one.pdf", ["Cached text"])
+        doc = PDFDocument(path)
+        text = doc.text
+        doc.close()
+        assert doc.text == text
+        assert doc.opens == 1
+        doc.page_words(0)  # not cached yet — reopens
+        assert doc.opens == 2
+        doc.close()
+
+
+class TestSharedDocuments:
+    def test_scan_then_parse_opens_file_once(self, tmp_path):
+        path = _make_pdf(tmp_path / "acme_1099nec.pdf", NEC_LINES)
+
+        scan = scan_documents_folder(str(tmp_path))
+        assert scan["documents"][0]["classification"] == "1099-NEC"
+
+        result = parse_1099_nec(str(path))
+        assert result.data.nonemployee_compensation == 45_000.0
+        assert result.data.payer_name == "Acme Corp"
+        assert get_document(path).opens == 1
+
+    def test_parsers_accept_document_or_path(self, tmp_path):
+        path = _make_pdf(tmp_path / "w2.pdf", [
+            "Form W-2 Wage and Tax Statement",
+            "Employer's name: Big Co",
+            "Box 1 Wages, tips, other compensation 72,500.00",
+        ])
+        with PDFDocument(path) as doc:
+            from_doc = parse_w2(doc)
+            assert _classify_document(doc) == "W-2"
+            assert doc.opens == 1
+        from_path = parse_w2(str(path))
+        assert from_doc.data == from_path.data
+        assert from_doc.source_file == from_path.source_file == str(path)
+
+    def test_table_fallback_reuses_open_document(self, tmp_path):
+        path = _make_pdf(tmp_path / "nec.pdf", ["Form 1099-NEC", "PAYER'S name: X"])
+        with PDFDocument(path) as doc:
+            result = parse_1099_nec(doc)  # Box 1 missing → table fallback
+            assert doc.opens == 1
+        assert result.data.nonemployee_compensation == 0
+
+    def test_edited_file_is_re_read(self, tmp_path):
+        path = _make_pdf(tmp_path / "doc.pdf", ["Before"])
+        assert get_document(path).text.startswith("Before")
+        _make_pdf(path, ["After the edit"])
+        assert get_document(path).text.startswith("After the edit")
+
+    def test_prior_return_pages(self, tmp_path):
+        path = _make_pdf(tmp_path / "2024_return.pdf",
+                         ["Form 1040 U.S. Individual Income Tax Return",
+                          "11 Adjusted gross income 85,000"])
+        data = parse_prior_return(str(path))
+        assert data["source_file"] == "2024_return.pdf"
+        assert data["pages"] == 1
+        assert "Form 1040" in data["forms_detected"]
+
+
+class TestExtractionCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "extract")
+        set_extraction_cache(cache)
+        yield cache
+        set_extraction_cache(None)
+
+    def test_unchanged_document_is_not_re_extracted(self, tmp_path, cache):
+        (tmp_path / "docs").mkdir()
+        path = _make_pdf(tmp_path / "docs" / "acme_1099nec.pdf", NEC_LINES)
+        first = scan_documents_folder(str(path.parent))
+        assert get_document(path).opens == 1
+
+        clear_document_cache()  # as a new session would start
+        second = scan_documents_folder(str(path.parent))
+        assert second["documents"] == first["documents"]
+        assert parse_1099_nec(str(path)).data.nonemployee_compensation == 45_000.0
+        assert get_document(path).opens == 0
+        assert cache.hits == 1
+
+    def test_key_follows_content_and_extractor(self, tmp_path, cache, monkeypatch):
+        path = _make_pdf(tmp_path / "doc.pdf", ["Before"])
+        copy = tmp_path / "renamed.pdf"
+        copy.write_bytes(path.read_bytes())
+        key = ExtractionCache.key_for(path)
+        assert ExtractionCache.key_for(copy) == key
+
+        monkeypatch.setattr(parse_documents, "EXTRACTOR_VERSION", "0/test")
+        assert ExtractionCache.key_for(path) != key
+        monkeypatch.undo()
+
+        _make_pdf(path, ["After the edit"])
+        assert ExtractionCache.key_for(path) != key
+        assert get_document(path).text.startswith("After the edit")
+
+    def test_classification_is_per_file_name(self, tmp_path, cache):
+        path = _make_pdf(tmp_path / "statement.pdf", ["Plain text"])
+        with PDFDocument(path, cache=cache) as doc:
+            assert _classify_document(doc) == "unknown"
+        renamed = tmp_path / "acme_1099nec.pdf"
+        path.rename(renamed)
+        with PDFDocument(renamed, cache=cache) as doc:
+            assert _classify_document(doc) == "1099-NEC"
+            assert doc.opens == 0
+            assert set(doc.classifications) == {"statement.pdf", "acme_1099nec.pdf"}
+
+    def test_eviction_keeps_directory_bounded(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "extract", max_bytes=1)
+        for name in ("a", "b"):
+            with PDFDocument(_make_pdf(tmp_path / f"{name}.pdf", [name]),
+                             cache=cache) as doc:
+                doc.text
+        assert len(list(cache.directory.glob("*.json"))) <= 1
+
+    def test_corrupt_entry_is_re_extracted(self, tmp_path, cache):
+        path = _make_pdf(tmp_path / "doc.pdf", ["Some text"])
+        cache.directory.mkdir(parents=True)
+        (cache.directory / f"{ExtractionCache.key_for(path)}.json").write_text("{not json")
+        with PDFDocument(path, cache=cache) as doc:
+            assert doc.text == "Some text\n\n"
+            assert doc.opens == 1
+
+    def test_no_cache_option(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from taxman.cli.app import app
+
+        _make_pdf(tmp_path / "acme_1099nec.pdf", NEC_LINES)
+        runner = CliRunner()
+        assert runner.invoke(app, ["scan", str(tmp_path)]).exit_code == 0
+        assert parse_documents._extraction_cache is not None
+        assert runner.invoke(app, ["--no-cache", "scan", str(tmp_path)]).exit_code == 0
+        assert parse_documents._extraction_cache is None
+
+
+def _worker_failing_on_w2(pdf_path):
+    """_scan_pdf_worker stand-in that raises for w2.pdf."""
+    if pdf_path.endswith("w2.pdf"):
+        raise RuntimeError("worker crashed")
+    return parse_documents._scan_pdf(pdf_path), None, 0.0
+
+
+class TestParallelScan:
+    @pytest.fixture
+    def folder(self, tmp_path):
+        _make_pdf(tmp_path / "acme_1099nec.pdf", NEC_LINES)
+        _make_pdf(tmp_path / "w2.pdf", ["Form W-2 Wage and Tax Statement"])
+        _make_pdf(tmp_path / "statement.pdf", ["Nothing to see"])
+        (tmp_path / "sub").mkdir()
+        _make_pdf(tmp_path / "sub" / "k1.pdf", ["Schedule K-1 (Form 1065)"])
+        (tmp_path / "broken.pdf").write_bytes(b"not a pdf")
+        (tmp_path / "notes.txt").write_text("notes")
+        return tmp_path
+
+    def test_matches_serial_scan(self, folder):
+        serial = scan_documents_folder(str(folder))
+        clear_document_cache()
+        parallel = scan_documents_folder(str(folder), workers=3)
+        assert parallel == serial
+        assert [d["name"] for d in parallel["documents"]] == [
+            "acme_1099nec.pdf", "broken.pdf", "notes.txt", "statement.pdf",
+            "k1.pdf", "w2.pdf"]
+        assert parallel["documents"][1]["classification"] == "error"
+
+    def test_worker_failure_marks_only_its_file(self, folder, monkeypatch):
+        monkeypatch.setattr(parse_documents, "_scan_pdf_worker", _worker_failing_on_w2)
+
+        results = scan_documents_folder(str(folder), workers=2)
+
+        by_name = {d["name"]: d for d in results["documents"]}
+        assert len(by_name) == 6
+        assert by_name["w2.pdf"]["classification"] == "error"
+        assert by_name["w2.pdf"]["error"] == "RuntimeError: worker crashed"
+        assert by_name["acme_1099nec.pdf"]["classification"] == "1099-NEC"
+        assert by_name["k1.pdf"]["classification"] == "K-1"
+
+    def test_parent_reuses_worker_extraction(self, folder):
+        scan_documents_folder(str(folder), workers=2)
+        path = folder / "acme_1099nec.pdf"
+        assert parse_1099_nec(str(path)).data.nonemployee_compensation == 45_000.0
+        assert get_document(path).opens == 0
+
+
+class TestRescan:
+    def test_only_added_and_changed_files_are_scanned(self, tmp_path, monkeypatch):
+        import os
+
+        nec = _make_pdf(tmp_path / "acme_1099nec.pdf", NEC_LINES)
+        w2 = _make_pdf(tmp_path / "w2.pdf", ["Form W-2 Wage and Tax Statement"])
+        gone = _make_pdf(tmp_path / "old.pdf", ["Nothing"])
+        first = rescan_documents_folder(str(tmp_path), {}, {})
+        assert first["added"] == [str(nec), str(gone), str(w2)]
+        assert first["results"] == scan_documents_folder(str(tmp_path))
+
+        gone.unlink()
+        os.utime(w2)  # touched, same content
+        _make_pdf(nec, ["Form W-2 Wage and Tax Statement"])
+        new = _make_pdf(tmp_path / "k1.pdf", ["Schedule K-1 (Form 1065)"])
+
+        scanned = []
+        real_scan_pdf = parse_documents._scan_pdf
+        monkeypatch.setattr(parse_documents, "_scan_pdf",
+                            lambda p: scanned.append(str(p)) or real_scan_pdf(p))
+        second = rescan_documents_folder(str(tmp_path), first["results"], first["manifest"])
+
+        assert scanned == [str(nec), str(new)]
+        assert second["added"] == [str(new)]
+        assert second["changed"] == [str(nec)]
+        assert second["removed"] == [str(gone)]
+        assert second["manifest"][str(w2)]["sha256"] == first["manifest"][str(w2)]["sha256"]
+        monkeypatch.undo()
+        clear_document_cache()
+        assert second["results"] == scan_documents_folder(str(tmp_path))
+
+
+class TestScanEvents:
+    def test_event_sequence(self, tmp_path):
+        _make_pdf(tmp_path / "acme_1099nec.pdf", NEC_LINES)
+        _make_pdf(tmp_path / "w2.pdf", ["Form W-2 Wage and Tax Statement"])
+        (tmp_path / "notes.txt").write_text("notes")
+
+        events = list(iter_scan_documents(str(tmp_path), workers=2))
+        kinds = [e["event"] for e in events]
+        assert kinds == ["start", "document", "document", "document", "finish"]
+        assert events[0]["to_scan"] == 2
+        # The non-PDF is ready before any PDF is classified
+        assert events[1]["document"]["name"] == "notes.txt"
+        assert sorted(e["index"] for e in events[1:4]) == [0, 1, 2]
+        elapsed = [e["elapsed"] for e in events]
+        assert elapsed == sorted(elapsed)
+
+        clear_document_cache()
+        assert events[-1]["results"] == scan_documents_folder(str(tmp_path))
+
+    def test_missing_folder(self, tmp_path):
+        events = list(iter_scan_documents(str(tmp_path / "nope")))
+        assert [e["event"] for e in events] == ["error"]
+        assert "Folder not found" in events[0]["error"]
+
+
+class TestFirstPageClassification:
+    def test_reads_only_first_page(self, tmp_path):
+        pages = [["Form 1040 U.S. Individual Income Tax Return"]]
+        pages += [[f"Schedule page {i}"] for i in range(2, 9)]
+        path = _make_pdf(tmp_path / "2024_return.pdf", *pages)
+        with PDFDocument(path) as doc:
+            assert _classify_document(doc) == "Prior Return"
+            assert doc.preview(40).startswith("Form 1040")
+            assert set(doc._page_text) == {0}
+            # Parsers still see every page when they ask for it
+            assert parse_prior_return(doc)["pages"] == 8
+
+    def test_escalates_while_unknown(self, tmp_path):
+        path = _make_pdf(tmp_path / "statement.pdf",
+                         ["Cover letter"], ["Account summary"],
+                         ["Nothing yet"], ["Form 1099-NEC"], ["Appendix"])
+        with PDFDocument(path) as doc:
+            assert _classify_document(doc) == "1099-NEC"
+            assert set(doc._page_text) == {0, 1, 2, 3, 4}
+
+        path = _make_pdf(tmp_path / "letter.pdf",
+                         ["Cover letter"], ["Schedule K-1 (Form 1065)"], ["Notes"], ["More"])
+        with PDFDocument(path) as doc:
+            assert _classify_document(doc) == "K-1"
+            assert set(doc._page_text) == {0, 1, 2}
+
+    def test_label_comes_from_first_page(self, tmp_path):
+        # A W-2 attached deep inside a prior return no longer relabels it
+        path = _make_pdf(tmp_path / "return.pdf",
+                         ["Form 1040 U.S. Individual Income Tax Return"],
+                         ["Form W-2 Wage and Tax Statement"])
+        with PDFDocument(path) as doc:
+            assert _classify_document(doc) == "Prior Return"
+
+
+def _make_fillable_pdf(path, fields, lines=()):
+    """Write a PDF with text widgets: (name, tooltip, value) each, plus page text."""
+    doc = fitz.open()
+    page = doc.new_page()
+    for i, line in enumerate(lines):
+        page.insert_text((72, 400 + 20 * i), line)
+    for i, (name, label, value) in enumerate(fields):
+        widget = fitz.Widget()
+        widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+        widget.field_name = name
+        widget.field_label = label
+        widget.field_value = value
+        widget.rect = fitz.Rect(72, 60 + 22 * i, 320, 78 + 22 * i)
+        page.add_widget(widget)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestFormFieldFastPath:
+    def test_1099_nec_fields_skip_layout_text(self, tmp_path):
+        path = _make_fillable_pdf(tmp_path / "nec.pdf", [
+            ("f1_2[0]", "PAYER'S name, street address, city", "Acme Corp\n1 Main St"),
+            ("f1_3[0]", "PAYER'S TIN", "12-3456789"),
+            ("f1_4[0]", "RECIPIENT'S TIN", "123-45-6789"),
+            ("f1_9[0]", "Box 1. Nonemployee compensation", "45,000.00"),
+            ("f1_11[0]", "Box 4. Federal income tax withheld", ""),
+        ])
+        with PDFDocument(path) as doc:
+            result = parse_1099_nec(doc)
+            assert doc.opens == 0
+        nec = result.data
+        assert (nec.payer_name, nec.payer_tin, nec.recipient_tin) == (
+            "Acme Corp", "12-3456789", "123-45-6789")
+        assert nec.nonemployee_compensation == 45_000.0
+        assert nec.federal_tax_withheld == 0.0
+        assert result.confidence == 1.0
+
+    def test_w2_and_k1_fields(self, tmp_path):
+        w2 = parse_w2(str(_make_fillable_pdf(tmp_path / "w2.pdf", [
+            ("emp", "c Employer's name, address, and ZIP code", "Big Co"),
+            ("b1", "1 Wages, tips, other compensation", "72,500.00"),
+            ("b2", "2 Federal income tax withheld", "9,100.00"),
+            ("b4", "4 Social security tax withheld", "4,495.00"),
+        ]))).data
+        assert (w2.employer_name, w2.wages, w2.federal_tax_withheld, w2.ss_tax_withheld) == (
+            "Big Co", 72_500.0, 9_100.0, 4_495.0)
+
+        k1 = parse_k1_1065(str(_make_fillable_pdf(tmp_path / "k1.pdf", [
+            ("pn", "Partnership's name, address", "Denver Rental Partners"),
+            ("j1", "Ending profit percentage", "25%"),
+            ("b2", "Box 2. Net rental real estate income (loss)", "(3,200.00)"),
+        ]))).data
+        assert k1.partnership_name == "Denver Rental Partners"
+        assert k1.partner_share_profit == 25.0
+        assert k1.net_rental_income == -3_200.0
+
+    def test_w2_box_16_is_not_box_1(self, tmp_path):
+        result = parse_w2(str(_make_fillable_pdf(tmp_path / "w2.pdf", [
+            ("s16", "16 State wages, tips, etc.", "72,500.00"),
+            ("b1", "1 Wages, tips, other compensation", "70,000.00"),
+        ])))
+        assert (result.data.wages, result.data.state_wages) == (70_000.0, 72_500.0)
+        assert result.confidence == 0.5
+        assert "Could not extract employer name" in result.warnings
+
+    def test_w2_fields_validated(self, tmp_path):
+        result = parse_w2(str(_make_fillable_pdf(tmp_path / "w2.pdf", [
+            ("emp", "c Employer's name, address, and ZIP code", "Big Co"),
+            ("b1", "1 Wages, tips, other compensation", "12,500,000.00"),
+        ])))
+        assert result.confidence == 1.0
+        assert result.warnings == ["Unusually high wages: $12,500,000.00"]
+
+        result = parse_w2(str(_make_fillable_pdf(tmp_path / "neg.pdf", [
+            ("emp", "c Employer's name, address, and ZIP code", "Big Co"),
+            ("b1", "1 Wages, tips, other compensation", "(500.00)"),
+        ])))
+        assert result.confidence == 0.3
+        assert "Box 1 (wages) is negative — verify manually" in result.warnings
+
+    def test_k1_typographic_apostrophes_and_ending_shares(self, tmp_path):
+        k1 = parse_k1_1065(str(_make_fillable_pdf(tmp_path / "k1.pdf", [
+            ("pn", "Partnership’s name, address, city", "Denver Rental Partners"),
+            ("ptin", "Partner’s SSN or TIN", "123-45-6789"),
+            ("jpb", "Partner’s share of profit, loss, and capital: Profit beginning %", "20%"),
+            ("jpe", "Partner’s share of profit, loss, and capital: Profit ending %", "25%"),
+            ("jlb", "Partner’s share of profit, loss, and capital: Loss beginning %", "20%"),
+            ("jle", "Partner’s share of profit, loss, and capital: Loss ending %", "30%"),
+            ("jcb", "Partner’s share of profit, loss, and capital: Capital beginning %", "20%"),
+            ("jce", "Partner’s share of profit, loss, and capital: Capital ending %", "35%"),
+        ]))).data
+        assert (k1.partnership_name, k1.partner_tin) == ("Denver Rental Partners", "123-45-6789")
+        assert (k1.partner_share_profit, k1.partner_share_loss, k1.partner_share_capital) == (
+            25.0, 30.0, 35.0)
+
+    def test_empty_fields_fall_back_to_layout_text(self, tmp_path):
+        path = _make_fillable_pdf(
+            tmp_path / "nec.pdf",
+            [("f1_9[0]", "Box 1. Nonemployee compensation", "")],
+            lines=NEC_LINES,
+        )
+        with PDFDocument(path) as doc:
+            result = parse_1099_nec(doc)
+            assert doc.opens == 1
+        assert result.data.nonemployee_compensation == 45_000.0
+        assert result.data.payer_name == "Acme Corp"
+
+
+COMPOSITE_PAGES = [
+    ["Consolidated Form 1099 - Tax Year 2025",
+     "PAYER'S name: Example Brokerage LLC",
+     "PAYER'S TIN: 98-7654321",
+     "Contents: 1099-DIV Dividends and Distributions, 1099-INT Interest Income"],
+    ["2025 Form 1099-DIV Dividends and Distributions",
+     "1a Total ordinary dividends 1,250.00",
+     "1b Qualified dividends 900.00",
+     "2a Total capital gain distributions 300.00",
+     "4 Federal income tax withheld 25.00",
+     "2025 Form 1099-INT Interest Income",
+     "1 Interest income 412.50",
+     "8 Tax-exempt interest 40.00"],
+    ["2025 Form 1099-B Proceeds From Broker and Barter Exchange Transactions",
+     "SHORT-TERM TRANSACTIONS FOR COVERED TAX LOTS",
+     "AAPL 10 sh 01/05/25 03/01/25 1,800.00 1,500.00 300.00",
+     "Total short-term 1,800.00 1,500.00 300.00"],
+    ["2025 Form 1099-B Proceeds From Broker and Barter Exchange Transactions (continued)",
+     "LONG-TERM TRANSACTIONS FOR COVERED TAX LOTS",
+     "MSFT 20 sh 02/01/21 06/10/25 5,000.00 3,000.00 2,000.00",
+     "Totals 5,000.00 3,000.00 2,000.00"],
+    ["Supplemental Information - not reported to the IRS",
+     "Fees and expenses 12.00"],
+]
+
+
+class TestBrokerageStatement:
+    def test_sections_follow_form_headers(self, tmp_path):
+        path = _make_pdf(tmp_path / "composite.pdf", *COMPOSITE_PAGES)
+        sections = [(s.form, s.first_page, s.last_page)
+                    for s in iter_statement_sections(str(path))]
+        assert sections == [
+            ("", 0, 0),
+            ("1099-DIV", 0, 0),  # contents line
+            ("1099-INT", 0, 0),
+            ("1099-DIV", 1, 1),
+            ("1099-INT", 1, 1),  # header partway down the page
+            ("1099-B", 2, 3),    # repeated header continues the section
+            ("Supplemental", 4, 4),
+        ]
+
+    def test_parses_each_section(self, tmp_path):
+        path = _make_pdf(tmp_path / "composite.pdf", *COMPOSITE_PAGES)
+        with PDFDocument(path) as doc:
+            assert _classify_document(doc) == "Brokerage Statement"
+            results = parse_brokerage_statement(doc)
+            # Streamed: only the page classification read stays cached
+            assert set(doc._page_text) == {0}
+
+        assert [r.document_type for r in results] == ["1099-DIV", "1099-INT", "1099-B"]
+        div, interest, broker = (r.data for r in results)
+        assert (div.payer_name, div.payer_tin) == ("Example Brokerage LLC", "98-7654321")
+        assert (div.ordinary_dividends, div.qualified_dividends,
+                div.capital_gain_distributions, div.federal_tax_withheld) == (
+            1_250.0, 900.0, 300.0, 25.0)
+        assert (interest.interest_income, interest.tax_exempt_interest) == (412.5, 40.0)
+        assert interest.payer_name == "Example Brokerage LLC"
+        assert (broker.st_proceeds, broker.st_cost_basis) == (1_800.0, 1_500.0)
+        assert (broker.lt_proceeds, broker.lt_cost_basis) == (5_000.0, 3_000.0)
+        assert broker.broker_tin == "98-7654321"
+        assert all(r.confidence == 0.7 for r in results)
+
+    def test_single_form_file(self, tmp_path):
+        path = _make_pdf(tmp_path / "bank.pdf", [
+            "Form 1099-INT Interest Income",
+            "PAYER'S name: First Savings Bank",
+            "Box 1 Interest income 88.10",
+        ])
+        with PDFDocument(path) as doc:
+            assert _classify_document(doc) == "1099-INT"
+            result = parse_1099_int(doc)
+        assert (result.data.payer_name, result.data.interest_income) == (
+            "First Savings Bank", 88.1)
@@ -276,6 +276,16 @@ class TestResultSerialization:
             assert restored.qbi is not None
             assert restored.qbi.qbi_deduction == result.qbi.qbi_deduction
 
+    def test_slotted_results_round_trip_exactly(self, mfs_expat):
+        """Result containers carry no __dict__ and still serialize losslessly."""
+        result = calculate_return(mfs_expat)
+        for obj in (result, result.lines[0], result.schedule_c_results[0],
+                    result.schedule_se, result.qbi):
+            assert not hasattr(obj, "__dict__")
+
+        data = json.loads(json.dumps(serialize_result(result), default=str))
+        assert serialize_result(deserialize_result(data)) == serialize_result(result)
+
 
 # =============================================================================
 # Resume Parity Test
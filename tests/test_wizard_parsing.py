@@ -29,7 +29,8 @@ class _Prompt:
 class TestParserDispatch:
     def test_parsers_dict_has_expected_types(self):
         """Verify the PARSERS dispatch table covers the expected types."""
-        expected = {"1099-NEC", "W-2", "K-1", "1098", "1095-A", "Charity Receipt"}
+        expected = {"1099-NEC", "W-2", "K-1", "1098", "1095-A", "1099-INT", "1099-DIV",
+                    "1099-B", "Brokerage Statement", "Charity Receipt"}
         assert set(TaxWizard.PARSERS.keys()) == expected
 
     def test_parser_functions_are_callable(self):